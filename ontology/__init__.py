@@ -1,6 +1,8 @@
 """Ontology action and edit runtime."""
 
 from .action.api.domain_models import (
+    ActionBatchItem,
+    ActionBatchItemResult,
     ActionDefinition,
     ActionExecution,
     ActionExecutionMode,
@@ -16,7 +18,9 @@ from .action.api.domain_models import (
     SideEffectOutbox,
 )
 from .action.storage.repository import ActionRepository, InMemoryActionRepository
+from .action.storage.cache import CachingActionRepository
 from .action.api.repair import ActionRepairJob, RepairResult
+from .action.api.workers import ActionWorkerPool
 from .action.api.service import (
     ActionReconciler,
     ActionService,
@@ -63,6 +67,8 @@ __all__ = [
     "ValidationChain",
     "InstanceService",
     "ActionDefinition",
+    "ActionBatchItem",
+    "ActionBatchItemResult",
     "ActionExecution",
     "ActionExecutionMode",
     "ActionTargetType",
@@ -77,9 +83,11 @@ __all__ = [
     "SideEffectOutbox",
     "ActionRepository",
     "InMemoryActionRepository",
+    "CachingActionRepository",
     "ActionService",
     "ActionRepairJob",
     "RepairResult",
+    "ActionWorkerPool",
     "ActionReconciler",
     "NotificationEffectHandler",
     "SideEffect",
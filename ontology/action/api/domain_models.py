@@ -91,6 +91,26 @@ class ActionExecution:
     error: Optional[str] = None
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
+    # Kept for queued executions so a worker can resolve and run them later.
+    action_version: Optional[int] = None
+    input_instances: Optional[Dict[str, Dict[str, Any]]] = None
+    # Only executions created by ``ActionService.enqueue`` are claimed by workers.
+    queued_for_worker: bool = False
+    # Caller-supplied idempotency key; repeated applies return this execution.
+    client_request_id: Optional[str] = None
+
+
+@dataclass
+class ActionBatchItem:
+    input_payload: Dict[str, Any] = field(default_factory=dict)
+    input_instances: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class ActionBatchItemResult:
+    # ``execution`` is None when the item was rejected before it ran.
+    execution: Optional[ActionExecution] = None
+    error: Optional[str] = None
 
 
 @dataclass
@@ -0,0 +1,111 @@
+"""Request-id deduplication for action applies.
+
+A caller that retries an apply with the same ``client_request_id`` gets the
+execution created by the first attempt instead of a second run. Recently
+seen ids are kept in a bounded LRU in front of the indexed repository
+lookup, and concurrent duplicates wait for the attempt already in flight.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Callable, Dict, Tuple
+
+from .domain_models import ActionExecution
+from ..storage.repository import ActionRepository
+
+
+class _InFlight:
+    __slots__ = ("done", "execution", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.execution: ActionExecution | None = None
+        self.error: BaseException | None = None
+
+
+class ApplyDeduplicator:
+    """Collapse applies sharing ``(action_name, client_request_id)`` onto one execution."""
+
+    def __init__(self, repository: ActionRepository, max_entries: int = 10_000) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._repository = repository
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._recent: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str], _InFlight] = {}
+        self._hits = 0
+        self._coalesced = 0
+        self._misses = 0
+
+    def run(
+        self,
+        action_name: str,
+        client_request_id: str,
+        execute: Callable[[], ActionExecution],
+    ) -> ActionExecution:
+        """Return the execution already recorded for the key, or run ``execute`` once."""
+        key = (action_name, client_request_id)
+        with self._lock:
+            execution_id = self._recent.get(key)
+            if execution_id is not None:
+                self._recent.move_to_end(key)
+                self._hits += 1
+                flight = None
+            else:
+                flight = self._in_flight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._in_flight[key] = _InFlight()
+                else:
+                    self._coalesced += 1
+        if flight is None:
+            execution = self._repository.get_execution(execution_id)
+            if execution is not None:
+                return execution
+            # The repository no longer has it; treat the id as unseen.
+            with self._lock:
+                self._recent.pop(key, None)
+            return self.run(action_name, client_request_id, execute)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.execution
+        try:
+            execution = self._repository.find_execution_by_client_request_id(action_name, client_request_id)
+            with self._lock:
+                if execution is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+            if execution is None:
+                execution = execute()
+            flight.execution = execution
+            self._remember(key, execution.execution_id)
+            return execution
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._recent),
+                "hits": self._hits,
+                "coalesced": self._coalesced,
+                "misses": self._misses,
+            }
+
+    def _remember(self, key: Tuple[str, str], execution_id: str) -> None:
+        with self._lock:
+            self._recent[key] = execution_id
+            self._recent.move_to_end(key)
+            while len(self._recent) > self._max_entries:
+                self._recent.popitem(last=False)
@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import anyio
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from .schemas import ActionApplyRequest, ActionExecutionResponse
-from .domain_models import ActionDefinition, ActionExecutionMode, ActionTargetType
+from .schemas import (
+    ActionApplyBatchRequest,
+    ActionApplyBatchResponse,
+    ActionApplyRequest,
+    ActionBatchItemResponse,
+    ActionExecutionResponse,
+)
+from .domain_models import (
+    ActionBatchItem,
+    ActionDefinition,
+    ActionExecution,
+    ActionExecutionMode,
+    ActionStatus,
+    ActionTargetType,
+)
 from ..storage.repository import ActionRepository
-from .service import ActionService
+from .service import ActionDefinitionNotFoundError, ActionService
+from .workers import TERMINAL_STATUSES, ActionWorkerPool
+
+LONG_POLL_MAX_SECONDS = 60.0
 
 
 
@@ -27,11 +44,48 @@ class ActionDefinitionResponse(BaseModel):
     version: int
     active: bool
 
+
+class DefinitionCacheStatsResponse(BaseModel):
+    """Definition cache counters; ``enabled`` is false when no cache is configured."""
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    hit_rate: float = 0.0
+
+
+def _execution_response(execution: ActionExecution) -> ActionExecutionResponse:
+    return ActionExecutionResponse(
+        execution_id=execution.execution_id,
+        action_name=execution.action_name,
+        status=execution.status.value,
+        submitter=execution.submitter,
+        submitted_at=execution.submitted_at.isoformat(),
+        input_payload=execution.input_payload,
+        output_payload=execution.output_payload,
+        error=execution.error,
+        finished_at=execution.finished_at.isoformat() if execution.finished_at else None,
+    )
+
+
 def create_router(
     action_service: ActionService | None = None,
     repository: ActionRepository | None = None,
+    apply_concurrency: int | None = None,
+    worker_pool: ActionWorkerPool | None = None,
 ) -> APIRouter:
-    """Create v1 action routes for apply and execution query."""
+    """Create v1 action routes for apply and execution query.
+
+    With ``apply_concurrency`` the apply route is a coroutine that runs the
+    (synchronous) action pipeline in worker threads, at most
+    ``apply_concurrency`` at a time, instead of sharing the default threadpool
+    with every other sync route.
+
+    With ``worker_pool`` apply only queues the execution and answers 202;
+    clients long-poll ``GET /actions/executions/{id}?wait=<seconds>``.
+    """
 
     router = APIRouter()
 
@@ -61,48 +115,114 @@ def create_router(
             active=definition.active,
         )
 
-    @router.post("/actions/{action_id}/apply", response_model=ActionExecutionResponse)
-    def apply_action(action_id: str, request: ActionApplyRequest) -> ActionExecutionResponse:
-        """Apply an action definition end-to-end (submit + execute + apply)."""
+    def _apply(action_id: str, request: ActionApplyRequest) -> ActionExecutionResponse:
         if action_service is None or repository is None:
             raise HTTPException(status_code=501, detail="Action service not configured")
-        definition = repository.get_action(action_id, request.version)
-        if definition is None:
-            raise HTTPException(status_code=404, detail="Action definition not found")
+        run = action_service.apply if worker_pool is None else action_service.enqueue
         try:
-            execution = action_service.apply(
+            execution = run(
                 action_name=action_id,
                 submitter=request.submitter,
                 input_payload=request.input_payload,
                 version=request.version,
                 input_instance_locators=request.input_instances,
+                client_request_id=request.client_request_id,
             )
+        except ActionDefinitionNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-        return ActionExecutionResponse(
-            execution_id=execution.execution_id,
-            action_name=execution.action_name,
-            status=execution.status.value,
-            submitter=execution.submitter,
-            submitted_at=execution.submitted_at.isoformat(),
-            input_payload=execution.input_payload,
-        )
+        if worker_pool is not None:
+            worker_pool.wake()
+        return _execution_response(execution)
+
+    if worker_pool is not None:
+
+        @router.post("/actions/{action_id}/apply", response_model=ActionExecutionResponse, status_code=202)
+        def enqueue_action(action_id: str, request: ActionApplyRequest) -> ActionExecutionResponse:
+            """Queue an action execution for the worker pool and return it as ``queued``."""
+            return _apply(action_id, request)
+
+    elif apply_concurrency is None:
+
+        @router.post("/actions/{action_id}/apply", response_model=ActionExecutionResponse)
+        def apply_action(action_id: str, request: ActionApplyRequest) -> ActionExecutionResponse:
+            """Apply an action definition end-to-end (submit + execute + apply)."""
+            return _apply(action_id, request)
+
+    else:
+        if apply_concurrency < 1:
+            raise ValueError("apply_concurrency must be at least 1")
+        apply_limiter = anyio.CapacityLimiter(apply_concurrency)
+
+        @router.post("/actions/{action_id}/apply", response_model=ActionExecutionResponse)
+        async def apply_action_async(action_id: str, request: ActionApplyRequest) -> ActionExecutionResponse:
+            """Apply an action definition end-to-end (submit + execute + apply)."""
+            return await anyio.to_thread.run_sync(_apply, action_id, request, limiter=apply_limiter)
+
+    @router.post("/actions/{action_id}/apply-batch", response_model=ActionApplyBatchResponse)
+    def apply_action_batch(action_id: str, request: ActionApplyBatchRequest) -> ActionApplyBatchResponse:
+        """Apply one action over many inputs; a failing item does not fail the batch."""
+        if action_service is None or repository is None:
+            raise HTTPException(status_code=501, detail="Action service not configured")
+        try:
+            results = action_service.apply_batch(
+                action_name=action_id,
+                submitter=request.submitter,
+                items=[
+                    ActionBatchItem(input_payload=item.input_payload, input_instances=item.input_instances or {})
+                    for item in request.items
+                ],
+                version=request.version,
+            )
+        except ActionDefinitionNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        items = [
+            ActionBatchItemResponse(
+                index=index,
+                succeeded=result.execution is not None and result.execution.status == ActionStatus.succeeded,
+                execution=_execution_response(result.execution) if result.execution is not None else None,
+                error=result.error,
+            )
+            for index, result in enumerate(results)
+        ]
+        succeeded = sum(item.succeeded for item in items)
+        return ActionApplyBatchResponse(succeeded=succeeded, failed=len(items) - succeeded, results=items)
+
+    @router.get("/admin/actions/definition-cache", response_model=DefinitionCacheStatsResponse)
+    def get_definition_cache_stats() -> DefinitionCacheStatsResponse:
+        """Report action/function definition cache hit-rate counters."""
+        stats = getattr(repository, "stats", None)
+        if stats is None:
+            return DefinitionCacheStatsResponse(enabled=False)
+        return DefinitionCacheStatsResponse(enabled=True, **stats())
 
     @router.get("/actions/executions/{execution_id}", response_model=ActionExecutionResponse)
-    def get_action_execution(execution_id: str) -> ActionExecutionResponse:
-        """Fetch one action execution by id."""
+    async def get_action_execution(
+        execution_id: str,
+        wait: float = Query(
+            0.0,
+            ge=0.0,
+            le=LONG_POLL_MAX_SECONDS,
+            description="Long-poll: wait up to this many seconds for a terminal status",
+        ),
+    ) -> ActionExecutionResponse:
+        """Fetch one action execution by id, optionally waiting until it finishes."""
         if repository is None:
             raise HTTPException(status_code=501, detail="Action repository not configured")
-        execution = repository.get_execution(execution_id)
-        if execution is None:
-            raise HTTPException(status_code=404, detail="Action execution not found")
-        return ActionExecutionResponse(
-            execution_id=execution.execution_id,
-            action_name=execution.action_name,
-            status=execution.status.value,
-            submitter=execution.submitter,
-            submitted_at=execution.submitted_at.isoformat(),
-            input_payload=execution.input_payload,
-        )
+        deadline = anyio.current_time() + wait
+        delay = 0.05
+        while True:
+            execution = await anyio.to_thread.run_sync(repository.get_execution, execution_id)
+            if execution is None:
+                raise HTTPException(status_code=404, detail="Action execution not found")
+            remaining = deadline - anyio.current_time()
+            if execution.status in TERMINAL_STATUSES or remaining <= 0:
+                return _execution_response(execution)
+            # Poll the repository so waiters see executions run by any process.
+            await anyio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
 
     return router
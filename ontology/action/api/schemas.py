@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ObjectResponse(BaseModel):
@@ -13,6 +13,88 @@ class ObjectResponse(BaseModel):
     version: Optional[int]
 
 
+class ObjectLocatorRequest(BaseModel):
+    """Locator of one ontology object in batch requests."""
+    object_type: str
+    primary_key: str
+
+
+class BatchGetObjectsRequest(BaseModel):
+    """Request payload for batch object fetch."""
+    locators: List[ObjectLocatorRequest] = Field(min_length=1, max_length=1000)
+
+
+class BatchGetObjectsResponse(BaseModel):
+    """Batch fetch results aligned with request locators; missing objects are null."""
+    objects: List[Optional[ObjectResponse]]
+
+
+class PropertyPredicateRequest(BaseModel):
+    """One property condition; ``in`` expects a list value."""
+    property: str = Field(min_length=1)
+    op: Literal["eq", "in", "gt", "gte", "lt", "lte"] = "eq"
+    value: Any
+
+
+class ObjectSearchRequest(BaseModel):
+    """Request payload for property-predicate object search (predicates are ANDed)."""
+    where: List[PropertyPredicateRequest] = Field(default_factory=list, max_length=32)
+    limit: int = Field(100, ge=1, le=1000)
+    after_primary_key: Optional[str] = None
+
+
+class QueryPlanResponse(BaseModel):
+    """How the store executed a search: index lookup or scan fallback."""
+    strategy: str
+    index: Optional[str] = None
+    property: Optional[str] = None
+    examined: Optional[int] = None
+    pushed_down: bool = False
+
+
+class ObjectSearchResponse(BaseModel):
+    """Matching objects ordered by primary key plus the executed query plan."""
+    objects: List[ObjectResponse]
+    plan: QueryPlanResponse
+    next_after_primary_key: Optional[str] = None
+
+
+class AggregateRequest(BaseModel):
+    """One aggregate column; ``count`` may omit ``property`` to count objects."""
+    op: Literal["count", "sum", "avg", "min", "max"]
+    property: Optional[str] = None
+    alias: Optional[str] = None
+
+
+class ObjectAggregateRequest(BaseModel):
+    """Request payload for server-side group-by aggregation."""
+    group_by: List[str] = Field(default_factory=list, max_length=8)
+    aggregates: List[AggregateRequest] = Field(min_length=1, max_length=32)
+    where: List[PropertyPredicateRequest] = Field(default_factory=list, max_length=32)
+    limit: int = Field(1000, ge=1, le=10000)
+
+
+class AggregateGroupResponse(BaseModel):
+    """Group-by values and the aggregate values computed for them."""
+    group: Dict[str, Any]
+    values: Dict[str, Any]
+
+
+class ObjectAggregateResponse(BaseModel):
+    """Aggregated groups ordered by group values."""
+    groups: List[AggregateGroupResponse]
+    engine: str
+    scanned: Optional[int] = None
+
+
+class LinkedObjectResponse(BaseModel):
+    """One NDJSON line of a link traversal: the object and how it was reached."""
+    depth: int
+    link_type: str
+    via: ObjectLocatorRequest
+    object: ObjectResponse
+
+
 class ActionApplyRequest(BaseModel):
     """Request payload for action apply endpoint."""
     submitter: str
@@ -38,3 +120,34 @@ class ActionExecutionResponse(BaseModel):
     submitter: str
     submitted_at: str
     input_payload: Dict[str, Any]
+    output_payload: Dict[str, Any] = Field(default_factory=dict)
+    error: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class ActionBatchItemRequest(BaseModel):
+    """One input of a batch apply."""
+    input_payload: Dict[str, Any] = Field(default_factory=dict)
+    input_instances: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+class ActionApplyBatchRequest(BaseModel):
+    """Request payload for applying one action over many inputs."""
+    submitter: str
+    items: List[ActionBatchItemRequest] = Field(min_length=1, max_length=1000)
+    version: Optional[int] = None
+
+
+class ActionBatchItemResponse(BaseModel):
+    """Result of one batch item; ``execution`` is null if the item was rejected before running."""
+    index: int
+    succeeded: bool
+    execution: Optional[ActionExecutionResponse] = None
+    error: Optional[str] = None
+
+
+class ActionApplyBatchResponse(BaseModel):
+    """Batch apply results aligned with request items."""
+    succeeded: int
+    failed: int
+    results: List[ActionBatchItemResponse]
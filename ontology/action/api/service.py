@@ -6,12 +6,15 @@ This module contains the core execution path for stage-1:
 submit -> execute function -> validate/apply edits -> persist execution logs.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 import uuid
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 from .domain_models import (
+    ActionBatchItem,
+    ActionBatchItemResult,
     ActionDefinition,
     ActionExecution,
     ActionExecutionMode,
@@ -25,7 +28,8 @@ from .domain_models import (
     NotificationLog,
     SideEffectOutbox,
 )
-from ..storage.repository import ActionRepository
+from ..storage.repository import ActionRepository, DuplicateClientRequestError, ExecutionJournal
+from .idempotency import ApplyDeduplicator
 from ontology.instance.api.service import InstanceService
 from ..storage.edits import ObjectLocator, RelationInstance, edit_to_dict
 from ..execution.notifications import NotificationDispatcher, NotificationMessage, WebhookDispatcher
@@ -38,6 +42,10 @@ from ..utils import now_utc
 SideEffectHandler = Callable[[Dict[str, Any]], None]
 
 
+class ActionDefinitionNotFoundError(ValueError):
+    """No action definition matches the requested name/version."""
+
+
 def _redact_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     redacted: Dict[str, Any] = {}
     for key, value in payload.items():
@@ -104,8 +112,15 @@ class ActionReconciler:
         self._apply_engine = apply_engine
 
     def reconcile(self, cutoff_seconds: int = 60) -> None:
-        for state in self._repository.list_stale_action_states(cutoff_seconds):
-            if self._apply_engine.store.has_action_applied(state.action_id, state.intent_payload.get("edits")):
+        states = self._repository.list_stale_action_states(cutoff_seconds)
+        if not states:
+            return
+        # One bulk probe for the whole backlog instead of one lookup per state.
+        applied_flags = self._apply_engine.store.has_actions_applied(
+            [(state.action_id, state.intent_payload.get("edits")) for state in states]
+        )
+        for state, applied in zip(states, applied_flags):
+            if applied:
                 state.status = ActionStateStatus.succeeded
                 state.updated_at = now_utc()
                 outbox_entries = []
@@ -134,12 +149,18 @@ class ActionService:
         apply_engine: InstanceService,
         function_runtime: FunctionRuntime | None = None,
         feature_flags: ActionFeatureFlags | None = None,
+        dedup_cache_size: int = 10_000,
     ) -> None:
         self._repository = repository
         self._runner = runner
         self._function_runtime = function_runtime or FunctionRuntime(action_runner=runner)
         self._apply_engine = apply_engine
         self._feature_flags = feature_flags or ActionFeatureFlags()
+        self._deduplicator = ApplyDeduplicator(repository, max_entries=dedup_cache_size)
+
+    @property
+    def deduplicator(self) -> ApplyDeduplicator:
+        return self._deduplicator
 
     def submit(
         self,
@@ -147,6 +168,16 @@ class ActionService:
         submitter: str,
         input_payload: Dict[str, Any],
     ) -> ActionExecution:
+        journal = self._open_journal(definition, submitter, input_payload)
+        journal.flush(self._repository)
+        return journal.execution
+
+    def _open_journal(
+        self,
+        definition: ActionDefinition,
+        submitter: str,
+        input_payload: Dict[str, Any],
+    ) -> ExecutionJournal:
         if not definition.active:
             raise ValueError("Action is inactive")
         if definition.submission_criteria and not definition.submission_criteria(input_payload):
@@ -159,16 +190,9 @@ class ActionService:
             submitted_at=now_utc(),
             input_payload=input_payload,
         )
-        self._repository.add_execution(execution)
-        self._repository.add_log(
-            ActionLog(
-                execution_id=execution.execution_id,
-                event_type="submitted",
-                payload=input_payload,
-                created_at=now_utc(),
-            )
-        )
-        return execution
+        journal = ExecutionJournal(execution, execution_persisted=False)
+        journal.log("submitted", input_payload)
+        return journal
 
     def apply(
         self,
@@ -177,35 +201,284 @@ class ActionService:
         input_payload: Dict[str, Any],
         version: int | None = None,
         input_instance_locators: Dict[str, Dict[str, Any]] | None = None,
+        client_request_id: str | None = None,
+    ) -> ActionExecution:
+        """Run an action end to end; a repeated ``client_request_id`` returns the first execution."""
+        if client_request_id is None:
+            return self._apply(action_name, submitter, input_payload, version, input_instance_locators)
+        return self._deduplicator.run(
+            action_name,
+            client_request_id,
+            lambda: self._apply(
+                action_name, submitter, input_payload, version, input_instance_locators, client_request_id
+            ),
+        )
+
+    def _apply(
+        self,
+        action_name: str,
+        submitter: str,
+        input_payload: Dict[str, Any],
+        version: int | None,
+        input_instance_locators: Dict[str, Dict[str, Any]] | None,
+        client_request_id: str | None = None,
+    ) -> ActionExecution:
+        definition = self._repository.get_action(action_name, version)
+        if definition is None:
+            raise ActionDefinitionNotFoundError("Action definition not found")
+
+        # The submission is persisted together with the first durable point
+        # of the execution, or on its own if the request is rejected below.
+        journal = self._open_journal(definition, submitter, input_payload)
+        try:
+            run = self._prepare(definition, journal.execution, input_instance_locators or {})
+        except Exception as exc:
+            self._reject(journal, exc)
+            journal.flush(self._repository)
+            raise
+        # Only executions that actually run claim the request id, so a
+        # rejected request can be retried once its inputs are fixed.
+        if client_request_id is not None:
+            journal.execution.client_request_id = client_request_id
+            # Claim the id before running: the unique index makes a duplicate
+            # from another process lose here, before its function runs.
+            try:
+                journal.flush(self._repository)
+            except DuplicateClientRequestError as exc:
+                return exc.existing
+        return run(journal)
+
+    def apply_batch(
+        self,
+        action_name: str,
+        submitter: str,
+        items: Sequence[ActionBatchItem],
+        version: int | None = None,
+        max_workers: int = 8,
+    ) -> List[ActionBatchItemResult]:
+        """Run one action over many inputs; results align with ``items``.
+
+        The definition and function are resolved once and every input
+        instance is fetched with one ``get_objects`` call. Functions run on at
+        most ``max_workers`` threads, the edits are committed with
+        ``apply_many`` and each durable point flushes all journals in one
+        repository transaction. A failing item only fails its own result.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        definition = self._repository.get_action(action_name, version)
+        if definition is None:
+            raise ActionDefinitionNotFoundError("Action definition not found")
+        if not definition.active:
+            raise ValueError("Action is inactive")
+        call = self._function_call(definition)
+
+        results = [ActionBatchItemResult() for _ in items]
+        journals: List[ExecutionJournal] = []
+        prepared: List[tuple[int, ExecutionJournal, list[tuple[str, Any]], int, int]] = []
+        fetch: List[ObjectLocator] = []
+        for index, item in enumerate(items):
+            try:
+                journal = self._open_journal(definition, submitter, item.input_payload)
+            except ValueError as exc:
+                results[index].error = str(exc)
+                continue
+            journals.append(journal)
+            try:
+                parsed, item_fetch = self._parse_input_locators(item.input_instances)
+            except ValueError as exc:
+                results[index].error = str(exc)
+                self._reject(journal, exc)
+                continue
+            prepared.append((index, journal, parsed, len(fetch), len(fetch) + len(item_fetch)))
+            fetch.extend(item_fetch)
+
+        fetched = self._apply_engine.get_objects(fetch) if fetch else []
+        runnable: List[tuple[int, ExecutionJournal, Dict[str, Any]]] = []
+        for index, journal, parsed, begin, end in prepared:
+            try:
+                resolved = self._assemble_input_instances(parsed, iter(fetched[begin:end]))
+                self._validate_target_constraints(definition, resolved)
+            except ValueError as exc:
+                results[index].error = str(exc)
+                self._reject(journal, exc)
+                continue
+            self._begin_attempt(journal.execution, definition, journal)
+            runnable.append((index, journal, resolved))
+
+        def run_function(journal: ExecutionJournal, resolved: Dict[str, Any]) -> Dict[str, Any] | Exception:
+            try:
+                return call(journal.execution, resolved)
+            except Exception as exc:  # noqa: BLE001
+                return exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(runnable)))) as pool:
+            outcomes = list(
+                pool.map(run_function, [journal for _, journal, _ in runnable], [resolved for _, _, resolved in runnable])
+            )
+
+        staged: List[tuple[int, ExecutionJournal, Dict[str, Any], ActionState]] = []
+        for (index, journal, resolved), outcome in zip(runnable, outcomes):
+            execution = journal.execution
+            results[index].execution = execution
+            if isinstance(outcome, Exception):
+                self._record_failure(execution, definition, "executing", outcome, None, resolved, [], journal)
+                self._finish_attempt(execution, journal)
+                continue
+            try:
+                action_state = self._stage_apply(execution, definition, outcome, None, journal)
+            except Exception as exc:  # noqa: BLE001
+                self._record_failure(execution, definition, "applying", exc, None, resolved, [], journal)
+                self._finish_attempt(execution, journal)
+                continue
+            staged.append((index, journal, resolved, action_state))
+
+        # Durable point 1: submissions, early failures and pending action states.
+        ExecutionJournal.flush_all(journals, self._repository)
+        apply_results = self._apply_engine.apply_many(
+            [journal.execution.ontology_edit for _, journal, _, _ in staged],
+            action_ids=[journal.execution.execution_id for _, journal, _, _ in staged],
+        )
+        for (index, journal, resolved, action_state), apply_result in zip(staged, apply_results):
+            execution = journal.execution
+            completed_steps: List[Any] = []
+            try:
+                self._complete_apply(
+                    execution, definition, apply_result, action_state, resolved, None, completed_steps, journal
+                )
+            except Exception as exc:  # noqa: BLE001
+                self._record_failure(
+                    execution, definition, "applying", exc, action_state, resolved, completed_steps, journal
+                )
+            finally:
+                self._finish_attempt(execution, journal)
+        # Durable point 2: terminal statuses.
+        ExecutionJournal.flush_all(journals, self._repository)
+        for result in results:
+            if result.execution is not None and result.execution.status != ActionStatus.succeeded:
+                result.error = result.execution.error
+        return results
+
+    def enqueue(
+        self,
+        action_name: str,
+        submitter: str,
+        input_payload: Dict[str, Any],
+        version: int | None = None,
+        input_instance_locators: Dict[str, Dict[str, Any]] | None = None,
+        client_request_id: str | None = None,
+    ) -> ActionExecution:
+        """Persist a queued execution for ``ActionWorkerPool`` and return at once."""
+        if client_request_id is None:
+            return self._enqueue(action_name, submitter, input_payload, version, input_instance_locators)
+        return self._deduplicator.run(
+            action_name,
+            client_request_id,
+            lambda: self._enqueue(
+                action_name, submitter, input_payload, version, input_instance_locators, client_request_id
+            ),
+        )
+
+    def _enqueue(
+        self,
+        action_name: str,
+        submitter: str,
+        input_payload: Dict[str, Any],
+        version: int | None,
+        input_instance_locators: Dict[str, Dict[str, Any]] | None,
+        client_request_id: str | None = None,
     ) -> ActionExecution:
         definition = self._repository.get_action(action_name, version)
         if definition is None:
-            raise ValueError("Action definition not found")
+            raise ActionDefinitionNotFoundError("Action definition not found")
+        journal = self._open_journal(definition, submitter, input_payload)
+        journal.execution.action_version = definition.version
+        journal.execution.input_instances = input_instance_locators or {}
+        journal.execution.client_request_id = client_request_id
+        journal.execution.queued_for_worker = True
+        try:
+            journal.flush(self._repository)
+        except DuplicateClientRequestError as exc:
+            return exc.existing
+        return journal.execution
+
+    def run_queued(self, execution: ActionExecution) -> ActionExecution:
+        """Run an execution claimed from the queue; failures end up on the execution."""
+        journal = ExecutionJournal(execution)
+        try:
+            definition = self._repository.get_action(execution.action_name, execution.action_version)
+            if definition is None:
+                raise ActionDefinitionNotFoundError("Action definition not found")
+            run = self._prepare(definition, execution, execution.input_instances or {})
+        except Exception as exc:  # noqa: BLE001
+            self._reject(journal, exc)
+            journal.flush(self._repository)
+            return execution
+        return run(journal)
+
+    @staticmethod
+    def _reject(journal: ExecutionJournal, exc: Exception) -> None:
+        """Mark an execution whose inputs failed validation as failed before anything ran."""
+        execution = journal.execution
+        execution.status = ActionStatus.failed
+        execution.error = str(exc)
+        execution.finished_at = now_utc()
+        journal.touch()
+        journal.log(
+            "execution_failed",
+            {
+                "failed_stage": "validating",
+                "error_code": "E_ACTION_EXECUTION",
+                "retryable": False,
+                "redacted_context": _redact_payload(execution.input_payload),
+                "message": str(exc),
+            },
+        )
+        journal.log("finished", {"status": execution.status.value})
 
-        execution = self.submit(definition=definition, submitter=submitter, input_payload=input_payload)
-        resolved_instances = self._resolve_input_instances(input_instance_locators or {})
+    def _prepare(
+        self,
+        definition: ActionDefinition,
+        execution: ActionExecution,
+        input_instance_locators: Dict[str, Dict[str, Any]],
+    ) -> Callable[[ExecutionJournal], ActionExecution]:
+        """Resolve inputs and the function; return the call that executes the attempt."""
+        resolved_instances = self._resolve_input_instances(input_instance_locators)
         self._validate_target_constraints(definition, resolved_instances)
+        call = self._function_call(definition)
+        return lambda journal: self._execute_with_result(
+            execution=execution,
+            definition=definition,
+            result_factory=lambda: call(execution, resolved_instances),
+            input_instances=resolved_instances,
+            journal=journal,
+        )
+
+    def _function_call(
+        self,
+        definition: ActionDefinition,
+    ) -> Callable[[ActionExecution, Dict[str, Any]], Dict[str, Any]]:
+        """Resolve the action's function once; the returned call runs it for one execution."""
         if definition.execution_mode == ActionExecutionMode.sandbox:
             # Function versioning is independent from Action definition versioning.
             # Resolve latest (or repository default policy) by function name.
             function_definition = self._repository.get_function(definition.function_name)
             if function_definition is None:
                 raise ValueError(f"Function definition '{definition.function_name}' is not found")
-            return self.execute_in_sandbox(
-                execution=execution,
-                definition=definition,
-                function_definition=function_definition,
-                input_instances=resolved_instances,
+            if function_definition.runtime != "python":
+                raise ValueError(f"Unsupported sandbox runtime: {function_definition.runtime}")
+            return lambda execution, input_instances: self._function_runtime.execute_in_sandbox(
+                implementation_code=function_definition.code_ref,
+                function_name=function_definition.name,
+                input_instances=input_instances,
+                params=execution.input_payload,
             )
 
         function = self._runner.resolve(definition.function_name)
         if function is None:
             raise ValueError(f"Function '{definition.function_name}' is not registered")
-        return self.execute(
-            execution=execution,
-            definition=definition,
-            function=function,
-            input_instances=resolved_instances,
+        return lambda execution, input_instances: self._runner.execute(
+            function, input_instances, params=execution.input_payload
         )
 
     def execute_in_sandbox(
@@ -215,6 +488,7 @@ class ActionService:
         function_definition: FunctionDefinition,
         input_instances: Dict[str, Any],
         side_effects: Optional[List[SideEffect]] = None,
+        journal: ExecutionJournal | None = None,
     ) -> ActionExecution:
         if function_definition.runtime != "python":
             raise ValueError(f"Unsupported sandbox runtime: {function_definition.runtime}")
@@ -229,6 +503,7 @@ class ActionService:
             ),
             input_instances=input_instances,
             side_effects=side_effects,
+            journal=journal,
         )
 
     def _resolve_input_instances(
@@ -238,12 +513,25 @@ class ActionService:
         """Resolve user-provided input instance locators to graph instances.
 
         The payload shape is: {alias: {object_type, primary_key, version?}}.
+        All entity inputs and relation endpoints are fetched with one batch
+        ``get_objects`` call.
         """
-        resolved: Dict[str, Any] = {}
+        parsed, fetch = self._parse_input_locators(input_instance_locators)
+        fetched = self._apply_engine.get_objects(fetch) if fetch else []
+        return self._assemble_input_instances(parsed, iter(fetched))
+
+    def _parse_input_locators(
+        self,
+        input_instance_locators: Dict[str, Dict[str, Any]],
+    ) -> tuple[list[tuple[str, Any]], list[ObjectLocator]]:
+        """Parse locators into ``(alias, locator)`` pairs plus the objects to fetch."""
+        parsed: list[tuple[str, Any]] = []
+        fetch: list[ObjectLocator] = []
         for alias, locator in input_instance_locators.items():
             if "link_type" in locator:
-                relation_instance = self._resolve_relation_instance(alias, locator)
-                resolved[alias] = relation_instance
+                relation = self._parse_relation_locator(alias, locator)
+                parsed.append((alias, relation))
+                fetch.extend((relation.from_locator, relation.to_locator))
                 continue
             object_type = locator.get("object_type")
             primary_key = locator.get("primary_key")
@@ -251,13 +539,29 @@ class ActionService:
                 raise ValueError(f"Invalid input instance locator for '{alias}'")
             version = locator.get("version")
             object_locator = ObjectLocator(object_type=object_type, primary_key=primary_key, version=version)
-            instance = self._apply_engine.get_object(object_locator)
+            parsed.append((alias, object_locator))
+            fetch.append(object_locator)
+        return parsed, fetch
+
+    @staticmethod
+    def _assemble_input_instances(parsed: list[tuple[str, Any]], fetched: Iterator[Any]) -> Dict[str, Any]:
+        """Pair parsed locators with fetched objects, in ``_parse_input_locators`` order."""
+        resolved: Dict[str, Any] = {}
+        for alias, item in parsed:
+            if isinstance(item, RelationInstance):
+                if next(fetched) is None:
+                    raise ValueError(f"Input relation from-endpoint not found for '{alias}'")
+                if next(fetched) is None:
+                    raise ValueError(f"Input relation to-endpoint not found for '{alias}'")
+                resolved[alias] = item
+                continue
+            instance = next(fetched)
             if instance is None:
                 raise ValueError(f"Input instance not found for '{alias}'")
             resolved[alias] = instance
         return resolved
 
-    def _resolve_relation_instance(self, alias: str, locator: Dict[str, Any]) -> RelationInstance:
+    def _parse_relation_locator(self, alias: str, locator: Dict[str, Any]) -> RelationInstance:
         link_type = locator.get("link_type")
         from_endpoint = locator.get("from")
         to_endpoint = locator.get("to")
@@ -268,16 +572,6 @@ class ActionService:
 
         from_locator = self._parse_endpoint_locator(alias, "from", from_endpoint)
         to_locator = self._parse_endpoint_locator(alias, "to", to_endpoint)
-
-        try:
-            self._apply_engine.get_object(from_locator)
-        except Exception as exc:  # noqa: BLE001
-            raise ValueError(f"Input relation from-endpoint not found for '{alias}'") from exc
-        try:
-            self._apply_engine.get_object(to_locator)
-        except Exception as exc:  # noqa: BLE001
-            raise ValueError(f"Input relation to-endpoint not found for '{alias}'") from exc
-
         return RelationInstance(link_type=link_type, from_locator=from_locator, to_locator=to_locator)
 
     @staticmethod
@@ -331,6 +625,7 @@ class ActionService:
         function: Callable[..., Any],
         input_instances: Dict[str, Any],
         side_effects: Optional[List[SideEffect]] = None,
+        journal: ExecutionJournal | None = None,
     ) -> ActionExecution:
         """Execute one action attempt end-to-end and persist lifecycle logs."""
         return self._execute_with_result(
@@ -339,6 +634,7 @@ class ActionService:
             result_factory=lambda: self._runner.execute(function, input_instances, params=execution.input_payload),
             input_instances=input_instances,
             side_effects=side_effects,
+            journal=journal,
         )
 
     def _execute_with_result(
@@ -348,165 +644,170 @@ class ActionService:
         result_factory: Callable[[], Dict[str, Any]],
         input_instances: Dict[str, Any],
         side_effects: Optional[List[SideEffect]] = None,
+        journal: ExecutionJournal | None = None,
     ) -> ActionExecution:
-        execution.status = ActionStatus.validating
-        execution.started_at = now_utc()
-        self._repository.update_execution(execution)
-        self._repository.add_log(
-            ActionLog(
-                execution_id=execution.execution_id,
-                event_type="execution_started",
-                payload={},
-                created_at=now_utc(),
-            )
-        )
-        completed_steps = []
+        """Run one attempt, journaling lifecycle writes between two durable points.
+
+        The journal is flushed right before the edits reach the instance store
+        (so the pending action state exists for reconciliation) and once after
+        the terminal status; every log entry is kept, only the commits merge.
+        """
+        journal = journal or ExecutionJournal(execution)
+        self._begin_attempt(execution, definition, journal)
+        completed_steps: List[Any] = []
         action_state: ActionState | None = None
-        current_stage = "validating"
+        current_stage = "executing"
         try:
             # 1) Function execution stage
-            current_stage = "executing"
-            execution.status = ActionStatus.executing
-            self._repository.update_execution(execution)
-            self._repository.add_log(
-                ActionLog(
-                    execution_id=execution.execution_id,
-                    event_type="function_started",
-                    payload={"function_name": definition.function_name},
-                    created_at=now_utc(),
-                )
-            )
             result = result_factory()
-            self._repository.add_log(
-                ActionLog(
-                    execution_id=execution.execution_id,
-                    event_type="function_finished",
-                    payload={"function_name": definition.function_name},
-                    created_at=now_utc(),
-                )
-            )
             # 2) Persist captured edits to instance store
             current_stage = "applying"
-            execution.status = ActionStatus.applying
-            self._repository.update_execution(execution)
-            execution.output_payload = {"result": result["result"]}
-            execution.ontology_edit = result["edits"]
-            intent_payload = {
-                "edits": edit_to_dict(result["edits"]),
-                "side_effects": [
-                    {"effect_type": effect.effect_type, "payload": effect.payload} for effect in ((side_effects or []) if self._feature_flags.side_effects_enabled else [])
-                ],
-            }
-            action_state = ActionState(
-                action_id=execution.execution_id,
-                execution_id=execution.execution_id,
-                status=ActionStateStatus.pending,
-                intent_payload=intent_payload,
-                created_at=now_utc(),
-                updated_at=now_utc(),
-            )
-            self._repository.add_action_state(action_state)
-            self._repository.add_log(
-                ActionLog(
-                    execution_id=execution.execution_id,
-                    event_type="apply_started",
-                    payload={"edit_count": len(result["edits"].edits)},
-                    created_at=now_utc(),
-                )
-            )
+            action_state = self._stage_apply(execution, definition, result, side_effects, journal)
+            journal.flush(self._repository)
             apply_result = self._apply_engine.apply(result["edits"], action_id=execution.execution_id)
-            if not apply_result.applied:
-                self._repository.add_log(
-                    ActionLog(
-                        execution_id=execution.execution_id,
-                        event_type="apply_failed",
-                        payload={
-                            "failed_stage": "applying",
-                            "error_code": "E_APPLY_INTERNAL",
-                            "retryable": False,
-                            "redacted_context": _redact_payload(execution.input_payload),
-                            "message": apply_result.error or "Apply failed",
-                        },
-                        created_at=now_utc(),
-                    )
-                )
-                raise ValueError(apply_result.error or "Apply failed")
-            self._repository.add_log(
-                ActionLog(
-                    execution_id=execution.execution_id,
-                    event_type="apply_succeeded",
-                    payload={"edit_count": len(result["edits"].edits)},
-                    created_at=now_utc(),
-                )
-            )
-            outbox_entries = []
-            if self._feature_flags.side_effects_enabled and side_effects:
-                for effect in side_effects:
-                    outbox_entries.append(
-                        SideEffectOutbox(
-                            outbox_id=str(uuid.uuid4()),
-                            execution_id=execution.execution_id,
-                            effect_type=effect.effect_type,
-                            payload=effect.payload,
-                        )
-                    )
-            if action_state:
-                action_state.status = ActionStateStatus.succeeded
-                action_state.updated_at = now_utc()
-                self._repository.confirm_action_state(action_state, outbox_entries)
-            if self._feature_flags.saga_enabled:
-                for step in definition.saga_steps:
-                    completed_steps.append(step)
-                    try:
-                        step.action(input_instances, execution.input_payload)
-                    except Exception:
-                        raise
             # 3) Mark terminal success after apply + optional saga path
-            execution.status = ActionStatus.succeeded
+            self._complete_apply(
+                execution, definition, apply_result, action_state, input_instances, side_effects, completed_steps, journal
+            )
         except Exception as exc:  # noqa: BLE001
-            execution.status = ActionStatus.failed
-            execution.error = str(exc)
-            if action_state:
-                action_state.status = ActionStateStatus.failed
-                action_state.updated_at = now_utc()
-                self._repository.update_action_state(action_state)
-            if self._feature_flags.saga_enabled:
-                for step in reversed(completed_steps):
-                    if step.compensation:
-                        step.compensation(input_instances, execution.input_payload)
-            self._repository.add_log(
-                ActionLog(
-                    execution_id=execution.execution_id,
-                    event_type="execution_failed",
-                    payload={
-                        "failed_stage": current_stage,
-                        "error_code": "E_ACTION_EXECUTION",
-                        "retryable": False,
-                        "redacted_context": _redact_payload(execution.input_payload),
-                        "message": str(exc),
-                    },
-                    created_at=now_utc(),
-                )
+            self._record_failure(
+                execution, definition, current_stage, exc, action_state, input_instances, completed_steps, journal
             )
-            if self._feature_flags.revert_enabled and definition.compensation_fn:
-                compensation = definition.compensation_fn(input_instances, execution.input_payload)
-                execution.compensation_edit = compensation
-                compensation_result = self._apply_engine.apply(compensation, action_id=execution.execution_id)
-                if compensation_result.applied:
-                    execution.status = ActionStatus.reverted
         finally:
-            execution.finished_at = now_utc()
-            self._repository.update_execution(execution)
-            self._repository.add_log(
-                ActionLog(
-                    execution_id=execution.execution_id,
-                    event_type="finished",
-                    payload={"status": execution.status.value},
-                    created_at=now_utc(),
-                )
-            )
+            self._finish_attempt(execution, journal)
+            journal.flush(self._repository)
         return execution
 
+    @staticmethod
+    def _begin_attempt(execution: ActionExecution, definition: ActionDefinition, journal: ExecutionJournal) -> None:
+        execution.status = ActionStatus.validating
+        execution.started_at = now_utc()
+        journal.touch()
+        journal.log("execution_started", {})
+        execution.status = ActionStatus.executing
+        journal.log("function_started", {"function_name": definition.function_name})
+
+    def _stage_apply(
+        self,
+        execution: ActionExecution,
+        definition: ActionDefinition,
+        result: Dict[str, Any],
+        side_effects: Optional[List[SideEffect]],
+        journal: ExecutionJournal,
+    ) -> ActionState:
+        """Record the function result and the pending action state ahead of the apply."""
+        journal.log("function_finished", {"function_name": definition.function_name})
+        execution.status = ActionStatus.applying
+        execution.output_payload = {"result": result["result"]}
+        execution.ontology_edit = result["edits"]
+        intent_payload = {
+            "edits": edit_to_dict(result["edits"]),
+            "side_effects": [
+                {"effect_type": effect.effect_type, "payload": effect.payload} for effect in ((side_effects or []) if self._feature_flags.side_effects_enabled else [])
+            ],
+        }
+        action_state = ActionState(
+            action_id=execution.execution_id,
+            execution_id=execution.execution_id,
+            status=ActionStateStatus.pending,
+            intent_payload=intent_payload,
+            created_at=now_utc(),
+            updated_at=now_utc(),
+        )
+        journal.add_state(action_state)
+        journal.log("apply_started", {"edit_count": len(result["edits"].edits)})
+        return action_state
+
+    def _complete_apply(
+        self,
+        execution: ActionExecution,
+        definition: ActionDefinition,
+        apply_result: Any,
+        action_state: ActionState,
+        input_instances: Dict[str, Any],
+        side_effects: Optional[List[SideEffect]],
+        completed_steps: List[Any],
+        journal: ExecutionJournal,
+    ) -> None:
+        """Confirm an apply result, run saga steps and mark success; raises on failure."""
+        edit_count = len(execution.ontology_edit.edits) if execution.ontology_edit else 0
+        if not apply_result.applied:
+            journal.log(
+                "apply_failed",
+                {
+                    "failed_stage": "applying",
+                    "error_code": "E_APPLY_INTERNAL",
+                    "retryable": False,
+                    "redacted_context": _redact_payload(execution.input_payload),
+                    "message": apply_result.error or "Apply failed",
+                },
+            )
+            raise ValueError(apply_result.error or "Apply failed")
+        journal.log("apply_succeeded", {"edit_count": edit_count})
+        outbox_entries = []
+        if self._feature_flags.side_effects_enabled and side_effects:
+            for effect in side_effects:
+                outbox_entries.append(
+                    SideEffectOutbox(
+                        outbox_id=str(uuid.uuid4()),
+                        execution_id=execution.execution_id,
+                        effect_type=effect.effect_type,
+                        payload=effect.payload,
+                    )
+                )
+        action_state.status = ActionStateStatus.succeeded
+        action_state.updated_at = now_utc()
+        journal.update_state(action_state, outbox_entries)
+        if self._feature_flags.saga_enabled:
+            for step in definition.saga_steps:
+                completed_steps.append(step)
+                step.action(input_instances, execution.input_payload)
+        execution.status = ActionStatus.succeeded
+
+    def _record_failure(
+        self,
+        execution: ActionExecution,
+        definition: ActionDefinition,
+        stage: str,
+        exc: Exception,
+        action_state: ActionState | None,
+        input_instances: Dict[str, Any],
+        completed_steps: List[Any],
+        journal: ExecutionJournal,
+    ) -> None:
+        execution.status = ActionStatus.failed
+        execution.error = str(exc)
+        if action_state:
+            action_state.status = ActionStateStatus.failed
+            action_state.updated_at = now_utc()
+            journal.update_state(action_state)
+        if self._feature_flags.saga_enabled:
+            for step in reversed(completed_steps):
+                if step.compensation:
+                    step.compensation(input_instances, execution.input_payload)
+        journal.log(
+            "execution_failed",
+            {
+                "failed_stage": stage,
+                "error_code": "E_ACTION_EXECUTION",
+                "retryable": False,
+                "redacted_context": _redact_payload(execution.input_payload),
+                "message": str(exc),
+            },
+        )
+        if self._feature_flags.revert_enabled and definition.compensation_fn:
+            compensation = definition.compensation_fn(input_instances, execution.input_payload)
+            execution.compensation_edit = compensation
+            compensation_result = self._apply_engine.apply(compensation, action_id=execution.execution_id)
+            if compensation_result.applied:
+                execution.status = ActionStatus.reverted
+
+    @staticmethod
+    def _finish_attempt(execution: ActionExecution, journal: ExecutionJournal) -> None:
+        execution.finished_at = now_utc()
+        journal.touch()
+        journal.log("finished", {"status": execution.status.value})
+
     def revert(self, execution: ActionExecution) -> ActionExecution:
         if not self._feature_flags.revert_enabled:
             raise ValueError("Revert feature is disabled")
@@ -0,0 +1,147 @@
+"""Worker pool for asynchronously applied actions.
+
+``ActionService.enqueue`` persists a queued execution and returns at once;
+the pool's threads claim queued executions from the repository (oldest
+first) and run them with ``ActionService.run_queued``. Per-action limits cap
+how many executions of one action run at the same time: a saturated action
+is skipped while claiming, so its backlog never blocks other actions.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Mapping
+
+from .domain_models import ActionExecution, ActionStatus
+from .service import ActionService
+from ..storage.repository import ActionRepository
+
+
+TERMINAL_STATUSES = (ActionStatus.succeeded, ActionStatus.failed, ActionStatus.reverted)
+
+
+class ActionWorkerPool:
+    """Bounded pool of worker threads draining the queued-execution backlog."""
+
+    def __init__(
+        self,
+        service: ActionService,
+        repository: ActionRepository,
+        workers: int = 4,
+        action_limits: Mapping[str, int] | None = None,
+        default_action_limit: int | None = None,
+        poll_interval: float = 0.5,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        limits = dict(action_limits or {})
+        if any(limit < 1 for limit in limits.values()) or (default_action_limit is not None and default_action_limit < 1):
+            raise ValueError("Action concurrency limits must be at least 1")
+        self._service = service
+        self._repository = repository
+        self._workers = workers
+        self._action_limits = limits
+        self._default_action_limit = default_action_limit
+        self._poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._running: Dict[str, int] = {}
+        self._claimed = 0
+        self._completed = 0
+        self._crashed = 0
+        self._threads: list[threading.Thread] = []
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._run_loop, name=f"action-worker-{index}", daemon=True)
+            for index in range(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stop_event.set()
+        self.wake()
+        for thread in self._threads:
+            thread.join(timeout=timeout_seconds)
+        self._threads = []
+
+    def wake(self) -> None:
+        """Tell idle workers that new executions were queued."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def run_once(self) -> bool:
+        """Claim and run one eligible execution in the calling thread."""
+        execution = self._claim()
+        if execution is None:
+            return False
+        self._run(execution)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "workers": self._workers,
+                "running": dict(self._running),
+                "claimed": self._claimed,
+                "completed": self._completed,
+                "crashed": self._crashed,
+            }
+
+    def _limit(self, action_name: str) -> int | None:
+        return self._action_limits.get(action_name, self._default_action_limit)
+
+    def _claim(self) -> ActionExecution | None:
+        # Claims are serialized so two workers never both take the last free
+        # slot of an action; the repository claim itself is atomic across
+        # processes.
+        with self._condition:
+            saturated = [
+                name
+                for name, count in self._running.items()
+                if (limit := self._limit(name)) is not None and count >= limit
+            ]
+            claimed = self._repository.claim_queued_executions(limit=1, exclude_action_names=saturated)
+            if not claimed:
+                return None
+            execution = claimed[0]
+            self._running[execution.action_name] = self._running.get(execution.action_name, 0) + 1
+            self._claimed += 1
+            return execution
+
+    def _run(self, execution: ActionExecution) -> None:
+        crashed = False
+        try:
+            self._service.run_queued(execution)
+        except Exception:  # noqa: BLE001
+            # Only repository failures get here; the repair job picks up the
+            # execution left in a non-terminal status.
+            crashed = True
+        finally:
+            with self._condition:
+                remaining = self._running[execution.action_name] - 1
+                if remaining:
+                    self._running[execution.action_name] = remaining
+                else:
+                    del self._running[execution.action_name]
+                if crashed:
+                    self._crashed += 1
+                else:
+                    self._completed += 1
+                self._condition.notify_all()
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            if self.run_once():
+                continue
+            with self._condition:
+                if not self._stop_event.is_set():
+                    self._condition.wait(self._poll_interval)
@@ -0,0 +1,148 @@
+"""Read-through cache for action and function definitions."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from ..api.domain_models import ActionDefinition, FunctionDefinition
+from .repository import ActionRepository
+
+DefinitionT = TypeVar("DefinitionT", ActionDefinition, FunctionDefinition)
+
+
+@dataclass
+class DefinitionCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class _DefinitionCache(Generic[DefinitionT]):
+    """Pinned ``(name, version)`` entries plus TTL-bound "latest" entries."""
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float], stats: DefinitionCacheStats) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._stats = stats
+        self._versions: Dict[Tuple[str, int], DefinitionT] = {}
+        self._latest: Dict[str, Tuple[float, DefinitionT]] = {}
+        self._write_seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._versions) + len(self._latest)
+
+    def get(
+        self,
+        name: str,
+        version: int | None,
+        load: Callable[[str, int | None], Optional[DefinitionT]],
+    ) -> Optional[DefinitionT]:
+        with self._lock:
+            seen_seq = self._write_seq
+            if version is not None:
+                cached = self._versions.get((name, version))
+            else:
+                entry = self._latest.get(name)
+                cached = None
+                if entry is not None:
+                    if entry[0] > self._clock():
+                        cached = entry[1]
+                    else:
+                        del self._latest[name]
+                        self._stats.expirations += 1
+            if cached is not None:
+                self._stats.hits += 1
+                return cached
+            self._stats.misses += 1
+        definition = load(name, version)
+        if definition is None:
+            # Misses are not cached: another process may register the definition.
+            return None
+        with self._lock:
+            # A definition registered while loading may have superseded the result.
+            if self._write_seq == seen_seq:
+                self._versions[(name, definition.version)] = definition
+                if version is None:
+                    self._latest[name] = (self._clock() + self._ttl_seconds, definition)
+        return definition
+
+    def invalidate(self, name: str, version: int) -> None:
+        with self._lock:
+            self._write_seq += 1
+            self._versions.pop((name, version), None)
+            self._latest.pop(name, None)
+            self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._write_seq += 1
+            self._versions.clear()
+            self._latest.clear()
+
+
+class CachingActionRepository:
+    """ActionRepository wrapper caching definition lookups.
+
+    Definitions are immutable per version, so ``(name, version)`` lookups are
+    cached for the lifetime of the wrapper; "latest version" lookups expire
+    after ``ttl_seconds`` so versions registered by other processes become
+    visible. ``add_action``/``add_function`` invalidate the name immediately.
+    Every other repository call is delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        backend: ActionRepository,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._stats = DefinitionCacheStats()
+        self._actions: _DefinitionCache[ActionDefinition] = _DefinitionCache(ttl_seconds, clock, self._stats)
+        self._functions: _DefinitionCache[FunctionDefinition] = _DefinitionCache(ttl_seconds, clock, self._stats)
+
+    @property
+    def backend(self) -> ActionRepository:
+        return self._backend
+
+    def stats(self) -> Dict[str, Any]:
+        counters = self._stats.as_dict()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "size": len(self._actions) + len(self._functions),
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        self._actions.clear()
+        self._functions.clear()
+
+    def add_action(self, definition: ActionDefinition) -> None:
+        try:
+            self._backend.add_action(definition)
+        finally:
+            self._actions.invalidate(definition.name, definition.version)
+
+    def add_function(self, definition: FunctionDefinition) -> None:
+        try:
+            self._backend.add_function(definition)
+        finally:
+            self._functions.invalidate(definition.name, definition.version)
+
+    def get_action(self, name: str, version: int | None = None) -> ActionDefinition | None:
+        return self._actions.get(name, version, self._backend.get_action)
+
+    def get_function(self, name: str, version: int | None = None) -> FunctionDefinition | None:
+        return self._functions.get(name, version, self._backend.get_function)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._backend, item)
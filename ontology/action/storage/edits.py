@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectLocator:
     """Stable locator for one ontology object (type + key + optional version)."""
     object_type: str
@@ -12,12 +12,16 @@ class ObjectLocator:
     version: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ObjectInstance:
-    """In-memory object instance snapshot."""
+    """Immutable object instance snapshot.
+
+    Stores may share one snapshot between readers, so ``properties`` can be a
+    read-only mapping; use ``dict(instance.properties)`` for a mutable copy.
+    """
     object_type: str
     primary_key: str
-    properties: Dict[str, Any]
+    properties: Mapping[str, Any]
     version: Optional[int] = None
 
     def locator(self) -> ObjectLocator:
@@ -74,10 +74,15 @@ class InMemoryGraphStore(GraphStore):
             raise ValueError("Object not found")
         if locator.version is not None and instance.version != locator.version:
             raise ValueError("Version conflict")
-        instance.properties.update(properties)
+        merged = {**instance.properties, **properties}
         if action_id:
-            instance.properties["last_modified_by_action_id"] = action_id
-        instance.version = (instance.version or 0) + 1
+            merged["last_modified_by_action_id"] = action_id
+        self.objects[key] = ObjectInstance(
+            object_type=instance.object_type,
+            primary_key=instance.primary_key,
+            properties=merged,
+            version=(instance.version or 0) + 1,
+        )
 
     def add_link(self, link_type: str, from_locator: ObjectLocator, to_locator: ObjectLocator) -> None:
         self.links.add(
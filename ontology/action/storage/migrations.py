@@ -0,0 +1,66 @@
+"""In-place schema upgrades for existing action control-plane databases.
+
+``Base.metadata.create_all`` creates missing tables but never alters an
+existing one. ``upgrade_schema`` adds the nullable columns and the indexes
+that newer releases declared on ``action_executions``, so a deployed
+database keeps working after an upgrade. The equivalent MySQL DDL is listed
+in ``UPGRADE_DDL`` for operators who apply schema changes by hand.
+
+Executions enqueued before ``queued_for_worker`` existed are the queued rows
+with an ``action_version``; the backfill marks them so workers still claim
+them, while rejected synchronous submissions left ``queued`` stay unclaimed.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
+
+from .models import ActionExecutionModel
+
+QUEUED_FOR_WORKER_BACKFILL = (
+    "UPDATE action_executions SET queued_for_worker = 1 WHERE status = 'queued' AND action_version IS NOT NULL"
+)
+
+UPGRADE_DDL = (
+    "ALTER TABLE action_executions ADD COLUMN action_version INTEGER NULL",
+    "ALTER TABLE action_executions ADD COLUMN input_instances JSON NULL",
+    "ALTER TABLE action_executions ADD COLUMN client_request_id VARCHAR(255) NULL",
+    "ALTER TABLE action_executions ADD COLUMN queued_for_worker BOOLEAN NULL",
+    QUEUED_FOR_WORKER_BACKFILL,
+    "CREATE UNIQUE INDEX ux_action_executions_client_request ON action_executions (action_name, client_request_id)",
+)
+
+
+def upgrade_schema(engine: Engine) -> list[str]:
+    """Add missing nullable columns and indexes to ``action_executions``; return the DDL run."""
+    table = ActionExecutionModel.__table__
+    inspector = inspect(engine)
+    if not inspector.has_table(table.name):
+        return []
+    existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+    existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+    statements: list[str] = []
+    with engine.begin() as connection:
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            if not column.nullable:
+                raise ValueError(f"Cannot add NOT NULL column {table.name}.{column.name} in place")
+            statement = (
+                f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                f"{column.type.compile(dialect=engine.dialect)}"
+            )
+            connection.exec_driver_sql(statement)
+            statements.append(statement)
+            if column.name == "queued_for_worker":
+                connection.exec_driver_sql(QUEUED_FOR_WORKER_BACKFILL)
+                statements.append(QUEUED_FOR_WORKER_BACKFILL)
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            statement = str(CreateIndex(index).compile(dialect=engine.dialect))
+            connection.exec_driver_sql(statement)
+            statements.append(statement)
+    return statements
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -15,6 +15,7 @@ class ActionExecutionModel(Base):
         Index("ix_action_executions_action_name", "action_name"),
         Index("ix_action_executions_submitter", "submitter"),
         Index("ix_action_executions_submitted_at", "submitted_at"),
+        Index("ux_action_executions_client_request", "action_name", "client_request_id", unique=True),
     )
 
     id = Column(String(64), primary_key=True)
@@ -29,6 +30,10 @@ class ActionExecutionModel(Base):
     error = Column(Text)
     started_at = Column(DateTime)
     finished_at = Column(DateTime)
+    action_version = Column(Integer)
+    input_instances = Column(JSON)
+    client_request_id = Column(String(255))
+    queued_for_worker = Column(Boolean, default=False)
 
 
 class ActionDefinitionModel(Base):
@@ -3,7 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from collections.abc import Sequence
 from datetime import datetime
-from typing import Dict, List, Protocol, Tuple
+import threading
+from typing import Any, Dict, List, Protocol, Tuple
 
 from ..utils import now_utc
 
@@ -21,6 +22,82 @@ from ..api.domain_models import (
 )
 
 
+class DuplicateClientRequestError(ValueError):
+    """Another execution already claimed the ``(action_name, client_request_id)`` pair."""
+
+    def __init__(self, existing: ActionExecution) -> None:
+        super().__init__(f"client_request_id {existing.client_request_id!r} already used by {existing.execution_id}")
+        self.existing = existing
+
+
+@dataclass
+class ExecutionJournal:
+    """Buffered lifecycle writes of one execution, persisted as one unit of work.
+
+    ``ActionService`` records logs, execution transitions and action-state
+    changes here and flushes them with ``ActionRepository.flush_journal`` at
+    its durable points, instead of committing every write on its own.
+    """
+
+    execution: ActionExecution
+    execution_persisted: bool = True
+    execution_dirty: bool = False
+    logs: List[ActionLog] = field(default_factory=list)
+    states: Dict[str, ActionState] = field(default_factory=dict)
+    new_state_ids: set[str] = field(default_factory=set)
+    outbox: List[SideEffectOutbox] = field(default_factory=list)
+
+    def log(self, event_type: str, payload: Dict[str, Any]) -> None:
+        self.logs.append(
+            ActionLog(
+                execution_id=self.execution.execution_id,
+                event_type=event_type,
+                payload=payload,
+                created_at=now_utc(),
+            )
+        )
+
+    def touch(self) -> None:
+        """Mark the execution row as changed since the last flush."""
+        self.execution_dirty = True
+
+    def add_state(self, state: ActionState) -> None:
+        self.states[state.action_id] = state
+        self.new_state_ids.add(state.action_id)
+
+    def update_state(self, state: ActionState, outbox_entries: Sequence[SideEffectOutbox] = ()) -> None:
+        self.states[state.action_id] = state
+        self.outbox.extend(outbox_entries)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.execution_dirty or self.logs or self.states or self.outbox)
+
+    def flush(self, repository: "ActionRepository") -> None:
+        if not self.pending:
+            return
+        repository.flush_journal(self)
+        self._mark_flushed()
+
+    @staticmethod
+    def flush_all(journals: Sequence["ExecutionJournal"], repository: "ActionRepository") -> None:
+        """Flush several journals in one repository transaction."""
+        pending = [journal for journal in journals if journal.pending]
+        if not pending:
+            return
+        repository.flush_journals(pending)
+        for journal in pending:
+            journal._mark_flushed()
+
+    def _mark_flushed(self) -> None:
+        self.execution_persisted = True
+        self.execution_dirty = False
+        self.logs = []
+        self.states = {}
+        self.new_state_ids = set()
+        self.outbox = []
+
+
 class ActionRepository(Protocol):
     def add_action(self, definition: ActionDefinition) -> None: ...
 
@@ -34,6 +111,15 @@ class ActionRepository(Protocol):
 
     def add_execution(self, execution: ActionExecution) -> None: ...
 
+    def find_execution_by_client_request_id(self, action_name: str, client_request_id: str) -> ActionExecution | None: ...
+
+    # Atomically moves up to ``limit`` queued executions (oldest first) to validating.
+    def claim_queued_executions(
+        self,
+        limit: int = 1,
+        exclude_action_names: Sequence[str] = (),
+    ) -> List[ActionExecution]: ...
+
     def update_execution(self, execution: ActionExecution) -> None: ...
 
     def add_log(self, log: ActionLog) -> None: ...
@@ -60,6 +146,11 @@ class ActionRepository(Protocol):
 
     def list_stale_action_states(self, cutoff_seconds: int) -> List[ActionState]: ...
 
+    # Persists every buffered write of the journal atomically.
+    def flush_journal(self, journal: ExecutionJournal) -> None: ...
+
+    def flush_journals(self, journals: Sequence[ExecutionJournal]) -> None: ...
+
     # Control-plane helper for repair jobs.
     def list_stale_executions(
         self,
@@ -78,6 +169,8 @@ class InMemoryActionRepository:
     notification_logs: List[NotificationLog] = field(default_factory=list)
     outbox: Dict[str, SideEffectOutbox] = field(default_factory=dict)
     action_states: Dict[str, ActionState] = field(default_factory=dict)
+    client_requests: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    _claim_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def add_action(self, definition: ActionDefinition) -> None:
         self.actions[(definition.name, definition.version)] = definition
@@ -103,10 +196,40 @@ class InMemoryActionRepository:
 
     def add_execution(self, execution: ActionExecution) -> None:
         self.executions[execution.execution_id] = execution
+        self._index_client_request(execution)
 
     def get_execution(self, execution_id: str) -> ActionExecution | None:
         return self.executions.get(execution_id)
 
+    def find_execution_by_client_request_id(self, action_name: str, client_request_id: str) -> ActionExecution | None:
+        execution_id = self.client_requests.get((action_name, client_request_id))
+        return self.executions.get(execution_id) if execution_id is not None else None
+
+    def _index_client_request(self, execution: ActionExecution) -> None:
+        if execution.client_request_id is not None:
+            self.client_requests.setdefault((execution.action_name, execution.client_request_id), execution.execution_id)
+
+    def claim_queued_executions(
+        self,
+        limit: int = 1,
+        exclude_action_names: Sequence[str] = (),
+    ) -> List[ActionExecution]:
+        with self._claim_lock:
+            queued = sorted(
+                (
+                    execution
+                    for execution in self.executions.values()
+                    if execution.status == ActionStatus.queued
+                    and execution.queued_for_worker
+                    and execution.action_name not in exclude_action_names
+                ),
+                key=lambda item: item.submitted_at,
+            )[:limit]
+            for execution in queued:
+                execution.status = ActionStatus.validating
+                execution.started_at = now_utc()
+        return queued
+
     def update_execution(self, execution: ActionExecution) -> None:
         self.executions[execution.execution_id] = execution
 
@@ -153,6 +276,25 @@ class InMemoryActionRepository:
         for entry in outbox_entries:
             self.add_outbox(entry)
 
+    def flush_journal(self, journal: ExecutionJournal) -> None:
+        execution = journal.execution
+        if not journal.execution_persisted and execution.client_request_id is not None:
+            existing = self.find_execution_by_client_request_id(execution.action_name, execution.client_request_id)
+            if existing is not None and existing.execution_id != execution.execution_id:
+                raise DuplicateClientRequestError(existing)
+        if journal.execution_dirty or not journal.execution_persisted:
+            self.executions[journal.execution.execution_id] = journal.execution
+            self._index_client_request(journal.execution)
+        self.logs.extend(journal.logs)
+        for state in journal.states.values():
+            self.action_states[state.action_id] = state
+        for entry in journal.outbox:
+            self.add_outbox(entry)
+
+    def flush_journals(self, journals: Sequence[ExecutionJournal]) -> None:
+        for journal in journals:
+            self.flush_journal(journal)
+
     def list_stale_action_states(self, cutoff_seconds: int) -> List[ActionState]:
         cutoff = now_utc().timestamp() - cutoff_seconds
         return [
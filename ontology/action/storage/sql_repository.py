@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..utils import now_utc
@@ -24,6 +25,8 @@ from ..api.domain_models import (
     SideEffectOutbox,
 )
 from .edits import edit_to_dict
+from .migrations import upgrade_schema
+from .repository import DuplicateClientRequestError, ExecutionJournal
 from .models import (
     ActionExecutionModel,
     ActionDefinitionModel,
@@ -42,25 +45,11 @@ class SqlActionRepository:
     def __init__(self, database_url: str) -> None:
         self._engine = create_engine(database_url)
         Base.metadata.create_all(self._engine)
+        upgrade_schema(self._engine)
 
     def add_execution(self, execution: ActionExecution) -> None:
         with Session(self._engine) as session:
-            session.add(
-                ActionExecutionModel(
-                    id=execution.execution_id,
-                    action_name=execution.action_name,
-                    submitter=execution.submitter,
-                    status=execution.status.value,
-                    submitted_at=execution.submitted_at,
-                    input_payload=execution.input_payload,
-                    output_payload=execution.output_payload,
-                    ontology_edit=self._serialize_edit(execution.ontology_edit),
-                    compensation_edit=self._serialize_edit(execution.compensation_edit),
-                    error=execution.error,
-                    started_at=execution.started_at,
-                    finished_at=execution.finished_at,
-                )
-            )
+            session.add(self._execution_model(execution))
             session.commit()
 
     def get_execution(self, execution_id: str) -> ActionExecution | None:
@@ -68,20 +57,57 @@ class SqlActionRepository:
             row = session.get(ActionExecutionModel, execution_id)
         if row is None:
             return None
-        return ActionExecution(
-            execution_id=row.id,
-            action_name=row.action_name,
-            submitter=row.submitter,
-            status=ActionStatus(row.status),
-            submitted_at=row.submitted_at,
-            input_payload=row.input_payload,
-            output_payload=row.output_payload or {},
-            ontology_edit=None,
-            compensation_edit=None,
-            error=row.error,
-            started_at=row.started_at,
-            finished_at=row.finished_at,
-        )
+        return self._execution_from_row(row)
+
+    def find_execution_by_client_request_id(self, action_name: str, client_request_id: str) -> ActionExecution | None:
+        with Session(self._engine) as session:
+            row = session.execute(
+                select(ActionExecutionModel)
+                .where(
+                    ActionExecutionModel.action_name == action_name,
+                    ActionExecutionModel.client_request_id == client_request_id,
+                )
+                .order_by(ActionExecutionModel.submitted_at)
+                .limit(1)
+            ).scalar_one_or_none()
+        if row is None:
+            return None
+        return self._execution_from_row(row)
+
+    def claim_queued_executions(
+        self,
+        limit: int = 1,
+        exclude_action_names: Sequence[str] = (),
+    ) -> list[ActionExecution]:
+        with Session(self._engine) as session:
+            stmt = (
+                select(ActionExecutionModel)
+                .where(
+                    ActionExecutionModel.status == ActionStatus.queued.value,
+                    ActionExecutionModel.queued_for_worker.is_(True),
+                )
+                .order_by(ActionExecutionModel.submitted_at)
+                .limit(limit)
+            )
+            if exclude_action_names:
+                stmt = stmt.where(ActionExecutionModel.action_name.not_in(list(exclude_action_names)))
+            rows = session.execute(stmt).scalars().all()
+            claimed: list[ActionExecution] = []
+            for row in rows:
+                started_at = now_utc()
+                # Conditional update: a concurrent claimer that won the row sees rowcount 0.
+                update_stmt = (
+                    update(ActionExecutionModel)
+                    .where(ActionExecutionModel.id == row.id, ActionExecutionModel.status == ActionStatus.queued.value)
+                    .values(status=ActionStatus.validating.value, started_at=started_at)
+                )
+                if session.execute(update_stmt).rowcount:
+                    execution = self._execution_from_row(row)
+                    execution.status = ActionStatus.validating
+                    execution.started_at = started_at
+                    claimed.append(execution)
+            session.commit()
+        return claimed
 
     def add_action(self, definition: ActionDefinition) -> None:
         with Session(self._engine) as session:
@@ -175,32 +201,12 @@ class SqlActionRepository:
 
     def update_execution(self, execution: ActionExecution) -> None:
         with Session(self._engine) as session:
-            stmt = (
-                update(ActionExecutionModel)
-                .where(ActionExecutionModel.id == execution.execution_id)
-                .values(
-                    status=execution.status.value,
-                    output_payload=execution.output_payload,
-                    ontology_edit=self._serialize_edit(execution.ontology_edit),
-                    compensation_edit=self._serialize_edit(execution.compensation_edit),
-                    error=execution.error,
-                    started_at=execution.started_at,
-                    finished_at=execution.finished_at,
-                )
-            )
-            session.execute(stmt)
+            session.execute(self._execution_update(execution))
             session.commit()
 
     def add_log(self, log: ActionLog) -> None:
         with Session(self._engine) as session:
-            session.add(
-                ActionLogModel(
-                    execution_id=log.execution_id,
-                    event_type=log.event_type,
-                    payload=log.payload,
-                    created_at=log.created_at,
-                )
-            )
+            session.add(self._log_model(log))
             session.commit()
 
     def add_revert(self, revert: ActionRevert) -> None:
@@ -232,20 +238,7 @@ class SqlActionRepository:
 
     def add_outbox(self, entry: SideEffectOutbox) -> None:
         with Session(self._engine) as session:
-            session.add(
-                OutboxModel(
-                    id=entry.outbox_id,
-                    execution_id=entry.execution_id,
-                    effect_type=entry.effect_type,
-                    payload=entry.payload,
-                    status=entry.status,
-                    retry_count=entry.retry_count,
-                    max_retries=entry.max_retries,
-                    next_attempt_at=entry.next_attempt_at,
-                    created_at=entry.created_at,
-                    updated_at=entry.updated_at,
-                )
-            )
+            session.add(self._outbox_model(entry))
             session.commit()
 
     def update_outbox(self, entry: SideEffectOutbox) -> None:
@@ -302,30 +295,12 @@ class SqlActionRepository:
 
     def add_action_state(self, state: ActionState) -> None:
         with Session(self._engine) as session:
-            session.add(
-                ActionStateModel(
-                    id=state.action_id,
-                    execution_id=state.execution_id,
-                    status=state.status.value,
-                    intent_payload=state.intent_payload,
-                    created_at=state.created_at,
-                    updated_at=state.updated_at,
-                )
-            )
+            session.add(self._state_model(state))
             session.commit()
 
     def update_action_state(self, state: ActionState) -> None:
         with Session(self._engine) as session:
-            stmt = (
-                update(ActionStateModel)
-                .where(ActionStateModel.id == state.action_id)
-                .values(
-                    status=state.status.value,
-                    intent_payload=state.intent_payload,
-                    updated_at=state.updated_at,
-                )
-            )
-            session.execute(stmt)
+            session.execute(self._state_update(state))
             session.commit()
 
     def confirm_action_state(
@@ -334,33 +309,43 @@ class SqlActionRepository:
         outbox_entries: list[SideEffectOutbox],
     ) -> None:
         with Session(self._engine) as session:
-            stmt = (
-                update(ActionStateModel)
-                .where(ActionStateModel.id == state.action_id)
-                .values(
-                    status=state.status.value,
-                    intent_payload=state.intent_payload,
-                    updated_at=state.updated_at,
-                )
-            )
-            session.execute(stmt)
-            for entry in outbox_entries:
-                session.add(
-                    OutboxModel(
-                        id=entry.outbox_id,
-                        execution_id=entry.execution_id,
-                        effect_type=entry.effect_type,
-                        payload=entry.payload,
-                        status=entry.status,
-                        retry_count=entry.retry_count,
-                        max_retries=entry.max_retries,
-                        next_attempt_at=entry.next_attempt_at,
-                        created_at=entry.created_at,
-                        updated_at=entry.updated_at,
-                    )
-                )
+            session.execute(self._state_update(state))
+            session.add_all([self._outbox_model(entry) for entry in outbox_entries])
             session.commit()
 
+    def flush_journal(self, journal: ExecutionJournal) -> None:
+        """Write the journal's buffered execution, logs, states and outbox in one commit."""
+        self.flush_journals([journal])
+
+    def flush_journals(self, journals: Sequence[ExecutionJournal]) -> None:
+        """Write several journals in one commit (batch applies)."""
+        try:
+            with Session(self._engine) as session:
+                for journal in journals:
+                    if not journal.execution_persisted:
+                        session.add(self._execution_model(journal.execution))
+                    elif journal.execution_dirty:
+                        session.execute(self._execution_update(journal.execution))
+                    for state in journal.states.values():
+                        if state.action_id in journal.new_state_ids:
+                            session.add(self._state_model(state))
+                        else:
+                            session.execute(self._state_update(state))
+                    session.add_all([self._log_model(log) for log in journal.logs])
+                    session.add_all([self._outbox_model(entry) for entry in journal.outbox])
+                session.commit()
+        except IntegrityError as exc:
+            # The unique (action_name, client_request_id) index lost a race
+            # against another process; report which execution won.
+            for journal in journals:
+                execution = journal.execution
+                if journal.execution_persisted or execution.client_request_id is None:
+                    continue
+                existing = self.find_execution_by_client_request_id(execution.action_name, execution.client_request_id)
+                if existing is not None and existing.execution_id != execution.execution_id:
+                    raise DuplicateClientRequestError(existing) from exc
+            raise
+
     def list_stale_action_states(self, cutoff_seconds: int) -> list[ActionState]:
         cutoff = now_utc() - timedelta(seconds=cutoff_seconds)
         with Session(self._engine) as session:
@@ -399,23 +384,112 @@ class SqlActionRepository:
                 .order_by(ActionExecutionModel.submitted_at)
             )
             rows = session.execute(stmt).scalars().all()
-        return [
-            ActionExecution(
-                execution_id=row.id,
-                action_name=row.action_name,
-                submitter=row.submitter,
-                status=ActionStatus(row.status),
-                submitted_at=row.submitted_at,
-                input_payload=row.input_payload,
-                output_payload=row.output_payload or {},
-                ontology_edit=None,
-                compensation_edit=None,
-                error=row.error,
-                started_at=row.started_at,
-                finished_at=row.finished_at,
+        return [self._execution_from_row(row) for row in rows]
+
+    @classmethod
+    def _execution_model(cls, execution: ActionExecution) -> ActionExecutionModel:
+        return ActionExecutionModel(
+            id=execution.execution_id,
+            action_name=execution.action_name,
+            submitter=execution.submitter,
+            status=execution.status.value,
+            submitted_at=execution.submitted_at,
+            input_payload=execution.input_payload,
+            output_payload=execution.output_payload,
+            ontology_edit=cls._serialize_edit(execution.ontology_edit),
+            compensation_edit=cls._serialize_edit(execution.compensation_edit),
+            error=execution.error,
+            started_at=execution.started_at,
+            finished_at=execution.finished_at,
+            action_version=execution.action_version,
+            input_instances=execution.input_instances,
+            client_request_id=execution.client_request_id,
+            queued_for_worker=execution.queued_for_worker,
+        )
+
+    @staticmethod
+    def _execution_from_row(row: ActionExecutionModel) -> ActionExecution:
+        return ActionExecution(
+            execution_id=row.id,
+            action_name=row.action_name,
+            submitter=row.submitter,
+            status=ActionStatus(row.status),
+            submitted_at=row.submitted_at,
+            input_payload=row.input_payload,
+            output_payload=row.output_payload or {},
+            ontology_edit=None,
+            compensation_edit=None,
+            error=row.error,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+            action_version=row.action_version,
+            input_instances=row.input_instances,
+            client_request_id=row.client_request_id,
+            queued_for_worker=bool(row.queued_for_worker),
+        )
+
+    @classmethod
+    def _execution_update(cls, execution: ActionExecution) -> Any:
+        return (
+            update(ActionExecutionModel)
+            .where(ActionExecutionModel.id == execution.execution_id)
+            .values(
+                status=execution.status.value,
+                output_payload=execution.output_payload,
+                ontology_edit=cls._serialize_edit(execution.ontology_edit),
+                compensation_edit=cls._serialize_edit(execution.compensation_edit),
+                error=execution.error,
+                started_at=execution.started_at,
+                finished_at=execution.finished_at,
             )
-            for row in rows
-        ]
+        )
+
+    @staticmethod
+    def _log_model(log: ActionLog) -> ActionLogModel:
+        return ActionLogModel(
+            execution_id=log.execution_id,
+            event_type=log.event_type,
+            payload=log.payload,
+            created_at=log.created_at,
+        )
+
+    @staticmethod
+    def _state_model(state: ActionState) -> ActionStateModel:
+        return ActionStateModel(
+            id=state.action_id,
+            execution_id=state.execution_id,
+            status=state.status.value,
+            intent_payload=state.intent_payload,
+            created_at=state.created_at,
+            updated_at=state.updated_at,
+        )
+
+    @staticmethod
+    def _state_update(state: ActionState) -> Any:
+        return (
+            update(ActionStateModel)
+            .where(ActionStateModel.id == state.action_id)
+            .values(
+                status=state.status.value,
+                intent_payload=state.intent_payload,
+                updated_at=state.updated_at,
+            )
+        )
+
+    @staticmethod
+    def _outbox_model(entry: SideEffectOutbox) -> OutboxModel:
+        return OutboxModel(
+            id=entry.outbox_id,
+            execution_id=entry.execution_id,
+            effect_type=entry.effect_type,
+            payload=entry.payload,
+            status=entry.status,
+            retry_count=entry.retry_count,
+            max_retries=entry.max_retries,
+            next_attempt_at=entry.next_attempt_at,
+            created_at=entry.created_at,
+            updated_at=entry.updated_at,
+        )
 
     @staticmethod
     def _serialize_edit(edit: Any) -> Any:
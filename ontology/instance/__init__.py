@@ -1,10 +1,16 @@
 from .storage.graph_store import GraphStore, InMemoryGraphStore, Neo4jGraphStore
+from .storage.cache import CachingGraphStore
+from .storage.durability import DurableGraphStore
+from .storage.sharding import ShardedGraphStore
 from .api.service import DataFunnelResult, DataFunnelService, InstanceService, ValidationChain
 
 __all__ = [
     'GraphStore',
     'InMemoryGraphStore',
     'Neo4jGraphStore',
+    'CachingGraphStore',
+    'DurableGraphStore',
+    'ShardedGraphStore',
     'DataFunnelResult',
     'DataFunnelService',
     'ValidationChain',
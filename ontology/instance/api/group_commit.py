@@ -0,0 +1,97 @@
+"""Coalesce concurrently submitted transactions into shared backend commits.
+
+The first thread to submit becomes the group leader: it waits up to
+``window`` seconds (or until ``max_group_size`` members queued), takes the
+queue and commits it while later submitters already form the next group.
+Followers block until the leader hands them their own result.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import TransactionEdit
+
+GroupMember = Tuple[TransactionEdit, Optional[str]]
+CommitGroup = Callable[[Sequence[GroupMember]], List[Any]]
+
+
+@dataclass
+class _Submission:
+    transaction: TransactionEdit
+    action_id: Optional[str]
+    result: Any = None
+    error: Optional[BaseException] = None
+    done: bool = False
+    leads: bool = False
+    wakeup: threading.Event = field(default_factory=threading.Event)
+
+
+class GroupCommitter:
+    """Leader/follower group commit in front of a ``CommitGroup`` callable.
+
+    ``commit`` receives the queued ``(transaction, action_id)`` members and
+    returns one result per member; if it raises, every member re-raises.
+    """
+
+    def __init__(self, commit: CommitGroup, window: float = 0.002, max_group_size: int = 64) -> None:
+        if max_group_size < 1:
+            raise ValueError("max_group_size must be at least 1")
+        self._commit = commit
+        self._window = window
+        self._max_group_size = max_group_size
+        self._cond = threading.Condition()
+        self._queue: List[_Submission] = []
+        self._has_leader = False
+        self.groups_committed = 0
+
+    def submit(self, transaction: TransactionEdit, action_id: Optional[str] = None) -> Any:
+        submission = _Submission(transaction, action_id)
+        with self._cond:
+            self._queue.append(submission)
+            if not self._has_leader:
+                self._has_leader = True
+                submission.leads = True
+            elif len(self._queue) >= self._max_group_size:
+                self._cond.notify_all()
+        while not submission.leads:
+            submission.wakeup.wait()
+            submission.wakeup.clear()
+            if submission.done:
+                return self._outcome(submission)
+        self._lead(submission)
+        return self._outcome(submission)
+
+    @staticmethod
+    def _outcome(submission: _Submission) -> Any:
+        if submission.error is not None:
+            raise submission.error
+        return submission.result
+
+    def _lead(self, leader: _Submission) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._queue) >= self._max_group_size, timeout=self._window)
+            group = self._queue[: self._max_group_size]
+            del self._queue[: self._max_group_size]
+            if self._queue:
+                # Hand leadership to the oldest waiter so no follower is stranded.
+                successor = self._queue[0]
+                successor.leads = True
+                successor.wakeup.set()
+            else:
+                self._has_leader = False
+            self.groups_committed += 1
+        try:
+            results = self._commit([(member.transaction, member.action_id) for member in group])
+        except BaseException as exc:
+            for member in group:
+                member.error = exc
+        else:
+            for member, result in zip(group, results):
+                member.result = result
+        for member in group:
+            member.done = True
+            if member is not leader:
+                member.wakeup.set()
@@ -1,9 +1,82 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter
+from pydantic import BaseModel
+
+from ontology.instance.api.service import InstanceService
+
+
+class IndexStatusResponse(BaseModel):
+    """One backend index/constraint as reported by the graph store."""
+    name: str
+    type: str | None = None
+    labels: list[str]
+    properties: list[str]
+    state: str | None = None
+    population_percent: float | None = None
+    size: int | None = None
+
+
+class SchemaStatusResponse(BaseModel):
+    """Admin view of graph store schema provisioning."""
+    store: str
+    indexes: list[IndexStatusResponse]
+
+
+class CacheStatsResponse(BaseModel):
+    """Object cache counters; ``enabled`` is false when no cache is configured."""
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class PoolStatsResponse(BaseModel):
+    """Graph store connection pool counters; ``enabled`` is false without a pooled backend."""
+    enabled: bool
+    max_pool_size: int = 0
+    sessions_opened: int = 0
+    sessions_in_use: int = 0
+    peak_sessions_in_use: int = 0
+    utilisation: float = 0.0
+    read_transactions: int = 0
+    write_transactions: int = 0
+    retries: int = 0
+    acquisition_timeouts: int = 0
+
+
+def create_router(instance_service: InstanceService) -> APIRouter:
+    """Create instance admin routes (schema/index diagnostics)."""
+
+    router = APIRouter()
+
+    @router.get("/admin/instance/schema", response_model=SchemaStatusResponse)
+    def get_schema_status() -> SchemaStatusResponse:
+        """Report indexes provisioned by the graph store and their state."""
+        indexes: list[dict[str, Any]] = instance_service.schema_status()
+        return SchemaStatusResponse(
+            store=type(instance_service.store).__name__,
+            indexes=[IndexStatusResponse(**index) for index in indexes],
+        )
 
+    @router.get("/admin/instance/cache", response_model=CacheStatsResponse)
+    def get_cache_stats() -> CacheStatsResponse:
+        """Report read-through object cache hit/miss/eviction counters."""
+        stats = getattr(instance_service.store, "stats", None)
+        if stats is None:
+            return CacheStatsResponse(enabled=False)
+        return CacheStatsResponse(enabled=True, **stats())
 
-def create_router() -> APIRouter:
-    """Placeholder instance router for module structure alignment."""
+    @router.get("/admin/instance/pool", response_model=PoolStatsResponse)
+    def get_pool_stats() -> PoolStatsResponse:
+        """Report graph store connection pool utilisation and retry counters."""
+        stats = instance_service.pool_stats()
+        if stats is None:
+            return PoolStatsResponse(enabled=False)
+        return PoolStatsResponse(enabled=True, **stats)
 
-    return APIRouter()
+    return router
@@ -7,7 +7,7 @@ commits them through GraphStore in a single apply call.
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, Optional, Sequence
+from typing import Callable, Iterable, Iterator, Optional, Sequence
 
 from ontology.action.storage.edits import (
     AddLinkEdit,
@@ -15,12 +15,17 @@ from ontology.action.storage.edits import (
     DeleteLinkEdit,
     DeleteObjectEdit,
     ModifyObjectEdit,
+    ObjectInstance,
     ObjectLocator,
     OntologyEdit,
     RemoveLinkEdit,
     TransactionEdit,
 )
+from ontology.instance.api.group_commit import GroupCommitter, GroupMember
+from ontology.instance.storage.aggregation import AggregateSpec, AggregationResult
 from ontology.instance.storage.graph_store import GraphStore
+from ontology.instance.storage.query import PropertyPredicate, SearchResult
+from ontology.instance.storage.traversal import TraversalHit
 
 
 @dataclass
@@ -94,11 +99,20 @@ class DataFunnelService:
         store: GraphStore,
         validator: Optional[ValidationHook] = None,
         validators: Optional[Iterable[ValidationHook]] = None,
+        group_commit_window: float | None = None,
+        max_group_size: int = 64,
     ) -> None:
         self._store = store
         self._validator = validator
         custom_validators = tuple(validators or ())
         self._validation_chain = ValidationChain((validate_transaction_strong, *custom_validators))
+        # With a window, concurrent apply() calls are coalesced into shared
+        # backend commits (see GroupCommitter).
+        self._group_committer = (
+            GroupCommitter(self._commit_group, window=group_commit_window, max_group_size=max_group_size)
+            if group_commit_window is not None
+            else None
+        )
 
     @property
     def store(self) -> GraphStore:
@@ -106,28 +120,167 @@ class DataFunnelService:
 
     def apply(self, transaction: TransactionEdit, action_id: str | None = None) -> DataFunnelResult:
         try:
-            if self._validator:
-                self._validator(transaction)
-            if self._validation_chain.validators:
-                self._validation_chain.run(transaction)
+            self._validate(transaction)
+        except Exception as exc:  # noqa: BLE001
+            return DataFunnelResult(applied=False, error=str(exc))
+        if self._group_committer is not None:
+            return self._group_committer.submit(transaction, action_id)
+        return self._commit_one(transaction, action_id)
+
+    def apply_many(
+        self,
+        transactions: Sequence[TransactionEdit],
+        action_ids: Sequence[str | None] | None = None,
+    ) -> list[DataFunnelResult]:
+        """Apply independent transactions with as few backend commits as possible.
+
+        Each transaction is validated on its own; the valid ones are committed
+        together through ``GraphStore.apply_group``. If that group fails it is
+        split in halves and retried until the failing members are isolated,
+        so every transaction gets the result it would have had applied alone.
+        """
+        ids = list(action_ids) if action_ids is not None else [None] * len(transactions)
+        if len(ids) != len(transactions):
+            raise ValueError("action_ids must match transactions")
+        results: list[DataFunnelResult | None] = [None] * len(transactions)
+        valid: list[int] = []
+        for position, transaction in enumerate(transactions):
+            try:
+                self._validate(transaction)
+            except Exception as exc:  # noqa: BLE001
+                results[position] = DataFunnelResult(applied=False, error=str(exc))
+                continue
+            valid.append(position)
+        committed = self._commit_group([(transactions[position], ids[position]) for position in valid])
+        for position, result in zip(valid, committed):
+            results[position] = result
+        return results  # type: ignore[return-value]
+
+    def _validate(self, transaction: TransactionEdit) -> None:
+        if self._validator:
+            self._validator(transaction)
+        if self._validation_chain.validators:
+            self._validation_chain.run(transaction)
+
+    def _commit_one(self, transaction: TransactionEdit, action_id: str | None) -> DataFunnelResult:
+        try:
             self._store.apply_edit(transaction, action_id=action_id)
         except Exception as exc:  # noqa: BLE001
             return DataFunnelResult(applied=False, error=str(exc))
         return DataFunnelResult(applied=True)
 
+    def _commit_group(self, members: Sequence[GroupMember]) -> list[DataFunnelResult]:
+        if len(members) <= 1:
+            return [self._commit_one(transaction, action_id) for transaction, action_id in members]
+        try:
+            self._store.apply_group(members)
+        except NotImplementedError:
+            return [self._commit_one(transaction, action_id) for transaction, action_id in members]
+        except Exception:  # noqa: BLE001
+            middle = len(members) // 2
+            return self._commit_group(members[:middle]) + self._commit_group(members[middle:])
+        return [DataFunnelResult(applied=True) for _ in members]
+
 
     def get_object(self, locator: ObjectLocator):
         """Read helper used by ActionService during input instance resolution."""
         return self.store.get_object(locator)
 
-    def list_objects(self, object_type: str, limit: int = 100, offset: int = 0):
+    def get_objects(self, locators: Sequence[ObjectLocator]):
+        """Batch read helper: one backend round trip, results aligned with ``locators``."""
+        return self.store.get_objects(locators)
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ):
         """Read helper used by search/read paths in lightweight deployments."""
-        return self.store.list_objects(object_type=object_type, limit=limit, offset=offset)
+        return self.store.list_objects(
+            object_type=object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        """Property-predicate search; the result carries the executed query plan."""
+        return self.store.search_objects(
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        """Server-side group-by aggregation over object properties."""
+        return self.store.aggregate_objects(
+            object_type,
+            aggregates,
+            group_by=group_by,
+            predicates=predicates,
+            limit=limit,
+        )
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        """Stream linked objects reachable from one object (breadth-first)."""
+        return self.store.traverse(
+            start_locator,
+            link_types=link_types,
+            direction=direction,
+            max_depth=max_depth,
+            limit=limit,
+            max_fanout=max_fanout,
+        )
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        """Lazily iterate every object of a type (bulk export)."""
+        return self.store.iter_objects(object_type, after_primary_key=after_primary_key, batch_size=batch_size)
 
     def has_action_applied(self, action_id: str, edit_payload: dict | None = None) -> bool:
         """Expose idempotency/reconciliation lookup from underlying store."""
         return self.store.has_action_applied(action_id, edit_payload)
 
+    def has_actions_applied(self, probes: Sequence[tuple[str, dict | None]]) -> list[bool]:
+        """Bulk reconciliation lookup: one answer per ``(action_id, edit_payload)``."""
+        return self.store.has_actions_applied(probes)
+
+    def schema_status(self) -> list[dict]:
+        """Expose backend index/constraint status for admin endpoints."""
+        return self.store.schema_status()
+
+    def pool_stats(self) -> dict | None:
+        """Expose backend connection pool counters for admin endpoints."""
+        return self.store.pool_stats()
+
 class InstanceService:
     """Unified phase-1 instance service for write/apply and basic reads."""
 
@@ -136,8 +289,16 @@ class InstanceService:
         store: GraphStore,
         validator: Optional[ValidationHook] = None,
         validators: Optional[Iterable[ValidationHook]] = None,
+        group_commit_window: float | None = None,
+        max_group_size: int = 64,
     ) -> None:
-        self._funnel = DataFunnelService(store=store, validator=validator, validators=validators)
+        self._funnel = DataFunnelService(
+            store=store,
+            validator=validator,
+            validators=validators,
+            group_commit_window=group_commit_window,
+            max_group_size=max_group_size,
+        )
 
     @property
     def store(self) -> GraphStore:
@@ -146,11 +307,97 @@ class InstanceService:
     def apply(self, transaction: TransactionEdit, action_id: str | None = None) -> DataFunnelResult:
         return self._funnel.apply(transaction=transaction, action_id=action_id)
 
+    def apply_many(
+        self,
+        transactions: Sequence[TransactionEdit],
+        action_ids: Sequence[str | None] | None = None,
+    ) -> list[DataFunnelResult]:
+        return self._funnel.apply_many(transactions, action_ids=action_ids)
+
     def get_object(self, locator: ObjectLocator):
         return self._funnel.get_object(locator)
 
-    def list_objects(self, object_type: str, limit: int = 100, offset: int = 0):
-        return self._funnel.list_objects(object_type=object_type, limit=limit, offset=offset)
+    def get_objects(self, locators: Sequence[ObjectLocator]):
+        return self._funnel.get_objects(locators)
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ):
+        return self._funnel.list_objects(
+            object_type=object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        return self._funnel.search_objects(
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        return self._funnel.aggregate_objects(
+            object_type,
+            aggregates,
+            group_by=group_by,
+            predicates=predicates,
+            limit=limit,
+        )
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        return self._funnel.traverse(
+            start_locator,
+            link_types=link_types,
+            direction=direction,
+            max_depth=max_depth,
+            limit=limit,
+            max_fanout=max_fanout,
+        )
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        return self._funnel.iter_objects(object_type, after_primary_key=after_primary_key, batch_size=batch_size)
 
     def has_action_applied(self, action_id: str, edit_payload: dict | None = None) -> bool:
         return self._funnel.has_action_applied(action_id, edit_payload)
+
+    def has_actions_applied(self, probes: Sequence[tuple[str, dict | None]]) -> list[bool]:
+        return self._funnel.has_actions_applied(probes)
+
+    def schema_status(self) -> list[dict]:
+        return self._funnel.schema_status()
+
+    def pool_stats(self) -> dict | None:
+        return self._funnel.pool_stats()
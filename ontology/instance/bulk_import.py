@@ -0,0 +1,303 @@
+"""Bulk import of objects and links from NDJSON or CSV files.
+
+Run as ``ontology-import`` (``python -m ontology.instance.bulk_import``).
+Records are validated and written in batches through
+``GraphStore.bulk_load_objects`` / ``bulk_load_links``: batched ``UNWIND``
+statements on Neo4j, direct index construction in memory. Objects that
+already exist are skipped, so an interrupted import can be re-run; invalid
+records are counted and reported without stopping the import until
+``max_errors`` is exceeded.
+
+Object records::
+
+    {"object_type": "Loan", "primary_key": "loan-1", "properties": {"amount": 10}}
+
+In CSV the ``primary_key`` column is required, ``object_type`` may come from
+``--object-type`` instead, and every other non-empty cell becomes a string
+property. Link records (NDJSON keys or CSV columns)::
+
+    {"link_type": "owns", "from_type": "User", "from_primary_key": "u-1",
+     "to_type": "Loan", "to_primary_key": "loan-1"}
+
+Files ending in ``.gz`` are decompressed on the fly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+from dataclasses import dataclass, field
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import AddLinkEdit, AddObjectEdit, ObjectLocator
+from ontology.instance.storage.durability import DurableGraphStore
+from ontology.instance.storage.graph_store import GraphStore, Neo4jGraphStore
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_MAX_ERRORS = 1000
+RESERVED_PROPERTIES = ("primary_key", "version")
+LINK_FIELDS = ("link_type", "from_type", "from_primary_key", "to_type", "to_primary_key")
+
+Record = Tuple[int, Any]
+
+
+@dataclass
+class RecordError:
+    source: str
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    """Running totals of an import, also handed to progress callbacks."""
+
+    objects_loaded: int = 0
+    objects_skipped: int = 0
+    links_loaded: int = 0
+    links_rejected: int = 0
+    invalid: int = 0
+    errors: List[RecordError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.objects_loaded + self.objects_skipped + self.links_loaded + self.links_rejected + self.invalid
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"objects: {self.objects_loaded} loaded, {self.objects_skipped} skipped; "
+            f"links: {self.links_loaded} loaded, {self.links_rejected} rejected; "
+            f"invalid: {self.invalid}; {self.rows} rows in {self.elapsed_seconds:.1f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+ProgressCallback = Callable[[ImportReport], None]
+
+
+def _open_text(path: str) -> io.TextIOBase:
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    raise ValueError(f"Cannot tell the format of {path!r}; expected .ndjson, .jsonl or .csv")
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Record]:
+    """Yield ``(line number, record)``; NDJSON records are left undecoded."""
+    fmt = fmt or detect_format(path)
+    with _open_text(path) as handle:
+        if fmt == "csv":
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, {name: value for name, value in row.items() if value not in ("", None)}
+            return
+        if fmt != "ndjson":
+            raise ValueError(f"Unsupported import format: {fmt}")
+        for line_number, line in enumerate(handle, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+def _decode(record: Any) -> dict:
+    if isinstance(record, str):
+        try:
+            record = json.loads(record)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON: {exc.msg}") from None
+    if not isinstance(record, dict):
+        raise ValueError("Record must be an object")
+    return record
+
+
+def _required_text(record: dict, name: str) -> str:
+    value = record.get(name)
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"'{name}' must be a non-empty string")
+    return value
+
+
+def object_edit_from_record(record: Any, object_type: Optional[str] = None) -> AddObjectEdit:
+    """Validate one object record; raises ValueError when it cannot be loaded."""
+    record = _decode(record)
+    if "properties" in record:
+        properties = record["properties"]
+        if not isinstance(properties, dict):
+            raise ValueError("'properties' must be an object")
+    else:
+        # Flat (CSV) records: every column besides the locator is a property.
+        properties = {name: value for name, value in record.items() if name not in ("object_type", "primary_key")}
+    for name in RESERVED_PROPERTIES:
+        if name in properties:
+            raise ValueError(f"Property '{name}' is reserved")
+    if object_type is not None and "object_type" not in record:
+        record = {**record, "object_type": object_type}
+    return AddObjectEdit(_required_text(record, "object_type"), _required_text(record, "primary_key"), dict(properties))
+
+
+def link_edit_from_record(record: Any) -> AddLinkEdit:
+    """Validate one link record; raises ValueError when it cannot be loaded."""
+    record = _decode(record)
+    link_type, from_type, from_pk, to_type, to_pk = (_required_text(record, name) for name in LINK_FIELDS)
+    return AddLinkEdit(link_type, ObjectLocator(from_type, from_pk), ObjectLocator(to_type, to_pk))
+
+
+class BulkImporter:
+    """Validate records in batches and load them into a GraphStore.
+
+    ``progress`` is called with the running ``ImportReport`` after every
+    batch. Raises ValueError once more than ``max_errors`` records were
+    invalid; batches written before that stay loaded.
+    """
+
+    def __init__(
+        self,
+        store: GraphStore,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+        progress: Optional[ProgressCallback] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._store = store
+        self._batch_size = batch_size
+        self._max_errors = max_errors
+        self._progress = progress
+        self._started = time.perf_counter()
+        self.report = ImportReport()
+
+    def import_objects(self, path: str, object_type: Optional[str] = None, fmt: Optional[str] = None) -> ImportReport:
+        return self.load_objects(read_records(path, fmt), object_type=object_type, source=path)
+
+    def import_links(self, path: str, fmt: Optional[str] = None) -> ImportReport:
+        return self.load_links(read_records(path, fmt), source=path)
+
+    def load_objects(
+        self,
+        records: Iterable[Record],
+        object_type: Optional[str] = None,
+        source: str = "<objects>",
+    ) -> ImportReport:
+        for batch in self._batches(records, lambda record: object_edit_from_record(record, object_type), source):
+            loaded = self._store.bulk_load_objects(batch)
+            self.report.objects_loaded += loaded
+            self.report.objects_skipped += len(batch) - loaded
+            self._batch_done()
+        return self.report
+
+    def load_links(self, records: Iterable[Record], source: str = "<links>") -> ImportReport:
+        for batch in self._batches(records, link_edit_from_record, source):
+            loaded = self._store.bulk_load_links(batch)
+            self.report.links_loaded += loaded
+            self.report.links_rejected += len(batch) - loaded
+            self._batch_done()
+        return self.report
+
+    def _batches(self, records: Iterable[Record], parse: Callable[[Any], Any], source: str) -> Iterator[list]:
+        batch: list = []
+        for line, record in records:
+            try:
+                batch.append(parse(record))
+            except ValueError as exc:
+                self._reject(source, line, str(exc))
+                continue
+            if len(batch) >= self._batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _reject(self, source: str, line: int, message: str) -> None:
+        self.report.invalid += 1
+        if len(self.report.errors) < self._max_errors:
+            self.report.errors.append(RecordError(source, line, message))
+        if self.report.invalid > self._max_errors:
+            raise ValueError(f"Too many invalid records (last at {source}:{line}: {message})")
+
+    def _batch_done(self) -> None:
+        self.report.elapsed_seconds = time.perf_counter() - self._started
+        if self._progress is not None:
+            self._progress(self.report)
+
+
+def _open_store(args: argparse.Namespace, parser: argparse.ArgumentParser) -> DurableGraphStore | Neo4jGraphStore:
+    if bool(args.data_dir) == bool(args.neo4j_uri):
+        parser.error("pass exactly one of --data-dir or --neo4j-uri")
+    if args.data_dir:
+        return DurableGraphStore(args.data_dir)
+    return Neo4jGraphStore(args.neo4j_uri, args.neo4j_user, os.environ.get("NEO4J_PASSWORD", args.neo4j_password))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Load object and link files into a durable in-memory store or Neo4j."""
+
+    parser = argparse.ArgumentParser(
+        prog="ontology-import",
+        description="Bulk load objects and links from NDJSON or CSV files",
+    )
+    parser.add_argument("--objects", action="append", default=[], metavar="PATH", help="Object file (repeatable)")
+    parser.add_argument("--links", action="append", default=[], metavar="PATH", help="Link file (repeatable)")
+    parser.add_argument("--object-type", default=None, help="Object type for CSV files without an object_type column")
+    parser.add_argument("--data-dir", default=None, help="Load into the durable in-memory store under this directory")
+    parser.add_argument("--neo4j-uri", default=None, help="Load into this Neo4j database")
+    parser.add_argument("--neo4j-user", default="neo4j")
+    parser.add_argument("--neo4j-password", default="neo4j", help="Defaults to $NEO4J_PASSWORD when set")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-errors", type=int, default=DEFAULT_MAX_ERRORS)
+    parser.add_argument("--quiet", action="store_true", help="Only print the final summary")
+    args = parser.parse_args(argv)
+    if not args.objects and not args.links:
+        parser.error("nothing to import; pass --objects and/or --links")
+
+    def report_progress(report: ImportReport) -> None:
+        print(report.summary(), file=sys.stderr, flush=True)
+
+    store = _open_store(args, parser)
+    importer = BulkImporter(
+        store,
+        batch_size=args.batch_size,
+        max_errors=args.max_errors,
+        progress=None if args.quiet else report_progress,
+    )
+    try:
+        # Objects first, so links in the same run find their endpoints.
+        for path in args.objects:
+            importer.import_objects(path, object_type=args.object_type)
+        for path in args.links:
+            importer.import_links(path)
+    except (OSError, ValueError) as exc:
+        print(f"ontology-import: {exc}", file=sys.stderr)
+        print(importer.report.summary(), file=sys.stderr)
+        return 1
+    finally:
+        if isinstance(store, DurableGraphStore):
+            # Leave a snapshot so the next start does not replay the whole load.
+            store.checkpoint()
+        store.close()
+    for error in importer.report.errors:
+        print(f"{error.source}:{error.line}: {error.message}", file=sys.stderr)
+    print(importer.report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
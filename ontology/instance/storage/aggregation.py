@@ -0,0 +1,278 @@
+"""Group-by aggregation over object properties.
+
+The in-memory store evaluates aggregations column-wise: property values are
+pulled into per-property columns once and reduced per group. When NumPy is
+installed the reductions run vectorized (``bincount`` / ``ufunc.at``);
+otherwise the same columns are reduced in pure Python. Integer columns are
+reduced as int64 (or in Python when a sum could overflow it), so both
+engines return the same exact ints.
+
+``sum``, ``avg``, ``min`` and ``max`` only consider numeric values (booleans
+excluded); ``count`` without a property counts objects and with a property
+counts objects where it is present and not null. Empty groups give a sum of
+0 and null avg/min/max, matching Cypher aggregation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import importlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import ObjectInstance
+
+from .query import value_key
+
+AGGREGATE_OPS = ("count", "sum", "avg", "min", "max")
+_INT64_MAX = 2**63 - 1
+
+try:
+    _numpy: Any = importlib.import_module("numpy")
+except ImportError:  # optional dependency
+    _numpy = None
+
+
+def numpy_available() -> bool:
+    return _numpy is not None
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    """One aggregate column: ``op`` over ``property_name`` named ``alias``."""
+
+    op: str
+    property_name: Optional[str] = None
+    alias: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.op not in AGGREGATE_OPS:
+            raise ValueError(f"Unsupported aggregate op: {self.op}")
+        if self.op != "count" and not self.property_name:
+            raise ValueError(f"Aggregate '{self.op}' requires a property")
+
+    @property
+    def name(self) -> str:
+        if self.alias:
+            return self.alias
+        return f"{self.op}_{self.property_name}" if self.property_name else self.op
+
+
+@dataclass
+class AggregateGroup:
+    group: Dict[str, Any]
+    values: Dict[str, Any]
+
+
+@dataclass
+class AggregationResult:
+    """Aggregated groups plus how they were computed.
+
+    ``engine`` is ``numpy``, ``python`` or ``cypher``; ``scanned`` counts
+    objects fed into the aggregation (``None`` when pushed down).
+    """
+
+    groups: List[AggregateGroup] = field(default_factory=list)
+    engine: str = "python"
+    scanned: Optional[int] = None
+
+
+def validate_aggregation(aggregates: Sequence[AggregateSpec], group_by: Sequence[str]) -> None:
+    if not aggregates:
+        raise ValueError("At least one aggregate is required")
+    names = [spec.name for spec in aggregates]
+    if len(set(names)) != len(names):
+        raise ValueError("Aggregate names must be unique")
+    if len(set(group_by)) != len(group_by):
+        raise ValueError("Group-by properties must be unique")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _group_token(value: Any) -> Any:
+    """Hashable, type-aware grouping key (so ``True`` and ``1`` stay apart)."""
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value).__name__, repr(value))
+    return (type(value).__name__, value)
+
+
+def _group_order(values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    order = []
+    for value in values:
+        if value is None:
+            order.append((-1,))
+        else:
+            order.append(value_key(value) or (3, repr(value)))
+    return tuple(order)
+
+
+def _build_groups(
+    instances: Sequence[ObjectInstance],
+    group_by: Sequence[str],
+) -> Tuple[List[int], List[Tuple[Any, ...]]]:
+    """Assign each instance a dense group code; return codes and group values."""
+    codes: List[int] = []
+    tokens: Dict[Tuple[Any, ...], int] = {}
+    values: List[Tuple[Any, ...]] = []
+    for instance in instances:
+        group_values = tuple(instance.properties.get(name) for name in group_by)
+        token = tuple(_group_token(value) for value in group_values)
+        code = tokens.get(token)
+        if code is None:
+            code = tokens[token] = len(values)
+            values.append(group_values)
+        codes.append(code)
+    if not group_by and not values:
+        # A global aggregate over no rows still yields one (empty) group.
+        values.append(())
+    return codes, values
+
+
+def _column(instances: Sequence[ObjectInstance], property_name: str) -> Tuple[List[Any], bool]:
+    """Numeric column (None for missing/non-numeric) and whether it holds only ints."""
+    column: List[Any] = []
+    integral = True
+    for instance in instances:
+        value = instance.properties.get(property_name)
+        if _is_number(value):
+            if isinstance(value, float):
+                integral = False
+            column.append(value)
+        else:
+            column.append(None)
+    return column, integral
+
+
+def _reduce_python(
+    spec: AggregateSpec,
+    instances: Sequence[ObjectInstance],
+    codes: List[int],
+    group_count: int,
+    columns: Dict[str, Tuple[List[Any], bool]],
+) -> List[Any]:
+    if spec.op == "count":
+        counts = [0] * group_count
+        if spec.property_name is None:
+            for code in codes:
+                counts[code] += 1
+        else:
+            for code, instance in zip(codes, instances):
+                if instance.properties.get(spec.property_name) is not None:
+                    counts[code] += 1
+        return counts
+    column, integral = columns[spec.property_name]  # type: ignore[index]
+    totals: List[Any] = [0] * group_count
+    seen = [0] * group_count
+    lows: List[Any] = [None] * group_count
+    highs: List[Any] = [None] * group_count
+    for code, value in zip(codes, column):
+        if value is None:
+            continue
+        totals[code] += value
+        seen[code] += 1
+        if lows[code] is None or value < lows[code]:
+            lows[code] = value
+        if highs[code] is None or value > highs[code]:
+            highs[code] = value
+    if spec.op == "sum":
+        return totals
+    if spec.op == "avg":
+        return [totals[code] / seen[code] if seen[code] else None for code in range(group_count)]
+    return lows if spec.op == "min" else highs
+
+
+def _reduce_numpy(
+    spec: AggregateSpec,
+    instances: Sequence[ObjectInstance],
+    codes: Any,
+    group_count: int,
+    columns: Dict[str, Tuple[List[Any], bool]],
+) -> List[Any]:
+    np = _numpy
+    if spec.op == "count":
+        if spec.property_name is None:
+            return np.bincount(codes, minlength=group_count).tolist()
+        present = np.fromiter(
+            (instance.properties.get(spec.property_name) is not None for instance in instances),
+            dtype=bool,
+            count=len(instances),
+        )
+        return np.bincount(codes[present], minlength=group_count).tolist()
+    column, integral = columns[spec.property_name]  # type: ignore[index]
+    if integral and sum(abs(value) for value in column if value is not None) > _INT64_MAX:
+        # Group sums could overflow int64; Python ints are exact.
+        return _reduce_python(spec, instances, codes.tolist(), group_count, columns)
+    mask = np.fromiter((value is not None for value in column), dtype=bool, count=len(column))
+    # Integer columns stay int64 so sums and extremes beyond 2**53 are exact.
+    values = np.array([0 if value is None else value for value in column], dtype=np.int64 if integral else np.float64)
+    seen = np.bincount(codes[mask], minlength=group_count)
+    if spec.op in ("sum", "avg"):
+        if integral:
+            totals = np.zeros(group_count, dtype=np.int64)
+            np.add.at(totals, codes[mask], values[mask])
+        else:
+            totals = np.bincount(codes[mask], weights=values[mask], minlength=group_count)
+        if spec.op == "sum":
+            return [int(total) if integral else float(total) for total in totals]
+        # Python division of the exact total, as the pure-Python engine does.
+        return [
+            (int(total) if integral else float(total)) / int(count) if count else None
+            for total, count in zip(totals, seen)
+        ]
+    if integral:
+        limits = np.iinfo(np.int64)
+        extremes = np.full(group_count, limits.max if spec.op == "min" else limits.min, dtype=np.int64)
+    else:
+        extremes = np.full(group_count, np.inf if spec.op == "min" else -np.inf)
+    reduce_at = np.minimum.at if spec.op == "min" else np.maximum.at
+    reduce_at(extremes, codes[mask], values[mask])
+    return [
+        (int(value) if integral else float(value)) if count else None
+        for value, count in zip(extremes, seen)
+    ]
+
+
+def aggregate_instances(
+    instances: Sequence[ObjectInstance],
+    aggregates: Sequence[AggregateSpec],
+    group_by: Sequence[str] = (),
+    limit: int = 1000,
+    engine: Optional[str] = None,
+) -> AggregationResult:
+    """Aggregate ``instances`` per distinct ``group_by`` value tuple.
+
+    ``engine`` forces ``numpy`` or ``python``; by default NumPy is used when
+    it is installed. Groups are ordered by their group values.
+    """
+    validate_aggregation(aggregates, group_by)
+    if engine is None:
+        engine = "numpy" if _numpy is not None else "python"
+    if engine == "numpy" and _numpy is None:
+        raise ValueError("NumPy is not installed")
+    if engine not in ("numpy", "python"):
+        raise ValueError(f"Unsupported aggregation engine: {engine}")
+    codes, group_values = _build_groups(instances, group_by)
+    columns = {
+        spec.property_name: _column(instances, spec.property_name)
+        for spec in aggregates
+        if spec.op != "count" and spec.property_name is not None
+    }
+    group_count = len(group_values)
+    if engine == "numpy":
+        code_array = _numpy.asarray(codes, dtype=_numpy.int64)
+        reduced = {spec.name: _reduce_numpy(spec, instances, code_array, group_count, columns) for spec in aggregates}
+    else:
+        reduced = {spec.name: _reduce_python(spec, instances, codes, group_count, columns) for spec in aggregates}
+    order = sorted(range(group_count), key=lambda code: _group_order(group_values[code]))[:limit]
+    groups = [
+        AggregateGroup(
+            group=dict(zip(group_by, group_values[code])),
+            values={name: column[code] for name, column in reduced.items()},
+        )
+        for code in order
+    ]
+    return AggregationResult(groups=groups, engine=engine, scanned=len(instances))
+
@@ -0,0 +1,321 @@
+"""Asyncio flavour of the GraphStore read/write surface.
+
+``AsyncNeo4jGraphStore`` runs on the neo4j async driver, so concurrent
+requests multiplex on the event loop instead of each holding a worker
+thread. It compiles exactly the same Cypher as ``Neo4jGraphStore``.
+``AsyncGraphStoreAdapter`` exposes any synchronous GraphStore through the
+same protocol (in-memory stores for tests and local runs).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Protocol, Sequence, Tuple
+
+from ontology.action.storage.edits import ObjectInstance, ObjectLocator, OntologyEdit
+
+from .cypher_batch import DEFAULT_MAX_BATCH_ROWS, CypherBatch, compile_transactions
+from .graph_store import (
+    GraphStore,
+    Neo4jGraphStore,
+    _compile_applied_probe,
+    _compile_get_objects,
+    _compile_search,
+    _extract_locators,
+    _get_object_query,
+    _list_objects_query,
+    _pushed_down_plan,
+)
+from .neo4j_pool import READ_ACCESS, WRITE_ACCESS, Neo4jPoolConfig, Neo4jPoolMetrics, is_acquisition_timeout
+from .neo4j_schema import Neo4jSchemaManager
+from .query import EQUALITY_OPS, PropertyPredicate, SearchResult
+
+
+class AsyncGraphStore(Protocol):
+    """Async counterpart of the GraphStore methods used by the hot API paths."""
+
+    async def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None: ...
+
+    async def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None: ...
+
+    async def get_object(self, locator: ObjectLocator) -> ObjectInstance: ...
+
+    async def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]: ...
+
+    async def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]: ...
+
+    async def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult: ...
+
+    async def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]: ...
+
+    async def close(self) -> None: ...
+
+    def pool_stats(self) -> Dict[str, Any] | None: ...
+
+
+class AsyncGraphStoreAdapter:
+    """Serve a synchronous GraphStore through ``AsyncGraphStore``.
+
+    Point reads only hold the store latch for microseconds, so they run
+    inline on the event loop; writes and searches no index can serve run in a
+    worker thread. Pass ``offload=True`` for stores whose reads block too
+    (e.g. a DurableGraphStore fsyncing its WAL) to run every call in a thread.
+    """
+
+    def __init__(self, store: GraphStore, offload: bool = False) -> None:
+        self._store = store
+        self._offload = offload
+
+    @property
+    def store(self) -> GraphStore:
+        return self._store
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self._offload:
+            return await self._offloaded(method, *args, **kwargs)
+        return getattr(self._store, method)(*args, **kwargs)
+
+    async def _offloaded(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(getattr(self._store, method), *args, **kwargs)
+
+    def _indexed(self, object_type: str, predicates: Sequence[PropertyPredicate]) -> bool:
+        """Whether an index of the store can narrow this search (see ``schema_status``)."""
+        kinds = {
+            status["properties"][0]: status["type"]
+            for status in self._store.schema_status()
+            if status["labels"] == [object_type] and len(status["properties"]) == 1
+        }
+        return any(
+            predicate.property_name in kinds
+            and (predicate.op in EQUALITY_OPS or kinds[predicate.property_name] != "HASH")
+            for predicate in predicates
+        )
+
+    async def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
+        await self._offloaded("apply_edit", edit, action_id=action_id)
+
+    async def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        await self._offloaded("apply_group", transactions)
+
+    async def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+        return await self._call("get_object", locator)
+
+    async def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        return await self._call("get_objects", locators)
+
+    async def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        return await self._call(
+            "list_objects",
+            object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    async def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        call = self._call if self._indexed(object_type, predicates) else self._offloaded
+        return await call(
+            "search_objects",
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
+
+    async def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        return await self._call("has_actions_applied", probes)
+
+    async def close(self) -> None:
+        return None
+
+    def pool_stats(self) -> Dict[str, Any] | None:
+        return self._store.pool_stats()
+
+
+class AsyncNeo4jGraphStore:
+    """Neo4j GraphStore on the async driver (``neo4j.AsyncGraphDatabase``).
+
+    Like ``Neo4jGraphStore``, reads run as managed read transactions and
+    writes through ``execute_write``, with the same pool counters.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        auto_schema: bool = True,
+        property_indexes: Dict[Tuple[str, str], str] | None = None,
+        pool_config: Neo4jPoolConfig | None = None,
+    ) -> None:
+        neo4j_module = importlib.import_module("neo4j")
+        config = pool_config or Neo4jPoolConfig()
+        self._driver = neo4j_module.AsyncGraphDatabase.driver(uri, auth=(user, password), **config.driver_kwargs())
+        self._session_config: Dict[str, Any] = {}
+        if config.database is not None:
+            self._session_config["database"] = config.database
+        if config.causal_consistency:
+            self._session_config["bookmark_manager"] = neo4j_module.AsyncGraphDatabase.bookmark_manager()
+        self._pool_metrics = Neo4jPoolMetrics(config.max_connection_pool_size)
+        self._max_batch_rows = max_batch_rows
+        self._schema = Neo4jSchemaManager(self._driver, database=config.database) if auto_schema else None
+        # Indexes created through the sync store, reported in search plans.
+        self._property_indexes: Dict[Tuple[str, str], str] = dict(property_indexes or {})
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Session/transaction counters used to size the connection pool."""
+        return self._pool_metrics.as_dict()
+
+    async def _ensure_schema(self, labels: Iterable[str]) -> None:
+        if self._schema is not None:
+            await self._schema.ensure_labels_async(labels)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[Any]:
+        self._pool_metrics.session_opened()
+        try:
+            async with self._driver.session(**self._session_config) as session:
+                yield session
+        except Exception as exc:
+            if is_acquisition_timeout(exc):
+                self._pool_metrics.acquisition_timed_out()
+            raise
+        finally:
+            self._pool_metrics.session_closed()
+
+    async def _managed(self, access_mode: str, work: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run ``work(tx, *args)`` as one retryable transaction and count driver retries."""
+        attempts = 0
+
+        async def attempt(tx: Any, *work_args: Any) -> Any:
+            nonlocal attempts
+            attempts += 1
+            return await work(tx, *work_args)
+
+        async with self._session() as session:
+            try:
+                if access_mode == READ_ACCESS:
+                    return await session.execute_read(attempt, *args)
+                return await session.execute_write(attempt, *args)
+            finally:
+                self._pool_metrics.transaction_finished(access_mode, attempts)
+
+    async def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
+        await self.apply_group([(edit, action_id)])
+
+    async def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        await self._ensure_schema(
+            {locator.object_type for edit, _ in transactions for locator in _extract_locators(edit)}
+        )
+        await self._managed(WRITE_ACCESS, self._run_batches, compile_transactions(transactions, self._max_batch_rows))
+
+    @staticmethod
+    async def _run_batches(tx: Any, batches: list[CypherBatch]) -> None:
+        for batch in batches:
+            result = await tx.run(batch.query, rows=batch.rows)
+            batch.verify(await result.single())
+
+    async def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+        await self._ensure_schema((locator.object_type,))
+        record = await self._managed(
+            READ_ACCESS, _read_single, _get_object_query(locator.object_type), {"primary_key": locator.primary_key}
+        )
+        if record is None:
+            raise ValueError("Object not found")
+        return Neo4jGraphStore._node_to_instance(locator.object_type, record["n"])
+
+    async def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        results: list[ObjectInstance | None] = [None] * len(locators)
+        labels, query, params = _compile_get_objects(locators)
+        if not query:
+            return results
+        await self._ensure_schema(labels)
+        for record in await self._managed(READ_ACCESS, _read_records, query, params):
+            idx = record["idx"]
+            results[idx] = Neo4jGraphStore._node_to_instance(locators[idx].object_type, record["n"])
+        return results
+
+    async def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        await self._ensure_schema((object_type,))
+        records = await self._managed(
+            READ_ACCESS,
+            _read_records,
+            _list_objects_query(object_type, after_primary_key),
+            {"offset": offset, "limit": limit, "after_primary_key": after_primary_key},
+        )
+        return [Neo4jGraphStore._node_to_instance(object_type, record["n"]) for record in records]
+
+    async def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        await self._ensure_schema((object_type,))
+        query, params = _compile_search(object_type, predicates, limit, after_primary_key)
+        records = await self._managed(READ_ACCESS, _read_records, query, params)
+        objects = [Neo4jGraphStore._node_to_instance(object_type, record["n"]) for record in records]
+        return SearchResult(objects=objects, plan=_pushed_down_plan(object_type, predicates, self._property_indexes))
+
+    async def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        labels, query, params, expected = _compile_applied_probe(probes)
+        if not query:
+            return [False] * len(probes)
+        await self._ensure_schema(labels)
+        matched = {record["probe_id"] for record in await self._managed(READ_ACCESS, _read_records, query, params)}
+        return [bool(probe_ids) and probe_ids <= matched for probe_ids in expected]
+
+    async def close(self) -> None:
+        await self._driver.close()
+
+
+async def _read_single(tx: Any, query: str, params: Dict[str, Any]) -> Any:
+    return await (await tx.run(query, **params)).single()
+
+
+async def _read_records(tx: Any, query: str, params: Dict[str, Any]) -> list[Any]:
+    # Records must be fetched before the managed transaction closes.
+    return [record async for record in await tx.run(query, **params)]
@@ -0,0 +1,275 @@
+"""Read-through object cache in front of a GraphStore."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import AddLinkEdit, AddObjectEdit, ObjectInstance, ObjectLocator, OntologyEdit
+
+from .aggregation import AggregateSpec, AggregationResult
+from .graph_store import GraphStore, _extract_locators
+from .query import PropertyPredicate, SearchResult
+from .traversal import TraversalHit
+
+ObjectKey = Tuple[str, str]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def _read_only(instance: ObjectInstance) -> ObjectInstance:
+    """Share ``instance`` between readers, freezing a backend-owned dict first."""
+    if not isinstance(instance.properties, dict):
+        return instance
+    return ObjectInstance(
+        object_type=instance.object_type,
+        primary_key=instance.primary_key,
+        properties=MappingProxyType(dict(instance.properties)),
+        version=instance.version,
+    )
+
+
+class CachingGraphStore(GraphStore):
+    """GraphStore wrapper with a bounded LRU + TTL cache for point reads.
+
+    Entries are keyed by ``(object_type, primary_key)`` and invalidated from
+    ``apply_edit`` using the locators the edit touches. Every write bumps a
+    write sequence; a read only populates the cache if no write happened
+    while it was fetching, so a reader racing a writer can never reinstall a
+    version older than the last write made through this process.
+    """
+
+    def __init__(
+        self,
+        backend: GraphStore,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[ObjectKey, tuple[float, ObjectInstance]]" = OrderedDict()
+        self._write_seq = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> GraphStore:
+        return self._backend
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats.as_dict(), "size": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
+        keys = {(locator.object_type, locator.primary_key) for locator in _extract_locators(edit)}
+        self._invalidate(keys)
+        try:
+            self._backend.apply_edit(edit, action_id=action_id)
+        finally:
+            # Invalidate again so reads that started before the write finished
+            # cannot keep (or install) a pre-write snapshot.
+            self._invalidate(keys)
+
+    def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        keys = {
+            (locator.object_type, locator.primary_key)
+            for edit, _ in transactions
+            for locator in _extract_locators(edit)
+        }
+        self._invalidate(keys)
+        try:
+            self._backend.apply_group(transactions)
+        finally:
+            self._invalidate(keys)
+
+    def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+        key = (locator.object_type, locator.primary_key)
+        cached, seen_seq = self._lookup(key)
+        if cached is not None:
+            return cached
+        instance = _read_only(self._backend.get_object(locator))
+        self._store(key, instance, seen_seq)
+        return instance
+
+    def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        results: list[ObjectInstance | None] = [None] * len(locators)
+        missing: list[int] = []
+        seen_seqs: Dict[int, int] = {}
+        for position, locator in enumerate(locators):
+            cached, seen_seq = self._lookup((locator.object_type, locator.primary_key))
+            if cached is not None:
+                results[position] = cached
+            else:
+                missing.append(position)
+                seen_seqs[position] = seen_seq
+        if missing:
+            fetched = self._backend.get_objects([locators[position] for position in missing])
+            for position, instance in zip(missing, fetched):
+                if instance is None:
+                    continue
+                instance = _read_only(instance)
+                locator = locators[position]
+                self._store((locator.object_type, locator.primary_key), instance, seen_seqs[position])
+                results[position] = instance
+        return results
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        return self._backend.list_objects(
+            object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        return self._backend.search_objects(
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
+
+    def create_property_index(self, object_type: str, property_name: str, kind: str = "hash") -> None:
+        self._backend.create_property_index(object_type, property_name, kind=kind)
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        return self._backend.aggregate_objects(
+            object_type,
+            aggregates,
+            group_by=group_by,
+            predicates=predicates,
+            limit=limit,
+        )
+
+    def neighbors(
+        self,
+        locator: ObjectLocator,
+        link_type: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[tuple[str, ObjectLocator]]:
+        return self._backend.neighbors(locator, link_type=link_type, direction=direction)
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        return self._backend.traverse(
+            start_locator,
+            link_types=link_types,
+            direction=direction,
+            max_depth=max_depth,
+            limit=limit,
+            max_fanout=max_fanout,
+        )
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        return self._backend.iter_objects(object_type, after_primary_key=after_primary_key, batch_size=batch_size)
+
+    def bulk_load_objects(self, edits: Sequence[AddObjectEdit]) -> int:
+        keys = {(edit.object_type, edit.primary_key) for edit in edits}
+        self._invalidate(keys)
+        try:
+            return self._backend.bulk_load_objects(edits)
+        finally:
+            self._invalidate(keys)
+
+    def bulk_load_links(self, edits: Sequence[AddLinkEdit]) -> int:
+        return self._backend.bulk_load_links(edits)
+
+    def has_action_applied(self, action_id: str, edit_payload: Dict[str, Any] | None) -> bool:
+        return self._backend.has_action_applied(action_id, edit_payload)
+
+    def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        return self._backend.has_actions_applied(probes)
+
+    def schema_status(self) -> list[Dict[str, Any]]:
+        return self._backend.schema_status()
+
+    def pool_stats(self) -> Dict[str, Any] | None:
+        return self._backend.pool_stats()
+
+    def _lookup(self, key: ObjectKey) -> tuple[Optional[ObjectInstance], int]:
+        now = self._clock()
+        with self._lock:
+            seen_seq = self._write_seq
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, instance = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return instance, seen_seq
+                del self._entries[key]
+            self._stats.misses += 1
+            return None, seen_seq
+
+    def _store(self, key: ObjectKey, instance: ObjectInstance, seen_seq: int) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            if self._write_seq != seen_seq:
+                return
+            self._entries[key] = (self._clock() + self._ttl_seconds, instance)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def _invalidate(self, keys: set[ObjectKey]) -> None:
+        with self._lock:
+            self._write_seq += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._stats.invalidations += 1
@@ -0,0 +1,554 @@
+"""Write-ahead log and snapshots that make InMemoryGraphStore durable.
+
+Layout of ``data_dir``:
+
+- ``wal.log``: one record per committed edit, ``<crc32> <json>\\n``, where the
+  JSON holds the log sequence number (lsn), the action id and the serialized
+  ``TransactionEdit``. Records are appended in apply order and made durable
+  with group-committed fsync: concurrent writers share one fsync.
+- ``snapshot.jsonl``: a compact dump of all objects and links taken at some
+  lsn. It is written to a temp file, fsynced and atomically renamed.
+- ``wal.prev.log``: the WAL segment a running checkpoint covers. Taking a
+  checkpoint rotates ``wal.log`` into it and captures the (immutable)
+  records under the writer lock; the snapshot is then written off the lock
+  and the segment is deleted once the snapshot is durable.
+
+Recovery loads the snapshot through a memory map, then replays the records
+of both WAL segments with a larger lsn. A torn or corrupt tail record (crash mid-append) ends the
+replay and is cut off the log. An edit is only acknowledged after its
+record is fsynced, so every acknowledged transaction survives a crash.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+import json
+import mmap
+import os
+import shutil
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import (
+    AddLinkEdit,
+    AddObjectEdit,
+    ObjectInstance,
+    ObjectLocator,
+    OntologyEdit,
+    TransactionEdit,
+    edit_from_dict,
+    edit_to_dict,
+)
+
+from .aggregation import AggregateSpec, AggregationResult
+from .graph_store import GraphStore, InMemoryGraphStore
+from .query import PropertyPredicate, SearchResult
+from .traversal import TraversalHit
+
+WAL_FILE_NAME = "wal.log"
+WAL_PREVIOUS_FILE_NAME = "wal.prev.log"
+SNAPSHOT_FILE_NAME = "snapshot.jsonl"
+SNAPSHOT_FORMAT = "ontology-snapshot"
+
+
+def _encode_record(payload: Dict[str, Any]) -> bytes:
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(body), body)
+
+
+def _decode_record(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one log line, or return None if it is torn or corrupt."""
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    body = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(body):
+            return None
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def _fsync_directory(path: Path) -> None:
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class WalRecord:
+    lsn: int
+    action_id: Optional[str]
+    edit: OntologyEdit
+
+
+class WriteAheadLog:
+    """Append-only edit log with group-committed fsync."""
+
+    def __init__(self, path: Path, fsync: bool = True, group_commit_delay: float = 0.0) -> None:
+        self._path = Path(path)
+        self._fsync = fsync
+        self._group_commit_delay = group_commit_delay
+        self._append_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._file = open(self._path, "ab")
+        self._appended_lsn = 0
+        self._durable_lsn = 0
+        self.sync_count = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def read(self) -> Iterator[WalRecord]:
+        """Yield valid records and cut a torn/corrupt tail off the file."""
+        valid_bytes = 0
+        with open(self._path, "rb") as handle:
+            for line in handle:
+                payload = _decode_record(line)
+                if payload is None:
+                    break
+                valid_bytes += len(line)
+                yield WalRecord(
+                    lsn=payload["lsn"],
+                    action_id=payload.get("action_id"),
+                    edit=edit_from_dict(payload["edit"]),
+                )
+        if valid_bytes != self._path.stat().st_size:
+            with self._append_lock:
+                self._file.flush()
+                self._file.truncate(valid_bytes)
+                self._file.seek(valid_bytes)
+
+    def reset_lsn(self, lsn: int) -> None:
+        self._appended_lsn = lsn
+        self._durable_lsn = lsn
+
+    def append(self, lsn: int, action_id: Optional[str], edit: OntologyEdit) -> None:
+        """Buffer one record; call ``sync(lsn)`` before acknowledging it."""
+        data = _encode_record({"lsn": lsn, "action_id": action_id, "edit": edit_to_dict(edit)})
+        with self._append_lock:
+            self._file.write(data)
+            self._appended_lsn = lsn
+
+    def sync(self, lsn: int) -> None:
+        """Make every record up to ``lsn`` durable.
+
+        Whoever takes the sync lock flushes everything appended so far, so
+        writers that queued behind it find their lsn already durable.
+        """
+        if self._durable_lsn >= lsn:
+            return
+        with self._sync_lock:
+            if self._durable_lsn >= lsn:
+                return
+            if self._group_commit_delay:
+                time.sleep(self._group_commit_delay)
+            with self._append_lock:
+                target = self._appended_lsn
+                self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            self._durable_lsn = target
+            self.sync_count += 1
+
+    def rotate(self, previous_path: Path) -> None:
+        """Move the (synced) log to ``previous_path`` and continue in an empty file."""
+        with self._append_lock:
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            if previous_path.exists():
+                # An earlier checkpoint never finished: keep its records too.
+                with open(previous_path, "ab") as previous, open(self._path, "rb") as current:
+                    shutil.copyfileobj(current, previous)
+                    previous.flush()
+                    if self._fsync:
+                        os.fsync(previous.fileno())
+                self._file.truncate(0)
+                self._file.seek(0)
+                if self._fsync:
+                    os.fsync(self._file.fileno())
+                return
+            self._file.close()
+            os.replace(self._path, previous_path)
+            self._file = open(self._path, "ab")
+            if self._fsync:
+                _fsync_directory(self._path.parent)
+
+    def truncate(self) -> None:
+        with self._append_lock:
+            self._file.flush()
+            self._file.truncate(0)
+            self._file.seek(0)
+            if self._fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._append_lock:
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            self._file.close()
+
+
+def read_wal_segment(path: Path) -> Iterator[WalRecord]:
+    """Yield the valid records of a closed WAL segment, stopping at a torn tail."""
+    with open(path, "rb") as handle:
+        for line in handle:
+            payload = _decode_record(line)
+            if payload is None:
+                return
+            yield WalRecord(
+                lsn=payload["lsn"],
+                action_id=payload.get("action_id"),
+                edit=edit_from_dict(payload["edit"]),
+            )
+
+
+def write_snapshot(store: InMemoryGraphStore, path: Path, lsn: int, fsync: bool = True) -> None:
+    """Atomically write a compact snapshot of ``store`` taken at ``lsn``."""
+    write_snapshot_records(list(store.objects.values()), list(store.links), path, lsn, fsync=fsync)
+
+
+def write_snapshot_records(
+    objects: Sequence[ObjectInstance],
+    links: Sequence[Tuple[str, Tuple[str, str], Tuple[str, str]]],
+    path: Path,
+    lsn: int,
+    fsync: bool = True,
+) -> None:
+    """Atomically write a snapshot from records captured at ``lsn``."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": 1,
+            "lsn": lsn,
+            "objects": len(objects),
+            "links": len(links),
+        }
+        handle.write(json.dumps(header).encode("utf-8") + b"\n")
+        for instance in objects:
+            row = {"o": [instance.object_type, instance.primary_key, instance.version, dict(instance.properties)]}
+            handle.write(json.dumps(row, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
+        for link_type, from_key, to_key in links:
+            row = {"l": [link_type, list(from_key), list(to_key)]}
+            handle.write(json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n")
+        handle.flush()
+        if fsync:
+            os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    if fsync:
+        _fsync_directory(path.parent)
+
+
+def load_snapshot(store: InMemoryGraphStore, path: Path) -> int:
+    """Load a snapshot into an empty store through a memory map; return its lsn."""
+    path = Path(path)
+    if not path.exists() or path.stat().st_size == 0:
+        return 0
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        header = json.loads(mapped.readline())
+        if header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format: {header.get('format')}")
+        for line in iter(mapped.readline, b""):
+            row = json.loads(line)
+            if "o" in row:
+                object_type, primary_key, version, properties = row["o"]
+                store._put_object(
+                    (object_type, primary_key),
+                    store._record(object_type, primary_key, properties, version),
+                )
+            else:
+                link_type, from_key, to_key = row["l"]
+                store._put_link((link_type, tuple(from_key), tuple(to_key)))
+        return int(header["lsn"])
+
+
+class DurableGraphStore(GraphStore):
+    """InMemoryGraphStore with a write-ahead log and periodic snapshots.
+
+    ``apply_edit`` stages and validates the edit in the in-memory store
+    under its striped key locks, so writers on disjoint keys run in
+    parallel. Only assigning the lsn, appending the record and publishing
+    the staged changes happen under ``_apply_lock``, while the stripes are
+    still held, so conflicting edits are logged in apply order. It returns
+    once the record is fsynced. Every ``snapshot_every`` records the
+    committing writer captures a checkpoint under the lock and a background
+    thread writes it.
+    """
+
+    def __init__(
+        self,
+        data_dir: str | os.PathLike[str],
+        snapshot_every: int = 10_000,
+        fsync: bool = True,
+        group_commit_delay: float = 0.0,
+    ) -> None:
+        self._data_dir = Path(data_dir)
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot_path = self._data_dir / SNAPSHOT_FILE_NAME
+        self._previous_wal_path = self._data_dir / WAL_PREVIOUS_FILE_NAME
+        self._snapshot_every = snapshot_every
+        self._fsync = fsync
+        self._apply_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._store = InMemoryGraphStore()
+        self._wal = WriteAheadLog(self._data_dir / WAL_FILE_NAME, fsync=fsync, group_commit_delay=group_commit_delay)
+        self._lsn = self._recover()
+        self._records_since_snapshot = 0
+        self._checkpoint_thread: threading.Thread | None = None
+
+    @property
+    def store(self) -> InMemoryGraphStore:
+        """Underlying in-memory store; writes must go through ``apply_edit``."""
+        return self._store
+
+    @property
+    def wal(self) -> WriteAheadLog:
+        return self._wal
+
+    @property
+    def lsn(self) -> int:
+        return self._lsn
+
+    def _recover(self) -> int:
+        lsn = load_snapshot(self._store, self._snapshot_path)
+        interrupted = self._previous_wal_path.exists()
+        segments = [read_wal_segment(self._previous_wal_path)] if interrupted else []
+        segments.append(self._wal.read())
+        for segment in segments:
+            for record in segment:
+                if record.lsn <= lsn:
+                    # Already in the snapshot (crash before the segment was dropped).
+                    continue
+                self._store.apply_edit(record.edit, action_id=record.action_id)
+                lsn = record.lsn
+        self._wal.reset_lsn(lsn)
+        if interrupted:
+            # Fold both segments into a fresh snapshot so the next rotation
+            # cannot overwrite unsnapshotted records.
+            write_snapshot(self._store, self._snapshot_path, lsn, fsync=self._fsync)
+            self._wal.truncate()
+            self._drop_previous_wal()
+        return lsn
+
+    def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
+        self.apply_group([(edit, action_id)])
+
+    def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        # One WAL record per member keeps replay identical to separate
+        # apply_edit calls; the group shares a single fsync.
+        logged: list[Tuple[int, bool]] = []
+        self._store.apply_group(transactions, commit_hook=partial(self._log, logged))
+        self._commit_logged(logged)
+
+    def bulk_load_objects(self, edits: Sequence[AddObjectEdit]) -> int:
+        # Only the objects the store actually creates are logged, as one
+        # record that replays to the same state.
+        logged: list[Tuple[int, bool]] = []
+        loaded = self._store.bulk_load_objects(edits, commit_hook=partial(self._log, logged))
+        self._commit_logged(logged)
+        return loaded
+
+    def bulk_load_links(self, edits: Sequence[AddLinkEdit]) -> int:
+        logged: list[Tuple[int, bool]] = []
+        loaded = self._store.bulk_load_links(edits, commit_hook=partial(self._log, logged))
+        self._commit_logged(logged)
+        return loaded
+
+    @contextmanager
+    def _log(
+        self,
+        logged: list[Tuple[int, bool]],
+        transactions: Sequence[Tuple[OntologyEdit, str | None]],
+    ) -> Iterator[None]:
+        """Append staged transactions to the WAL and publish them under ``_apply_lock``.
+
+        The store enters this while still holding the key stripes, so
+        conflicting transactions are logged in the order they were applied.
+        """
+        with self._apply_lock:
+            lsn, snapshot_due = 0, False
+            for edit, action_id in transactions:
+                lsn, due = self._append(edit, action_id)
+                snapshot_due = snapshot_due or due
+            yield
+        logged.append((lsn, snapshot_due))
+
+    def _append(self, edit: OntologyEdit, action_id: str | None) -> Tuple[int, bool]:
+        """Log one edit; caller holds ``_apply_lock``."""
+        self._lsn += 1
+        self._wal.append(self._lsn, action_id, edit)
+        self._records_since_snapshot += 1
+        snapshot_due = self._snapshot_every > 0 and self._records_since_snapshot >= self._snapshot_every
+        return self._lsn, snapshot_due
+
+    def _commit_logged(self, logged: list[Tuple[int, bool]]) -> None:
+        if logged and logged[0][0]:
+            self._commit(*logged[0])
+
+    def _commit(self, lsn: int, snapshot_due: bool) -> None:
+        self._wal.sync(lsn)
+        # Skip if a checkpoint is still being written; the next due write retries.
+        if snapshot_due and self._snapshot_lock.acquire(blocking=False):
+            try:
+                captured = self._capture_checkpoint()
+            except BaseException:
+                self._snapshot_lock.release()
+                raise
+            self._checkpoint_thread = threading.Thread(
+                target=self._write_checkpoint_in_background,
+                args=captured,
+                name="graph-store-checkpoint",
+                daemon=True,
+            )
+            self._checkpoint_thread.start()
+
+    def checkpoint(self) -> None:
+        """Write a snapshot of the current state and drop the WAL it covers."""
+        with self._snapshot_lock:
+            self._write_checkpoint(*self._capture_checkpoint())
+
+    def _capture_checkpoint(self) -> Tuple[int, list[ObjectInstance], list[Any]]:
+        """Rotate the WAL and capture record references; caller holds ``_snapshot_lock``."""
+        with self._apply_lock:
+            self._wal.sync(self._lsn)
+            self._wal.rotate(self._previous_wal_path)
+            self._records_since_snapshot = 0
+            # Every publish happens under _apply_lock and stored records are
+            # immutable, so copying references captures the state at that lsn.
+            return self._lsn, list(self._store.objects.values()), list(self._store.links)
+
+    def _write_checkpoint(self, lsn: int, objects: list[ObjectInstance], links: list[Any]) -> None:
+        write_snapshot_records(objects, links, self._snapshot_path, lsn, fsync=self._fsync)
+        self._drop_previous_wal()
+
+    def _write_checkpoint_in_background(self, lsn: int, objects: list[ObjectInstance], links: list[Any]) -> None:
+        try:
+            self._write_checkpoint(lsn, objects, links)
+        finally:
+            self._snapshot_lock.release()
+
+    def _drop_previous_wal(self) -> None:
+        self._previous_wal_path.unlink(missing_ok=True)
+        if self._fsync:
+            _fsync_directory(self._data_dir)
+
+    def close(self) -> None:
+        if self._checkpoint_thread is not None:
+            self._checkpoint_thread.join()
+        self._wal.close()
+
+    def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+        return self._store.get_object(locator)
+
+    def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        return self._store.get_objects(locators)
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        return self._store.list_objects(
+            object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    def neighbors(
+        self,
+        locator: ObjectLocator,
+        link_type: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[tuple[str, ObjectLocator]]:
+        return self._store.neighbors(locator, link_type=link_type, direction=direction)
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        return self._store.search_objects(
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
+
+    def create_property_index(self, object_type: str, property_name: str, kind: str = "hash") -> None:
+        self._store.create_property_index(object_type, property_name, kind=kind)
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        return self._store.aggregate_objects(
+            object_type,
+            aggregates,
+            group_by=group_by,
+            predicates=predicates,
+            limit=limit,
+        )
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        return self._store.traverse(
+            start_locator,
+            link_types=link_types,
+            direction=direction,
+            max_depth=max_depth,
+            limit=limit,
+            max_fanout=max_fanout,
+        )
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        return self._store.iter_objects(object_type, after_primary_key=after_primary_key, batch_size=batch_size)
+
+    def has_action_applied(self, action_id: str, edit_payload: Dict[str, Any] | None) -> bool:
+        return self._store.has_action_applied(action_id, edit_payload)
+
+    def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        return self._store.has_actions_applied(probes)
+
+    def schema_status(self) -> list[Dict[str, Any]]:
+        return self._store.schema_status()
+
+    def pool_stats(self) -> Dict[str, Any] | None:
+        return self._store.pool_stats()
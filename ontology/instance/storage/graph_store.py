@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass
-import copy
 import importlib
-from typing import Any, Dict, Set, Tuple
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Set, Tuple
 
 from ontology.action.storage.edits import (
     AddLinkEdit,
@@ -19,31 +20,264 @@ from ontology.action.storage.edits import (
     TransactionEdit,
 )
 
+from .aggregation import (
+    AggregateGroup,
+    AggregateSpec,
+    AggregationResult,
+    aggregate_instances,
+    validate_aggregation,
+)
+from .cypher_batch import (
+    DEFAULT_MAX_BATCH_ROWS,
+    CypherBatch,
+    compile_bulk_load,
+    compile_edits,
+    compile_transactions,
+    quote_name,
+)
+from .indexes import AdjacencyIndex, HashPropertyIndex, SortedKeyIndex, SortedPropertyIndex
+from .neo4j_pool import READ_ACCESS, WRITE_ACCESS, Neo4jPoolConfig, Neo4jPoolMetrics, is_acquisition_timeout
+from .neo4j_schema import Neo4jSchemaManager
+from .query import (
+    EQUALITY_OPS,
+    PROPERTY_INDEX_KINDS,
+    PropertyPredicate,
+    QueryPlan,
+    SearchResult,
+    matches_all,
+    property_index_name,
+    range_bounds,
+    value_key,
+)
+from .records import ShapeTable
+from .traversal import TraversalHit, validate_traversal
+from .write_set import DEFAULT_LOCK_STRIPES, LockStripes, WriteSet
+
 
 class GraphStore:
     """Storage abstraction for ontology object/link read-write operations."""
     def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
         raise NotImplementedError
 
+    def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        """Apply independent ``(edit, action_id)`` transactions in one backend commit.
+
+        All-or-nothing: if any member fails, none is applied and the error
+        is raised. Members are applied in order, each stamped with its own
+        action id, exactly as consecutive ``apply_edit`` calls would.
+        """
+        raise NotImplementedError
+
     def get_object(self, locator: ObjectLocator) -> ObjectInstance:
         raise NotImplementedError
 
-    def list_objects(self, object_type: str, limit: int = 100, offset: int = 0) -> list[ObjectInstance]:
+    def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        """Fetch many objects at once; results align with ``locators`` and missing ones are None."""
+        results: list[ObjectInstance | None] = []
+        for locator in locators:
+            try:
+                results.append(self.get_object(locator))
+            except ValueError:
+                results.append(None)
+        return results
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        """List objects of one type ordered by primary key.
+
+        ``after_primary_key`` is a keyset cursor: only objects whose primary key
+        sorts strictly after it are returned. ``offset`` is applied after the
+        cursor and is kept for backwards compatibility.
+        """
         raise NotImplementedError
 
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        """Lazily yield every object of a type in primary-key order.
+
+        Memory use is bounded by ``batch_size`` regardless of how many objects
+        the type holds. The default walks ``list_objects`` with a keyset cursor.
+        """
+        cursor = after_primary_key
+        while True:
+            page = self.list_objects(object_type, limit=batch_size, after_primary_key=cursor)
+            yield from page
+            if len(page) < batch_size:
+                return
+            cursor = page[-1].primary_key
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        """Return objects matching every predicate, ordered by primary key.
+
+        The default pages through ``list_objects`` and filters client-side;
+        backends override it to use indexes or push predicates down.
+        """
+        objects: list[ObjectInstance] = []
+        examined = 0
+        cursor = after_primary_key
+        while len(objects) < limit:
+            page = self.list_objects(object_type, limit=500, after_primary_key=cursor)
+            if not page:
+                break
+            for instance in page:
+                examined += 1
+                if matches_all(predicates, instance.properties):
+                    objects.append(instance)
+                    if len(objects) >= limit:
+                        break
+            cursor = page[-1].primary_key
+        return SearchResult(objects=objects, plan=QueryPlan(strategy="scan", examined=examined))
+
+    def create_property_index(self, object_type: str, property_name: str, kind: str = "hash") -> None:
+        """Create a secondary index on ``(object_type, property_name)`` used by ``search_objects``."""
+        raise NotImplementedError
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        """Compute count/sum/avg/min/max per distinct ``group_by`` values.
+
+        The default pages matching objects through ``search_objects`` and
+        aggregates them in process; backends override it to aggregate where
+        the data lives.
+        """
+        validate_aggregation(aggregates, group_by)
+        instances: list[ObjectInstance] = []
+        cursor: str | None = None
+        while True:
+            page = self.search_objects(object_type, predicates, limit=1000, after_primary_key=cursor).objects
+            instances.extend(page)
+            if len(page) < 1000:
+                break
+            cursor = page[-1].primary_key
+        return aggregate_instances(instances, aggregates, group_by, limit=limit)
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        """Stream objects reachable from ``start_locator`` breadth-first.
+
+        Only links whose type is in ``link_types`` are followed (all when
+        None). Each object is reported once, at its shortest depth, and the
+        start object is never reported. ``max_fanout`` caps how many links
+        are followed out of any single object per hop. Raises ValueError
+        eagerly when the start object does not exist.
+        """
+        raise NotImplementedError
+
+    def bulk_load_objects(self, edits: Sequence[AddObjectEdit]) -> int:
+        """Create objects that do not exist yet; return how many were created.
+
+        Existing keys are skipped instead of failing the batch, so an
+        interrupted import can be re-run. Objects are stored at version 1
+        without an action id. The default applies one edit at a time;
+        backends override it with a batched write path.
+        """
+        loaded = 0
+        for edit in edits:
+            try:
+                self.apply_edit(edit)
+            except ValueError:
+                continue
+            loaded += 1
+        return loaded
+
+    def bulk_load_links(self, edits: Sequence[AddLinkEdit]) -> int:
+        """Create links whose endpoints both exist; return how many were written.
+
+        Links that already exist count as written (loading is idempotent).
+        """
+        loaded = 0
+        for edit in edits:
+            try:
+                self.apply_edit(edit)
+            except ValueError:
+                continue
+            loaded += 1
+        return loaded
+
     def has_action_applied(self, action_id: str, edit_payload: Dict[str, Any] | None) -> bool:
         raise NotImplementedError
 
+    def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        """Bulk variant of ``has_action_applied`` for ``(action_id, edit_payload)`` probes.
+
+        Backends override this to answer all probes in one round trip; the
+        default falls back to one probe at a time.
+        """
+        return [self.has_action_applied(action_id, edit_payload) for action_id, edit_payload in probes]
+
+    def schema_status(self) -> list[Dict[str, Any]]:
+        """Describe backend indexes used by lookups (admin/diagnostics only)."""
+        return []
+
+    def pool_stats(self) -> Dict[str, Any] | None:
+        """Connection pool counters; ``None`` for backends without a pool."""
+        return None
+
+
+# Wraps the publish of staged transactions, e.g. to log them in apply order.
+CommitHook = Callable[[Sequence[Tuple[OntologyEdit, str | None]]], AbstractContextManager[Any]]
+
 
 @dataclass
 class InMemoryGraphStore(GraphStore):
-    """In-memory GraphStore implementation for tests and local runs."""
+    """In-memory GraphStore implementation for tests and local runs.
+
+    Safe for concurrent use. A transaction holds the striped locks of the
+    keys it touches while it validates and stages its changes in a private
+    write set, then publishes them under a short latch. Transactions on
+    disjoint keys run in parallel, a failed transaction leaves no trace, and
+    readers take the latch only to collect references to published
+    (immutable) instances, so they never see partial transactions and never
+    wait for a running one.
+
+    Objects are stored as compact immutable records (interned per-type
+    property names plus a value tuple) and reads return them without copying.
+    """
     objects: Dict[Tuple[str, str], ObjectInstance]
     links: Set[Tuple[str, Tuple[str, str], Tuple[str, str]]]
 
-    def __init__(self) -> None:
+    def __init__(self, lock_stripes: int = DEFAULT_LOCK_STRIPES) -> None:
         self.objects = {}
         self.links = set()
+        self._shapes = ShapeTable()
+        self._type_index: Dict[str, SortedKeyIndex] = {}
+        self._property_indexes: Dict[str, Dict[str, HashPropertyIndex]] = {}
+        self._outgoing = AdjacencyIndex()
+        self._incoming = AdjacencyIndex()
+        self._key_locks = LockStripes(lock_stripes)
+        self._latch = threading.Lock()
+        self._local = threading.local()
 
     def add_object(
         self,
@@ -52,18 +286,7 @@ class InMemoryGraphStore(GraphStore):
         properties: Dict[str, Any],
         action_id: str | None = None,
     ) -> None:
-        key = (object_type, primary_key)
-        if key in self.objects:
-            raise ValueError("Object already exists")
-        stored_properties = dict(properties)
-        if action_id:
-            stored_properties["last_modified_by_action_id"] = action_id
-        self.objects[key] = ObjectInstance(
-            object_type=object_type,
-            primary_key=primary_key,
-            properties=stored_properties,
-            version=1,
-        )
+        self.apply_edit(AddObjectEdit(object_type, primary_key, properties), action_id=action_id)
 
     def modify_object(
         self,
@@ -71,101 +294,472 @@ class InMemoryGraphStore(GraphStore):
         properties: Dict[str, Any],
         action_id: str | None = None,
     ) -> None:
-        key = (locator.object_type, locator.primary_key)
-        instance = self.objects.get(key)
-        if instance is None:
-            raise ValueError("Object not found")
-        if locator.version is not None and instance.version != locator.version:
-            raise ValueError("Version conflict")
-        instance.properties.update(properties)
-        if action_id:
-            instance.properties["last_modified_by_action_id"] = action_id
-        instance.version = (instance.version or 0) + 1
+        self.apply_edit(ModifyObjectEdit(locator, properties), action_id=action_id)
+
+    def delete_object(self, locator: ObjectLocator) -> None:
+        self.apply_edit(DeleteObjectEdit(locator))
 
     def add_link(self, link_type: str, from_locator: ObjectLocator, to_locator: ObjectLocator) -> None:
-        self.links.add(
-            (link_type, (from_locator.object_type, from_locator.primary_key), (to_locator.object_type, to_locator.primary_key))
-        )
+        self.apply_edit(AddLinkEdit(link_type, from_locator, to_locator))
 
     def remove_link(self, link_type: str, from_locator: ObjectLocator, to_locator: ObjectLocator) -> None:
-        self.links.discard(
-            (link_type, (from_locator.object_type, from_locator.primary_key), (to_locator.object_type, to_locator.primary_key))
-        )
+        self.apply_edit(RemoveLinkEdit(link_type, from_locator, to_locator))
+
+    def neighbors(
+        self,
+        locator: ObjectLocator,
+        link_type: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[tuple[str, ObjectLocator]]:
+        """Return ``(link_type, neighbour)`` pairs linked to one object in O(degree).
+
+        ``direction`` is ``outgoing`` (object is the link source), ``incoming``
+        (object is the link target) or ``both``.
+        """
+        if direction not in ("outgoing", "incoming", "both"):
+            raise ValueError(f"Unsupported link direction: {direction}")
+        key = (locator.object_type, locator.primary_key)
+        with self._latch:
+            found: list[tuple[str, Tuple[str, str]]] = []
+            if direction in ("outgoing", "both"):
+                found.extend(self._outgoing.neighbors(key, link_type))
+            if direction in ("incoming", "both"):
+                found.extend(self._incoming.neighbors(key, link_type))
+        return [(current_type, ObjectLocator(other[0], other[1])) for current_type, other in found]
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        validate_traversal(direction, max_depth, limit, max_fanout, link_types)
+        start = (start_locator.object_type, start_locator.primary_key)
+        if start not in self.objects:
+            raise ValueError("Object not found")
+        return self._breadth_first(start, link_types, direction, max_depth, limit, max_fanout)
+
+    def _breadth_first(
+        self,
+        start: Tuple[str, str],
+        link_types: Sequence[str] | None,
+        direction: str,
+        max_depth: int,
+        limit: int,
+        max_fanout: int | None,
+    ) -> Iterator[TraversalHit]:
+        # Each hop is expanded under the latch and yielded after releasing it,
+        # so a slow consumer never holds up writers.
+        visited = {start}
+        frontier = [start]
+        emitted = 0
+        for depth in range(1, max_depth + 1):
+            hop: list[tuple[str, Tuple[str, str], ObjectInstance]] = []
+            with self._latch:
+                for node in frontier:
+                    edges = sorted(self._edges_of(node, link_types, direction))
+                    for link_type, other in edges[:max_fanout]:
+                        if other in visited:
+                            continue
+                        instance = self.objects.get(other)
+                        if instance is None:
+                            continue
+                        visited.add(other)
+                        hop.append((link_type, node, instance))
+                        if emitted + len(hop) >= limit:
+                            break
+                    if emitted + len(hop) >= limit:
+                        break
+            for link_type, via, instance in hop:
+                yield TraversalHit(
+                    depth=depth,
+                    link_type=link_type,
+                    via=ObjectLocator(via[0], via[1]),
+                    object=instance,
+                )
+            emitted += len(hop)
+            frontier = [(instance.object_type, instance.primary_key) for _, _, instance in hop]
+            if emitted >= limit or not frontier:
+                return
+
+    def _edges_of(
+        self,
+        node: Tuple[str, str],
+        link_types: Sequence[str] | None,
+        direction: str,
+    ) -> Iterator[tuple[str, Tuple[str, str]]]:
+        for link_type in link_types or (None,):
+            if direction in ("outgoing", "both"):
+                yield from self._outgoing.neighbors(node, link_type)
+            if direction in ("incoming", "both"):
+                yield from self._incoming.neighbors(node, link_type)
 
     def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
-        if isinstance(edit, TransactionEdit):
-            snapshot_objects = copy.deepcopy(self.objects)
-            snapshot_links = set(self.links)
+        write_set: WriteSet | None = getattr(self._local, "write_set", None)
+        if write_set is not None:
+            # Nested edit: the outermost transaction already holds the locks.
+            self._stage(write_set, edit, action_id)
+            return
+        self.apply_group([(edit, action_id)])
+
+    def apply_group(
+        self,
+        transactions: Sequence[Tuple[OntologyEdit, str | None]],
+        commit_hook: Optional[CommitHook] = None,
+    ) -> None:
+        """Apply transactions atomically.
+
+        ``commit_hook`` is entered with the transactions after they were
+        staged and validated, still under their key stripes, and wraps the
+        publish; conflicting transactions therefore enter it in apply order.
+        """
+        keys = {
+            (locator.object_type, locator.primary_key)
+            for edit, _ in transactions
+            for locator in _extract_locators(edit)
+        }
+        with self._key_locks.hold(keys):
+            write_set = WriteSet()
+            self._local.write_set = write_set
             try:
-                for nested in edit.edits:
-                    self.apply_edit(nested, action_id=action_id)
-            except Exception:
-                self.objects = snapshot_objects
-                self.links = snapshot_links
-                raise
+                for edit, action_id in transactions:
+                    self._stage(write_set, edit, action_id)
+            finally:
+                self._local.write_set = None
+            with _enter_hook(commit_hook, transactions):
+                self._publish(write_set)
+
+    def _stage(self, write_set: WriteSet, edit: OntologyEdit, action_id: str | None) -> None:
+        if isinstance(edit, TransactionEdit):
+            for nested in edit.edits:
+                self._stage(write_set, nested, action_id)
             return
         if isinstance(edit, AddObjectEdit):
-            self.add_object(edit.object_type, edit.primary_key, edit.properties, action_id=action_id)
+            self._stage_add_object(write_set, edit, action_id)
             return
         if isinstance(edit, DeleteObjectEdit):
-            self.delete_object(edit.locator)
+            self._stage_delete_object(write_set, edit.locator)
             return
         if isinstance(edit, ModifyObjectEdit):
-            self.modify_object(edit.locator, edit.properties, action_id=action_id)
+            self._stage_modify_object(write_set, edit, action_id)
             return
         if isinstance(edit, AddLinkEdit):
-            self.add_link(edit.link_type, edit.from_locator, edit.to_locator)
+            write_set.stage_link(_link_key(edit.link_type, edit.from_locator, edit.to_locator), True)
             return
         if isinstance(edit, (RemoveLinkEdit, DeleteLinkEdit)):
-            self.remove_link(edit.link_type, edit.from_locator, edit.to_locator)
+            write_set.stage_link(_link_key(edit.link_type, edit.from_locator, edit.to_locator), False)
             return
         raise ValueError(f"Unsupported edit: {edit}")
 
-    def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+    def _stage_add_object(self, write_set: WriteSet, edit: AddObjectEdit, action_id: str | None) -> None:
+        key = (edit.object_type, edit.primary_key)
+        if self._visible_object(write_set, key) is not None:
+            raise ValueError("Object already exists")
+        stored_properties = dict(edit.properties)
+        if action_id:
+            stored_properties["last_modified_by_action_id"] = action_id
+        write_set.stage_object(key, self._record(edit.object_type, edit.primary_key, stored_properties, 1))
+
+    def _stage_modify_object(self, write_set: WriteSet, edit: ModifyObjectEdit, action_id: str | None) -> None:
+        locator = edit.locator
         key = (locator.object_type, locator.primary_key)
-        instance = self.objects.get(key)
+        instance = self._visible_object(write_set, key)
         if instance is None:
             raise ValueError("Object not found")
-        return ObjectInstance(
-            object_type=instance.object_type,
-            primary_key=instance.primary_key,
-            properties=dict(instance.properties),
-            version=instance.version,
+        if locator.version is not None and instance.version != locator.version:
+            raise ValueError("Version conflict")
+        # Copy-on-write: published instances are never mutated in place.
+        properties = {**instance.properties, **edit.properties}
+        if action_id:
+            properties["last_modified_by_action_id"] = action_id
+        write_set.stage_object(
+            key,
+            self._record(instance.object_type, instance.primary_key, properties, (instance.version or 0) + 1),
         )
 
-    def list_objects(self, object_type: str, limit: int = 100, offset: int = 0) -> list[ObjectInstance]:
-        results = [
-            ObjectInstance(
-                object_type=instance.object_type,
-                primary_key=instance.primary_key,
-                properties=dict(instance.properties),
-                version=instance.version,
-            )
-            for (obj_type, _), instance in self.objects.items()
-            if obj_type == object_type
-        ]
-        results.sort(key=lambda item: item.primary_key)
-        return results[offset : offset + limit]
-
-    def delete_object(self, locator: ObjectLocator) -> None:
+    def _stage_delete_object(self, write_set: WriteSet, locator: ObjectLocator) -> None:
         key = (locator.object_type, locator.primary_key)
-        instance = self.objects.get(key)
+        instance = self._visible_object(write_set, key)
         if instance is None:
             raise ValueError("Object not found")
         if locator.version is not None and instance.version != locator.version:
             raise ValueError("Version conflict")
-        del self.objects[key]
-        self.links = {
-            link
-            for link in self.links
-            if link[1] != key and link[2] != key
-        }
+        write_set.stage_object(key, None)
+        with self._latch:
+            touching = {(link_type, key, other) for link_type, other in self._outgoing.neighbors(key)}
+            touching.update((link_type, other, key) for link_type, other in self._incoming.neighbors(key))
+        touching.update(link for link, present in write_set.links_touching(key) if present)
+        for link in touching:
+            write_set.stage_link(link, False)
+
+    def _visible_object(self, write_set: WriteSet, key: Tuple[str, str]) -> ObjectInstance | None:
+        if key in write_set.objects:
+            return write_set.objects[key]
+        return self.objects.get(key)
+
+    def _record(
+        self,
+        object_type: str,
+        primary_key: str,
+        properties: Mapping[str, Any],
+        version: int | None,
+    ) -> ObjectInstance:
+        return self._shapes.record(object_type, primary_key, properties, version)
+
+    def _publish(self, write_set: WriteSet) -> None:
+        with self._latch:
+            for key, instance in write_set.objects.items():
+                if instance is None:
+                    self._drop_object(key)
+                else:
+                    self._put_object(key, instance)
+            for link, present in write_set.links.items():
+                if present:
+                    self._put_link(link)
+                else:
+                    self._drop_link(link)
+
+    def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+        instance = self.objects.get((locator.object_type, locator.primary_key))
+        if instance is None:
+            raise ValueError("Object not found")
+        return instance
+
+    def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        with self._latch:
+            return [self.objects.get((locator.object_type, locator.primary_key)) for locator in locators]
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        found: list[ObjectInstance] = []
+        with self._latch:
+            index = self._type_index.get(object_type)
+            if index is None:
+                return []
+            for primary_key in index.iter_from(after=after_primary_key, offset=offset):
+                if len(found) >= limit:
+                    break
+                found.append(self.objects[(object_type, primary_key)])
+        return found
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        # Re-seek the ordered type index per batch so the latch is never held
+        # while the consumer (e.g. a slow HTTP client) processes objects.
+        cursor = after_primary_key
+        while True:
+            with self._latch:
+                index = self._type_index.get(object_type)
+                if index is None:
+                    return
+                batch: list[ObjectInstance] = []
+                for primary_key in index.iter_from(after=cursor):
+                    batch.append(self.objects[(object_type, primary_key)])
+                    if len(batch) >= batch_size:
+                        break
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            cursor = batch[-1].primary_key
+
+    def bulk_load_objects(self, edits: Sequence[AddObjectEdit], commit_hook: Optional[CommitHook] = None) -> int:
+        # Bulk loads skip the write set: one stripe acquisition and one latch
+        # hold per call, and type indexes are extended chunk-wise instead of
+        # per key. Callers bound the latch hold by bounding the batch size.
+        # The stripes pin whether each key exists, so the new objects are
+        # picked before taking the latch and only they reach ``commit_hook``.
+        new_keys: Dict[str, list[str]] = {}
+        with self._key_locks.hold([(edit.object_type, edit.primary_key) for edit in edits]):
+            fresh: Dict[Tuple[str, str], AddObjectEdit] = {}
+            for edit in edits:
+                key = (edit.object_type, edit.primary_key)
+                if key not in fresh and key not in self.objects:
+                    fresh[key] = edit
+            if not fresh:
+                return 0
+            with _enter_hook(commit_hook, [(TransactionEdit(edits=list(fresh.values())), None)]), self._latch:
+                for key, edit in fresh.items():
+                    instance = self._record(edit.object_type, edit.primary_key, edit.properties, 1)
+                    self.objects[key] = instance
+                    for property_name, property_index in self._property_indexes.get(key[0], {}).items():
+                        _index_property(property_index, instance, property_name)
+                    new_keys.setdefault(key[0], []).append(key[1])
+                for object_type, primary_keys in new_keys.items():
+                    index = self._type_index.get(object_type)
+                    if index is None:
+                        index = self._type_index[object_type] = SortedKeyIndex()
+                    index.update(primary_keys)
+        return len(fresh)
+
+    def bulk_load_links(self, edits: Sequence[AddLinkEdit], commit_hook: Optional[CommitHook] = None) -> int:
+        # Endpoint stripes keep a concurrent delete from orphaning a new link.
+        endpoints = [
+            (locator.object_type, locator.primary_key)
+            for edit in edits
+            for locator in (edit.from_locator, edit.to_locator)
+        ]
+        with self._key_locks.hold(endpoints):
+            linkable = [
+                edit
+                for edit in edits
+                if (edit.from_locator.object_type, edit.from_locator.primary_key) in self.objects
+                and (edit.to_locator.object_type, edit.to_locator.primary_key) in self.objects
+            ]
+            if not linkable:
+                return 0
+            with _enter_hook(commit_hook, [(TransactionEdit(edits=list(linkable)), None)]), self._latch:
+                for edit in linkable:
+                    self._put_link(_link_key(edit.link_type, edit.from_locator, edit.to_locator))
+        return len(linkable)
+
+    def _put_object(self, key: Tuple[str, str], instance: ObjectInstance) -> None:
+        previous = self.objects.get(key)
+        self.objects[key] = instance
+        index = self._type_index.get(key[0])
+        if index is None:
+            index = self._type_index[key[0]] = SortedKeyIndex()
+        index.add(key[1])
+        property_indexes = self._property_indexes.get(key[0])
+        if property_indexes:
+            for property_name, property_index in property_indexes.items():
+                if previous is not None:
+                    _unindex_property(property_index, previous, property_name)
+                _index_property(property_index, instance, property_name)
+
+    def _drop_object(self, key: Tuple[str, str]) -> None:
+        previous = self.objects.pop(key, None)
+        if previous is None:
+            return
+        for property_name, property_index in self._property_indexes.get(key[0], {}).items():
+            _unindex_property(property_index, previous, property_name)
+        index = self._type_index.get(key[0])
+        if index is not None:
+            index.discard(key[1])
+            if not len(index):
+                del self._type_index[key[0]]
+
+    def _put_link(self, link: Tuple[str, Tuple[str, str], Tuple[str, str]]) -> None:
+        link_type, from_key, to_key = link
+        self.links.add(link)
+        self._outgoing.add(from_key, link_type, to_key)
+        self._incoming.add(to_key, link_type, from_key)
+
+    def _drop_link(self, link: Tuple[str, Tuple[str, str], Tuple[str, str]]) -> None:
+        link_type, from_key, to_key = link
+        self.links.discard(link)
+        self._outgoing.discard(from_key, link_type, to_key)
+        self._incoming.discard(to_key, link_type, from_key)
+
+    def create_property_index(self, object_type: str, property_name: str, kind: str = "hash") -> None:
+        """Build (or rebuild as another kind) a secondary index from existing objects."""
+        if kind not in PROPERTY_INDEX_KINDS:
+            raise ValueError(f"Unsupported property index kind: {kind}")
+        with self._latch:
+            existing = self._property_indexes.get(object_type, {}).get(property_name)
+            if existing is not None and existing.kind == kind:
+                return
+            property_index = SortedPropertyIndex() if kind == "sorted" else HashPropertyIndex()
+            for primary_key in self._type_index.get(object_type, ()):
+                _index_property(property_index, self.objects[(object_type, primary_key)], property_name)
+            self._property_indexes.setdefault(object_type, {})[property_name] = property_index
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        found: list[ObjectInstance] = []
+        with self._latch:
+            plan, candidates = self._plan_search(object_type, predicates)
+            examined = 0
+            if candidates is None:
+                keys = self._type_index.get(object_type)
+                ordered = keys.iter_from(after=after_primary_key) if keys is not None else iter(())
+            else:
+                ordered = iter(sorted(
+                    key for key in candidates if after_primary_key is None or key > after_primary_key
+                ))
+            for primary_key in ordered:
+                if len(found) >= limit:
+                    break
+                instance = self.objects[(object_type, primary_key)]
+                examined += 1
+                if matches_all(predicates, instance.properties):
+                    found.append(instance)
+            plan.examined = examined
+        return SearchResult(objects=found, plan=plan)
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        validate_aggregation(aggregates, group_by)
+        with self._latch:
+            _, candidates = self._plan_search(object_type, predicates)
+            keys = candidates if candidates is not None else self._type_index.get(object_type, ())
+            instances = [self.objects[(object_type, primary_key)] for primary_key in keys]
+        # Published instances are immutable, so columns are built outside the latch.
+        if predicates:
+            instances = [instance for instance in instances if matches_all(predicates, instance.properties)]
+        return aggregate_instances(instances, aggregates, group_by, limit=limit)
+
+    def _plan_search(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+    ) -> tuple[QueryPlan, set[str] | None]:
+        """Pick the most selective usable index, or fall back to a type scan.
+
+        Equality/IN predicates can use either index kind; range predicates
+        need a sorted index. Candidates are still re-checked against every
+        predicate, so an index only narrows the scan.
+        """
+        property_indexes = self._property_indexes.get(object_type, {})
+        best: tuple[int, str, list] | None = None
+        for property_name, property_index in property_indexes.items():
+            on_property = [predicate for predicate in predicates if predicate.property_name == property_name]
+            equality = [predicate for predicate in on_property if predicate.op in EQUALITY_OPS]
+            if equality:
+                values = min((predicate.value_keys() for predicate in equality), key=property_index.count)
+                estimate = property_index.count(values)
+            elif on_property and isinstance(property_index, SortedPropertyIndex):
+                bounds = range_bounds(on_property)
+                values = [] if bounds is None else property_index.range_values(*bounds)
+                estimate = property_index.count(values)
+            else:
+                continue
+            if best is None or estimate < best[0]:
+                best = (estimate, property_name, values)
+        if best is None:
+            return QueryPlan(strategy="scan"), None
+        _, property_name, values = best
+        plan = QueryPlan(
+            strategy="index",
+            index=property_index_name(object_type, property_name),
+            property_name=property_name,
+        )
+        return plan, property_indexes[property_name].lookup(values)
 
     def has_action_applied(self, action_id: str, edit_payload: Dict[str, Any] | None) -> bool:
-        if not edit_payload:
-            return False
-        edit = edit_from_dict(edit_payload)
-        locators = _extract_locators(edit)
+        locators = _payload_locators(edit_payload)
         if not locators:
             return False
         for locator in locators:
@@ -177,189 +771,598 @@ class InMemoryGraphStore(GraphStore):
                 return False
         return True
 
+    def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        return [self.has_action_applied(action_id, edit_payload) for action_id, edit_payload in probes]
+
+    def schema_status(self) -> list[Dict[str, Any]]:
+        with self._latch:
+            entries = [
+                (f"type_index_{object_type}", "ORDERED", object_type, "primary_key", len(index))
+                for object_type, index in self._type_index.items()
+            ]
+            entries.extend(
+                (
+                    property_index_name(object_type, property_name),
+                    "ORDERED" if property_index.kind == "sorted" else "HASH",
+                    object_type,
+                    property_name,
+                    len(property_index),
+                )
+                for object_type, by_property in self._property_indexes.items()
+                for property_name, property_index in by_property.items()
+            )
+        return [
+            {
+                "name": name,
+                "type": index_type,
+                "labels": [object_type],
+                "properties": [property_name],
+                "state": "ONLINE",
+                "population_percent": 100.0,
+                "size": size,
+            }
+            for name, index_type, object_type, property_name, size in sorted(entries)
+        ]
+
+
+def _index_property(property_index: HashPropertyIndex, instance: ObjectInstance, property_name: str) -> None:
+    key = value_key(instance.properties.get(property_name))
+    if key is not None:
+        property_index.add(key, instance.primary_key)
+
+
+def _unindex_property(property_index: HashPropertyIndex, instance: ObjectInstance, property_name: str) -> None:
+    key = value_key(instance.properties.get(property_name))
+    if key is not None:
+        property_index.discard(key, instance.primary_key)
+
+
+def _enter_hook(
+    commit_hook: Optional[CommitHook],
+    transactions: Sequence[Tuple[OntologyEdit, str | None]],
+) -> AbstractContextManager[Any]:
+    return nullcontext() if commit_hook is None else commit_hook(transactions)
+
+
+def _link_key(
+    link_type: str,
+    from_locator: ObjectLocator,
+    to_locator: ObjectLocator,
+) -> Tuple[str, Tuple[str, str], Tuple[str, str]]:
+    return (
+        link_type,
+        (from_locator.object_type, from_locator.primary_key),
+        (to_locator.object_type, to_locator.primary_key),
+    )
+
 
 class Neo4jGraphStore(GraphStore):
-    """Neo4j-backed GraphStore implementation for production-like environments."""
-    def __init__(self, uri: str, user: str, password: str) -> None:
+    """Neo4j-backed GraphStore implementation for production-like environments.
+
+    Reads run as managed read transactions (``execute_read``), so a
+    ``neo4j://`` routing driver spreads them over read replicas and retries
+    transient failures; writes run through ``execute_write`` on the leader.
+    """
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        auto_schema: bool = True,
+        schema_labels: Iterable[str] = (),
+        pool_config: Neo4jPoolConfig | None = None,
+    ) -> None:
         neo4j_module = importlib.import_module("neo4j")
-        self._driver = neo4j_module.GraphDatabase.driver(uri, auth=(user, password))
+        config = pool_config or Neo4jPoolConfig()
+        self._driver = neo4j_module.GraphDatabase.driver(uri, auth=(user, password), **config.driver_kwargs())
+        self._session_config: Dict[str, Any] = {}
+        if config.database is not None:
+            self._session_config["database"] = config.database
+        if config.causal_consistency:
+            self._session_config["bookmark_manager"] = neo4j_module.GraphDatabase.bookmark_manager()
+        self._pool_metrics = Neo4jPoolMetrics(config.max_connection_pool_size)
+        self._max_batch_rows = max_batch_rows
+        # Labels are provisioned lazily on first use; schema_labels are
+        # provisioned eagerly so known types are indexed before traffic.
+        self._schema = Neo4jSchemaManager(self._driver, database=config.database) if auto_schema else None
+        if self._schema is not None and schema_labels:
+            self._schema.ensure_labels(schema_labels)
+        self._property_indexes: Dict[Tuple[str, str], str] = {}
+
+    def schema_status(self) -> list[Dict[str, Any]]:
+        if self._schema is None:
+            return []
+        return self._schema.status()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Session/transaction counters used to size the connection pool."""
+        return self._pool_metrics.as_dict()
+
+    def close(self) -> None:
+        self._driver.close()
+
+    def _ensure_schema(self, labels: Iterable[str]) -> None:
+        if self._schema is not None:
+            self._schema.ensure_labels(labels)
+
+    @contextmanager
+    def _session(self, **overrides: Any) -> Iterator[Any]:
+        self._pool_metrics.session_opened()
+        try:
+            with self._driver.session(**self._session_config, **overrides) as session:
+                yield session
+        except Exception as exc:
+            if is_acquisition_timeout(exc):
+                self._pool_metrics.acquisition_timed_out()
+            raise
+        finally:
+            self._pool_metrics.session_closed()
+
+    def _managed(self, session: Any, access_mode: str, work: Callable[..., Any], *args: Any) -> Any:
+        """Run ``work(tx, *args)`` as one retryable transaction and count driver retries."""
+        attempts = 0
+
+        def attempt(tx: Any, *work_args: Any) -> Any:
+            nonlocal attempts
+            attempts += 1
+            return work(tx, *work_args)
+
+        try:
+            if access_mode == READ_ACCESS:
+                return session.execute_read(attempt, *args)
+            return session.execute_write(attempt, *args)
+        finally:
+            self._pool_metrics.transaction_finished(access_mode, attempts)
+
+    def _read(self, work: Callable[..., Any], *args: Any) -> Any:
+        with self._session() as session:
+            return self._managed(session, READ_ACCESS, work, *args)
+
+    def _write(self, work: Callable[..., Any], *args: Any) -> Any:
+        with self._session() as session:
+            return self._managed(session, WRITE_ACCESS, work, *args)
 
     def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
+        self._ensure_schema({locator.object_type for locator in _extract_locators(edit)})
         if isinstance(edit, TransactionEdit):
-            with self._driver.session() as session:
-                session.execute_write(self._apply_transaction, edit, action_id)
+            self._write(self._apply_transaction, edit, action_id)
             return
-        with self._driver.session() as session:
-            session.execute_write(self._apply_single, edit, action_id)
+        self._write(self._apply_single, edit, action_id)
+
+    def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        self._ensure_schema(
+            {locator.object_type for edit, _ in transactions for locator in _extract_locators(edit)}
+        )
+        self._write(self._apply_group, transactions)
+
+    def bulk_load_objects(self, edits: Sequence[AddObjectEdit]) -> int:
+        self._ensure_schema({edit.object_type for edit in edits})
+        return self._bulk_load(edits)
+
+    def bulk_load_links(self, edits: Sequence[AddLinkEdit]) -> int:
+        return self._bulk_load(edits)
+
+    def _bulk_load(self, edits: Sequence[OntologyEdit]) -> int:
+        batches = compile_bulk_load(edits, self._max_batch_rows)
+        if not batches:
+            return 0
+        return self._write(self._run_bulk_batches, batches)
+
+    @staticmethod
+    def _run_bulk_batches(tx: Any, batches: list[CypherBatch]) -> int:
+        loaded = 0
+        for batch in batches:
+            loaded += batch.loaded(tx.run(batch.query, rows=batch.rows).single())
+        return loaded
 
     def get_object(self, locator: ObjectLocator) -> ObjectInstance:
-        label = self._escape_label(locator.object_type)
-        query = f"MATCH (n:{label} {{primary_key: $primary_key}}) RETURN n"
-        with self._driver.session() as session:
-            record = session.run(query, primary_key=locator.primary_key).single()
+        self._ensure_schema((locator.object_type,))
+        record = self._read(_read_single, _get_object_query(locator.object_type), {"primary_key": locator.primary_key})
         if record is None:
             raise ValueError("Object not found")
-        node = record["n"]
+        return self._node_to_instance(locator.object_type, record["n"])
+
+    def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        results: list[ObjectInstance | None] = [None] * len(locators)
+        labels, query, params = _compile_get_objects(locators)
+        if not query:
+            return results
+        self._ensure_schema(labels)
+        for record in self._read(_read_records, query, params):
+            idx = record["idx"]
+            results[idx] = self._node_to_instance(locators[idx].object_type, record["n"])
+        return results
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        self._ensure_schema((object_type,))
+        records = self._read(
+            _read_records,
+            _list_objects_query(object_type, after_primary_key),
+            {"offset": offset, "limit": limit, "after_primary_key": after_primary_key},
+        )
+        return [self._node_to_instance(object_type, record["n"]) for record in records]
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        """Stream one ordered query; the driver pulls ``batch_size`` records per fetch.
+
+        A managed transaction cannot yield records lazily (a retry would replay
+        rows already streamed), so this is an auto-commit query in a READ
+        session, which still routes it to a read replica.
+        """
+        self._ensure_schema((object_type,))
+        label = quote_name(object_type)
+        where = " WHERE n.primary_key > $after_primary_key" if after_primary_key is not None else ""
+        query = f"MATCH (n:{label}){where} RETURN n ORDER BY n.primary_key"
+        with self._session(fetch_size=batch_size, default_access_mode=READ_ACCESS) as session:
+            for record in session.run(query, after_primary_key=after_primary_key):
+                yield self._node_to_instance(object_type, record["n"])
+
+    def create_property_index(self, object_type: str, property_name: str, kind: str = "hash") -> None:
+        """Create a Neo4j range index; it serves both hash and sorted lookups."""
+        if kind not in PROPERTY_INDEX_KINDS:
+            raise ValueError(f"Unsupported property index kind: {kind}")
+        manager = self._schema or Neo4jSchemaManager(self._driver, database=self._session_config.get("database"))
+        self._property_indexes[(object_type, property_name)] = manager.ensure_property_index(
+            object_type,
+            property_name,
+        )
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        self._ensure_schema((object_type,))
+        query, params = _compile_search(object_type, predicates, limit, after_primary_key)
+        objects = [self._node_to_instance(object_type, record["n"]) for record in self._read(_read_records, query, params)]
+        return SearchResult(objects=objects, plan=_pushed_down_plan(object_type, predicates, self._property_indexes))
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: Sequence[AggregateSpec],
+        group_by: Sequence[str] = (),
+        predicates: Sequence[PropertyPredicate] = (),
+        limit: int = 1000,
+    ) -> AggregationResult:
+        validate_aggregation(aggregates, group_by)
+        self._ensure_schema((object_type,))
+        query, params = _compile_aggregate(object_type, aggregates, group_by, predicates, limit)
+        groups = [
+            AggregateGroup(
+                group={name: record[f"g{position}"] for position, name in enumerate(group_by)},
+                values={spec.name: record[f"a{position}"] for position, spec in enumerate(aggregates)},
+            )
+            for record in self._read(_read_records, query, params)
+        ]
+        return AggregationResult(groups=groups, engine="cypher")
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        """Traverse with one variable-length pattern, or hop by hop when fan-out is capped.
+
+        A variable-length pattern cannot bound the links followed per node, so
+        ``max_fanout`` switches to one ``CALL {} ... LIMIT`` expansion per hop.
+        """
+        validate_traversal(direction, max_depth, limit, max_fanout, link_types)
+        self._ensure_schema((start_locator.object_type,))
+        label = quote_name(start_locator.object_type)
+        record = self._read(
+            _read_single,
+            f"MATCH (s:{label} {{primary_key: $primary_key}}) RETURN elementId(s) AS id",
+            {"primary_key": start_locator.primary_key},
+        )
+        if record is None:
+            raise ValueError("Object not found")
+        if max_fanout is None:
+            return self._traverse_variable_length(record["id"], link_types, direction, max_depth, limit)
+        return self._traverse_by_hop(record["id"], link_types, direction, max_depth, limit, max_fanout)
+
+    def _traverse_variable_length(
+        self,
+        start_id: str,
+        link_types: Sequence[str] | None,
+        direction: str,
+        max_depth: int,
+        limit: int,
+    ) -> Iterator[TraversalHit]:
+        pattern = _relationship_pattern(link_types, direction, f"*1..{int(max_depth)}")
+        query = (
+            "MATCH (s) WHERE elementId(s) = $start_id"
+            f" MATCH p = (s){pattern}(m) WHERE m <> s"
+            " WITH m, p ORDER BY length(p)"
+            " WITH m, head(collect(p)) AS p"
+            " WITH m, p, nodes(p)[-2] AS via"
+            " RETURN m AS n, labels(m)[0] AS object_type, length(p) AS depth,"
+            " type(last(relationships(p))) AS link_type, labels(via)[0] AS via_type, via.primary_key AS via_key"
+            " ORDER BY depth, object_type, n.primary_key LIMIT $limit"
+        )
+        for record in self._read(_read_records, query, {"start_id": start_id, "limit": limit}):
+            yield self._record_to_hit(record, record["depth"])
+
+    def _traverse_by_hop(
+        self,
+        start_id: str,
+        link_types: Sequence[str] | None,
+        direction: str,
+        max_depth: int,
+        limit: int,
+        max_fanout: int,
+    ) -> Iterator[TraversalHit]:
+        pattern = _relationship_pattern(link_types, direction, "", variable="r")
+        query = (
+            "UNWIND $frontier AS id"
+            " MATCH (a) WHERE elementId(a) = id"
+            " CALL { WITH a"
+            f" MATCH (a){pattern}(b) WHERE elementId(b) <> id"
+            " RETURN r, b ORDER BY type(r), b.primary_key LIMIT $max_fanout }"
+            " RETURN b AS n, labels(b)[0] AS object_type, elementId(b) AS node_id, type(r) AS link_type,"
+            " labels(a)[0] AS via_type, a.primary_key AS via_key"
+        )
+        visited = {start_id}
+        frontier = [start_id]
+        emitted = 0
+        # One session serves every hop; each hop is its own retryable read.
+        with self._session() as session:
+            for depth in range(1, max_depth + 1):
+                next_frontier: list[str] = []
+                hop = self._managed(
+                    session, READ_ACCESS, _read_records, query, {"frontier": frontier, "max_fanout": max_fanout}
+                )
+                for record in hop:
+                    if record["node_id"] in visited:
+                        continue
+                    visited.add(record["node_id"])
+                    next_frontier.append(record["node_id"])
+                    yield self._record_to_hit(record, depth)
+                    emitted += 1
+                    if emitted >= limit:
+                        return
+                if not next_frontier:
+                    return
+                frontier = next_frontier
+
+    @classmethod
+    def _record_to_hit(cls, record: Any, depth: int) -> TraversalHit:
+        return TraversalHit(
+            depth=depth,
+            link_type=record["link_type"],
+            via=ObjectLocator(record["via_type"], record["via_key"]),
+            object=cls._node_to_instance(record["object_type"], record["n"]),
+        )
+
+    @staticmethod
+    def _node_to_instance(object_type: str, node: Any) -> ObjectInstance:
         properties = dict(node)
         properties.pop("version", None)
-        properties.pop("primary_key", None)
+        primary_key = properties.pop("primary_key", None)
         return ObjectInstance(
-            object_type=locator.object_type,
-            primary_key=locator.primary_key,
+            object_type=object_type,
+            primary_key=primary_key,
             properties=properties,
             version=node.get("version"),
         )
 
-    def list_objects(self, object_type: str, limit: int = 100, offset: int = 0) -> list[ObjectInstance]:
-        label = self._escape_label(object_type)
-        query = f"MATCH (n:{label}) RETURN n ORDER BY n.primary_key SKIP $offset LIMIT $limit"
-        with self._driver.session() as session:
-            records = session.run(query, offset=offset, limit=limit)
-            results = []
-            for record in records:
-                node = record["n"]
-                properties = dict(node)
-                properties.pop("version", None)
-                properties.pop("primary_key", None)
-                results.append(
-                    ObjectInstance(
-                        object_type=object_type,
-                        primary_key=node.get("primary_key"),
-                        properties=properties,
-                        version=node.get("version"),
-                    )
-                )
-        return results
-
     def _apply_transaction(self, tx: Any, transaction: TransactionEdit, action_id: str | None) -> None:
-        for edit in transaction.edits:
-            self._apply_single(tx, edit, action_id)
+        self._run_batches(tx, compile_edits(transaction.edits, action_id, self._max_batch_rows))
 
     def _apply_single(self, tx: Any, edit: OntologyEdit, action_id: str | None) -> None:
-        if isinstance(edit, AddObjectEdit):
-            self._add_object(tx, edit, action_id)
-            return
-        if isinstance(edit, DeleteObjectEdit):
-            self._delete_object(tx, edit)
-            return
-        if isinstance(edit, ModifyObjectEdit):
-            self._modify_object(tx, edit, action_id)
-            return
-        if isinstance(edit, AddLinkEdit):
-            self._add_link(tx, edit)
-            return
-        if isinstance(edit, (RemoveLinkEdit, DeleteLinkEdit)):
-            self._remove_link(tx, edit)
-            return
-        raise ValueError(f"Unsupported edit: {edit}")
+        self._run_batches(tx, compile_edits([edit], action_id, self._max_batch_rows))
 
-    def _add_object(self, tx: Any, edit: AddObjectEdit, action_id: str | None) -> None:
-        label = self._escape_label(edit.object_type)
-        exists_query = f"MATCH (n:{label} {{primary_key: $primary_key}}) RETURN n"
-        if tx.run(exists_query, primary_key=edit.primary_key).single():
-            raise ValueError("Object already exists")
-        properties = dict(edit.properties)
-        properties["primary_key"] = edit.primary_key
-        properties["version"] = 1
-        if action_id:
-            properties["last_modified_by_action_id"] = action_id
-        create_query = f"CREATE (n:{label}) SET n = $props"
-        tx.run(create_query, props=properties)
-
-    def _modify_object(self, tx: Any, edit: ModifyObjectEdit, action_id: str | None) -> None:
-        label = self._escape_label(edit.locator.object_type)
-        version_clause = ""
-        params = {
-            "primary_key": edit.locator.primary_key,
-            "props": dict(edit.properties),
-        }
-        if action_id:
-            params["props"]["last_modified_by_action_id"] = action_id
-        if edit.locator.version is not None:
-            version_clause = " AND n.version = $version"
-            params["version"] = edit.locator.version
-        query = (
-            f"MATCH (n:{label} {{primary_key: $primary_key}})"
-            f" WHERE true{version_clause}"
-            " SET n += $props, n.version = coalesce(n.version, 0) + 1"
-            " RETURN n"
-        )
-        record = tx.run(query, **params).single()
-        if record is None:
-            raise ValueError("Object not found or version conflict")
-
-    def _delete_object(self, tx: Any, edit: DeleteObjectEdit) -> None:
-        label = self._escape_label(edit.locator.object_type)
-        params = {"primary_key": edit.locator.primary_key}
-        where = ""
-        if edit.locator.version is not None:
-            where = " WHERE n.version = $version"
-            params["version"] = edit.locator.version
-        query = (
-            f"MATCH (n:{label} {{primary_key: $primary_key}})"
-            f"{where} DETACH DELETE n RETURN count(n) as deleted"
-        )
-        record = tx.run(query, **params).single()
-        if record is None or record["deleted"] == 0:
-            raise ValueError("Object not found or version conflict")
+    def _apply_group(self, tx: Any, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        self._run_batches(tx, compile_transactions(transactions, self._max_batch_rows))
+
+    @staticmethod
+    def _run_batches(tx: Any, batches: list[CypherBatch]) -> None:
+        for batch in batches:
+            record = tx.run(batch.query, rows=batch.rows).single()
+            batch.verify(record)
 
     def has_action_applied(self, action_id: str, edit_payload: Dict[str, Any] | None) -> bool:
-        if not edit_payload:
-            return False
-        edit = edit_from_dict(edit_payload)
-        locators = _extract_locators(edit)
-        if not locators:
-            return False
-        with self._driver.session() as session:
-            for locator in locators:
-                label = self._escape_label(locator.object_type)
-                query = (
-                    f"MATCH (n:{label} {{primary_key: $primary_key}})"
-                    " WHERE n.last_modified_by_action_id = $action_id"
-                    " RETURN n LIMIT 1"
-                )
-                record = session.run(query, primary_key=locator.primary_key, action_id=action_id).single()
-                if record is None:
-                    return False
-        return True
+        return self.has_actions_applied([(action_id, edit_payload)])[0]
 
-    def _add_link(self, tx: Any, edit: AddLinkEdit) -> None:
-        from_label = self._escape_label(edit.from_locator.object_type)
-        to_label = self._escape_label(edit.to_locator.object_type)
-        rel_type = self._escape_label(edit.link_type)
-        query = (
-            f"MATCH (a:{from_label} {{primary_key: $from_pk}})"
-            f" MATCH (b:{to_label} {{primary_key: $to_pk}})"
-            f" MERGE (a)-[r:{rel_type}]->(b)"
-            " RETURN r"
+    def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        labels, query, params, expected = _compile_applied_probe(probes)
+        if not query:
+            return [False] * len(probes)
+        self._ensure_schema(labels)
+        matched = {record["probe_id"] for record in self._read(_read_records, query, params)}
+        return [bool(probe_ids) and probe_ids <= matched for probe_ids in expected]
+
+
+def _read_single(tx: Any, query: str, params: Dict[str, Any]) -> Any:
+    return tx.run(query, **params).single()
+
+
+def _read_records(tx: Any, query: str, params: Dict[str, Any]) -> list[Any]:
+    # Records must be fetched before the managed transaction closes.
+    return list(tx.run(query, **params))
+
+
+def _get_object_query(object_type: str) -> str:
+    return f"MATCH (n:{quote_name(object_type)} {{primary_key: $primary_key}}) RETURN n"
+
+
+def _compile_get_objects(locators: Sequence[ObjectLocator]) -> tuple[list[str], str, Dict[str, Any]]:
+    """One UNION ALL query with an UNWIND branch per label; rows carry their position."""
+    rows_by_label: Dict[str, list[Dict[str, Any]]] = {}
+    for position, locator in enumerate(locators):
+        rows_by_label.setdefault(locator.object_type, []).append({"idx": position, "primary_key": locator.primary_key})
+    branches = []
+    params: Dict[str, Any] = {}
+    for position, object_type in enumerate(rows_by_label):
+        params[f"rows_{position}"] = rows_by_label[object_type]
+        branches.append(
+            f"UNWIND $rows_{position} AS row"
+            f" MATCH (n:{quote_name(object_type)} {{primary_key: row.primary_key}})"
+            " RETURN row.idx AS idx, n"
         )
-        record = tx.run(
-            query,
-            from_pk=edit.from_locator.primary_key,
-            to_pk=edit.to_locator.primary_key,
-        ).single()
-        if record is None:
-            raise ValueError("Link endpoints not found")
+    return list(rows_by_label), " UNION ALL ".join(branches), params
 
-    def _remove_link(self, tx: Any, edit: RemoveLinkEdit) -> None:
-        from_label = self._escape_label(edit.from_locator.object_type)
-        to_label = self._escape_label(edit.to_locator.object_type)
-        rel_type = self._escape_label(edit.link_type)
-        query = (
-            f"MATCH (a:{from_label} {{primary_key: $from_pk}})"
-            f"-[r:{rel_type}]->"
-            f"(b:{to_label} {{primary_key: $to_pk}})"
-            " DELETE r"
+
+def _list_objects_query(object_type: str, after_primary_key: str | None) -> str:
+    # A range predicate on primary_key lets the planner seek the
+    # (label, primary_key) index instead of skipping over earlier rows.
+    where = " WHERE n.primary_key > $after_primary_key" if after_primary_key is not None else ""
+    return f"MATCH (n:{quote_name(object_type)}){where} RETURN n ORDER BY n.primary_key SKIP $offset LIMIT $limit"
+
+
+def _pushed_down_plan(
+    object_type: str,
+    predicates: Sequence[PropertyPredicate],
+    property_indexes: Dict[Tuple[str, str], str],
+) -> QueryPlan:
+    # Neo4j plans the query itself; report the index it can use, if any.
+    indexed = [
+        predicate.property_name for predicate in predicates if (object_type, predicate.property_name) in property_indexes
+    ]
+    if indexed:
+        return QueryPlan(
+            strategy="index",
+            index=property_indexes[(object_type, indexed[0])],
+            property_name=indexed[0],
+            pushed_down=True,
         )
-        tx.run(
-            query,
-            from_pk=edit.from_locator.primary_key,
-            to_pk=edit.to_locator.primary_key,
+    return QueryPlan(strategy="scan", pushed_down=True)
+
+
+def _compile_applied_probe(
+    probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+) -> tuple[list[str], str, Dict[str, Any], list[set[int]]]:
+    """Build one UNION ALL query with an UNWIND branch per label.
+
+    Returns the labels involved, the query, its parameters and, per probe,
+    the probe ids that must all match for that action to count as applied.
+    """
+    rows_by_label: Dict[str, list[Dict[str, Any]]] = {}
+    expected: list[set[int]] = []
+    next_id = 0
+    for action_id, edit_payload in probes:
+        probe_ids: set[int] = set()
+        seen: set[tuple[str, str]] = set()
+        for locator in _payload_locators(edit_payload):
+            key = (locator.object_type, locator.primary_key)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows_by_label.setdefault(locator.object_type, []).append(
+                {"probe_id": next_id, "primary_key": locator.primary_key, "action_id": action_id}
+            )
+            probe_ids.add(next_id)
+            next_id += 1
+        expected.append(probe_ids)
+    branches = []
+    params: Dict[str, Any] = {}
+    for position, (object_type, rows) in enumerate(rows_by_label.items()):
+        label = quote_name(object_type)
+        params[f"rows_{position}"] = rows
+        branches.append(
+            f"UNWIND $rows_{position} AS row"
+            f" MATCH (n:{label} {{primary_key: row.primary_key}})"
+            " WHERE n.last_modified_by_action_id = row.action_id"
+            " RETURN row.probe_id AS probe_id"
         )
+    return list(rows_by_label), " UNION ALL ".join(branches), params, expected
 
-    @staticmethod
-    def _escape_label(label: str) -> str:
-        return label.replace("`", "``")
+
+_CYPHER_OPERATORS = {"eq": "=", "in": "IN", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+
+def _compile_search(
+    object_type: str,
+    predicates: Sequence[PropertyPredicate],
+    limit: int,
+    after_primary_key: str | None,
+) -> tuple[str, Dict[str, Any]]:
+    """Compile predicates into one parameterised MATCH ... WHERE query."""
+    label = quote_name(object_type)
+    params: Dict[str, Any] = {"limit": limit}
+    clauses = _predicate_clauses(predicates, params)
+    if after_primary_key is not None:
+        params["after_primary_key"] = after_primary_key
+        clauses.append("n.primary_key > $after_primary_key")
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    query = f"MATCH (n:{label}){where} RETURN n ORDER BY n.primary_key LIMIT $limit"
+    return query, params
+
+
+def _predicate_clauses(predicates: Sequence[PropertyPredicate], params: Dict[str, Any]) -> list[str]:
+    clauses: list[str] = []
+    for position, predicate in enumerate(predicates):
+        name = f"p{position}"
+        params[name] = list(predicate.value) if predicate.op == "in" else predicate.value
+        clauses.append(f"n.{quote_name(predicate.property_name)} {_CYPHER_OPERATORS[predicate.op]} ${name}")
+    return clauses
+
+
+def _compile_aggregate(
+    object_type: str,
+    aggregates: Sequence[AggregateSpec],
+    group_by: Sequence[str],
+    predicates: Sequence[PropertyPredicate],
+    limit: int,
+) -> tuple[str, Dict[str, Any]]:
+    """Compile a group-by aggregation; grouping keys are implicit in RETURN."""
+    label = quote_name(object_type)
+    params: Dict[str, Any] = {"limit": limit}
+    clauses = _predicate_clauses(predicates, params)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    columns = [f"n.{quote_name(name)} AS g{position}" for position, name in enumerate(group_by)]
+    for position, spec in enumerate(aggregates):
+        argument = "*" if spec.property_name is None else f"n.{quote_name(spec.property_name)}"
+        columns.append(f"{spec.op}({argument}) AS a{position}")
+    order = f" ORDER BY {', '.join(f'g{position}' for position in range(len(group_by)))}" if group_by else ""
+    query = f"MATCH (n:{label}){where} RETURN {', '.join(columns)}{order} LIMIT $limit"
+    return query, params
+
+
+def _relationship_pattern(
+    link_types: Sequence[str] | None,
+    direction: str,
+    length: str,
+    variable: str = "",
+) -> str:
+    types = "|".join(quote_name(link_type) for link_type in link_types or ())
+    body = f"[{variable}{':' + types if types else ''}{length}]"
+    if direction == "outgoing":
+        return f"-{body}->"
+    if direction == "incoming":
+        return f"<-{body}-"
+    return f"-{body}-"
+
+
+def _payload_locators(edit_payload: Dict[str, Any] | None) -> list[ObjectLocator]:
+    """Decode a serialized edit payload and collect the locators it touches."""
+    if not edit_payload:
+        return []
+    return _extract_locators(edit_from_dict(edit_payload))
 
 
 def _extract_locators(edit: OntologyEdit) -> list[ObjectLocator]:
@@ -0,0 +1,268 @@
+"""Ordered key indexes for the in-memory graph store."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class SortedKeyIndex:
+    """Ordered set of string keys stored as a list of bounded sorted chunks.
+
+    Inserts and deletes touch one chunk (O(log n + chunk size)) and seeking
+    to a key is two binary searches, so keyset pagination costs
+    O(log n + limit) regardless of how deep the page is.
+    """
+
+    def __init__(self, chunk_size: int = 512) -> None:
+        self._chunk_size = chunk_size
+        self._chunks: List[List[str]] = []
+        self._maxes: List[str] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str) or not self._maxes:
+            return False
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._chunks[pos]
+        idx = bisect_left(chunk, key)
+        return idx < len(chunk) and chunk[idx] == key
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def add(self, key: str) -> None:
+        if not self._maxes:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            self._size = 1
+            return
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            pos -= 1
+            chunk = self._chunks[pos]
+            chunk.append(key)
+            self._maxes[pos] = key
+        else:
+            chunk = self._chunks[pos]
+            idx = bisect_left(chunk, key)
+            if idx < len(chunk) and chunk[idx] == key:
+                return
+            insort(chunk, key)
+        self._size += 1
+        if len(chunk) > self._chunk_size * 2:
+            half = len(chunk) // 2
+            self._chunks[pos : pos + 1] = [chunk[:half], chunk[half:]]
+            self._maxes[pos : pos + 1] = [chunk[half - 1], chunk[-1]]
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add many keys at once.
+
+        Keys that sort after every existing key (an empty index, or a load in
+        key order) are appended as whole chunks without per-key bisecting.
+        """
+        ordered = sorted(set(keys))
+        if not ordered:
+            return
+        if self._maxes and ordered[0] <= self._maxes[-1]:
+            for key in ordered:
+                self.add(key)
+            return
+        if self._chunks and len(self._chunks[-1]) < self._chunk_size:
+            tail = self._chunks[-1]
+            room = self._chunk_size - len(tail)
+            tail.extend(ordered[:room])
+            self._maxes[-1] = tail[-1]
+            self._size += min(room, len(ordered))
+            ordered = ordered[room:]
+        for start in range(0, len(ordered), self._chunk_size):
+            chunk = ordered[start : start + self._chunk_size]
+            self._chunks.append(chunk)
+            self._maxes.append(chunk[-1])
+            self._size += len(chunk)
+
+    def discard(self, key: str) -> None:
+        if not self._maxes:
+            return
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return
+        chunk = self._chunks[pos]
+        idx = bisect_left(chunk, key)
+        if idx == len(chunk) or chunk[idx] != key:
+            return
+        del chunk[idx]
+        self._size -= 1
+        if not chunk:
+            del self._chunks[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = chunk[-1]
+
+    def iter_from(self, after: Optional[str] = None, offset: int = 0) -> Iterator[str]:
+        """Yield keys in order, strictly after ``after`` and skipping ``offset`` keys."""
+        if after is None:
+            pos, idx = self._locate_position(offset)
+        else:
+            pos = bisect_right(self._maxes, after)
+            idx = bisect_right(self._chunks[pos], after) if pos < len(self._chunks) else 0
+            idx += offset
+            while pos < len(self._chunks) and idx >= len(self._chunks[pos]):
+                idx -= len(self._chunks[pos])
+                pos += 1
+        while pos < len(self._chunks):
+            chunk = self._chunks[pos]
+            for i in range(idx, len(chunk)):
+                yield chunk[i]
+            pos += 1
+            idx = 0
+
+    def _locate_position(self, offset: int) -> tuple[int, int]:
+        pos = 0
+        while pos < len(self._chunks) and offset >= len(self._chunks[pos]):
+            offset -= len(self._chunks[pos])
+            pos += 1
+        return pos, offset
+
+
+ObjectKey = Tuple[str, str]
+
+
+class AdjacencyIndex:
+    """One direction of link adjacency: node -> link type -> neighbour nodes.
+
+    InMemoryGraphStore keeps one instance for outgoing and one for incoming
+    links, so neighbour lookups and link cleanup on delete cost O(degree).
+    """
+
+    def __init__(self) -> None:
+        self._edges: Dict[ObjectKey, Dict[str, Set[ObjectKey]]] = {}
+
+    def add(self, node: ObjectKey, link_type: str, other: ObjectKey) -> None:
+        self._edges.setdefault(node, {}).setdefault(link_type, set()).add(other)
+
+    def discard(self, node: ObjectKey, link_type: str, other: ObjectKey) -> None:
+        by_type = self._edges.get(node)
+        if by_type is None:
+            return
+        targets = by_type.get(link_type)
+        if targets is None:
+            return
+        targets.discard(other)
+        if not targets:
+            del by_type[link_type]
+            if not by_type:
+                del self._edges[node]
+
+    def neighbors(self, node: ObjectKey, link_type: Optional[str] = None) -> Iterator[Tuple[str, ObjectKey]]:
+        """Yield ``(link_type, neighbour)`` pairs for ``node``."""
+        by_type = self._edges.get(node)
+        if not by_type:
+            return
+        if link_type is not None:
+            for other in by_type.get(link_type, ()):
+                yield link_type, other
+            return
+        for current_type, targets in by_type.items():
+            for other in targets:
+                yield current_type, other
+
+    def degree(self, node: ObjectKey, link_type: Optional[str] = None) -> int:
+        by_type = self._edges.get(node)
+        if not by_type:
+            return 0
+        if link_type is not None:
+            return len(by_type.get(link_type, ()))
+        return sum(len(targets) for targets in by_type.values())
+
+
+ValueKey = Tuple[int, object]
+
+
+class HashPropertyIndex:
+    """Secondary index ``value key -> primary keys`` for equality and IN lookups.
+
+    Value keys are normalized by ``ontology.instance.storage.query.value_key``
+    so index lookups agree with predicate evaluation during scans.
+    """
+
+    kind = "hash"
+
+    def __init__(self) -> None:
+        self._buckets: Dict[ValueKey, Set[str]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: ValueKey, primary_key: str) -> None:
+        bucket = self._buckets.setdefault(value, set())
+        if primary_key not in bucket:
+            bucket.add(primary_key)
+            self._size += 1
+
+    def discard(self, value: ValueKey, primary_key: str) -> None:
+        bucket = self._buckets.get(value)
+        if bucket is None or primary_key not in bucket:
+            return
+        bucket.discard(primary_key)
+        self._size -= 1
+        if not bucket:
+            del self._buckets[value]
+
+    def count(self, values: Iterable[ValueKey]) -> int:
+        return sum(len(self._buckets.get(value, ())) for value in values)
+
+    def lookup(self, values: Iterable[ValueKey]) -> Set[str]:
+        found: Set[str] = set()
+        for value in values:
+            found.update(self._buckets.get(value, ()))
+        return found
+
+
+class SortedPropertyIndex(HashPropertyIndex):
+    """Hash buckets plus an ordered list of distinct value keys for range lookups.
+
+    Only distinct values are kept in order, so inserting a value that is
+    already present is O(1) and range lookups cost O(log d + matches).
+    """
+
+    kind = "sorted"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._ordered: List[ValueKey] = []
+
+    def add(self, value: ValueKey, primary_key: str) -> None:
+        if value not in self._buckets:
+            insort(self._ordered, value)
+        super().add(value, primary_key)
+
+    def discard(self, value: ValueKey, primary_key: str) -> None:
+        super().discard(value, primary_key)
+        if value not in self._buckets:
+            pos = bisect_left(self._ordered, value)
+            if pos < len(self._ordered) and self._ordered[pos] == value:
+                del self._ordered[pos]
+
+    def range_values(
+        self,
+        low: Optional[ValueKey],
+        low_inclusive: bool,
+        high: Optional[ValueKey],
+        high_inclusive: bool,
+    ) -> List[ValueKey]:
+        """Distinct value keys between ``low`` and ``high`` (``None`` = unbounded)."""
+        start = 0
+        if low is not None:
+            start = bisect_left(self._ordered, low) if low_inclusive else bisect_right(self._ordered, low)
+        end = len(self._ordered)
+        if high is not None:
+            end = bisect_right(self._ordered, high) if high_inclusive else bisect_left(self._ordered, high)
+        return self._ordered[start:end]
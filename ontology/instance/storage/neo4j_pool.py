@@ -0,0 +1,109 @@
+"""Connection pool settings and utilisation counters for the Neo4j stores.
+
+The driver does not publish pool occupancy, so the store counts what it can
+observe itself: a session holds at most one pooled connection while it runs
+work, which makes sessions in flight a close proxy for connections in use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Dict
+
+READ_ACCESS = "READ"
+WRITE_ACCESS = "WRITE"
+
+
+@dataclass(frozen=True)
+class Neo4jPoolConfig:
+    """Driver pool and session defaults shared by every store session.
+
+    ``causal_consistency`` chains all sessions through one bookmark manager so
+    reads routed to a follower still observe this process's earlier writes.
+    """
+
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0
+    fetch_size: int = 1000
+    max_transaction_retry_time: float = 30.0
+    max_connection_lifetime: float = 3600.0
+    database: str | None = None
+    causal_consistency: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_connection_pool_size < 1:
+            raise ValueError("max_connection_pool_size must be at least 1")
+        if self.connection_acquisition_timeout <= 0:
+            raise ValueError("connection_acquisition_timeout must be positive")
+        if self.fetch_size == 0 or self.fetch_size < -1:
+            raise ValueError("fetch_size must be positive, or -1 to fetch everything at once")
+        if self.max_transaction_retry_time < 0:
+            raise ValueError("max_transaction_retry_time must not be negative")
+
+    def driver_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ``GraphDatabase.driver`` (session defaults included)."""
+        return {
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "fetch_size": self.fetch_size,
+            "max_transaction_retry_time": self.max_transaction_retry_time,
+            "max_connection_lifetime": self.max_connection_lifetime,
+        }
+
+
+def is_acquisition_timeout(exc: BaseException) -> bool:
+    # neo4j 5 raises a plain ClientError when the pool stays exhausted.
+    return "failed to obtain a connection from the pool" in str(exc)
+
+
+class Neo4jPoolMetrics:
+    """Thread-safe counters describing how the store uses the driver pool."""
+
+    def __init__(self, max_pool_size: int) -> None:
+        self._lock = threading.Lock()
+        self.max_pool_size = max_pool_size
+        self.sessions_opened = 0
+        self.sessions_in_use = 0
+        self.peak_sessions_in_use = 0
+        self.read_transactions = 0
+        self.write_transactions = 0
+        self.retries = 0
+        self.acquisition_timeouts = 0
+
+    def session_opened(self) -> None:
+        with self._lock:
+            self.sessions_opened += 1
+            self.sessions_in_use += 1
+            self.peak_sessions_in_use = max(self.peak_sessions_in_use, self.sessions_in_use)
+
+    def session_closed(self) -> None:
+        with self._lock:
+            self.sessions_in_use -= 1
+
+    def transaction_finished(self, access_mode: str, attempts: int) -> None:
+        """Record one managed transaction; the driver retried it ``attempts - 1`` times."""
+        with self._lock:
+            if access_mode == READ_ACCESS:
+                self.read_transactions += 1
+            else:
+                self.write_transactions += 1
+            self.retries += max(attempts - 1, 0)
+
+    def acquisition_timed_out(self) -> None:
+        with self._lock:
+            self.acquisition_timeouts += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_pool_size": self.max_pool_size,
+                "sessions_opened": self.sessions_opened,
+                "sessions_in_use": self.sessions_in_use,
+                "peak_sessions_in_use": self.peak_sessions_in_use,
+                "utilisation": self.sessions_in_use / self.max_pool_size,
+                "read_transactions": self.read_transactions,
+                "write_transactions": self.write_transactions,
+                "retries": self.retries,
+                "acquisition_timeouts": self.acquisition_timeouts,
+            }
@@ -0,0 +1,118 @@
+"""Neo4j schema bootstrap for ontology object labels.
+
+Every statement in Neo4jGraphStore matches on ``{primary_key: ...}`` under a
+dynamic label, and reconciliation filters on ``last_modified_by_action_id``.
+Without schema these become label scans, so each label gets a uniqueness
+constraint on ``primary_key`` and an index on ``last_modified_by_action_id``
+the first time it is used (or eagerly at startup).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from typing import Any, Dict, Iterable, List
+
+from .cypher_batch import quote_name
+
+SCHEMA_NAME_PREFIX = "ontology_"
+
+
+def _schema_name(kind: str, *parts: str) -> str:
+    """Readable schema object name; the hash of the raw parts keeps e.g. ``a-b`` and ``a_b`` apart."""
+    slug = "_".join(re.sub(r"[^0-9A-Za-z_]", "_", part) for part in parts)
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:8]
+    return f"{SCHEMA_NAME_PREFIX}{kind}_{slug}_{digest}"
+
+
+class Neo4jSchemaManager:
+    """Create and track per-label constraints and indexes."""
+
+    def __init__(self, driver: Any, database: str | None = None) -> None:
+        self._driver = driver
+        self._session_config: Dict[str, Any] = {} if database is None else {"database": database}
+        self._provisioned: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def provisioned_labels(self) -> List[str]:
+        return sorted(self._provisioned)
+
+    def statements_for(self, label: str) -> List[str]:
+        """DDL statements that provision one label (idempotent via IF NOT EXISTS)."""
+        quoted = quote_name(label)
+        return [
+            f"CREATE CONSTRAINT `{_schema_name('pk', label)}` IF NOT EXISTS"
+            f" FOR (n:{quoted}) REQUIRE n.primary_key IS UNIQUE",
+            f"CREATE INDEX `{_schema_name('action', label)}` IF NOT EXISTS"
+            f" FOR (n:{quoted}) ON (n.last_modified_by_action_id)",
+        ]
+
+    def property_index_statement(self, label: str, property_name: str) -> str:
+        return (
+            f"CREATE INDEX `{_schema_name('prop', label, property_name)}` IF NOT EXISTS"
+            f" FOR (n:{quote_name(label)}) ON (n.{quote_name(property_name)})"
+        )
+
+    def ensure_property_index(self, label: str, property_name: str) -> str:
+        """Create a range index on one property (serves eq, IN and range); returns its name."""
+        with self._driver.session(**self._session_config) as session:
+            session.run(self.property_index_statement(label, property_name)).consume()
+        return _schema_name("prop", label, property_name)
+
+    def ensure_labels(self, labels: Iterable[str]) -> None:
+        """Provision labels not seen before; a no-op set lookup once provisioned."""
+        missing = {label for label in labels if label not in self._provisioned}
+        if not missing:
+            return
+        with self._lock:
+            missing -= self._provisioned
+            if not missing:
+                return
+            # Schema changes cannot share a transaction with data writes, so
+            # they run in their own auto-commit session.
+            with self._driver.session(**self._session_config) as session:
+                for label in sorted(missing):
+                    for statement in self.statements_for(label):
+                        session.run(statement).consume()
+            self._provisioned |= missing
+
+    async def ensure_labels_async(self, labels: Iterable[str]) -> None:
+        """``ensure_labels`` for a manager built on the async driver.
+
+        No lock is held across awaits; statements are idempotent, so two
+        coroutines provisioning the same new label concurrently is harmless.
+        """
+        missing = {label for label in labels if label not in self._provisioned}
+        if not missing:
+            return
+        async with self._driver.session(**self._session_config) as session:
+            for label in sorted(missing):
+                for statement in self.statements_for(label):
+                    result = await session.run(statement)
+                    await result.consume()
+        with self._lock:
+            self._provisioned |= missing
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Report ontology-managed indexes and their population state."""
+        query = (
+            "SHOW INDEXES YIELD name, type, labelsOrTypes, properties, state, populationPercent"
+            " WHERE name STARTS WITH $prefix"
+            " RETURN name, type, labelsOrTypes, properties, state, populationPercent"
+            " ORDER BY name"
+        )
+        with self._driver.session(**self._session_config) as session:
+            records = session.run(query, prefix=SCHEMA_NAME_PREFIX)
+            return [
+                {
+                    "name": record["name"],
+                    "type": record["type"],
+                    "labels": list(record["labelsOrTypes"] or []),
+                    "properties": list(record["properties"] or []),
+                    "state": record["state"],
+                    "population_percent": record["populationPercent"],
+                }
+                for record in records
+            ]
@@ -0,0 +1,146 @@
+"""Property predicates, query plans and search results for object search.
+
+Predicates compare one object property against a scalar: ``eq``, ``in``
+and the range operators ``gt``/``gte``/``lt``/``lte``. Values of different
+kinds (booleans, numbers, strings) never match each other, which keeps
+index lookups, in-memory scans and Neo4j comparisons in agreement.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import ObjectInstance
+
+EQUALITY_OPS = ("eq", "in")
+RANGE_OPS = ("gt", "gte", "lt", "lte")
+PREDICATE_OPS = EQUALITY_OPS + RANGE_OPS
+PROPERTY_INDEX_KINDS = ("hash", "sorted")
+
+ValueKey = Tuple[int, Any]
+
+
+def value_key(value: Any) -> Optional[ValueKey]:
+    """Normalize a scalar into a comparable ``(kind rank, value)`` key.
+
+    Returns ``None`` for values that cannot be searched (null, lists, maps).
+    """
+    if isinstance(value, bool):
+        return (0, value)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    return None
+
+
+@dataclass(frozen=True)
+class PropertyPredicate:
+    """One ``property <op> value`` condition; ``in`` takes a list of values."""
+
+    property_name: str
+    op: str
+    value: Any
+
+    def __post_init__(self) -> None:
+        if not self.property_name:
+            raise ValueError("Predicate property must not be empty")
+        if self.op not in PREDICATE_OPS:
+            raise ValueError(f"Unsupported predicate op: {self.op}")
+        values = self.value if self.op == "in" else [self.value]
+        if self.op == "in" and not isinstance(self.value, (list, tuple)):
+            raise ValueError("'in' predicate requires a list of values")
+        for item in values:
+            if value_key(item) is None:
+                raise ValueError(f"Unsupported predicate value for '{self.property_name}': {item!r}")
+
+    def value_keys(self) -> List[ValueKey]:
+        values = self.value if self.op == "in" else [self.value]
+        return [value_key(item) for item in values]  # type: ignore[misc]
+
+    def matches(self, properties: Dict[str, Any]) -> bool:
+        if self.property_name not in properties:
+            return False
+        actual = value_key(properties[self.property_name])
+        if actual is None:
+            return False
+        if self.op == "eq":
+            return actual == value_key(self.value)
+        if self.op == "in":
+            return actual in self.value_keys()
+        bound = value_key(self.value)
+        if actual[0] != bound[0]:  # type: ignore[index]
+            return False
+        if self.op == "gt":
+            return actual[1] > bound[1]  # type: ignore[index]
+        if self.op == "gte":
+            return actual[1] >= bound[1]  # type: ignore[index]
+        if self.op == "lt":
+            return actual[1] < bound[1]  # type: ignore[index]
+        return actual[1] <= bound[1]  # type: ignore[index]
+
+
+def matches_all(predicates: Sequence[PropertyPredicate], properties: Dict[str, Any]) -> bool:
+    return all(predicate.matches(properties) for predicate in predicates)
+
+
+def range_bounds(
+    predicates: Sequence[PropertyPredicate],
+) -> Optional[Tuple[Optional[ValueKey], bool, Optional[ValueKey], bool]]:
+    """Combine range predicates on one property into ``(low, low_incl, high, high_incl)``.
+
+    Bounds of a single value kind are closed off at that kind so a range on
+    numbers never reaches strings. Returns ``None`` when bounds mix kinds and
+    therefore cannot match anything.
+    """
+    low: Optional[ValueKey] = None
+    low_inclusive = True
+    high: Optional[ValueKey] = None
+    high_inclusive = True
+    ranks = set()
+    for predicate in predicates:
+        key = value_key(predicate.value)
+        ranks.add(key[0])  # type: ignore[index]
+        if predicate.op in ("gt", "gte"):
+            inclusive = predicate.op == "gte"
+            if low is None or key > low or (key == low and not inclusive):  # type: ignore[operator]
+                low, low_inclusive = key, inclusive
+        else:
+            inclusive = predicate.op == "lte"
+            if high is None or key < high or (key == high and not inclusive):  # type: ignore[operator]
+                high, high_inclusive = key, inclusive
+    if len(ranks) != 1:
+        return None
+    rank = ranks.pop()
+    if low is None:
+        low, low_inclusive = (rank,), True
+    if high is None:
+        high, high_inclusive = (rank + 1,), False
+    return low, low_inclusive, high, high_inclusive
+
+
+@dataclass
+class QueryPlan:
+    """How a search was executed, reported back to callers.
+
+    ``strategy`` is ``index`` or ``scan``; ``index`` names the index used and
+    ``examined`` counts objects checked against the predicates (``None`` when
+    the backend evaluated the query itself, see ``pushed_down``).
+    """
+
+    strategy: str
+    index: Optional[str] = None
+    property_name: Optional[str] = None
+    examined: Optional[int] = None
+    pushed_down: bool = False
+
+
+@dataclass
+class SearchResult:
+    objects: List[ObjectInstance] = field(default_factory=list)
+    plan: QueryPlan = field(default_factory=lambda: QueryPlan(strategy="scan"))
+
+
+def property_index_name(object_type: str, property_name: str) -> str:
+    return f"property_index_{object_type}_{property_name}"
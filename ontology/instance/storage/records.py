@@ -0,0 +1,95 @@
+"""Compact object records for the in-memory graph store.
+
+Objects of one type usually share the same property names, so a record keeps
+only a tuple of values and points at an interned, per-type *shape* (the
+ordered property names plus a name -> position map). Published records are
+immutable and readers receive them as-is instead of per-read copies.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, Iterator, Mapping, Tuple
+
+from ontology.action.storage.edits import ObjectInstance
+
+
+class PropertyShape:
+    """Interned property-name tuple shared by every record with that layout."""
+
+    __slots__ = ("object_type", "names", "positions")
+
+    def __init__(self, object_type: str, names: Tuple[str, ...]) -> None:
+        self.object_type = object_type
+        self.names = names
+        self.positions: Dict[str, int] = {name: position for position, name in enumerate(names)}
+
+
+class PropertiesView(Mapping[str, Any]):
+    """Read-only mapping over one record's value array."""
+
+    __slots__ = ("_shape", "_values")
+
+    def __init__(self, shape: PropertyShape, values: Tuple[Any, ...]) -> None:
+        self._shape = shape
+        self._values = values
+
+    def __getitem__(self, name: str) -> Any:
+        return self._values[self._shape.positions[name]]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        position = self._shape.positions.get(name)
+        return default if position is None else self._values[position]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._shape.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape.names)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"PropertiesView({dict(self)!r})"
+
+
+class ShapeTable:
+    """Per-store intern table of property shapes, keyed by type and names."""
+
+    def __init__(self) -> None:
+        self._shapes: Dict[Tuple[str, Tuple[str, ...]], PropertyShape] = {}
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def shape(self, object_type: str, names: Tuple[str, ...]) -> PropertyShape:
+        key = (object_type, names)
+        shape = self._shapes.get(key)
+        if shape is None:
+            # setdefault keeps concurrent stagers converging on one instance.
+            shape = self._shapes.setdefault(
+                key,
+                PropertyShape(_intern(object_type), tuple(_intern(name) for name in names)),
+            )
+        return shape
+
+    def record(
+        self,
+        object_type: str,
+        primary_key: str,
+        properties: Mapping[str, Any],
+        version: int | None,
+    ) -> ObjectInstance:
+        """Build an immutable record; ``properties`` is copied into a value array."""
+        shape = self.shape(object_type, tuple(properties))
+        return ObjectInstance(
+            object_type=shape.object_type,
+            primary_key=primary_key,
+            properties=PropertiesView(shape, tuple(properties.values())),
+            version=version,
+        )
+
+
+def _intern(name: Any) -> Any:
+    return sys.intern(name) if type(name) is str else name
@@ -0,0 +1,703 @@
+"""Hash-partitioned GraphStore over N shard stores.
+
+Objects live on the shard chosen by a stable hash of ``(object_type,
+primary_key)``. A link is stored on the shard of each endpoint, so a shard
+answers outgoing and incoming adjacency for its own objects even when the
+other endpoint lives elsewhere. Shards are stores with in-memory link
+semantics (``InMemoryGraphStore``, ``DurableGraphStore``): links need not
+have both endpoints locally and ``neighbors`` is available.
+
+Writes touching one shard go straight to it. Writes touching several shards
+run a two-phase protocol:
+
+1. Prepare: the coordinator holds striped locks on every key involved
+   (every sharded write takes them, so nothing else can change those
+   objects) and validates each shard's part against the shard's current
+   state, raising the same errors a single store would.
+2. Commit: the parts are recorded in the recovery log and fsynced; that
+   record is the commit decision. Each part is then applied to its shard
+   with the transaction's action id, and its completion is logged.
+
+On start-up ``recover`` re-drives every decided transaction that did not
+finish, skipping parts the shard already reflects, so a crash after the
+decision never leaves a transaction half applied. A part that fails in a
+running process does not stop the others: the commit rolls forward over
+every shard, and if a part still cannot be applied the store is fenced.
+A fenced store rejects reads and writes with ``ShardStoreFencedError``
+until ``recover`` completes the transaction. Reads are consistent per
+shard; a read spanning shards may see a cross-shard commit on one shard
+slightly before the other.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import threading
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ontology.action.storage.edits import (
+    AddLinkEdit,
+    AddObjectEdit,
+    DeleteLinkEdit,
+    DeleteObjectEdit,
+    ModifyObjectEdit,
+    ObjectInstance,
+    ObjectLocator,
+    OntologyEdit,
+    RemoveLinkEdit,
+    TransactionEdit,
+    edit_from_dict,
+    edit_to_dict,
+)
+
+from .durability import _decode_record, _encode_record, _fsync_directory
+from .graph_store import GraphStore, _extract_locators, _payload_locators
+from .query import PropertyPredicate, QueryPlan, SearchResult
+from .traversal import TraversalHit, validate_traversal
+from .write_set import DEFAULT_LOCK_STRIPES, LockStripes
+
+ObjectKey = Tuple[str, str]
+GroupMember = Tuple[OntologyEdit, Optional[str]]
+ShardParts = Dict[int, List[GroupMember]]
+
+
+def shard_index(object_type: str, primary_key: str, shard_count: int) -> int:
+    """Stable (process-independent) shard of one object key."""
+    return zlib.crc32(f"{object_type}\x1f{primary_key}".encode("utf-8")) % shard_count
+
+
+class ShardStoreFencedError(RuntimeError):
+    """A decided cross-shard transaction is only partly applied."""
+
+    def __init__(self, tx_id: str) -> None:
+        super().__init__(f"Cross-shard transaction {tx_id} is partly applied; call recover() to finish it")
+        self.tx_id = tx_id
+
+
+class ShardRecoveryLog:
+    """Commit decisions and per-shard completions of cross-shard transactions.
+
+    Records use the WAL framing (``<crc32> <json>``). Only the decision is
+    fsynced; a lost completion record just makes recovery re-check that part.
+    With ``path=None`` the log lives in memory (tests, throwaway stores).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        fsync: bool = True,
+        compact_every: int = 1000,
+    ) -> None:
+        self._path = Path(path) if path is not None else None
+        self._fsync = fsync
+        self._compact_every = compact_every
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[ShardParts, set[int]]] = {}
+        self._records = 0
+        self._file = None
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._load()
+            self._file = open(self._path, "ab")
+
+    @property
+    def pending(self) -> Dict[str, Tuple[ShardParts, set[int]]]:
+        """Decided transactions that have not completed on every shard."""
+        with self._lock:
+            return {tx_id: (parts, set(done)) for tx_id, (parts, done) in self._pending.items()}
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        valid_bytes = 0
+        with open(self._path, "rb") as handle:
+            for line in handle:
+                payload = _decode_record(line)
+                if payload is None:
+                    break
+                valid_bytes += len(line)
+                self._replay(payload)
+        if valid_bytes != self._path.stat().st_size:
+            with open(self._path, "r+b") as handle:
+                handle.truncate(valid_bytes)
+
+    def _replay(self, payload: Dict[str, Any]) -> None:
+        tx_id = payload["tx"]
+        if "parts" in payload:
+            parts = {
+                int(index): [(edit_from_dict(edit), action_id) for edit, action_id in members]
+                for index, members in payload["parts"].items()
+            }
+            self._pending[tx_id] = (parts, set())
+        elif tx_id in self._pending:
+            if "done" in payload:
+                self._pending[tx_id][1].add(payload["done"])
+            else:
+                del self._pending[tx_id]
+
+    def _write(self, payload: Dict[str, Any], sync: bool) -> None:
+        # Caller holds _lock.
+        self._replay(payload)
+        self._records += 1
+        if self._file is None:
+            return
+        self._file.write(_encode_record(payload))
+        self._file.flush()
+        if sync and self._fsync:
+            os.fsync(self._file.fileno())
+
+    def decide(self, parts: ShardParts) -> str:
+        """Durably record the commit decision; returns the transaction id."""
+        tx_id = uuid.uuid4().hex
+        payload = {
+            "tx": tx_id,
+            "parts": {
+                str(index): [[edit_to_dict(edit), action_id] for edit, action_id in members]
+                for index, members in parts.items()
+            },
+        }
+        with self._lock:
+            self._write(payload, sync=True)
+        return tx_id
+
+    def part_done(self, tx_id: str, index: int) -> None:
+        with self._lock:
+            self._write({"tx": tx_id, "done": index}, sync=False)
+
+    def finish(self, tx_id: str) -> None:
+        with self._lock:
+            self._write({"tx": tx_id, "end": True}, sync=False)
+            if not self._pending and self._records >= self._compact_every:
+                self._truncate()
+
+    def _truncate(self) -> None:
+        self._records = 0
+        if self._file is None:
+            return
+        self._file.truncate(0)
+        self._file.seek(0)
+        if self._fsync:
+            os.fsync(self._file.fileno())
+            _fsync_directory(self._path.parent)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ShardedGraphStore(GraphStore):
+    """GraphStore that hash-partitions objects across ``shards``.
+
+    ``recovery_log`` defaults to an in-memory log; pass a file-backed
+    ``ShardRecoveryLog`` when the shards are durable.
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[GraphStore],
+        recovery_log: ShardRecoveryLog | None = None,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
+    ) -> None:
+        if not shards:
+            raise ValueError("ShardedGraphStore needs at least one shard")
+        self._shards = list(shards)
+        self._log = recovery_log or ShardRecoveryLog()
+        self._key_locks = LockStripes(lock_stripes)
+        self._stats_lock = threading.Lock()
+        self._fenced_by: str | None = None
+        self.cross_shard_commits = 0
+        self.recover()
+
+    @property
+    def shards(self) -> list[GraphStore]:
+        return list(self._shards)
+
+    @property
+    def recovery_log(self) -> ShardRecoveryLog:
+        return self._log
+
+    @property
+    def fenced(self) -> bool:
+        return self._fenced_by is not None
+
+    def _check_fence(self) -> None:
+        fenced_by = self._fenced_by
+        if fenced_by is not None:
+            raise ShardStoreFencedError(fenced_by)
+
+    def shard_of(self, locator: ObjectLocator) -> int:
+        return shard_index(locator.object_type, locator.primary_key, len(self._shards))
+
+    def _shard_of_key(self, key: ObjectKey) -> int:
+        return shard_index(key[0], key[1], len(self._shards))
+
+    # Writes
+
+    def apply_edit(self, edit: OntologyEdit, action_id: str | None = None) -> None:
+        self.apply_group([(edit, action_id)])
+
+    def apply_group(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> None:
+        keys = {
+            (locator.object_type, locator.primary_key)
+            for edit, _ in transactions
+            for locator in _extract_locators(edit)
+        }
+        with self._key_locks.hold(keys):
+            self._check_fence()
+            parts = self._split(transactions)
+            if not parts:
+                return
+            if len(parts) == 1:
+                index, members = next(iter(parts.items()))
+                self._shards[index].apply_group(members)
+                return
+            for index, members in parts.items():
+                _prepare(self._shards[index], members)
+            tx_id = self._log.decide(parts)
+            try:
+                self._commit(tx_id, parts, set())
+            except Exception as exc:
+                # The decision is logged, so the transaction must not be
+                # reported as failed while other shards already show it.
+                self._fenced_by = tx_id
+                raise ShardStoreFencedError(tx_id) from exc
+        with self._stats_lock:
+            self.cross_shard_commits += 1
+
+    def _commit(self, tx_id: str, parts: ShardParts, done: set[int]) -> None:
+        """Apply every part not yet done, rolling forward past failed ones."""
+        failure: Exception | None = None
+        for index in sorted(parts):
+            if index in done:
+                continue
+            shard = self._shards[index]
+            try:
+                shard.apply_group(parts[index])
+            except Exception as exc:
+                # The part may have applied before it failed (or before a
+                # crash) without its completion being logged; it only counts
+                # as done if the shard verifiably holds its outcome.
+                if not _reflects(shard, parts[index]):
+                    failure = failure or exc
+                    continue
+            self._log.part_done(tx_id, index)
+        if failure is not None:
+            raise failure
+        self._log.finish(tx_id)
+
+    def recover(self) -> int:
+        """Finish decided cross-shard transactions and lift a fence; returns how many were re-driven."""
+        pending = self._log.pending
+        for tx_id, (parts, done) in pending.items():
+            keys = {
+                (locator.object_type, locator.primary_key)
+                for members in parts.values()
+                for edit, _ in members
+                for locator in _extract_locators(edit)
+            }
+            with self._key_locks.hold(keys):
+                self._commit(tx_id, parts, done)
+        self._fenced_by = None
+        return len(pending)
+
+    def _split(self, transactions: Sequence[Tuple[OntologyEdit, str | None]]) -> ShardParts:
+        """Route each member's edits to shards, keeping their order per shard."""
+        parts: ShardParts = {}
+        # Cross-shard links staged earlier in this call, so a later delete of
+        # an endpoint also drops the mirror on the other shard.
+        staged_links: set[Tuple[str, ObjectKey, ObjectKey]] = set()
+        for edit, action_id in transactions:
+            routed: Dict[int, List[OntologyEdit]] = {}
+            for simple in _flatten(edit):
+                for index, routed_edit in self._route(simple, staged_links):
+                    routed.setdefault(index, []).append(routed_edit)
+            for index, edits in routed.items():
+                if len(edits) == 1 and not isinstance(edit, TransactionEdit):
+                    parts.setdefault(index, []).append((edits[0], action_id))
+                else:
+                    parts.setdefault(index, []).append((TransactionEdit(edits=edits), action_id))
+        return parts
+
+    def _route(
+        self,
+        edit: OntologyEdit,
+        staged_links: set[Tuple[str, ObjectKey, ObjectKey]],
+    ) -> Iterator[Tuple[int, OntologyEdit]]:
+        if isinstance(edit, AddObjectEdit):
+            yield shard_index(edit.object_type, edit.primary_key, len(self._shards)), edit
+            return
+        if isinstance(edit, ModifyObjectEdit):
+            yield self.shard_of(edit.locator), edit
+            return
+        if isinstance(edit, DeleteObjectEdit):
+            owner = self.shard_of(edit.locator)
+            yield owner, edit
+            # The owner drops every link touching the object; mirrors of its
+            # cross-shard links live on the other endpoint's shard.
+            key = (edit.locator.object_type, edit.locator.primary_key)
+            for link_type, from_key, to_key in self._cross_links_of(key, owner, staged_links):
+                other = to_key if from_key == key else from_key
+                staged_links.discard((link_type, from_key, to_key))
+                yield self._shard_of_key(other), RemoveLinkEdit(
+                    link_type,
+                    ObjectLocator(*from_key),
+                    ObjectLocator(*to_key),
+                )
+            return
+        if isinstance(edit, (AddLinkEdit, RemoveLinkEdit, DeleteLinkEdit)):
+            from_index = self.shard_of(edit.from_locator)
+            to_index = self.shard_of(edit.to_locator)
+            yield from_index, edit
+            if to_index != from_index:
+                yield to_index, edit
+                link = (
+                    edit.link_type,
+                    (edit.from_locator.object_type, edit.from_locator.primary_key),
+                    (edit.to_locator.object_type, edit.to_locator.primary_key),
+                )
+                if isinstance(edit, AddLinkEdit):
+                    staged_links.add(link)
+                else:
+                    staged_links.discard(link)
+            return
+        raise ValueError(f"Unsupported edit: {edit}")
+
+    def _cross_links_of(
+        self,
+        key: ObjectKey,
+        owner: int,
+        staged_links: set[Tuple[str, ObjectKey, ObjectKey]],
+    ) -> set[Tuple[str, ObjectKey, ObjectKey]]:
+        shard = self._shards[owner]
+        locator = ObjectLocator(*key)
+        links = {
+            (link_type, key, (other.object_type, other.primary_key))
+            for link_type, other in shard.neighbors(locator, direction="outgoing")
+        }
+        links.update(
+            (link_type, (other.object_type, other.primary_key), key)
+            for link_type, other in shard.neighbors(locator, direction="incoming")
+        )
+        links.update(link for link in staged_links if key in (link[1], link[2]))
+        return {link for link in links if self._shard_of_key(link[1]) != self._shard_of_key(link[2])}
+
+    def bulk_load_objects(self, edits: Sequence[AddObjectEdit]) -> int:
+        self._check_fence()
+        by_shard: Dict[int, List[AddObjectEdit]] = {}
+        for edit in edits:
+            by_shard.setdefault(shard_index(edit.object_type, edit.primary_key, len(self._shards)), []).append(edit)
+        return sum(self._shards[index].bulk_load_objects(part) for index, part in sorted(by_shard.items()))
+
+    def bulk_load_links(self, edits: Sequence[AddLinkEdit]) -> int:
+        endpoints = self.get_objects([locator for edit in edits for locator in (edit.from_locator, edit.to_locator)])
+        local: Dict[int, List[AddLinkEdit]] = {}
+        cross: List[OntologyEdit] = []
+        for position, edit in enumerate(edits):
+            if endpoints[2 * position] is None or endpoints[2 * position + 1] is None:
+                continue
+            from_index = self.shard_of(edit.from_locator)
+            if from_index == self.shard_of(edit.to_locator):
+                local.setdefault(from_index, []).append(edit)
+            else:
+                cross.append(edit)
+        loaded = sum(self._shards[index].bulk_load_links(part) for index, part in sorted(local.items()))
+        if cross:
+            # Both mirrors of every cross-shard link commit together.
+            self.apply_group([(TransactionEdit(edits=cross), None)])
+        return loaded + len(cross)
+
+    def create_property_index(self, object_type: str, property_name: str, kind: str = "hash") -> None:
+        for shard in self._shards:
+            shard.create_property_index(object_type, property_name, kind=kind)
+
+    # Reads
+
+    def get_object(self, locator: ObjectLocator) -> ObjectInstance:
+        self._check_fence()
+        return self._shards[self.shard_of(locator)].get_object(locator)
+
+    def get_objects(self, locators: Sequence[ObjectLocator]) -> list[ObjectInstance | None]:
+        self._check_fence()
+        positions: Dict[int, List[int]] = {}
+        for position, locator in enumerate(locators):
+            positions.setdefault(self.shard_of(locator), []).append(position)
+        results: list[ObjectInstance | None] = [None] * len(locators)
+        for index, shard_positions in positions.items():
+            found = self._shards[index].get_objects([locators[position] for position in shard_positions])
+            for position, instance in zip(shard_positions, found):
+                results[position] = instance
+        return results
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ) -> list[ObjectInstance]:
+        self._check_fence()
+        pages = [
+            shard.list_objects(object_type, limit=offset + limit, after_primary_key=after_primary_key)
+            for shard in self._shards
+        ]
+        merged = heapq.merge(*pages, key=_primary_key)
+        return [instance for position, instance in enumerate(merged) if position >= offset][:limit]
+
+    def iter_objects(
+        self,
+        object_type: str,
+        after_primary_key: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ObjectInstance]:
+        self._check_fence()
+        return heapq.merge(
+            *(
+                shard.iter_objects(object_type, after_primary_key=after_primary_key, batch_size=batch_size)
+                for shard in self._shards
+            ),
+            key=_primary_key,
+        )
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: Sequence[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ) -> SearchResult:
+        self._check_fence()
+        results = [
+            shard.search_objects(object_type, predicates, limit=limit, after_primary_key=after_primary_key)
+            for shard in self._shards
+        ]
+        objects = list(heapq.merge(*(result.objects for result in results), key=_primary_key))[:limit]
+        first = results[0].plan
+        examined = [result.plan.examined for result in results]
+        return SearchResult(
+            objects=objects,
+            plan=QueryPlan(
+                strategy=first.strategy,
+                index=first.index,
+                property_name=first.property_name,
+                examined=None if None in examined else sum(examined),
+                pushed_down=all(result.plan.pushed_down for result in results),
+            ),
+        )
+
+    def neighbors(
+        self,
+        locator: ObjectLocator,
+        link_type: str | None = None,
+        direction: str = "outgoing",
+    ) -> list[tuple[str, ObjectLocator]]:
+        """Adjacency of one object; its shard holds both directions."""
+        self._check_fence()
+        return self._shards[self.shard_of(locator)].neighbors(locator, link_type=link_type, direction=direction)
+
+    def traverse(
+        self,
+        start_locator: ObjectLocator,
+        link_types: Sequence[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ) -> Iterator[TraversalHit]:
+        validate_traversal(direction, max_depth, limit, max_fanout, link_types)
+        self.get_object(start_locator)
+        return self._breadth_first(start_locator, link_types, direction, max_depth, limit, max_fanout)
+
+    def _breadth_first(
+        self,
+        start: ObjectLocator,
+        link_types: Sequence[str] | None,
+        direction: str,
+        max_depth: int,
+        limit: int,
+        max_fanout: int | None,
+    ) -> Iterator[TraversalHit]:
+        # Same visiting order as InMemoryGraphStore; each hop fetches its
+        # candidate objects with one batched read per shard.
+        directions = ("outgoing", "incoming") if direction == "both" else (direction,)
+        visited = {(start.object_type, start.primary_key)}
+        frontier = [start]
+        emitted = 0
+        for depth in range(1, max_depth + 1):
+            candidates: list[tuple[str, ObjectLocator, ObjectLocator]] = []
+            for node in frontier:
+                edges = sorted(
+                    (found_type, (other.object_type, other.primary_key))
+                    for link_type in link_types or (None,)
+                    for current_direction in directions
+                    for found_type, other in self.neighbors(node, link_type=link_type, direction=current_direction)
+                )
+                candidates.extend((found_type, node, ObjectLocator(*other)) for found_type, other in edges[:max_fanout])
+            instances = self.get_objects([other for _, _, other in candidates])
+            next_frontier: list[ObjectLocator] = []
+            for (link_type, via, other), instance in zip(candidates, instances):
+                key = (other.object_type, other.primary_key)
+                if key in visited or instance is None:
+                    continue
+                visited.add(key)
+                next_frontier.append(other)
+                yield TraversalHit(depth=depth, link_type=link_type, via=via, object=instance)
+                emitted += 1
+                if emitted >= limit:
+                    return
+            if not next_frontier:
+                return
+            frontier = next_frontier
+
+    def has_action_applied(self, action_id: str, edit_payload: Dict[str, Any] | None) -> bool:
+        return self.has_actions_applied([(action_id, edit_payload)])[0]
+
+    def has_actions_applied(
+        self,
+        probes: Sequence[Tuple[str, Dict[str, Any] | None]],
+    ) -> list[bool]:
+        # Same rule as a single store: every touched object exists and was
+        # last written by the action; objects are read in one batch per shard.
+        touched = [list(dict.fromkeys(_payload_locators(edit_payload))) for _, edit_payload in probes]
+        instances = iter(self.get_objects([locator for locators in touched for locator in locators]))
+        flags = []
+        for (action_id, _), locators in zip(probes, touched):
+            found = [next(instances) for _ in locators]
+            flags.append(
+                bool(locators)
+                and all(
+                    instance is not None and instance.properties.get("last_modified_by_action_id") == action_id
+                    for instance in found
+                )
+            )
+        return flags
+
+    def schema_status(self) -> list[Dict[str, Any]]:
+        return [status for shard in self._shards for status in shard.schema_status()]
+
+    def close(self) -> None:
+        for shard in self._shards:
+            close = getattr(shard, "close", None)
+            if close is not None:
+                close()
+        self._log.close()
+
+
+def _primary_key(instance: ObjectInstance) -> str:
+    return instance.primary_key
+
+
+def _flatten(edit: OntologyEdit) -> Iterator[OntologyEdit]:
+    if isinstance(edit, TransactionEdit):
+        for nested in edit.edits:
+            yield from _flatten(nested)
+        return
+    yield edit
+
+
+def _prepare(shard: GraphStore, members: Sequence[GroupMember]) -> None:
+    """Validate one shard's part against its current state without writing.
+
+    Mirrors the checks the store runs while staging, in order, so a part that
+    passes here commits; raises the store's own error messages otherwise.
+    """
+    object_edits = [
+        edit
+        for member, _ in members
+        for edit in _flatten(member)
+        if isinstance(edit, (AddObjectEdit, ModifyObjectEdit, DeleteObjectEdit))
+    ]
+    locators = list(dict.fromkeys(ObjectLocator(*_object_key(edit)) for edit in object_edits))
+    versions: Dict[ObjectKey, Optional[int]] = {}
+    for locator, instance in zip(locators, shard.get_objects(locators)):
+        versions[(locator.object_type, locator.primary_key)] = None if instance is None else (instance.version or 0)
+    for edit in object_edits:
+        key = _object_key(edit)
+        current = versions[key]
+        if isinstance(edit, AddObjectEdit):
+            if current is not None:
+                raise ValueError("Object already exists")
+            versions[key] = 1
+            continue
+        if current is None:
+            raise ValueError("Object not found")
+        if edit.locator.version is not None and current != edit.locator.version:
+            raise ValueError("Version conflict")
+        versions[key] = None if isinstance(edit, DeleteObjectEdit) else current + 1
+
+
+def _reflects(shard: GraphStore, members: Sequence[GroupMember]) -> bool:
+    """Whether ``shard`` verifiably holds the outcome of ``members``.
+
+    Checked when applying a decided part raised: every object must carry the
+    exact version (or, when the starting version is unknown, the writing
+    action id) and property values the part produces, and every link it adds
+    or removes must be present or absent. An unverifiable part is not applied.
+    """
+    # key -> (version, properties, action_id), or None when deleted.
+    objects: Dict[ObjectKey, Optional[Tuple[Optional[int], Dict[str, Any], Optional[str]]]] = {}
+    links: Dict[Tuple[str, ObjectKey, ObjectKey], bool] = {}
+    for member, action_id in members:
+        for edit in _flatten(member):
+            if isinstance(edit, AddObjectEdit):
+                objects[_object_key(edit)] = (1, dict(edit.properties), action_id)
+            elif isinstance(edit, ModifyObjectEdit):
+                key = _object_key(edit)
+                version, properties, last_action_id = objects.get(key) or (None, {}, None)
+                if edit.locator.version is not None:
+                    version = edit.locator.version
+                objects[key] = (
+                    None if version is None else version + 1,
+                    {**properties, **edit.properties},
+                    action_id or last_action_id,
+                )
+            elif isinstance(edit, DeleteObjectEdit):
+                key = _object_key(edit)
+                objects[key] = None
+                for link in links:
+                    if key in (link[1], link[2]):
+                        links[link] = False
+            elif isinstance(edit, (AddLinkEdit, RemoveLinkEdit, DeleteLinkEdit)):
+                link = (
+                    edit.link_type,
+                    (edit.from_locator.object_type, edit.from_locator.primary_key),
+                    (edit.to_locator.object_type, edit.to_locator.primary_key),
+                )
+                links[link] = isinstance(edit, AddLinkEdit)
+            else:
+                return False
+    locators = [ObjectLocator(*key) for key in objects]
+    for locator, instance in zip(locators, shard.get_objects(locators)):
+        expected = objects[(locator.object_type, locator.primary_key)]
+        if expected is None or instance is None:
+            if expected is not None or instance is not None:
+                return False
+            continue
+        version, properties, action_id = expected
+        if version is None and action_id is None:
+            return False
+        if version is not None and (instance.version or 0) != version:
+            return False
+        if action_id is not None and instance.properties.get("last_modified_by_action_id") != action_id:
+            return False
+        if any(instance.properties.get(name) != value for name, value in properties.items()):
+            return False
+    for (link_type, from_key, to_key), present in links.items():
+        targets = {
+            (other.object_type, other.primary_key)
+            for _, other in shard.neighbors(ObjectLocator(*from_key), link_type, direction="outgoing")
+        }
+        if (to_key in targets) != present:
+            return False
+    return True
+
+
+def _object_key(edit: OntologyEdit) -> ObjectKey:
+    if isinstance(edit, AddObjectEdit):
+        return (edit.object_type, edit.primary_key)
+    return (edit.locator.object_type, edit.locator.primary_key)  # type: ignore[attr-defined]
@@ -0,0 +1,43 @@
+"""Linked-object traversal results and argument checks shared by GraphStores."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from ontology.action.storage.edits import ObjectInstance, ObjectLocator
+
+TRAVERSAL_DIRECTIONS = ("outgoing", "incoming", "both")
+
+
+@dataclass
+class TraversalHit:
+    """One object reached by a traversal.
+
+    ``depth`` is the hop count of the shortest path found, ``via`` the object
+    it was reached from and ``link_type`` the link followed on that last hop.
+    """
+
+    depth: int
+    link_type: str
+    via: ObjectLocator
+    object: ObjectInstance
+
+
+def validate_traversal(
+    direction: str,
+    max_depth: int,
+    limit: int,
+    max_fanout: Optional[int],
+    link_types: Optional[Sequence[str]],
+) -> None:
+    if direction not in TRAVERSAL_DIRECTIONS:
+        raise ValueError(f"Unsupported link direction: {direction}")
+    if max_depth < 1:
+        raise ValueError("max_depth must be at least 1")
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    if max_fanout is not None and max_fanout < 1:
+        raise ValueError("max_fanout must be at least 1")
+    if link_types is not None and not link_types:
+        raise ValueError("link_types must not be empty; pass None for all link types")
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import argparse
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .action.api.service import ActionService
-from .action.storage.repository import ActionRepository
-from .instance.api.service import InstanceService
+from .action.api.workers import ActionWorkerPool
+from .action.execution.runtime import ActionRunner
+from .action.storage.repository import ActionRepository, InMemoryActionRepository
+from .instance.api.service import DataFunnelService, InstanceService
+from .instance.storage.async_graph_store import AsyncGraphStore, AsyncGraphStoreAdapter
+from .instance.storage.cache import CachingGraphStore
+from .instance.storage.durability import DurableGraphStore
 from .instance.storage.graph_store import GraphStore, InMemoryGraphStore
-from .search.api.service import SearchService
+from .instance.storage.sharding import ShardedGraphStore, ShardRecoveryLog
+from .search.api.service import AsyncSearchService, SearchService
 from .object_monitor.define.api.service import InMemoryMonitorReleaseService
 from .object_monitor.runtime.event_filter import EventFilter
 
@@ -22,14 +29,24 @@ def create_app(
     action_service: ActionService | None = None,
     repository: ActionRepository | None = None,
     include_legacy_routes: bool = True,
+    async_store: AsyncGraphStore | None = None,
+    apply_concurrency: int | None = None,
+    worker_pool: ActionWorkerPool | None = None,
 ) -> "FastAPI":
-    """Build FastAPI app with phase-1 routers and shared services."""
+    """Build FastAPI app with phase-1 routers and shared services.
+
+    ``async_store`` switches the hot object read routes to async handlers;
+    ``apply_concurrency`` bounds action applies run off the event loop;
+    ``worker_pool`` queues applies and runs them in the pool, started and
+    stopped with the app.
+    """
 
     from fastapi import FastAPI
     from fastapi.responses import RedirectResponse
 
     from .action.api.legacy_router import create_legacy_router
     from .action.api.router import create_router as create_action_router
+    from .instance.api.router import create_router as create_instance_router
     from .search.api.router import create_router as create_search_router
     from .object_monitor.define.api.router import create_router as create_monitor_router
 
@@ -41,6 +58,16 @@ def create_app(
 
         return RedirectResponse(url="/docs", status_code=307)
 
+    if worker_pool is not None:
+
+        @app.on_event("startup")
+        def _start_action_workers() -> None:
+            worker_pool.start()
+
+        @app.on_event("shutdown")
+        def _stop_action_workers() -> None:
+            worker_pool.stop()
+
     instance_service = InstanceService(store)
     search_service = SearchService(instance_service)
     monitor_release_service = InMemoryMonitorReleaseService()
@@ -50,10 +77,14 @@ def create_app(
         create_action_router(
             action_service=action_service,
             repository=repository,
+            apply_concurrency=apply_concurrency,
+            worker_pool=worker_pool,
         ),
         prefix="/api/v1",
     )
-    app.include_router(create_search_router(search_service), prefix="/api/v1")
+    async_search_service = AsyncSearchService(async_store) if async_store is not None else None
+    app.include_router(create_search_router(search_service, async_search_service), prefix="/api/v1")
+    app.include_router(create_instance_router(instance_service), prefix="/api/v1")
     app.include_router(
         create_monitor_router(monitor_release_service, monitor_event_filter),
         prefix="/api/v1",
@@ -76,6 +107,60 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Run ontology backend server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
     parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="Persist the in-memory graph store (WAL + snapshots) under this directory",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Hash-partition objects across this many graph stores (one sub-directory each with --data-dir)",
+    )
+    parser.add_argument(
+        "--object-cache-size",
+        type=int,
+        default=0,
+        help="Enable a read-through object cache with this many entries (0 disables)",
+    )
+    parser.add_argument(
+        "--property-index",
+        action="append",
+        default=[],
+        metavar="TYPE.PROPERTY[:sorted]",
+        help="Create a secondary property index for object search (repeatable; hash unless :sorted)",
+    )
+    parser.add_argument(
+        "--async-reads",
+        action="store_true",
+        help="Serve object get/batchGet/list/search as async routes",
+    )
+    parser.add_argument(
+        "--apply-concurrency",
+        type=int,
+        default=None,
+        help="Run action applies as async routes with at most this many in flight",
+    )
+    parser.add_argument(
+        "--action-workers",
+        type=int,
+        default=0,
+        help="Queue action applies (202 + long poll) and run them on this many worker threads (0 runs them inline)",
+    )
+    parser.add_argument(
+        "--action-limit",
+        action="append",
+        default=[],
+        metavar="ACTION=N",
+        help="Run at most N executions of ACTION at once in the worker pool (repeatable)",
+    )
+    parser.add_argument(
+        "--default-action-limit",
+        type=int,
+        default=None,
+        help="Per-action concurrency limit for actions without --action-limit",
+    )
     parser.add_argument(
         "--no-legacy-routes",
         action="store_true",
@@ -85,9 +170,64 @@ def main() -> None:
 
     import uvicorn
 
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    store: GraphStore
+    if args.shards > 1:
+        data_dir = Path(args.data_dir) if args.data_dir else None
+        store = ShardedGraphStore(
+            [
+                DurableGraphStore(data_dir / f"shard-{index}") if data_dir else InMemoryGraphStore()
+                for index in range(args.shards)
+            ],
+            ShardRecoveryLog(data_dir / "coordinator.log") if data_dir else None,
+        )
+    else:
+        store = DurableGraphStore(args.data_dir) if args.data_dir else InMemoryGraphStore()
+    for spec in args.property_index:
+        target, _, kind = spec.partition(":")
+        object_type, _, property_name = target.partition(".")
+        if not object_type or not property_name:
+            parser.error(f"--property-index expects TYPE.PROPERTY[:sorted], got {spec!r}")
+        store.create_property_index(object_type, property_name, kind=kind or "hash")
+    if args.object_cache_size > 0:
+        store = CachingGraphStore(store, max_entries=args.object_cache_size)
+    # A durable store may block on WAL fsync, so its async calls use threads.
+    async_store = AsyncGraphStoreAdapter(store, offload=bool(args.data_dir)) if args.async_reads else None
+    action_service: ActionService | None = None
+    repository: ActionRepository | None = None
+    worker_pool: ActionWorkerPool | None = None
+    if args.action_workers < 0:
+        parser.error("--action-workers must not be negative")
+    if args.action_workers > 0:
+        action_limits: dict[str, int] = {}
+        for spec in args.action_limit:
+            action_name, _, limit = spec.partition("=")
+            if not action_name or not limit.isdigit():
+                parser.error(f"--action-limit expects ACTION=N, got {spec!r}")
+            action_limits[action_name] = int(limit)
+        repository = InMemoryActionRepository()
+        action_service = ActionService(repository, ActionRunner(), DataFunnelService(store))
+        try:
+            worker_pool = ActionWorkerPool(
+                action_service,
+                repository,
+                workers=args.action_workers,
+                action_limits=action_limits,
+                default_action_limit=args.default_action_limit,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+    elif args.action_limit or args.default_action_limit is not None:
+        parser.error("--action-limit and --default-action-limit require --action-workers")
     app = create_app(
-        store=InMemoryGraphStore(),
+        store=store,
+        action_service=action_service,
+        repository=repository,
         include_legacy_routes=not args.no_legacy_routes,
+        async_store=async_store,
+        apply_concurrency=args.apply_concurrency,
+        worker_pool=worker_pool,
     )
     uvicorn.run(app, host=args.host, port=args.port)
 
@@ -1,43 +1,272 @@
 from __future__ import annotations
 
+import json
+from typing import Iterable, Iterator
+import zlib
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from ontology.action.api.schemas import (
+    AggregateGroupResponse,
+    BatchGetObjectsRequest,
+    BatchGetObjectsResponse,
+    LinkedObjectResponse,
+    ObjectAggregateRequest,
+    ObjectAggregateResponse,
+    ObjectLocatorRequest,
+    ObjectResponse,
+    ObjectSearchRequest,
+    ObjectSearchResponse,
+    QueryPlanResponse,
+)
+from ontology.action.storage.edits import ObjectInstance, ObjectLocator
+from ontology.instance.storage.aggregation import AggregateSpec
+from ontology.instance.storage.query import PropertyPredicate, SearchResult
+from ontology.search.api.service import AsyncSearchService, SearchService
+
+
+EXPORT_BATCH_SIZE = 1000
+LIST_CURSOR_DESCRIPTION = "Keyset cursor: return objects after this primary key"
+
+
+def _ndjson_chunks(instances: Iterable[ObjectInstance], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """Encode objects as NDJSON, one chunk per ``batch_size`` lines."""
+    lines: list[str] = []
+    for instance in instances:
+        lines.append(
+            json.dumps(
+                {
+                    "object_type": instance.object_type,
+                    "primary_key": instance.primary_key,
+                    "properties": dict(instance.properties),
+                    "version": instance.version,
+                },
+                default=str,
+            )
+        )
+        if len(lines) >= batch_size:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _object_response(instance: ObjectInstance) -> ObjectResponse:
+    return ObjectResponse(
+        object_type=instance.object_type,
+        primary_key=instance.primary_key,
+        properties=instance.properties,
+        version=instance.version,
+    )
 
-from ontology.action.api.schemas import ObjectResponse
-from ontology.search.api.service import SearchService
 
+def _batch_get_response(instances: Iterable[ObjectInstance | None]) -> BatchGetObjectsResponse:
+    return BatchGetObjectsResponse(
+        objects=[None if instance is None else _object_response(instance) for instance in instances]
+    )
 
-def create_router(search_service: SearchService) -> APIRouter:
-    """Create search routes under /objects namespace."""
+
+def _predicates(request: ObjectSearchRequest) -> list[PropertyPredicate]:
+    try:
+        return [PropertyPredicate(item.property, item.op, item.value) for item in request.where]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+def _search_response(result: SearchResult, limit: int) -> ObjectSearchResponse:
+    objects = [_object_response(instance) for instance in result.objects]
+    return ObjectSearchResponse(
+        objects=objects,
+        plan=QueryPlanResponse(
+            strategy=result.plan.strategy,
+            index=result.plan.index,
+            property=result.plan.property_name,
+            examined=result.plan.examined,
+            pushed_down=result.plan.pushed_down,
+        ),
+        next_after_primary_key=objects[-1].primary_key if len(objects) == limit else None,
+    )
+
+
+def create_router(
+    search_service: SearchService,
+    async_search_service: AsyncSearchService | None = None,
+) -> APIRouter:
+    """Create search routes under /objects namespace.
+
+    With ``async_search_service`` the get, batchGet, list and search routes
+    run as coroutines on the event loop instead of in the threadpool.
+    """
     router = APIRouter()
 
-    @router.get('/objects/{object_type}/{primary_key}', response_model=ObjectResponse)
-    def get_object(object_type: str, primary_key: str) -> ObjectResponse:
+    if async_search_service is None:
+
+        @router.post('/objects:batchGet', response_model=BatchGetObjectsResponse)
+        def batch_get_objects(request: BatchGetObjectsRequest) -> BatchGetObjectsResponse:
+            locators = [ObjectLocator(item.object_type, item.primary_key) for item in request.locators]
+            return _batch_get_response(search_service.get_objects(locators))
+
+    else:
+
+        @router.post('/objects:batchGet', response_model=BatchGetObjectsResponse)
+        async def batch_get_objects_async(request: BatchGetObjectsRequest) -> BatchGetObjectsResponse:
+            locators = [ObjectLocator(item.object_type, item.primary_key) for item in request.locators]
+            return _batch_get_response(await async_search_service.get_objects(locators))
+
+    @router.get('/objects/{object_type}:export')
+    def export_objects(
+        object_type: str,
+        after_primary_key: str | None = Query(None, description="Resume the export after this primary key"),
+        compression: str | None = Query(None, pattern="^gzip$"),
+    ) -> StreamingResponse:
+        """Stream every object of a type as NDJSON in primary-key order."""
+        chunks = _ndjson_chunks(
+            search_service.iter_objects(object_type, after_primary_key=after_primary_key, batch_size=EXPORT_BATCH_SIZE)
+        )
+        headers = {}
+        if compression == "gzip":
+            chunks = _gzip_chunks(chunks)
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
+
+    if async_search_service is None:
+
+        @router.post('/objects/{object_type}/search', response_model=ObjectSearchResponse)
+        def search_objects(object_type: str, request: ObjectSearchRequest) -> ObjectSearchResponse:
+            result = search_service.search_objects(
+                object_type,
+                _predicates(request),
+                limit=request.limit,
+                after_primary_key=request.after_primary_key,
+            )
+            return _search_response(result, request.limit)
+
+    else:
+
+        @router.post('/objects/{object_type}/search', response_model=ObjectSearchResponse)
+        async def search_objects_async(object_type: str, request: ObjectSearchRequest) -> ObjectSearchResponse:
+            result = await async_search_service.search_objects(
+                object_type,
+                _predicates(request),
+                limit=request.limit,
+                after_primary_key=request.after_primary_key,
+            )
+            return _search_response(result, request.limit)
+
+    @router.post('/objects/{object_type}/aggregate', response_model=ObjectAggregateResponse)
+    def aggregate_objects(object_type: str, request: ObjectAggregateRequest) -> ObjectAggregateResponse:
         try:
-            instance = search_service.get_object(object_type, primary_key)
+            predicates = [PropertyPredicate(item.property, item.op, item.value) for item in request.where]
+            aggregates = [AggregateSpec(item.op, item.property, item.alias) for item in request.aggregates]
+            result = search_service.aggregate_objects(
+                object_type,
+                aggregates,
+                group_by=request.group_by,
+                predicates=predicates,
+                limit=request.limit,
+            )
         except ValueError as exc:
-            raise HTTPException(status_code=404, detail=str(exc)) from exc
-        return ObjectResponse(
-            object_type=instance.object_type,
-            primary_key=instance.primary_key,
-            properties=instance.properties,
-            version=instance.version,
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return ObjectAggregateResponse(
+            groups=[AggregateGroupResponse(group=group.group, values=group.values) for group in result.groups],
+            engine=result.engine,
+            scanned=result.scanned,
         )
 
-    @router.get('/objects/{object_type}', response_model=list[ObjectResponse])
-    def list_objects(
+    @router.get('/objects/{object_type}/{primary_key}/links/{link_type}')
+    def traverse_links(
         object_type: str,
-        limit: int = Query(100, ge=1, le=1000),
-        offset: int = Query(0, ge=0),
-    ) -> list[ObjectResponse]:
-        instances = search_service.list_objects(object_type, limit=limit, offset=offset)
-        return [
-            ObjectResponse(
-                object_type=instance.object_type,
-                primary_key=instance.primary_key,
-                properties=instance.properties,
-                version=instance.version,
+        primary_key: str,
+        link_type: str,
+        direction: str = Query("outgoing", pattern="^(outgoing|incoming|both)$"),
+        max_depth: int = Query(1, ge=1, le=5),
+        limit: int = Query(100, ge=1, le=10000),
+        max_fanout: int = Query(1000, ge=1, le=10000, description="Links followed per object per hop"),
+    ) -> StreamingResponse:
+        """Stream linked objects as NDJSON; ``link_type`` ``*`` follows every link type."""
+        try:
+            hits = search_service.traverse(
+                object_type,
+                primary_key,
+                link_types=None if link_type == "*" else [link_type],
+                direction=direction,
+                max_depth=max_depth,
+                limit=limit,
+                max_fanout=max_fanout,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+        def lines() -> Iterator[str]:
+            for hit in hits:
+                line = LinkedObjectResponse(
+                    depth=hit.depth,
+                    link_type=hit.link_type,
+                    via=ObjectLocatorRequest(object_type=hit.via.object_type, primary_key=hit.via.primary_key),
+                    object=_object_response(hit.object),
+                )
+                yield line.model_dump_json() + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    if async_search_service is None:
+
+        @router.get('/objects/{object_type}/{primary_key}', response_model=ObjectResponse)
+        def get_object(object_type: str, primary_key: str) -> ObjectResponse:
+            try:
+                instance = search_service.get_object(object_type, primary_key)
+            except ValueError as exc:
+                raise HTTPException(status_code=404, detail=str(exc)) from exc
+            return _object_response(instance)
+
+        @router.get('/objects/{object_type}', response_model=list[ObjectResponse])
+        def list_objects(
+            object_type: str,
+            limit: int = Query(100, ge=1, le=1000),
+            offset: int = Query(0, ge=0),
+            after_primary_key: str | None = Query(None, description=LIST_CURSOR_DESCRIPTION),
+        ) -> list[ObjectResponse]:
+            instances = search_service.list_objects(
+                object_type,
+                limit=limit,
+                offset=offset,
+                after_primary_key=after_primary_key,
+            )
+            return [_object_response(instance) for instance in instances]
+
+    else:
+
+        @router.get('/objects/{object_type}/{primary_key}', response_model=ObjectResponse)
+        async def get_object_async(object_type: str, primary_key: str) -> ObjectResponse:
+            try:
+                instance = await async_search_service.get_object(object_type, primary_key)
+            except ValueError as exc:
+                raise HTTPException(status_code=404, detail=str(exc)) from exc
+            return _object_response(instance)
+
+        @router.get('/objects/{object_type}', response_model=list[ObjectResponse])
+        async def list_objects_async(
+            object_type: str,
+            limit: int = Query(100, ge=1, le=1000),
+            offset: int = Query(0, ge=0),
+            after_primary_key: str | None = Query(None, description=LIST_CURSOR_DESCRIPTION),
+        ) -> list[ObjectResponse]:
+            instances = await async_search_service.list_objects(
+                object_type,
+                limit=limit,
+                offset=offset,
+                after_primary_key=after_primary_key,
             )
-            for instance in instances
-        ]
+            return [_object_response(instance) for instance in instances]
 
     return router
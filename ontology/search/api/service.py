@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from ontology.action.storage.edits import ObjectLocator
 from ontology.instance.api.service import InstanceService
+from ontology.instance.storage.aggregation import AggregateSpec
+from ontology.instance.storage.async_graph_store import AsyncGraphStore
+from ontology.instance.storage.query import PropertyPredicate
 
 
 class SearchService:
@@ -12,5 +15,115 @@ class SearchService:
     def get_object(self, object_type: str, primary_key: str):
         return self._instance_service.get_object(ObjectLocator(object_type, primary_key))
 
-    def list_objects(self, object_type: str, limit: int = 100, offset: int = 0):
-        return self._instance_service.list_objects(object_type, limit=limit, offset=offset)
+    def get_objects(self, locators: list[ObjectLocator]):
+        return self._instance_service.get_objects(locators)
+
+    def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ):
+        return self._instance_service.list_objects(
+            object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    def search_objects(
+        self,
+        object_type: str,
+        predicates: list[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ):
+        return self._instance_service.search_objects(
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
+
+    def aggregate_objects(
+        self,
+        object_type: str,
+        aggregates: list[AggregateSpec],
+        group_by: list[str] | None = None,
+        predicates: list[PropertyPredicate] | None = None,
+        limit: int = 1000,
+    ):
+        return self._instance_service.aggregate_objects(
+            object_type,
+            aggregates,
+            group_by=group_by or [],
+            predicates=predicates or [],
+            limit=limit,
+        )
+
+    def traverse(
+        self,
+        object_type: str,
+        primary_key: str,
+        link_types: list[str] | None = None,
+        direction: str = "outgoing",
+        max_depth: int = 1,
+        limit: int = 100,
+        max_fanout: int | None = None,
+    ):
+        return self._instance_service.traverse(
+            ObjectLocator(object_type, primary_key),
+            link_types=link_types,
+            direction=direction,
+            max_depth=max_depth,
+            limit=limit,
+            max_fanout=max_fanout,
+        )
+
+    def iter_objects(self, object_type: str, after_primary_key: str | None = None, batch_size: int = 1000):
+        return self._instance_service.iter_objects(
+            object_type,
+            after_primary_key=after_primary_key,
+            batch_size=batch_size,
+        )
+
+
+class AsyncSearchService:
+    """Async read facade for the hot object query endpoints (get, batchGet, list, search)."""
+    def __init__(self, store: AsyncGraphStore) -> None:
+        self._store = store
+
+    async def get_object(self, object_type: str, primary_key: str):
+        return await self._store.get_object(ObjectLocator(object_type, primary_key))
+
+    async def get_objects(self, locators: list[ObjectLocator]):
+        return await self._store.get_objects(locators)
+
+    async def list_objects(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: str | None = None,
+    ):
+        return await self._store.list_objects(
+            object_type,
+            limit=limit,
+            offset=offset,
+            after_primary_key=after_primary_key,
+        )
+
+    async def search_objects(
+        self,
+        object_type: str,
+        predicates: list[PropertyPredicate],
+        limit: int = 100,
+        after_primary_key: str | None = None,
+    ):
+        return await self._store.search_objects(
+            object_type,
+            predicates,
+            limit=limit,
+            after_primary_key=after_primary_key,
+        )
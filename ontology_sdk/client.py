@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Optional
+import json
+from typing import Any, Iterator, Optional
 
 from ontology.action.storage.edits import ObjectInstance, ObjectLocator
 from ontology.instance.storage.graph_store import GraphStore
@@ -18,6 +20,57 @@ def _request_with_objects_prefix(http_client: Any, base_url: str, suffix: str, p
     return response
 
 
+@contextmanager
+def _stream_with_objects_prefix(
+    http_client: Any,
+    base_url: str,
+    suffix: str,
+    params: Optional[dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """Stream an objects endpoint with the same v1-first fallback as ``_request_with_objects_prefix``."""
+
+    with http_client.stream("GET", f"{base_url}/api/v1/objects/{suffix}", params=params) as response:
+        if response.status_code != 404:
+            yield response
+            return
+    with http_client.stream("GET", f"{base_url}/objects/{suffix}", params=params) as response:
+        yield response
+
+
+def _list_params(limit: int, offset: int, after_primary_key: Optional[str]) -> dict[str, Any]:
+    params: dict[str, Any] = {"limit": limit, "offset": offset}
+    if after_primary_key is not None:
+        params["after_primary_key"] = after_primary_key
+    return params
+
+
+def _iterate_export(
+    http_client: Any,
+    base_url: str,
+    object_type: str,
+    after_primary_key: Optional[str],
+    compressed: bool,
+) -> Iterator[ObjectInstance]:
+    """Consume the NDJSON export endpoint line by line (needs an httpx-style ``stream``)."""
+    params: dict[str, Any] = {}
+    if after_primary_key is not None:
+        params["after_primary_key"] = after_primary_key
+    if compressed:
+        params["compression"] = "gzip"
+    with _stream_with_objects_prefix(http_client, base_url, f"{object_type}:export", params) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            item = json.loads(line)
+            yield ObjectInstance(
+                object_type=item["object_type"],
+                primary_key=item["primary_key"],
+                properties=item["properties"],
+                version=item.get("version"),
+            )
+
+
 @dataclass
 class ObjectTypeClient:
     """Client for one ontology object type endpoint."""
@@ -42,15 +95,25 @@ class ObjectTypeClient:
             )
         raise ValueError("No store or HTTP client configured")
 
-    def list(self, limit: int = 100, offset: int = 0) -> list[ObjectInstance]:
+    def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: Optional[str] = None,
+    ) -> list[ObjectInstance]:
         if self.store is not None:
-            return self.store.list_objects(self.object_type, limit=limit, offset=offset)
+            return self.store.list_objects(
+                self.object_type,
+                limit=limit,
+                offset=offset,
+                after_primary_key=after_primary_key,
+            )
         if self.base_url and self.http_client:
             response = _request_with_objects_prefix(
                 self.http_client,
                 self.base_url,
                 self.object_type,
-                params={"limit": limit, "offset": offset},
+                params=_list_params(limit, offset, after_primary_key),
             )
             response.raise_for_status()
             data = response.json()
@@ -65,6 +128,14 @@ class ObjectTypeClient:
             ]
         raise ValueError("No store or HTTP client configured")
 
+    def iterate(self, after_primary_key: Optional[str] = None, compressed: bool = False) -> Iterator[ObjectInstance]:
+        """Lazily iterate every object of this type in primary-key order."""
+        if self.store is not None:
+            return self.store.iter_objects(self.object_type, after_primary_key=after_primary_key)
+        if self.base_url and self.http_client:
+            return _iterate_export(self.http_client, self.base_url, self.object_type, after_primary_key, compressed)
+        raise ValueError("No store or HTTP client configured")
+
 
 class ObjectsClient:
     """Objects API grouping accessor."""
@@ -94,15 +165,26 @@ class ObjectsClient:
             )
         raise ValueError("No store or HTTP client configured")
 
-    def list(self, object_type: str, limit: int = 100, offset: int = 0) -> list[ObjectInstance]:
+    def list(
+        self,
+        object_type: str,
+        limit: int = 100,
+        offset: int = 0,
+        after_primary_key: Optional[str] = None,
+    ) -> list[ObjectInstance]:
         if self._store is not None:
-            return self._store.list_objects(object_type, limit=limit, offset=offset)
+            return self._store.list_objects(
+                object_type,
+                limit=limit,
+                offset=offset,
+                after_primary_key=after_primary_key,
+            )
         if self._base_url and self._http_client:
             response = _request_with_objects_prefix(
                 self._http_client,
                 self._base_url,
                 object_type,
-                params={"limit": limit, "offset": offset},
+                params=_list_params(limit, offset, after_primary_key),
             )
             response.raise_for_status()
             data = response.json()
@@ -117,6 +199,19 @@ class ObjectsClient:
             ]
         raise ValueError("No store or HTTP client configured")
 
+    def iterate(
+        self,
+        object_type: str,
+        after_primary_key: Optional[str] = None,
+        compressed: bool = False,
+    ) -> Iterator[ObjectInstance]:
+        """Lazily iterate every object of a type via the streaming export endpoint."""
+        if self._store is not None:
+            return self._store.iter_objects(object_type, after_primary_key=after_primary_key)
+        if self._base_url and self._http_client:
+            return _iterate_export(self._http_client, self._base_url, object_type, after_primary_key, compressed)
+        raise ValueError("No store or HTTP client configured")
+
     def __getattr__(self, item: str) -> ObjectTypeClient:
         return ObjectTypeClient(item, self._store, self._base_url, self._http_client)
 
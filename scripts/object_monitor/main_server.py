@@ -11,8 +11,15 @@ def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--host", default="0.0.0.0")
     parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--group-commit-window-ms",
+        type=float,
+        default=None,
+        help="Coalesce concurrent action applies arriving within this window into one commit",
+    )
     args = parser.parse_args()
-    uvicorn.run(build_ontology_main_server_app(), host=args.host, port=args.port)
+    window = args.group_commit_window_ms / 1000 if args.group_commit_window_ms is not None else None
+    uvicorn.run(build_ontology_main_server_app(group_commit_window=window), host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
@@ -3,8 +3,10 @@ from __future__ import annotations
 from ontology.action.api.domain_models import FunctionDefinition
 from ontology.action.api.service import ActionService
 from ontology.action.execution.runtime import ActionRunner, function_action
+from ontology.action.storage.cache import CachingActionRepository
 from ontology.action.storage.repository import InMemoryActionRepository
 from ontology.instance.api.service import InstanceService
+from ontology.instance.storage.durability import DurableGraphStore
 from ontology.instance.storage.graph_store import InMemoryGraphStore
 from ontology.main import create_app
 from ontology.object_monitor.runtime.api.data_plane_app import ObjectMonitorDataPlaneService, create_object_monitor_data_plane_app
@@ -25,13 +27,17 @@ def noop_action(context, **kwargs):
     return {"accepted": True, "input": kwargs}
 
 
-def build_ontology_main_server_app():
-    store = InMemoryGraphStore()
-    repository = InMemoryActionRepository()
+def build_ontology_main_server_app(data_dir: str | None = None, group_commit_window: float | None = None):
+    store = DurableGraphStore(data_dir) if data_dir else InMemoryGraphStore()
+    repository = CachingActionRepository(InMemoryActionRepository())
     runner = ActionRunner()
     runner.register("noop_action", noop_action)
     repository.add_function(FunctionDefinition(name="noop_action", runtime="python", code_ref="builtin://noop_action"))
-    action_service = ActionService(repository=repository, runner=runner, apply_engine=InstanceService(store))
+    action_service = ActionService(
+        repository=repository,
+        runner=runner,
+        apply_engine=InstanceService(store, group_commit_window=group_commit_window),
+    )
     app = create_app(store, action_service=action_service, repository=repository)
     return app
 
@@ -14,6 +14,7 @@ from ontology import (
     ObjectLocator,
 )
 from ontology.action.execution.runtime import function_action
+from ontology.action.storage.edits import ModifyObjectEdit
 from ontology.main import create_app
 
 
@@ -101,3 +102,220 @@ def test_root_redirects_to_docs() -> None:
     response = client.get("/", follow_redirects=False)
     assert response.status_code == 307
     assert response.headers["location"] == "/docs"
+
+
+def test_search_list_supports_after_primary_key_cursor() -> None:
+    store = InMemoryGraphStore()
+    for key in ("loan-1", "loan-2", "loan-3"):
+        store.add_object("Loan", key, {"status": "PENDING"})
+    client = TestClient(create_app(store))
+
+    response = client.get("/api/v1/objects/Loan", params={"limit": 1, "after_primary_key": "loan-1"})
+
+    assert response.status_code == 200
+    assert [item["primary_key"] for item in response.json()] == ["loan-2"]
+
+
+def test_instance_schema_admin_endpoint_reports_type_indexes() -> None:
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {})
+    store.add_object("Loan", "loan-2", {})
+    client = TestClient(create_app(store))
+
+    response = client.get("/api/v1/admin/instance/schema")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["store"] == "InMemoryGraphStore"
+    assert body["indexes"][0]["labels"] == ["Loan"]
+    assert body["indexes"][0]["properties"] == ["primary_key"]
+    assert body["indexes"][0]["size"] == 2
+
+
+def test_search_batch_get_returns_objects_aligned_with_locators() -> None:
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {"status": "PENDING"})
+    store.add_object("Borrower", "b-1", {"name": "Ada"})
+    client = TestClient(create_app(store))
+
+    response = client.post(
+        "/api/v1/objects:batchGet",
+        json={
+            "locators": [
+                {"object_type": "Borrower", "primary_key": "b-1"},
+                {"object_type": "Loan", "primary_key": "missing"},
+                {"object_type": "Loan", "primary_key": "loan-1"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    objects = response.json()["objects"]
+    assert objects[0]["properties"] == {"name": "Ada"}
+    assert objects[1] is None
+    assert objects[2]["primary_key"] == "loan-1"
+
+
+def test_instance_cache_admin_endpoint_reports_counters() -> None:
+    from ontology.instance import CachingGraphStore
+
+    backend = InMemoryGraphStore()
+    backend.add_object("Loan", "loan-1", {})
+    client = TestClient(create_app(CachingGraphStore(backend)))
+
+    client.get("/api/v1/objects/Loan/loan-1")
+    client.get("/api/v1/objects/Loan/loan-1")
+    response = client.get("/api/v1/admin/instance/cache")
+
+    assert response.status_code == 200
+    assert response.json()["enabled"] is True
+    assert response.json()["hits"] == 1
+    assert response.json()["misses"] == 1
+    assert client.get("/api/v1/admin/instance/cache").json()["size"] == 1
+    assert TestClient(create_app(backend)).get("/api/v1/admin/instance/cache").json()["enabled"] is False
+
+
+def test_search_endpoint_filters_by_predicates_and_reports_plan() -> None:
+    store = InMemoryGraphStore()
+    for index, status in enumerate(["frozen", "open", "frozen", "closed"]):
+        store.add_object("Account", f"acct-{index}", {"status": status, "balance": index * 10})
+    store.create_property_index("Account", "status")
+    client = TestClient(create_app(store))
+
+    response = client.post(
+        "/api/v1/objects/Account/search",
+        json={"where": [{"property": "status", "value": "frozen"}, {"property": "balance", "op": "gt", "value": 5}]},
+    )
+    scan = client.post("/api/v1/objects/Account/search", json={"where": [{"property": "balance", "op": "lte", "value": 10}]})
+    invalid = client.post("/api/v1/objects/Account/search", json={"where": [{"property": "status", "op": "in", "value": "x"}]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["primary_key"] for item in body["objects"]] == ["acct-2"]
+    assert body["plan"]["strategy"] == "index"
+    assert body["plan"]["index"] == "property_index_Account_status"
+    assert [item["primary_key"] for item in scan.json()["objects"]] == ["acct-0", "acct-1"]
+    assert scan.json()["plan"]["strategy"] == "scan"
+    assert invalid.status_code == 400
+
+
+def test_aggregate_endpoint_groups_objects_in_one_call() -> None:
+    store = InMemoryGraphStore()
+    for index, status in enumerate(["frozen", "open", "frozen", "open", "open"]):
+        store.add_object("Account", f"acct-{index}", {"status": status, "balance": index * 10})
+    client = TestClient(create_app(store))
+
+    response = client.post(
+        "/api/v1/objects/Account/aggregate",
+        json={
+            "group_by": ["status"],
+            "aggregates": [{"op": "count"}, {"op": "sum", "property": "balance", "alias": "total"}],
+            "where": [{"property": "balance", "op": "gt", "value": 0}],
+        },
+    )
+    invalid = client.post("/api/v1/objects/Account/aggregate", json={"aggregates": [{"op": "max"}]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["scanned"] == 4
+    assert body["groups"] == [
+        {"group": {"status": "frozen"}, "values": {"count": 1, "total": 20}},
+        {"group": {"status": "open"}, "values": {"count": 3, "total": 80}},
+    ]
+    assert invalid.status_code == 400
+
+
+def test_links_endpoint_streams_traversal_as_ndjson() -> None:
+    import json
+
+    store = InMemoryGraphStore()
+    for key in ("emp-1", "emp-2", "emp-3"):
+        store.add_object("Employee", key, {"name": key})
+    store.add_link("manages", ObjectLocator("Employee", "emp-1"), ObjectLocator("Employee", "emp-2"))
+    store.add_link("manages", ObjectLocator("Employee", "emp-2"), ObjectLocator("Employee", "emp-3"))
+    client = TestClient(create_app(store))
+
+    response = client.get("/api/v1/objects/Employee/emp-1/links/manages", params={"max_depth": 2})
+    missing = client.get("/api/v1/objects/Employee/nobody/links/manages")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [(line["depth"], line["object"]["primary_key"], line["via"]["primary_key"]) for line in lines] == [
+        (1, "emp-2", "emp-1"),
+        (2, "emp-3", "emp-2"),
+    ]
+    assert missing.status_code == 404
+
+
+def test_export_endpoint_streams_ndjson_with_optional_gzip() -> None:
+    import gzip
+    import json
+
+    store = InMemoryGraphStore()
+    for key in ("loan-2", "loan-1", "loan-3"):
+        store.add_object("Loan", key, {"amount": 1})
+    client = TestClient(create_app(store))
+
+    plain = client.get("/api/v1/objects/Loan:export", params={"after_primary_key": "loan-1"})
+    with client.stream("GET", "/api/v1/objects/Loan:export", params={"compression": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+        encoding = response.headers["content-encoding"]
+
+    assert plain.status_code == 200
+    assert [json.loads(line)["primary_key"] for line in plain.text.splitlines()] == ["loan-2", "loan-3"]
+    assert encoding == "gzip"
+    assert [json.loads(line)["primary_key"] for line in gzip.decompress(raw).splitlines()] == [
+        "loan-1",
+        "loan-2",
+        "loan-3",
+    ]
+    assert client.get("/api/v1/objects/Missing:export").text == ""
+
+
+def test_action_apply_v1_honours_client_request_id() -> None:
+    app, store = _build_app()
+    client = TestClient(app)
+    body = {
+        "submitter": "user-1",
+        "input_payload": {"status": "APPROVED"},
+        "input_instances": {"loan": {"object_type": "Loan", "primary_key": "loan-1"}},
+        "client_request_id": "monitor-event-1",
+    }
+
+    first = client.post("/api/v1/actions/Approve/apply", json=body)
+    store.apply_edit(ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"status": "PENDING"}))
+    retried = client.post("/api/v1/actions/Approve/apply", json=body)
+
+    assert retried.status_code == 200
+    assert retried.json()["execution_id"] == first.json()["execution_id"]
+    assert store.get_object(ObjectLocator("Loan", "loan-1")).properties["status"] == "PENDING"
+
+
+def test_action_apply_batch_v1_reports_per_item_results() -> None:
+    app, store = _build_app()
+    store.add_object("Loan", "loan-2", {"status": "PENDING"})
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v1/actions/Approve/apply-batch",
+        json={
+            "version": 1,
+            "submitter": "user-1",
+            "items": [
+                {"input_payload": {"status": "APPROVED"}, "input_instances": {"loan": {"object_type": "Loan", "primary_key": "loan-1"}}},
+                {"input_payload": {"status": "APPROVED"}, "input_instances": {"loan": {"object_type": "Loan", "primary_key": "nope"}}},
+                {"input_payload": {"status": "REJECTED"}, "input_instances": {"loan": {"object_type": "Loan", "primary_key": "loan-2"}}},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (2, 1)
+    assert [item["succeeded"] for item in body["results"]] == [True, False, True]
+    assert body["results"][1]["execution"] is None
+    assert body["results"][1]["error"] == "Input instance not found for 'loan'"
+    assert body["results"][2]["execution"]["status"] == "succeeded"
+    assert store.get_object(ObjectLocator("Loan", "loan-2")).properties["status"] == "REJECTED"
+    assert client.post("/api/v1/actions/Missing/apply-batch", json={"submitter": "u", "items": [{}]}).status_code == 404
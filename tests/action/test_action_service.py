@@ -3,6 +3,7 @@ import pytest
 from ontology.action.utils import now_utc
 
 from ontology import (
+    ActionBatchItem,
     ActionDefinition,
     ActionRunner,
     ActionReconciler,
@@ -178,6 +179,50 @@ def test_action_reconciler_backfills_outbox() -> None:
     assert any(entry.effect_type == "notify" for entry in repo.outbox.values())
 
 
+def test_action_reconciler_probes_backlog_in_one_bulk_call() -> None:
+    class CountingStore(InMemoryGraphStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.bulk_calls = 0
+
+        def has_actions_applied(self, probes):
+            self.bulk_calls += 1
+            return super().has_actions_applied(probes)
+
+    store = CountingStore()
+    repo = InMemoryActionRepository()
+    apply_engine = DataFunnelService(store)
+    reconciler = ActionReconciler(repo, apply_engine)
+    for index in range(5):
+        store.add_object("Loan", f"loan-r-{index}", {"status": "PENDING"})
+        edit = TransactionEdit(
+            edits=[ModifyObjectEdit(locator=ObjectLocator("Loan", f"loan-r-{index}"), properties={"status": "OK"})]
+        )
+        if index % 2 == 0:
+            apply_engine.apply(edit, action_id=f"exec-r-{index}")
+        repo.add_action_state(
+            ActionState(
+                action_id=f"exec-r-{index}",
+                execution_id=f"exec-r-{index}",
+                status=ActionStateStatus.pending,
+                intent_payload={"edits": edit_to_dict(edit)},
+                created_at=now_utc(),
+                updated_at=now_utc(),
+            )
+        )
+
+    reconciler.reconcile(cutoff_seconds=0)
+
+    assert store.bulk_calls == 1
+    assert [repo.action_states[f"exec-r-{index}"].status for index in range(5)] == [
+        ActionStateStatus.succeeded,
+        ActionStateStatus.failed,
+        ActionStateStatus.succeeded,
+        ActionStateStatus.failed,
+        ActionStateStatus.succeeded,
+    ]
+
+
 def test_action_service_saga_compensation() -> None:
     store = InMemoryGraphStore()
     store.add_object("Loan", "loan-3", {"status": "PENDING"})
@@ -512,3 +557,233 @@ def test_action_service_resolves_relation_input_and_validates_relation_target_ty
 
     assert execution.status.value == "succeeded"
     assert captured["link_type"] == "MEMBER_OF"
+
+
+def test_action_service_resolves_inputs_with_one_batch_fetch() -> None:
+    class CountingStore(InMemoryGraphStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batch_calls = 0
+
+        def get_object(self, locator):
+            raise AssertionError("input resolution must use get_objects")
+
+        def get_objects(self, locators):
+            self.batch_calls += 1
+            return super().get_objects(locators)
+
+    store = CountingStore()
+    for key in ("u1", "u2", "u3"):
+        store.add_object("User", key, {"name": key})
+    store.add_object("Group", "g1", {"name": "G"})
+    repo = InMemoryActionRepository()
+    captured = {}
+
+    def multi_input(a, b, c, membership, context):
+        captured["keys"] = [a.primary_key, b.primary_key, c.primary_key, membership.to_locator.primary_key]
+        return "ok"
+
+    runner = ActionRunner()
+    runner.register("multi_input", multi_input)
+    service = ActionService(repo, runner, DataFunnelService(store))
+    repo.add_action(ActionDefinition(name="Multi", description="", function_name="multi_input", version=1))
+
+    execution = service.apply(
+        action_name="Multi",
+        submitter="u",
+        input_payload={},
+        version=1,
+        input_instance_locators={
+            "a": {"object_type": "User", "primary_key": "u1"},
+            "b": {"object_type": "User", "primary_key": "u2"},
+            "c": {"object_type": "User", "primary_key": "u3"},
+            "membership": {
+                "link_type": "MEMBER_OF",
+                "from": {"object_type": "User", "primary_key": "u1"},
+                "to": {"object_type": "Group", "primary_key": "g1"},
+            },
+        },
+    )
+
+    assert execution.status.value == "succeeded"
+    assert captured["keys"] == ["u1", "u2", "u3", "g1"]
+    assert store.batch_calls == 1
+
+    with pytest.raises(ValueError, match="Input relation to-endpoint not found for 'membership'"):
+        service.apply(
+            action_name="Multi",
+            submitter="u",
+            input_payload={},
+            version=1,
+            input_instance_locators={
+                "membership": {
+                    "link_type": "MEMBER_OF",
+                    "from": {"object_type": "User", "primary_key": "u1"},
+                    "to": {"object_type": "Group", "primary_key": "missing"},
+                },
+            },
+        )
+    with pytest.raises(ValueError, match="Input instance not found for 'a'"):
+        service.apply(
+            action_name="Multi",
+            submitter="u",
+            input_payload={},
+            version=1,
+            input_instance_locators={"a": {"object_type": "User", "primary_key": "missing"}},
+        )
+
+
+def test_action_service_apply_deduplicates_client_request_id() -> None:
+    import threading
+
+    calls: list[str] = []
+    release = threading.Event()
+
+    @function_action
+    def count_calls(loan: ObjectInstance, context, status: str) -> str:
+        calls.append(status)
+        release.wait(5)
+        loan.status = status
+        return "ok"
+
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {"status": "NEW"})
+    repo = InMemoryActionRepository()
+    runner = ActionRunner()
+    runner.register("count_calls", count_calls)
+    service = ActionService(repo, runner, DataFunnelService(store))
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="count_calls"))
+    locators = {"loan": {"object_type": "Loan", "primary_key": "loan-1"}}
+
+    results: list = []
+
+    def apply() -> None:
+        results.append(service.apply("Approve", "user-1", {"status": "A"}, None, locators, client_request_id="req-1"))
+
+    threads = [threading.Thread(target=apply) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(500):
+        if service.deduplicator.stats()["coalesced"] == 3:
+            break
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    # Concurrent duplicates wait for the first run; later retries hit the LRU.
+    assert calls == ["A"]
+    assert len({execution.execution_id for execution in results}) == 1
+    retried = service.apply("Approve", "user-1", {"status": "A"}, None, locators, client_request_id="req-1")
+    assert retried.execution_id == results[0].execution_id
+    assert calls == ["A"]
+    assert service.deduplicator.stats() == {"entries": 1, "hits": 1, "coalesced": 3, "misses": 1}
+
+    # A fresh service (e.g. after a restart) falls back to the repository index.
+    restarted = ActionService(repo, runner, DataFunnelService(store))
+    assert restarted.apply("Approve", "user-1", {"status": "A"}, None, locators, client_request_id="req-1").execution_id == retried.execution_id
+    assert calls == ["A"]
+    service.apply("Approve", "user-1", {"status": "B"}, None, locators, client_request_id="req-2")
+    assert calls == ["A", "B"]
+
+
+def test_action_service_rejected_apply_does_not_claim_client_request_id() -> None:
+    store = InMemoryGraphStore()
+    repo = InMemoryActionRepository()
+    runner = ActionRunner()
+    runner.register("update_status", update_status)
+    service = ActionService(repo, runner, DataFunnelService(store))
+    repo.add_action(ActionDefinition(name="UpdateStatus", description="", function_name="update_status"))
+    locators = {"loan": {"object_type": "Loan", "primary_key": "loan-9"}}
+
+    with pytest.raises(ValueError, match="Input instance not found"):
+        service.apply("UpdateStatus", "user-1", {"status": "A"}, None, locators, client_request_id="req-1")
+    store.add_object("Loan", "loan-9", {"status": "NEW"})
+    execution = service.apply("UpdateStatus", "user-1", {"status": "A"}, None, locators, client_request_id="req-1")
+
+    assert execution.client_request_id == "req-1"
+    assert store.get_object(ObjectLocator("Loan", "loan-9")).properties["status"] == "A"
+
+
+def test_action_service_apply_batch_isolates_failing_items() -> None:
+    class CountingStore(InMemoryGraphStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batch_calls = 0
+            self.group_calls = 0
+
+        def get_objects(self, locators):
+            self.batch_calls += 1
+            return super().get_objects(locators)
+
+        def apply_group(self, transactions):
+            self.group_calls += 1
+            return super().apply_group(transactions)
+
+    @function_action
+    def set_status(loan: ObjectInstance, context, status: str) -> str:
+        if status == "BOOM":
+            raise RuntimeError("function failed")
+        loan.status = status
+        return status
+
+    store = CountingStore()
+    for key in ("loan-1", "loan-2", "loan-3"):
+        store.add_object("Loan", key, {"status": "NEW"})
+    store.group_calls = 0
+    repo = InMemoryActionRepository()
+    runner = ActionRunner()
+    runner.register("set_status", set_status)
+    service = ActionService(repo, runner, DataFunnelService(store))
+    repo.add_action(
+        ActionDefinition(
+            name="SetStatus",
+            description="",
+            function_name="set_status",
+            submission_criteria=lambda payload: payload.get("status") != "REJECT",
+        )
+    )
+
+    def item(key: str, status: str) -> ActionBatchItem:
+        return ActionBatchItem({"status": status}, {"loan": {"object_type": "Loan", "primary_key": key}})
+
+    results = service.apply_batch(
+        "SetStatus",
+        "user-1",
+        [
+            item("loan-1", "APPROVED"),
+            item("missing", "APPROVED"),
+            item("loan-2", "BOOM"),
+            item("loan-3", "REJECT"),
+            item("loan-3", "DONE"),
+        ],
+        max_workers=2,
+    )
+
+    assert [result.execution.status.value if result.execution else None for result in results] == [
+        "succeeded",
+        None,
+        "failed",
+        None,
+        "succeeded",
+    ]
+    assert results[0].error is None and results[0].execution.output_payload == {"result": "APPROVED"}
+    assert results[1].error == "Input instance not found for 'loan'"
+    assert results[2].error == "function failed"
+    assert results[3].error == "Submission criteria not satisfied"
+    assert store.batch_calls == 1 and store.group_calls == 1
+    assert [store.get_object(ObjectLocator("Loan", key)).properties["status"] for key in ("loan-1", "loan-2", "loan-3")] == [
+        "APPROVED",
+        "NEW",
+        "DONE",
+    ]
+    assert [log.event_type for log in repo.logs if log.execution_id == results[0].execution.execution_id] == [
+        "submitted",
+        "execution_started",
+        "function_started",
+        "function_finished",
+        "apply_started",
+        "apply_succeeded",
+        "finished",
+    ]
+    assert repo.action_states[results[4].execution.execution_id].status == ActionStateStatus.succeeded
@@ -0,0 +1,196 @@
+import threading
+
+import pytest
+
+from ontology import (
+    ActionBatchItem,
+    ActionDefinition,
+    ActionRunner,
+    ActionService,
+    ActionStatus,
+    ActionWorkerPool,
+    DataFunnelService,
+    InMemoryActionRepository,
+    InMemoryGraphStore,
+    ObjectLocator,
+)
+from ontology.action.execution.runtime import function_action
+
+
+@function_action
+def set_status(loan, context, status: str) -> str:
+    loan.status = status
+    return "ok"
+
+
+def _build(*functions):
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {"status": "NEW"})
+    repo = InMemoryActionRepository()
+    runner = ActionRunner()
+    for name, fn in functions:
+        runner.register(name, fn)
+        repo.add_action(ActionDefinition(name=name.title(), description="", function_name=name, version=1))
+    return ActionService(repo, runner, DataFunnelService(store)), repo, store
+
+
+LOAN = {"loan": {"object_type": "Loan", "primary_key": "loan-1"}}
+
+
+def test_enqueued_execution_runs_in_worker_and_records_failures() -> None:
+    service, repo, store = _build(("approve", set_status))
+    pool = ActionWorkerPool(service, repo)
+
+    queued = service.enqueue("Approve", "user-1", {"status": "APPROVED"}, input_instance_locators=LOAN)
+    missing = service.enqueue(
+        "Approve", "user-1", {"status": "X"}, input_instance_locators={"loan": {"object_type": "Loan", "primary_key": "x"}}
+    )
+
+    assert queued.status == ActionStatus.queued
+    assert store.get_object(ObjectLocator("Loan", "loan-1")).properties["status"] == "NEW"
+    assert pool.run_once() and pool.run_once()
+    assert not pool.run_once()
+    assert repo.get_execution(queued.execution_id).status == ActionStatus.succeeded
+    assert store.get_object(ObjectLocator("Loan", "loan-1")).properties["status"] == "APPROVED"
+    failed = repo.get_execution(missing.execution_id)
+    assert failed.status == ActionStatus.failed
+    assert failed.error.startswith("Input instance not found")
+    assert [log.event_type for log in repo.logs if log.execution_id == missing.execution_id] == [
+        "submitted",
+        "execution_failed",
+        "finished",
+    ]
+    assert pool.stats()["completed"] == 2
+
+
+def test_rejected_submissions_are_failed_and_never_claimed() -> None:
+    calls: list[str] = []
+
+    @function_action
+    def approve(loan, context, status: str) -> str:
+        calls.append(status)
+        return "ok"
+
+    service, repo, _ = _build(("approve", approve))
+    pool = ActionWorkerPool(service, repo)
+    missing = {"loan": {"object_type": "Loan", "primary_key": "x"}}
+
+    with pytest.raises(ValueError):
+        service.apply("Approve", "user-1", {"status": "A"}, input_instance_locators=missing)
+    results = service.apply_batch(
+        "Approve", "user-1", [ActionBatchItem({"status": "B"}, missing), ActionBatchItem({"status": "C"}, {"loan": {}})]
+    )
+
+    assert all(result.error for result in results)
+    assert not pool.run_once()
+    assert calls == []
+    assert len(repo.executions) == 3
+    assert all(execution.status == ActionStatus.failed for execution in repo.executions.values())
+    assert all(execution.error for execution in repo.executions.values())
+
+
+def test_per_action_limit_keeps_other_actions_flowing() -> None:
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    @function_action
+    def slow(context) -> str:
+        started.release()
+        release.wait(5)
+        return "slow"
+
+    @function_action
+    def fast(context) -> str:
+        return "fast"
+
+    service, repo, _ = _build(("slow", slow), ("fast", fast))
+    pool = ActionWorkerPool(service, repo, workers=3, action_limits={"Slow": 1}, poll_interval=0.01)
+    slow_runs = [service.enqueue("Slow", "user-1", {}) for _ in range(3)]
+    fast_run = service.enqueue("Fast", "user-1", {})
+
+    pool.start()
+    try:
+        assert started.acquire(timeout=5)
+        for _ in range(500):
+            if repo.get_execution(fast_run.execution_id).status == ActionStatus.succeeded:
+                break
+            threading.Event().wait(0.01)
+        assert repo.get_execution(fast_run.execution_id).status == ActionStatus.succeeded
+        # Only one Slow execution may hold a worker; the rest stay queued.
+        assert pool.stats()["running"] == {"Slow": 1}
+        assert sum(repo.get_execution(run.execution_id).status == ActionStatus.queued for run in slow_runs) == 2
+    finally:
+        release.set()
+        for _ in range(500):
+            if all(repo.get_execution(run.execution_id).status == ActionStatus.succeeded for run in slow_runs):
+                break
+            threading.Event().wait(0.01)
+        pool.stop()
+    assert all(repo.get_execution(run.execution_id).status == ActionStatus.succeeded for run in slow_runs)
+    assert not pool.running
+
+
+def test_worker_pool_rejects_invalid_limits() -> None:
+    service, repo, _ = _build()
+    with pytest.raises(ValueError):
+        ActionWorkerPool(service, repo, workers=0)
+    with pytest.raises(ValueError):
+        ActionWorkerPool(service, repo, action_limits={"Approve": 0})
+
+
+def test_async_apply_returns_202_and_long_polls_until_finished() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from ontology.main import create_app
+
+    service, repo, store = _build(("approve", set_status))
+    pool = ActionWorkerPool(service, repo, workers=2, poll_interval=0.05)
+    app = create_app(store, action_service=service, repository=repo, worker_pool=pool)
+
+    with TestClient(app) as client:
+        assert pool.running
+        response = client.post(
+            "/api/v1/actions/Approve/apply",
+            json={"submitter": "user-1", "input_payload": {"status": "APPROVED"}, "input_instances": LOAN},
+        )
+        assert response.status_code == 202
+        assert response.json()["status"] == "queued"
+
+        polled = client.get(f"/api/v1/actions/executions/{response.json()['execution_id']}", params={"wait": 5})
+        assert polled.status_code == 200
+        assert polled.json()["status"] == "succeeded"
+        assert polled.json()["finished_at"] is not None
+        assert client.get("/api/v1/actions/executions/missing", params={"wait": 1}).status_code == 404
+    assert not pool.running
+    assert store.get_object(ObjectLocator("Loan", "loan-1")).properties["status"] == "APPROVED"
+
+
+def test_main_builds_worker_pool_from_action_workers_flags(monkeypatch) -> None:
+    pytest.importorskip("fastapi")
+    uvicorn = pytest.importorskip("uvicorn")
+    import ontology.main as entrypoint
+
+    built: dict[str, object] = {}
+
+    def fake_create_app(**kwargs):
+        built.update(kwargs)
+        return object()
+
+    monkeypatch.setattr(entrypoint, "create_app", fake_create_app)
+    monkeypatch.setattr(uvicorn, "run", lambda app, host, port: None)
+    monkeypatch.setattr(
+        "sys.argv", ["ontology", "--action-workers", "3", "--action-limit", "Approve=2", "--default-action-limit", "4"]
+    )
+
+    entrypoint.main()
+
+    pool = built["worker_pool"]
+    assert isinstance(pool, ActionWorkerPool)
+    assert pool.stats()["workers"] == 3
+    assert (pool._limit("Approve"), pool._limit("Reject")) == (2, 4)
+    assert built["action_service"] is not None and built["repository"] is not None
+
+    monkeypatch.setattr("sys.argv", ["ontology", "--action-limit", "Approve=2"])
+    with pytest.raises(SystemExit):
+        entrypoint.main()
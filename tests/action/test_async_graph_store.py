@@ -0,0 +1,267 @@
+import asyncio
+import inspect
+import threading
+from typing import Any
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from ontology import (
+    ActionDefinition,
+    ActionRunner,
+    ActionService,
+    DataFunnelService,
+    InMemoryActionRepository,
+    InMemoryGraphStore,
+    ObjectLocator,
+)
+from ontology.action.execution.runtime import function_action
+from ontology.action.api.router import create_router as create_action_router
+from ontology.action.storage.edits import AddObjectEdit, ModifyObjectEdit, TransactionEdit, edit_to_dict
+from ontology.instance.storage.async_graph_store import AsyncGraphStoreAdapter, AsyncNeo4jGraphStore
+from ontology.instance.storage.neo4j_pool import Neo4jPoolMetrics
+from ontology.instance.storage.neo4j_schema import Neo4jSchemaManager
+from ontology.instance.storage.query import PropertyPredicate
+from ontology.main import create_app
+from ontology.search.api.router import create_router as create_search_router
+from ontology.search.api.service import AsyncSearchService, SearchService
+
+
+@function_action
+def set_status(loan, context, status: str) -> str:
+    loan.status = status
+    return "ok"
+
+
+def test_async_routes_serve_reads_and_applies_from_the_event_loop() -> None:
+    store = InMemoryGraphStore()
+    store.create_property_index("Loan", "status")
+    for index in range(3):
+        store.add_object("Loan", f"loan-{index}", {"status": "PENDING" if index else "OPEN"})
+    repo = InMemoryActionRepository()
+    runner = ActionRunner()
+    runner.register("approve", set_status)
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    service = ActionService(repo, runner, DataFunnelService(store))
+    app = create_app(
+        store,
+        action_service=service,
+        repository=repo,
+        async_store=AsyncGraphStoreAdapter(store),
+        apply_concurrency=2,
+    )
+    routers = [
+        create_search_router(SearchService(None), AsyncSearchService(AsyncGraphStoreAdapter(store))),
+        create_action_router(service, repo, apply_concurrency=2),
+    ]
+    endpoints = {route.path: route.endpoint for router in routers for route in router.routes}
+    for path in (
+        "/objects:batchGet",
+        "/objects/{object_type}/search",
+        "/objects/{object_type}/{primary_key}",
+        "/objects/{object_type}",
+        "/actions/{action_id}/apply",
+    ):
+        assert inspect.iscoroutinefunction(endpoints[path]), path
+    assert not inspect.iscoroutinefunction(endpoints["/objects/{object_type}/aggregate"])
+    client = TestClient(app)
+
+    applied = client.post(
+        "/api/v1/actions/Approve/apply",
+        json={
+            "version": 1,
+            "submitter": "user-1",
+            "input_payload": {"status": "APPROVED"},
+            "input_instances": {"loan": {"object_type": "Loan", "primary_key": "loan-1"}},
+        },
+    )
+    assert applied.status_code == 200
+    assert applied.json()["status"] == "succeeded"
+
+    assert client.get("/api/v1/objects/Loan/loan-1").json()["properties"]["status"] == "APPROVED"
+    assert client.get("/api/v1/objects/Loan/missing").status_code == 404
+    listed = client.get("/api/v1/objects/Loan", params={"limit": 2, "after_primary_key": "loan-0"}).json()
+    assert [item["primary_key"] for item in listed] == ["loan-1", "loan-2"]
+    batch = client.post(
+        "/api/v1/objects:batchGet",
+        json={"locators": [{"object_type": "Loan", "primary_key": "loan-2"}, {"object_type": "Loan", "primary_key": "x"}]},
+    ).json()
+    assert [item and item["primary_key"] for item in batch["objects"]] == ["loan-2", None]
+    search = client.post(
+        "/api/v1/objects/Loan/search",
+        json={"where": [{"property": "status", "op": "eq", "value": "PENDING"}]},
+    ).json()
+    assert [item["primary_key"] for item in search["objects"]] == ["loan-2"]
+    assert search["plan"]["strategy"] == "index"
+    assert client.post("/api/v1/actions/Missing/apply", json={"submitter": "u", "input_payload": {}}).status_code == 404
+
+
+def test_async_adapter_offloads_to_threads_and_keeps_store_semantics() -> None:
+    store = InMemoryGraphStore()
+    adapter = AsyncGraphStoreAdapter(store, offload=True)
+    modify = ModifyObjectEdit(ObjectLocator("Loan", "loan-3", version=1), {"n": 30})
+
+    async def scenario() -> list[Any]:
+        await adapter.apply_group(
+            [(TransactionEdit(edits=[AddObjectEdit("Loan", f"loan-{index}", {"n": index})]), f"exec-{index}") for index in range(20)]
+        )
+        await adapter.apply_edit(modify, "exec-m")
+        objects = await asyncio.gather(*(adapter.get_object(ObjectLocator("Loan", f"loan-{index}")) for index in range(20)))
+        result = await adapter.search_objects("Loan", [PropertyPredicate("n", "gte", 18)])
+        applied = await adapter.has_actions_applied([("exec-m", edit_to_dict(modify)), ("exec-unknown", None)])
+        return [objects, result, applied]
+
+    objects, result, applied = asyncio.run(scenario())
+
+    assert [obj.properties["n"] for obj in objects][:5] == [0, 1, 2, 30, 4]
+    assert sorted(obj.primary_key for obj in result.objects) == ["loan-18", "loan-19", "loan-3"]
+    assert applied == [True, False]
+
+
+def test_async_adapter_offloads_writes_and_unindexed_searches_by_default() -> None:
+    class _RecordingStore(InMemoryGraphStore):
+        def __init__(self) -> None:
+            super().__init__()
+            self.threads: dict[str, set[int]] = {}
+
+        def _note(self, name: str) -> None:
+            self.threads.setdefault(name, set()).add(threading.get_ident())
+
+        def apply_group(self, transactions: Any, commit_hook: Any = None) -> None:
+            self._note("apply_group")
+            super().apply_group(transactions, commit_hook)
+
+        def get_object(self, locator: ObjectLocator) -> Any:
+            self._note("get_object")
+            return super().get_object(locator)
+
+        def search_objects(self, object_type: str, predicates: Any, **kwargs: Any) -> Any:
+            self._note(f"search_{predicates[0].property_name}_{predicates[0].op}")
+            return super().search_objects(object_type, predicates, **kwargs)
+
+    store = _RecordingStore()
+    store.create_property_index("Loan", "status")
+    adapter = AsyncGraphStoreAdapter(store)
+
+    async def scenario() -> int:
+        await adapter.apply_edit(AddObjectEdit("Loan", "loan-1", {"status": "OPEN", "n": 1}))
+        await adapter.get_object(ObjectLocator("Loan", "loan-1"))
+        await adapter.search_objects("Loan", [PropertyPredicate("status", "eq", "OPEN")])
+        await adapter.search_objects("Loan", [PropertyPredicate("status", "gt", "A")])
+        await adapter.search_objects("Loan", [PropertyPredicate("n", "eq", 1)])
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+
+    inline = {name for name, threads in store.threads.items() if threads == {loop_thread}}
+    assert inline == {"get_object", "search_status_eq"}
+    assert set(store.threads) - inline == {"apply_group", "search_status_gt", "search_n_eq"}
+
+
+class _AsyncResult:
+    def __init__(self, records: list[Any]) -> None:
+        self._records = records
+
+    async def single(self) -> Any:
+        return self._records[0] if self._records else None
+
+    async def consume(self) -> None:
+        return None
+
+    def __aiter__(self) -> Any:
+        async def records() -> Any:
+            for record in self._records:
+                yield record
+
+        return records()
+
+
+class _AsyncTx:
+    def __init__(self, calls: list[tuple[str, dict[str, Any]]]) -> None:
+        self._calls = calls
+
+    async def run(self, query: str, **params: Any) -> _AsyncResult:
+        self._calls.append((query, params))
+        if "rows" in params:
+            return _AsyncResult([{"existing": [], "matched": len(params["rows"])}])
+        rows = [row for value in params.values() if isinstance(value, list) for row in value]
+        return _AsyncResult(
+            [{"idx": row["idx"], "n": {"primary_key": row["primary_key"], "version": 2}} for row in rows if row["primary_key"] != "missing"]
+        )
+
+
+class _AsyncSession:
+    def __init__(self, driver: "_AsyncDriver") -> None:
+        self._driver = driver
+
+    async def __aenter__(self) -> "_AsyncSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def run(self, query: str, **params: Any) -> _AsyncResult:
+        # Auto-commit queries are only expected for schema DDL.
+        self._driver.calls.append((query, params))
+        return _AsyncResult([])
+
+    async def execute_read(self, work: Any, *args: Any) -> Any:
+        self._driver.read_transactions += 1
+        return await work(_AsyncTx(self._driver.calls), *args)
+
+    async def execute_write(self, work: Any, *args: Any) -> Any:
+        self._driver.write_transactions += 1
+        return await work(_AsyncTx(self._driver.calls), *args)
+
+
+class _AsyncDriver:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.read_transactions = 0
+        self.write_transactions = 0
+        self.closed = False
+
+    def session(self) -> _AsyncSession:
+        return _AsyncSession(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_async_neo4j_store_batches_writes_and_reads_on_the_async_driver() -> None:
+    driver = _AsyncDriver()
+    store = AsyncNeo4jGraphStore.__new__(AsyncNeo4jGraphStore)
+    store._driver = driver
+    store._session_config = {}
+    store._pool_metrics = Neo4jPoolMetrics(max_pool_size=10)
+    store._max_batch_rows = 1000
+    store._schema = Neo4jSchemaManager(driver)
+    store._property_indexes = {}
+
+    async def scenario() -> list[Any]:
+        await store.apply_group(
+            [
+                (TransactionEdit(edits=[AddObjectEdit("Loan", f"loan-{index}", {"n": index})]), f"exec-{index}")
+                for index in range(3)
+            ]
+        )
+        objects = await store.get_objects([ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "missing")])
+        await store.close()
+        return objects
+
+    objects = asyncio.run(scenario())
+
+    assert (driver.read_transactions, driver.write_transactions) == (1, 1)
+    stats = store.pool_stats()
+    assert (stats["read_transactions"], stats["write_transactions"], stats["retries"]) == (1, 1, 0)
+    assert (stats["sessions_opened"], stats["sessions_in_use"]) == (2, 0)
+    ddl = [query for query, _ in driver.calls if query.startswith("CREATE ")]
+    assert len(ddl) == 2 and store._schema.provisioned_labels == ["Loan"]
+    writes = [params["rows"] for _, params in driver.calls if "rows" in params]
+    assert [len(rows) for rows in writes] == [3]
+    assert objects[0].primary_key == "loan-1" and objects[0].version == 2
+    assert objects[1] is None
+    assert driver.closed
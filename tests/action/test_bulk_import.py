@@ -0,0 +1,172 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from ontology import InMemoryGraphStore, ObjectLocator
+from ontology.instance.bulk_import import BulkImporter, ImportReport, main
+from ontology.instance.storage.cache import CachingGraphStore
+from ontology.instance.storage.durability import DurableGraphStore
+from ontology.instance.storage.query import PropertyPredicate
+
+
+def _write_ndjson(path: Path, rows: list) -> Path:
+    path.write_text("".join((row if isinstance(row, str) else json.dumps(row)) + "\n" for row in rows))
+    return path
+
+
+def test_bulk_import_loads_ndjson_objects_and_csv_links_and_reports_bad_rows(tmp_path: Path) -> None:
+    objects = _write_ndjson(
+        tmp_path / "objects.ndjson",
+        [
+            {"object_type": "User", "primary_key": "u-1", "properties": {"name": "ann"}},
+            {"object_type": "Loan", "primary_key": "loan-2", "properties": {"amount": 20}},
+            {"object_type": "Loan", "primary_key": "loan-1", "properties": {"amount": 10}},
+            "{not json",
+            {"object_type": "Loan", "primary_key": "", "properties": {}},
+            {"object_type": "Loan", "primary_key": "loan-3", "properties": {"version": 9}},
+        ],
+    )
+    links = tmp_path / "links.csv"
+    links.write_text(
+        "link_type,from_type,from_primary_key,to_type,to_primary_key\n"
+        "owns,User,u-1,Loan,loan-1\n"
+        "owns,User,u-1,Loan,loan-2\n"
+        "owns,User,u-1,Loan,missing\n"
+    )
+    store = InMemoryGraphStore()
+    progress: list[int] = []
+    importer = BulkImporter(store, batch_size=2, progress=lambda report: progress.append(report.rows))
+
+    importer.import_objects(str(objects))
+    report = importer.import_links(str(links))
+
+    assert (report.objects_loaded, report.links_loaded, report.links_rejected, report.invalid) == (3, 2, 1, 3)
+    assert [(error.line, error.message) for error in report.errors] == [
+        (4, "Invalid JSON: Expecting property name enclosed in double quotes"),
+        (5, "'primary_key' must be a non-empty string"),
+        (6, "Property 'version' is reserved"),
+    ]
+    assert progress == sorted(progress) and progress[-1] == report.rows
+    assert [obj.primary_key for obj in store.list_objects("Loan")] == ["loan-1", "loan-2"]
+    assert store.get_object(ObjectLocator("Loan", "loan-1")).version == 1
+    assert sorted(locator.primary_key for _, locator in store.neighbors(ObjectLocator("User", "u-1"), "owns")) == [
+        "loan-1",
+        "loan-2",
+    ]
+
+    # Re-running the import skips everything that is already loaded.
+    rerun = BulkImporter(store).import_objects(str(objects))
+    assert (rerun.objects_loaded, rerun.objects_skipped) == (0, 3)
+
+
+def test_bulk_import_reads_gzipped_csv_and_maintains_indexes(tmp_path: Path) -> None:
+    path = tmp_path / "loans.csv.gz"
+    with gzip.open(path, "wt", newline="") as handle:
+        handle.write("primary_key,status,note\n")
+        for index in range(50):
+            handle.write(f"loan-{index:03d},{'OPEN' if index % 5 else 'CLOSED'},\n")
+    store = InMemoryGraphStore()
+    store.create_property_index("Loan", "status")
+    store.add_object("Loan", "loan-010", {"status": "CLOSED"})
+
+    report = BulkImporter(store, batch_size=16).import_objects(str(path), object_type="Loan")
+
+    assert (report.objects_loaded, report.objects_skipped) == (49, 1)
+    assert store.get_object(ObjectLocator("Loan", "loan-003")).properties == {"status": "OPEN"}
+    keys = [obj.primary_key for obj in store.list_objects("Loan", limit=100)]
+    assert keys == [f"loan-{index:03d}" for index in range(50)]
+    assert [obj.primary_key for obj in store.list_objects("Loan", limit=3, after_primary_key="loan-047")] == [
+        "loan-048",
+        "loan-049",
+    ]
+    result = store.search_objects("Loan", [PropertyPredicate("status", "eq", "CLOSED")])
+    assert result.plan.strategy == "index"
+    assert [obj.primary_key for obj in result.objects] == [f"loan-{index:03d}" for index in range(0, 50, 5)]
+
+
+def test_bulk_import_stops_after_max_errors(tmp_path: Path) -> None:
+    path = _write_ndjson(tmp_path / "bad.ndjson", [{"object_type": "Loan"}] * 5)
+    importer = BulkImporter(InMemoryGraphStore(), max_errors=2)
+
+    with pytest.raises(ValueError, match="Too many invalid records"):
+        importer.import_objects(str(path))
+    assert importer.report.invalid == 3
+
+
+def test_bulk_load_through_wrappers_is_durable(tmp_path: Path) -> None:
+    store = DurableGraphStore(tmp_path / "data", fsync=False)
+    cached = CachingGraphStore(store)
+    importer = BulkImporter(cached, batch_size=3)
+    importer.load_objects(
+        (line, {"object_type": "Loan", "primary_key": f"loan-{line}", "properties": {"n": line}}) for line in range(7)
+    )
+    link = {
+        "link_type": "next",
+        "from_type": "Loan",
+        "from_primary_key": "loan-0",
+        "to_type": "Loan",
+        "to_primary_key": "loan-1",
+    }
+    importer.load_links([(1, link)])
+    assert store.wal.sync_count >= 1
+    store.close()
+
+    reopened = DurableGraphStore(tmp_path / "data", fsync=False)
+    assert len(reopened.list_objects("Loan", limit=100)) == 7
+    next_loans = list(reopened.neighbors(ObjectLocator("Loan", "loan-0"), "next"))
+    assert next_loans == [("next", ObjectLocator("Loan", "loan-1"))]
+    reopened.close()
+
+
+def test_ontology_import_cli_loads_into_data_dir(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    objects = _write_ndjson(
+        tmp_path / "objects.jsonl",
+        [{"object_type": "Loan", "primary_key": f"loan-{index}", "properties": {}} for index in range(3)],
+    )
+
+    exit_code = main(["--objects", str(objects), "--data-dir", str(tmp_path / "data"), "--quiet"])
+
+    assert exit_code == 0
+    assert "objects: 3 loaded" in capsys.readouterr().out
+    store = DurableGraphStore(tmp_path / "data", fsync=False)
+    assert [obj.primary_key for obj in store.list_objects("Loan")] == ["loan-0", "loan-1", "loan-2"]
+    assert store.wal.path.stat().st_size == 0
+    store.close()
+
+
+def test_ontology_import_cli_closes_the_neo4j_store(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    opened: list[InMemoryGraphStore] = []
+
+    class _FakeNeo4jStore(InMemoryGraphStore):
+        closed = False
+
+        def __init__(self, uri: str, user: str, password: str) -> None:
+            super().__init__()
+            opened.append(self)
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr("ontology.instance.bulk_import.Neo4jGraphStore", _FakeNeo4jStore)
+    objects = _write_ndjson(
+        tmp_path / "objects.jsonl",
+        [{"object_type": "Loan", "primary_key": "loan-0", "properties": {}}],
+    )
+    missing = tmp_path / "missing.jsonl"
+
+    assert main(["--objects", str(objects), "--neo4j-uri", "bolt://db", "--quiet"]) == 0
+    assert main(["--objects", str(missing), "--neo4j-uri", "bolt://db", "--quiet"]) == 1
+    capsys.readouterr()
+    assert [store.closed for store in opened] == [True, True]
+
+
+def test_import_report_rate() -> None:
+    report = ImportReport(objects_loaded=900, invalid=100, elapsed_seconds=2.0)
+    assert report.rows == 1000
+    assert report.rows_per_second == 500.0
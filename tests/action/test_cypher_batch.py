@@ -0,0 +1,593 @@
+from typing import Any
+
+import pytest
+
+from ontology import ObjectLocator
+from ontology.action.storage.edits import (
+    AddLinkEdit,
+    AddObjectEdit,
+    DeleteObjectEdit,
+    ModifyObjectEdit,
+    RemoveLinkEdit,
+    TransactionEdit,
+    edit_to_dict,
+)
+from ontology.instance.storage.cypher_batch import compile_bulk_load, compile_edits, compile_transactions
+from ontology.instance.storage.graph_store import Neo4jGraphStore
+from ontology.instance.storage.neo4j_pool import Neo4jPoolMetrics
+
+
+class _FakeResult:
+    def __init__(self, record: Any) -> None:
+        self._record = record
+
+    def single(self) -> Any:
+        return self._record
+
+
+class _FakeTx:
+    """Records statements and answers each with a canned record."""
+
+    def __init__(self, records: list[Any] | None = None) -> None:
+        self.calls: list[tuple[str, list[dict[str, Any]]]] = []
+        self._records = list(records or [])
+
+    def run(self, query: str, **params: Any) -> _FakeResult:
+        self.calls.append((query, params["rows"]))
+        return _FakeResult(self._records.pop(0) if self._records else None)
+
+
+def _store() -> Neo4jGraphStore:
+    store = Neo4jGraphStore.__new__(Neo4jGraphStore)
+    store._max_batch_rows = 1000
+    store._schema = None
+    store._property_indexes = {}
+    store._session_config = {}
+    store._pool_metrics = Neo4jPoolMetrics(max_pool_size=10)
+    return store
+
+
+def test_compile_edits_groups_consecutive_edits_by_kind_and_label() -> None:
+    edits = [AddObjectEdit("Loan", f"loan-{i}", {"amount": i}) for i in range(500)]
+    edits += [ModifyObjectEdit(ObjectLocator("Loan", f"loan-{i}", version=1), {"status": "X"}) for i in range(3)]
+    edits += [AddLinkEdit("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "loan-2"))]
+
+    batches = compile_edits(edits, action_id="exec-1")
+
+    assert [(batch.kind, len(batch.rows)) for batch in batches] == [
+        ("add_object", 500),
+        ("modify_object", 3),
+        ("add_link", 1),
+    ]
+    assert batches[0].query.startswith("UNWIND $rows AS row")
+    assert batches[0].rows[0]["props"] == {
+        "amount": 0,
+        "primary_key": "loan-0",
+        "version": 1,
+        "last_modified_by_action_id": "exec-1",
+    }
+    assert batches[1].rows[0]["version"] == 1
+
+
+def test_compile_edits_splits_on_repeated_key_label_change_and_size_cap() -> None:
+    edits = [
+        ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"a": 1}),
+        ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"a": 2}),
+        ModifyObjectEdit(ObjectLocator("Borrower", "b-1"), {"a": 3}),
+        TransactionEdit(edits=[DeleteObjectEdit(ObjectLocator("Loan", f"loan-{i}")) for i in range(5)]),
+    ]
+
+    batches = compile_edits(edits, max_batch_rows=2)
+
+    assert [(batch.kind, len(batch.rows)) for batch in batches] == [
+        ("modify_object", 1),
+        ("modify_object", 1),
+        ("modify_object", 1),
+        ("delete_object", 2),
+        ("delete_object", 2),
+        ("delete_object", 1),
+    ]
+
+
+def test_neo4j_transaction_runs_one_round_trip_per_batch() -> None:
+    tx = _FakeTx(records=[{"existing": []}, {"matched": 2}, None])
+    transaction = TransactionEdit(
+        edits=[
+            AddObjectEdit("Loan", "loan-1", {}),
+            AddObjectEdit("Loan", "loan-2", {}),
+            AddLinkEdit("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "loan-2")),
+            AddLinkEdit("owns", ObjectLocator("Loan", "loan-2"), ObjectLocator("Loan", "loan-1")),
+            RemoveLinkEdit("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "loan-3")),
+        ]
+    )
+
+    _store()._apply_transaction(tx, transaction, "exec-1")
+
+    assert len(tx.calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("edit", "record", "message"),
+    [
+        (AddObjectEdit("Loan", "loan-1", {}), {"existing": ["loan-1"]}, "Object already exists"),
+        (ModifyObjectEdit(ObjectLocator("Loan", "loan-1", version=3), {"a": 1}), {"matched": 0}, "version conflict"),
+        (DeleteObjectEdit(ObjectLocator("Loan", "loan-1")), {"matched": 0}, "Object not found"),
+        (
+            AddLinkEdit("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "missing")),
+            {"matched": 0},
+            "Link endpoints not found",
+        ),
+    ],
+)
+def test_neo4j_batches_keep_per_edit_error_semantics(edit: Any, record: Any, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _store()._apply_transaction(_FakeTx(records=[record]), TransactionEdit(edits=[edit]), None)
+
+
+class _FakeSession:
+    def __init__(self, matched_ids: set[int], calls: list[tuple[str, dict[str, Any]]]) -> None:
+        self._matched_ids = matched_ids
+        self._calls = calls
+
+    def __enter__(self) -> "_FakeSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute_read(self, work: Any, *args: Any) -> Any:
+        # The fake session doubles as the transaction handed to ``work``.
+        return work(self, *args)
+
+    def run(self, query: str, **params: Any) -> list[dict[str, int]]:
+        self._calls.append((query, params))
+        rows = [row for value in params.values() for row in value]
+        return [{"probe_id": row["probe_id"]} for row in rows if row["probe_id"] in self._matched_ids]
+
+
+class _FakeDriver:
+    def __init__(self, matched_ids: set[int]) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._matched_ids = matched_ids
+
+    def session(self) -> _FakeSession:
+        return _FakeSession(self._matched_ids, self.calls)
+
+
+def test_neo4j_has_actions_applied_probes_all_actions_in_one_query() -> None:
+    store = _store()
+    # Probe ids are assigned in payload order: exec-1 -> 0, 1; exec-2 -> 2; exec-3 -> none.
+    store._driver = _FakeDriver(matched_ids={0, 1})
+    tx_1 = TransactionEdit(
+        edits=[
+            ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"a": 1}),
+            AddObjectEdit("Borrower", "b-1", {}),
+            ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"a": 2}),
+        ]
+    )
+    tx_2 = TransactionEdit(edits=[ModifyObjectEdit(ObjectLocator("Loan", "loan-2"), {"a": 1})])
+
+    from ontology.action.storage.edits import edit_to_dict
+
+    flags = store.has_actions_applied(
+        [("exec-1", edit_to_dict(tx_1)), ("exec-2", edit_to_dict(tx_2)), ("exec-3", None)]
+    )
+
+    assert flags == [True, False, False]
+    assert len(store._driver.calls) == 1
+    query, params = store._driver.calls[0]
+    assert query.count("UNWIND") == 2
+    assert "UNION ALL" in query
+    assert sorted(len(rows) for rows in params.values()) == [1, 2]
+
+
+def test_neo4j_schema_manager_provisions_each_label_once() -> None:
+    from ontology.instance.storage.neo4j_schema import Neo4jSchemaManager
+
+    class _DdlResult:
+        def consume(self) -> None:
+            return None
+
+    class _DdlSession(_FakeSession):
+        def run(self, query: str, **params: Any) -> Any:
+            self._calls.append((query, params))
+            return _DdlResult()
+
+    class _DdlDriver(_FakeDriver):
+        def session(self) -> _DdlSession:
+            return _DdlSession(set(), self.calls)
+
+    driver = _DdlDriver(matched_ids=set())
+    manager = Neo4jSchemaManager(driver)
+
+    manager.ensure_labels(["Loan", "Borrower"])
+    manager.ensure_labels(["Loan"])
+
+    statements = [query for query, _ in driver.calls]
+    assert len(statements) == 4
+    assert (
+        "CREATE CONSTRAINT `ontology_pk_Loan_36c71e41` IF NOT EXISTS FOR (n:`Loan`) REQUIRE n.primary_key IS UNIQUE"
+        in statements
+    )
+    assert any("ON (n.last_modified_by_action_id)" in query for query in statements)
+    assert manager.provisioned_labels == ["Borrower", "Loan"]
+
+
+def test_neo4j_get_objects_fetches_all_labels_in_one_query() -> None:
+    class _NodeSession(_FakeSession):
+        def run(self, query: str, **params: Any) -> list[dict[str, Any]]:
+            self._calls.append((query, params))
+            rows = [row for value in params.values() for row in value]
+            return [
+                {"idx": row["idx"], "n": {"primary_key": row["primary_key"], "version": 1, "status": "OK"}}
+                for row in rows
+                if row["primary_key"] != "missing"
+            ]
+
+    class _NodeDriver(_FakeDriver):
+        def session(self) -> _NodeSession:
+            return _NodeSession(set(), self.calls)
+
+    store = _store()
+    store._driver = _NodeDriver(matched_ids=set())
+
+    results = store.get_objects(
+        [ObjectLocator("Loan", "loan-1"), ObjectLocator("Borrower", "missing"), ObjectLocator("Borrower", "b-1")]
+    )
+
+    assert len(store._driver.calls) == 1
+    assert [item.primary_key if item else None for item in results] == ["loan-1", None, "b-1"]
+    assert results[2].object_type == "Borrower"
+    assert results[0].properties == {"status": "OK"}
+
+
+def test_neo4j_search_pushes_predicates_down_and_reports_index() -> None:
+    from ontology.instance.storage.query import PropertyPredicate
+
+    class _DdlResult:
+        def consume(self) -> None:
+            return None
+
+    class _SearchSession(_FakeSession):
+        def run(self, query: str, **params: Any) -> Any:
+            self._calls.append((query, params))
+            if query.startswith("CREATE INDEX"):
+                return _DdlResult()
+            return [{"n": {"primary_key": "acct-2", "version": 3, "status": "frozen"}}]
+
+    class _SearchDriver(_FakeDriver):
+        def session(self) -> _SearchSession:
+            return _SearchSession(set(), self.calls)
+
+    store = _store()
+    store._driver = _SearchDriver(matched_ids=set())
+    predicates = [
+        PropertyPredicate("status", "in", ["frozen", "closed"]),
+        PropertyPredicate("balance", "gte", 10),
+    ]
+
+    scan = store.search_objects("Account", predicates, limit=5, after_primary_key="acct-1")
+    store.create_property_index("Account", "status")
+    indexed = store.search_objects("Account", predicates)
+
+    query, params = store._driver.calls[0]
+    assert query == (
+        "MATCH (n:`Account`) WHERE n.`status` IN $p0 AND n.`balance` >= $p1"
+        " AND n.primary_key > $after_primary_key RETURN n ORDER BY n.primary_key LIMIT $limit"
+    )
+    assert params == {"p0": ["frozen", "closed"], "p1": 10, "after_primary_key": "acct-1", "limit": 5}
+    assert store._driver.calls[1][0] == (
+        "CREATE INDEX `ontology_prop_Account_status_42a27d9f` IF NOT EXISTS FOR (n:`Account`) ON (n.`status`)"
+    )
+    assert scan.objects[0].primary_key == "acct-2"
+    assert (scan.plan.strategy, scan.plan.pushed_down) == ("scan", True)
+    assert (indexed.plan.strategy, indexed.plan.index) == ("index", "ontology_prop_Account_status_42a27d9f")
+
+
+def test_neo4j_aggregate_pushes_group_by_into_cypher() -> None:
+    from ontology.instance.storage.aggregation import AggregateSpec
+    from ontology.instance.storage.query import PropertyPredicate
+
+    class _AggregateSession(_FakeSession):
+        def run(self, query: str, **params: Any) -> list[dict[str, Any]]:
+            self._calls.append((query, params))
+            return [{"g0": "frozen", "a0": 3, "a1": 12.5}]
+
+    class _AggregateDriver(_FakeDriver):
+        def session(self) -> _AggregateSession:
+            return _AggregateSession(set(), self.calls)
+
+    store = _store()
+    store._driver = _AggregateDriver(matched_ids=set())
+
+    result = store.aggregate_objects(
+        "Account",
+        [AggregateSpec("count"), AggregateSpec("avg", "balance")],
+        group_by=["status"],
+        predicates=[PropertyPredicate("region", "eq", "eu")],
+        limit=50,
+    )
+
+    query, params = store._driver.calls[0]
+    assert query == (
+        "MATCH (n:`Account`) WHERE n.`region` = $p0"
+        " RETURN n.`status` AS g0, count(*) AS a0, avg(n.`balance`) AS a1 ORDER BY g0 LIMIT $limit"
+    )
+    assert params == {"p0": "eu", "limit": 50}
+    assert result.engine == "cypher"
+    assert result.groups[0].group == {"status": "frozen"}
+    assert result.groups[0].values == {"count": 3, "avg_balance": 12.5}
+
+
+def test_neo4j_traverse_uses_variable_length_pattern_or_capped_hops() -> None:
+    class _TraverseSession(_FakeSession):
+        def run(self, query: str, **params: Any) -> Any:
+            self._calls.append((query, params))
+            if query.startswith("MATCH (s:`Node`"):
+                return _FakeResult({"id": "4:root"})
+            if "frontier" in params:
+                if params["frontier"] != ["4:root"]:
+                    return []
+                return [
+                    {
+                        "n": {"primary_key": key, "version": 1},
+                        "object_type": "Node",
+                        "node_id": f"4:{key}",
+                        "link_type": "child",
+                        "via_type": "Node",
+                        "via_key": "root",
+                    }
+                    for key in ("a", "b")
+                ]
+            return [
+                {
+                    "n": {"primary_key": "a", "version": 1},
+                    "object_type": "Node",
+                    "depth": 1,
+                    "link_type": "child",
+                    "via_type": "Node",
+                    "via_key": "root",
+                }
+            ]
+
+    class _TraverseDriver(_FakeDriver):
+        def session(self) -> _TraverseSession:
+            return _TraverseSession(set(), self.calls)
+
+    store = _store()
+    store._driver = _TraverseDriver(matched_ids=set())
+    start = ObjectLocator("Node", "root")
+
+    variable = list(store.traverse(start, ["child", "peer"], direction="incoming", max_depth=3, limit=10))
+    query, params = store._driver.calls[1]
+    assert "MATCH p = (s)<-[:`child`|`peer`*1..3]-(m)" in query
+    assert params == {"start_id": "4:root", "limit": 10}
+    assert [(hit.depth, hit.object.primary_key, hit.via.primary_key) for hit in variable] == [(1, "a", "root")]
+
+    store._driver.calls.clear()
+    capped = list(store.traverse(start, None, direction="both", max_depth=2, max_fanout=2))
+    hop_queries = [call for call in store._driver.calls if "frontier" in call[1]]
+    assert "MATCH (a)-[r]-(b)" in hop_queries[0][0]
+    assert hop_queries[0][1] == {"frontier": ["4:root"], "max_fanout": 2}
+    assert hop_queries[1][1]["frontier"] == ["4:a", "4:b"]
+    assert [hit.object.primary_key for hit in capped] == ["a", "b"]
+
+
+def test_neo4j_iter_objects_streams_one_ordered_query() -> None:
+    class _StreamSession(_FakeSession):
+        def run(self, query: str, **params: Any) -> Any:
+            self._calls.append((query, params))
+            return iter([{"n": {"primary_key": f"loan-{index}", "version": 1}} for index in range(3)])
+
+    class _StreamDriver(_FakeDriver):
+        def __init__(self) -> None:
+            super().__init__(matched_ids=set())
+            self.session_kwargs: dict[str, Any] = {}
+
+        def session(self, **kwargs: Any) -> _StreamSession:
+            self.session_kwargs = kwargs
+            return _StreamSession(set(), self.calls)
+
+    store = _store()
+    store._driver = _StreamDriver()
+
+    keys = [item.primary_key for item in store.iter_objects("Loan", after_primary_key="loan-0", batch_size=250)]
+
+    assert keys == ["loan-0", "loan-1", "loan-2"]
+    assert store._driver.session_kwargs == {"fetch_size": 250, "default_access_mode": "READ"}
+    assert store._driver.calls == [
+        (
+            "MATCH (n:`Loan`) WHERE n.primary_key > $after_primary_key RETURN n ORDER BY n.primary_key",
+            {"after_primary_key": "loan-0"},
+        )
+    ]
+
+
+def test_neo4j_bulk_load_groups_rows_per_label_and_counts_loaded_rows() -> None:
+    edits = [AddObjectEdit("Loan" if i % 2 else "User", f"k-{i}", {"n": i}) for i in range(5)]
+    edits.append(AddLinkEdit("owns", ObjectLocator("User", "k-0"), ObjectLocator("Loan", "k-1")))
+
+    batches = compile_bulk_load(edits, max_batch_rows=2)
+
+    assert [(batch.kind, len(batch.rows)) for batch in batches] == [
+        ("bulk_add_object", 2),
+        ("bulk_add_object", 1),
+        ("bulk_add_object", 2),
+        ("bulk_add_link", 1),
+    ]
+    assert "WHERE e IS NULL" in batches[0].query
+    assert batches[0].rows[0]["props"] == {"n": 0, "primary_key": "k-0", "version": 1}
+
+    tx = _FakeTx(records=[{"loaded": 2}, {"loaded": 0}, {"loaded": 2}, {"loaded": 1}])
+    assert Neo4jGraphStore._run_bulk_batches(tx, batches) == 5
+    assert len(tx.calls) == 4
+
+    with pytest.raises(ValueError, match="Unsupported bulk load edit"):
+        compile_bulk_load([DeleteObjectEdit(ObjectLocator("Loan", "k-1"))])
+
+
+def test_bulk_load_keeps_the_first_row_of_a_repeated_key() -> None:
+    edits = [
+        AddObjectEdit("Loan", "k-1", {"n": 1}),
+        AddObjectEdit("User", "k-1", {"n": 2}),
+        AddObjectEdit("Loan", "k-2", {"n": 3}),
+        AddObjectEdit("Loan", "k-1", {"n": 4}),
+    ]
+
+    batches = compile_bulk_load(edits, max_batch_rows=1)
+
+    assert [(batch.rows[0]["primary_key"], batch.rows[0]["props"]["n"]) for batch in batches] == [
+        ("k-1", 1),
+        ("k-2", 3),
+        ("k-1", 2),
+    ]
+
+
+def test_compile_transactions_shares_batches_but_keeps_each_action_id() -> None:
+    batches = compile_transactions(
+        [
+            (TransactionEdit(edits=[AddObjectEdit("Loan", "loan-1", {})]), "exec-1"),
+            (TransactionEdit(edits=[AddObjectEdit("Loan", "loan-2", {})]), "exec-2"),
+            (ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"a": 1}), "exec-3"),
+            (ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"a": 2}), "exec-4"),
+        ]
+    )
+
+    assert [(batch.kind, len(batch.rows)) for batch in batches] == [
+        ("add_object", 2),
+        ("modify_object", 1),
+        ("modify_object", 1),
+    ]
+    assert [row["props"]["last_modified_by_action_id"] for row in batches[0].rows] == ["exec-1", "exec-2"]
+
+
+def test_neo4j_reads_use_managed_read_transactions_and_count_retries() -> None:
+    class _TransientError(Exception):
+        pass
+
+    class _RoutingSession(_FakeSession):
+        def __init__(self, driver: "_RoutingDriver") -> None:
+            super().__init__(driver.matched_ids, driver.calls)
+            self._driver = driver
+
+        def execute_read(self, work: Any, *args: Any) -> Any:
+            self._driver.modes.append("read")
+            # Fail the first attempt the way a follower switch would; the driver retries.
+            try:
+                return work(_FailingTx(), *args)
+            except _TransientError:
+                return work(self, *args)
+
+        def execute_write(self, work: Any, *args: Any) -> Any:
+            self._driver.modes.append("write")
+            return work(_FakeTx(records=[{"matched": 1}]), *args)
+
+    class _FailingTx:
+        def run(self, query: str, **params: Any) -> Any:
+            raise _TransientError()
+
+    class _RoutingDriver(_FakeDriver):
+        def __init__(self) -> None:
+            super().__init__(matched_ids={0})
+            self.matched_ids = {0}
+            self.modes: list[str] = []
+            self.session_kwargs: list[dict[str, Any]] = []
+
+        def session(self, **kwargs: Any) -> _RoutingSession:
+            self.session_kwargs.append(kwargs)
+            return _RoutingSession(self)
+
+    store = _store()
+    store._driver = _RoutingDriver()
+    store._session_config = {"database": "ontology"}
+
+    store.apply_edit(ModifyObjectEdit(ObjectLocator("Loan", "loan-1", version=1), {"a": 1}), "exec-1")
+    from ontology.action.storage.edits import edit_to_dict
+
+    assert store.has_actions_applied([("exec-1", edit_to_dict(AddObjectEdit("Loan", "loan-1", {})))]) == [True]
+
+    assert store._driver.modes == ["write", "read"]
+    assert all(kwargs == {"database": "ontology"} for kwargs in store._driver.session_kwargs)
+    stats = store.pool_stats()
+    assert (stats["read_transactions"], stats["write_transactions"], stats["retries"]) == (1, 1, 1)
+    assert (stats["sessions_opened"], stats["sessions_in_use"], stats["peak_sessions_in_use"]) == (2, 0, 1)
+
+
+def test_neo4j_pool_config_reaches_driver_and_admin_endpoint() -> None:
+    pytest.importorskip("neo4j")
+    from fastapi.testclient import TestClient
+
+    from ontology import InMemoryGraphStore
+    from ontology.instance.storage.neo4j_pool import Neo4jPoolConfig
+    from ontology.main import create_app
+
+    with pytest.raises(ValueError, match="max_connection_pool_size"):
+        Neo4jPoolConfig(max_connection_pool_size=0)
+    config = Neo4jPoolConfig(max_connection_pool_size=8, connection_acquisition_timeout=2.5, fetch_size=500)
+    assert config.driver_kwargs()["connection_acquisition_timeout"] == 2.5
+
+    # The driver connects lazily, so no server is needed to build the store.
+    store = Neo4jGraphStore("neo4j://localhost:7687", "neo4j", "secret", auto_schema=False, pool_config=config)
+    try:
+        assert "bookmark_manager" in store._session_config
+        client = TestClient(create_app(store))
+        pool = client.get("/api/v1/admin/instance/pool").json()
+        assert (pool["enabled"], pool["max_pool_size"], pool["sessions_in_use"]) == (True, 8, 0)
+    finally:
+        store._driver.close()
+
+    client = TestClient(create_app(InMemoryGraphStore()))
+    assert client.get("/api/v1/admin/instance/pool").json()["enabled"] is False
+
+
+def test_every_compiled_query_backtick_quotes_labels_and_relationship_types() -> None:
+    from ontology.instance.storage.graph_store import (
+        _compile_applied_probe,
+        _compile_get_objects,
+        _get_object_query,
+        _list_objects_query,
+    )
+
+    label, rel_type = "Loan Book-2", "held`by"
+    source, target = ObjectLocator(label, "k-1"), ObjectLocator("User", "u-1")
+    edits = [
+        AddObjectEdit(label, "k-1", {}),
+        ModifyObjectEdit(source, {"a": 1}),
+        AddLinkEdit(rel_type, source, target),
+        RemoveLinkEdit(rel_type, source, target),
+        DeleteObjectEdit(source),
+    ]
+    queries = [batch.query for batch in compile_edits(edits)]
+    bulk = compile_bulk_load([AddObjectEdit(label, "k-2", {}), AddLinkEdit(rel_type, source, target)])
+    queries += [batch.query for batch in bulk]
+    queries += [
+        _get_object_query(label),
+        _list_objects_query(label, "k-0"),
+        _compile_get_objects([source])[1],
+        _compile_applied_probe([("exec-1", edit_to_dict(AddObjectEdit(label, "k-1", {})))])[1],
+    ]
+
+    for query in queries:
+        assert query.count(label) == query.count(f"`{label}`") > 0
+        assert query.count("held") == query.count("`held``by`")
+    assert sum("`held``by`" in query for query in queries) == 3
+
+
+def test_schema_names_stay_distinct_when_labels_sanitize_alike() -> None:
+    from ontology.instance.storage.neo4j_schema import Neo4jSchemaManager
+
+    # Building statements never touches the driver.
+    manager = Neo4jSchemaManager(driver=None)
+
+    names = {
+        statement.split("`")[1]
+        for label in ("a-b", "a_b", "a b")
+        for statement in manager.statements_for(label)
+    }
+    indexes = {
+        manager.property_index_statement(label, property_name).split("`")[1]
+        for label, property_name in (("a_b", "c"), ("a", "b_c"))
+    }
+
+    assert len(names) == 6
+    assert len(indexes) == 2
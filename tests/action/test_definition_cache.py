@@ -0,0 +1,139 @@
+import pytest
+
+from ontology import (
+    ActionDefinition,
+    ActionRunner,
+    ActionService,
+    CachingActionRepository,
+    DataFunnelService,
+    FunctionDefinition,
+    InMemoryActionRepository,
+    InMemoryGraphStore,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingRepository(InMemoryActionRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.action_reads = 0
+
+    def get_action(self, name: str, version: int | None = None) -> ActionDefinition | None:
+        self.action_reads += 1
+        return super().get_action(name, version)
+
+
+def _definition(version: int) -> ActionDefinition:
+    return ActionDefinition(name="Approve", description=f"v{version}", function_name="approve", version=version)
+
+
+def test_definition_cache_pins_versions_and_expires_latest() -> None:
+    clock = _Clock()
+    backend = _CountingRepository()
+    backend.add_action(_definition(1))
+    repo = CachingActionRepository(backend, ttl_seconds=5, clock=clock)
+
+    assert repo.get_action("Approve", 1).description == "v1"
+    assert repo.get_action("Approve").description == "v1"
+    assert repo.get_action("Approve").description == "v1"
+    assert backend.action_reads == 2
+
+    # A version registered elsewhere shows up once the "latest" entry expires.
+    backend.add_action(_definition(2))
+    assert repo.get_action("Approve").description == "v1"
+    clock.now = 6
+    assert repo.get_action("Approve").description == "v2"
+    clock.now = 1_000
+    assert repo.get_action("Approve", 1).description == "v1"
+    assert repo.get_action("Approve", 2).description == "v2"
+    assert backend.action_reads == 3
+    assert repo.get_action("Missing") is None and repo.get_action("Missing") is None
+    stats = repo.stats()
+    assert stats["hits"] == 4 and stats["misses"] == 5 and stats["expirations"] == 1
+    assert stats["hit_rate"] == pytest.approx(4 / 9)
+
+
+def test_definition_cache_invalidates_on_add() -> None:
+    repo = CachingActionRepository(InMemoryActionRepository(), ttl_seconds=60)
+    repo.add_action(_definition(1))
+    repo.add_function(FunctionDefinition(name="approve", runtime="python", code_ref="approve", version=1))
+    assert repo.get_action("Approve").version == 1
+    assert repo.get_function("approve").version == 1
+
+    repo.add_action(_definition(2))
+    repo.add_function(FunctionDefinition(name="approve", runtime="python", code_ref="approve", version=2))
+
+    assert repo.get_action("Approve").version == 2
+    assert repo.get_function("approve").version == 2
+    assert repo.stats()["invalidations"] == 4
+
+
+def test_action_apply_resolves_definition_from_cache() -> None:
+    backend = _CountingRepository()
+    backend.add_action(_definition(1))
+    repo = CachingActionRepository(backend)
+    runner = ActionRunner()
+    runner.register("approve", lambda context: "ok")
+    service = ActionService(repo, runner, DataFunnelService(InMemoryGraphStore()))
+
+    executions = [service.apply("Approve", "user-1", {}) for _ in range(5)]
+
+    assert backend.action_reads == 1
+    # Non-definition calls go straight to the wrapped repository.
+    assert backend.get_execution(executions[-1].execution_id).status.value == "succeeded"
+    assert repo.get_execution(executions[0].execution_id) is backend.executions[executions[0].execution_id]
+
+
+def test_definition_cache_stats_route() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from ontology.main import create_app
+
+    repo = CachingActionRepository(InMemoryActionRepository())
+    repo.add_action(_definition(1))
+    repo.get_action("Approve")
+    repo.get_action("Approve")
+    client = TestClient(create_app(InMemoryGraphStore(), repository=repo))
+    plain = TestClient(create_app(InMemoryGraphStore(), repository=InMemoryActionRepository()))
+
+    body = client.get("/api/v1/admin/actions/definition-cache").json()
+    assert body["enabled"] is True and body["hits"] == 1 and body["hit_rate"] == 0.5
+    assert plain.get("/api/v1/admin/actions/definition-cache").json()["enabled"] is False
+
+
+def test_apply_route_resolves_definition_once_per_request() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from ontology.main import create_app
+
+    backend = _CountingRepository()
+    backend.add_action(_definition(1))
+    runner = ActionRunner()
+    runner.register("approve", lambda context: "ok")
+    service = ActionService(backend, runner, DataFunnelService(InMemoryGraphStore()))
+    client = TestClient(create_app(InMemoryGraphStore(), action_service=service, repository=backend))
+
+    assert client.post("/api/v1/actions/Approve/apply", json={"submitter": "u", "input_payload": {}}).status_code == 200
+    assert backend.action_reads == 1
+    missing = client.post("/api/v1/actions/Missing/apply", json={"submitter": "u", "input_payload": {}})
+    assert missing.status_code == 404
+
+
+def test_main_server_app_caches_definitions() -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from scripts.object_monitor.service_factory import build_ontology_main_server_app
+
+    client = TestClient(build_ontology_main_server_app())
+
+    assert client.get("/api/v1/admin/actions/definition-cache").json()["enabled"] is True
@@ -0,0 +1,287 @@
+import threading
+
+import pytest
+
+from ontology import ObjectLocator
+from ontology.action.storage.edits import AddLinkEdit, AddObjectEdit, ModifyObjectEdit, TransactionEdit
+from ontology.instance.storage.durability import DurableGraphStore, WAL_FILE_NAME
+
+
+def _seed(store: DurableGraphStore) -> None:
+    store.apply_edit(
+        TransactionEdit(
+            edits=[
+                AddObjectEdit("Employee", "emp-1", {"name": "Ada"}),
+                AddObjectEdit("Company", "co-1", {"name": "Acme"}),
+                AddLinkEdit("works_for", ObjectLocator("Employee", "emp-1"), ObjectLocator("Company", "co-1")),
+            ]
+        ),
+        action_id="exec-1",
+    )
+
+
+def test_durable_store_recovers_from_wal(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    store.apply_edit(
+        TransactionEdit(edits=[ModifyObjectEdit(ObjectLocator("Employee", "emp-1", version=1), {"name": "Grace"})]),
+        action_id="exec-2",
+    )
+    store.close()
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    employee = recovered.get_object(ObjectLocator("Employee", "emp-1"))
+    assert employee.version == 2
+    assert employee.properties["name"] == "Grace"
+    assert recovered.neighbors(ObjectLocator("Employee", "emp-1")) == [("works_for", ObjectLocator("Company", "co-1"))]
+    assert employee.properties["last_modified_by_action_id"] == "exec-2"
+    assert recovered.lsn == 2
+
+
+def test_durable_store_drops_torn_record_after_crash_mid_transaction(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-2", {"name": "Lin"})]))
+    store.close()
+
+    wal_path = tmp_path / WAL_FILE_NAME
+    data = wal_path.read_bytes()
+    last_record_start = data.rstrip(b"\n").rfind(b"\n") + 1
+    # Simulate a crash halfway through writing the second transaction.
+    wal_path.write_bytes(data[: last_record_start + (len(data) - last_record_start) // 2])
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.get_object(ObjectLocator("Employee", "emp-1")).properties["name"] == "Ada"
+    with pytest.raises(ValueError):
+        recovered.get_object(ObjectLocator("Employee", "emp-2"))
+    assert wal_path.stat().st_size == last_record_start
+
+    # The log stays appendable after the torn tail is cut off.
+    recovered.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-3", {"name": "Kai"})]))
+    recovered.close()
+    again = DurableGraphStore(tmp_path, fsync=False)
+    assert again.get_object(ObjectLocator("Employee", "emp-3")).version == 1
+
+
+def test_durable_store_skips_corrupt_record(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-2", {"name": "Lin"})]))
+    store.close()
+
+    wal_path = tmp_path / WAL_FILE_NAME
+    wal_path.write_bytes(wal_path.read_bytes().replace(b'"Lin"', b'"Lyn"'))
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.lsn == 1
+    assert len(recovered.list_objects("Employee")) == 1
+
+
+def test_failed_transaction_is_not_logged(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    with pytest.raises(ValueError):
+        store.apply_edit(
+            TransactionEdit(
+                edits=[
+                    AddObjectEdit("Employee", "emp-2", {"name": "Lin"}),
+                    AddObjectEdit("Employee", "emp-1", {"name": "duplicate"}),
+                ]
+            )
+        )
+    store.close()
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.lsn == 1
+    assert [item.primary_key for item in recovered.list_objects("Employee")] == ["emp-1"]
+
+
+def test_snapshot_truncates_wal_and_replays_tail(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, snapshot_every=2, fsync=False)
+    _seed(store)
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-2", {"name": "Lin"})]))
+    assert (tmp_path / WAL_FILE_NAME).stat().st_size == 0
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-3", {"name": "Kai"})]))
+    store.close()
+
+    recovered = DurableGraphStore(tmp_path, snapshot_every=2, fsync=False)
+    assert recovered.lsn == 3
+    assert [item.primary_key for item in recovered.list_objects("Employee")] == ["emp-1", "emp-2", "emp-3"]
+    assert recovered.neighbors(ObjectLocator("Company", "co-1"), direction="incoming") == [
+        ("works_for", ObjectLocator("Employee", "emp-1"))
+    ]
+
+
+def test_crash_between_snapshot_and_wal_truncate_is_idempotent(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-2", {"name": "Lin"})]))
+    wal_before = (tmp_path / WAL_FILE_NAME).read_bytes()
+    store.checkpoint()
+    store.close()
+    # The snapshot rename landed but the WAL truncate did not.
+    (tmp_path / WAL_FILE_NAME).write_bytes(wal_before)
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.lsn == 2
+    assert len(recovered.list_objects("Employee")) == 2
+
+
+def test_concurrent_writers_share_fsync(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, group_commit_delay=0.01)
+    barrier = threading.Barrier(8)
+
+    def write(index: int) -> None:
+        barrier.wait()
+        store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", f"emp-{index}", {})]))
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+
+    assert store.wal.sync_count < 8
+    assert len(DurableGraphStore(tmp_path).list_objects("Employee")) == 8
+
+
+def test_group_apply_logs_each_member_with_one_sync(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    syncs_before = store.wal.sync_count
+    store.apply_group(
+        [
+            (TransactionEdit(edits=[AddObjectEdit("Loan", "loan-1", {})]), "exec-1"),
+            (TransactionEdit(edits=[AddObjectEdit("Loan", "loan-2", {})]), "exec-2"),
+        ]
+    )
+    with pytest.raises(ValueError, match="already exists"):
+        store.apply_group(
+            [
+                (TransactionEdit(edits=[AddObjectEdit("Loan", "loan-3", {})]), "exec-3"),
+                (TransactionEdit(edits=[AddObjectEdit("Loan", "loan-1", {})]), "exec-4"),
+            ]
+        )
+    assert store.wal.sync_count == syncs_before + 1
+    assert store.lsn == 2
+    store.close()
+
+    reopened = DurableGraphStore(tmp_path, fsync=False)
+    loans = reopened.list_objects("Loan")
+    assert [(obj.primary_key, obj.properties["last_modified_by_action_id"]) for obj in loans] == [
+        ("loan-1", "exec-1"),
+        ("loan-2", "exec-2"),
+    ]
+    reopened.close()
+
+
+def test_background_checkpoint_does_not_block_writers(tmp_path, monkeypatch) -> None:
+    from ontology.instance.storage import durability
+
+    started = threading.Event()
+    release = threading.Event()
+    write_snapshot_records = durability.write_snapshot_records
+
+    def slow_write(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        write_snapshot_records(*args, **kwargs)
+
+    monkeypatch.setattr(durability, "write_snapshot_records", slow_write)
+    store = DurableGraphStore(tmp_path, snapshot_every=2, fsync=False)
+    _seed(store)
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-2", {"name": "Lin"})]))
+    assert started.wait(5)
+
+    # The snapshot is still being written; writers only wait for their fsync.
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-3", {"name": "Kai"})]))
+    assert (tmp_path / durability.WAL_PREVIOUS_FILE_NAME).exists()
+    release.set()
+    store.close()
+
+    assert not (tmp_path / durability.WAL_PREVIOUS_FILE_NAME).exists()
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.lsn == 3
+    assert len(recovered.list_objects("Employee")) == 3
+
+
+def test_interrupted_checkpoint_replays_both_wal_segments(tmp_path, monkeypatch) -> None:
+    from ontology.instance.storage import durability
+
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    monkeypatch.setattr(durability, "write_snapshot_records", crash)
+    with pytest.raises(OSError):
+        store.checkpoint()
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Employee", "emp-2", {"name": "Lin"})]))
+    with pytest.raises(OSError):
+        store.checkpoint()
+    store.close()
+    monkeypatch.undo()
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.lsn == 2
+    assert len(recovered.list_objects("Employee")) == 2
+    assert not (tmp_path / durability.WAL_PREVIOUS_FILE_NAME).exists()
+    recovered.close()
+    assert DurableGraphStore(tmp_path, fsync=False).lsn == 2
+
+
+def test_writer_on_another_key_is_not_blocked_by_a_staging_writer(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+    stripes = store.store._key_locks
+    held = ("Employee", "emp-1")
+    other = next(
+        ("Employee", f"emp-{index}")
+        for index in range(2, 100)
+        if stripes.stripes_for([("Employee", f"emp-{index}")]) != stripes.stripes_for([held])
+    )
+    stuck_done = threading.Event()
+
+    def modify_held() -> None:
+        store.apply_edit(ModifyObjectEdit(ObjectLocator(*held), {"name": "Grace"}))
+        stuck_done.set()
+
+    with stripes.hold([held]):
+        writer = threading.Thread(target=modify_held)
+        writer.start()
+        # The blocked writer waits on its key stripe, not on the WAL lock.
+        free_writer = threading.Thread(
+            target=store.apply_edit, args=(AddObjectEdit(other[0], other[1], {"name": "Lin"}),)
+        )
+        free_writer.start()
+        free_writer.join(5)
+        assert not free_writer.is_alive()
+        assert not stuck_done.is_set()
+    writer.join(5)
+    assert stuck_done.is_set()
+    store.close()
+
+    recovered = DurableGraphStore(tmp_path, fsync=False)
+    assert recovered.lsn == 3
+    assert recovered.get_object(ObjectLocator(*held)).properties["name"] == "Grace"
+
+
+def test_concurrent_writers_on_one_key_replay_in_apply_order(tmp_path) -> None:
+    store = DurableGraphStore(tmp_path, fsync=False)
+    _seed(store)
+
+    def bump(worker: int) -> None:
+        for step in range(25):
+            store.apply_edit(ModifyObjectEdit(ObjectLocator("Employee", "emp-1"), {"name": f"{worker}-{step}"}))
+
+    threads = [threading.Thread(target=bump, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    live = store.get_object(ObjectLocator("Employee", "emp-1"))
+    store.close()
+
+    recovered = DurableGraphStore(tmp_path, fsync=False).get_object(ObjectLocator("Employee", "emp-1"))
+    assert recovered.version == live.version == 101
+    assert recovered.properties == live.properties
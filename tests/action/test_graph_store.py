@@ -0,0 +1,502 @@
+from ontology import InMemoryGraphStore, ObjectLocator
+from ontology.action.storage.edits import (
+    AddLinkEdit,
+    AddObjectEdit,
+    DeleteObjectEdit,
+    ModifyObjectEdit,
+    RemoveLinkEdit,
+    TransactionEdit,
+)
+import pytest
+
+
+def _seed_store() -> InMemoryGraphStore:
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {"status": "NEW", "amount": 10})
+    store.add_object("Loan", "loan-2", {"status": "NEW", "amount": 20})
+    store.add_link("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "loan-2"))
+    return store
+
+
+def test_in_memory_transaction_rolls_back_only_touched_state() -> None:
+    store = _seed_store()
+    tx = TransactionEdit(
+        edits=[
+            ModifyObjectEdit(ObjectLocator("Loan", "loan-1"), {"status": "APPROVED"}),
+            AddObjectEdit("Loan", "loan-3", {"status": "NEW"}),
+            AddLinkEdit("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "loan-3")),
+            RemoveLinkEdit("owns", ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "loan-2")),
+            DeleteObjectEdit(ObjectLocator("Loan", "loan-2")),
+            AddObjectEdit("Loan", "loan-1", {"status": "DUP"}),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="already exists"):
+        store.apply_edit(tx, action_id="exec-1")
+
+    loan_1 = store.get_object(ObjectLocator("Loan", "loan-1"))
+    assert loan_1.properties == {"status": "NEW", "amount": 10}
+    assert loan_1.version == 1
+    assert store.get_object(ObjectLocator("Loan", "loan-2")).properties["amount"] == 20
+    assert [obj.primary_key for obj in store.list_objects("Loan")] == ["loan-1", "loan-2"]
+    assert store.links == {("owns", ("Loan", "loan-1"), ("Loan", "loan-2"))}
+
+
+def test_in_memory_transaction_rollback_restores_links_removed_by_delete() -> None:
+    store = _seed_store()
+    tx = TransactionEdit(
+        edits=[
+            DeleteObjectEdit(ObjectLocator("Loan", "loan-2")),
+            ModifyObjectEdit(ObjectLocator("Loan", "missing"), {"status": "X"}),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="Object not found"):
+        store.apply_edit(tx)
+
+    assert store.get_object(ObjectLocator("Loan", "loan-2")).version == 1
+    assert store.links == {("owns", ("Loan", "loan-1"), ("Loan", "loan-2"))}
+
+
+def test_in_memory_nested_transaction_is_covered_by_outer_transaction() -> None:
+    store = _seed_store()
+    tx = TransactionEdit(
+        edits=[
+            TransactionEdit(edits=[ModifyObjectEdit(ObjectLocator("Loan", "loan-2"), {"status": "DONE"})]),
+            ModifyObjectEdit(ObjectLocator("Loan", "loan-1", version=9), {"status": "DONE"}),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="Version conflict"):
+        store.apply_edit(tx)
+
+    assert store.get_object(ObjectLocator("Loan", "loan-2")).properties["status"] == "NEW"
+
+
+def test_sorted_key_index_matches_sorted_reference() -> None:
+    import random
+
+    from ontology.instance.storage.indexes import SortedKeyIndex
+
+    rng = random.Random(7)
+    index = SortedKeyIndex(chunk_size=4)
+    reference: set[str] = set()
+    for _ in range(2000):
+        key = f"k-{rng.randrange(500):04d}"
+        if rng.random() < 0.3:
+            index.discard(key)
+            reference.discard(key)
+        else:
+            index.add(key)
+            reference.add(key)
+    expected = sorted(reference)
+
+    assert list(index) == expected
+    assert len(index) == len(expected)
+    assert list(index.iter_from(offset=10))[:5] == expected[10:15]
+    assert list(index.iter_from(after=expected[20], offset=2))[:3] == expected[23:26]
+    assert list(index.iter_from(after="k-9999")) == []
+
+
+def test_in_memory_list_objects_keyset_pagination() -> None:
+    store = InMemoryGraphStore()
+    for index in range(25):
+        store.add_object("Loan", f"loan-{index:02d}", {"amount": index})
+    store.add_object("Borrower", "b-1", {})
+
+    pages = []
+    cursor = None
+    while True:
+        page = store.list_objects("Loan", limit=10, after_primary_key=cursor)
+        if not page:
+            break
+        pages.append([obj.primary_key for obj in page])
+        cursor = page[-1].primary_key
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert pages[1][0] == "loan-10"
+    assert [obj.primary_key for obj in store.list_objects("Loan", limit=2, offset=3)] == ["loan-03", "loan-04"]
+    assert store.list_objects("Missing") == []
+
+    store.delete_object(ObjectLocator("Loan", "loan-10"))
+    assert store.list_objects("Loan", limit=1, after_primary_key="loan-09")[0].primary_key == "loan-11"
+
+
+def test_in_memory_reads_share_compact_read_only_records() -> None:
+    store = _seed_store()
+    first = store.get_object(ObjectLocator("Loan", "loan-1"))
+
+    assert store.list_objects("Loan", limit=1)[0] is first
+    assert first.properties == {"status": "NEW", "amount": 10}
+    assert list(first.properties) == ["status", "amount"]
+    assert "__dict__" not in dir(first) and "__dict__" not in dir(first.properties)
+    with pytest.raises(TypeError):
+        first.properties["status"] = "MUTATED"
+    with pytest.raises(AttributeError):
+        first.version = 9
+    # Objects of one type with the same property names share one name tuple.
+    second = store.get_object(ObjectLocator("Loan", "loan-2"))
+    assert second.properties._shape is first.properties._shape
+
+    store.modify_object(ObjectLocator("Loan", "loan-1", version=1), {"status": "DONE"}, action_id="exec-1")
+
+    assert first.properties["status"] == "NEW" and first.version == 1
+    updated = store.get_object(ObjectLocator("Loan", "loan-1"))
+    assert dict(updated.properties) == {"status": "DONE", "amount": 10, "last_modified_by_action_id": "exec-1"}
+    assert updated.properties.get("missing", "fallback") == "fallback"
+
+
+def test_in_memory_adjacency_indexes_track_links_and_deletes() -> None:
+    store = _seed_store()
+    loan_1 = ObjectLocator("Loan", "loan-1")
+    loan_2 = ObjectLocator("Loan", "loan-2")
+    store.add_object("Borrower", "b-1", {})
+    store.add_link("borrower", loan_1, ObjectLocator("Borrower", "b-1"))
+    store.add_link("borrower", loan_2, ObjectLocator("Borrower", "b-1"))
+
+    assert sorted(store.neighbors(loan_1), key=lambda pair: pair[0]) == [
+        ("borrower", ObjectLocator("Borrower", "b-1")),
+        ("owns", loan_2),
+    ]
+    assert store.neighbors(loan_1, link_type="owns") == [("owns", loan_2)]
+    incoming = store.neighbors(ObjectLocator("Borrower", "b-1"), direction="incoming")
+    assert sorted(locator.primary_key for _, locator in incoming) == ["loan-1", "loan-2"]
+
+    store.delete_object(loan_2)
+
+    assert store.neighbors(loan_1) == [("borrower", ObjectLocator("Borrower", "b-1"))]
+    assert store.neighbors(ObjectLocator("Borrower", "b-1"), direction="incoming") == [("borrower", loan_1)]
+    assert store.links == {("borrower", ("Loan", "loan-1"), ("Borrower", "b-1"))}
+
+    store.remove_link("borrower", loan_1, ObjectLocator("Borrower", "b-1"))
+    assert store.neighbors(loan_1, direction="both") == []
+
+
+def test_in_memory_adjacency_indexes_follow_rollback() -> None:
+    store = _seed_store()
+    loan_1 = ObjectLocator("Loan", "loan-1")
+    tx = TransactionEdit(
+        edits=[
+            DeleteObjectEdit(ObjectLocator("Loan", "loan-2")),
+            AddObjectEdit("Loan", "loan-1", {"status": "DUP"}),
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        store.apply_edit(tx)
+
+    assert store.neighbors(loan_1) == [("owns", ObjectLocator("Loan", "loan-2"))]
+    assert store.neighbors(ObjectLocator("Loan", "loan-2"), direction="incoming") == [("owns", loan_1)]
+
+
+def test_in_memory_concurrent_transfers_keep_versions_and_links_consistent() -> None:
+    import random
+    import threading
+    from collections import Counter
+
+    store = InMemoryGraphStore(lock_stripes=8)
+    accounts = [f"acct-{index}" for index in range(12)]
+    for key in accounts:
+        store.add_object("Account", key, {"balance": 100})
+    total = 100 * len(accounts)
+    writers = 8
+    transfers_per_writer = 150
+    start = threading.Barrier(writers + 1)
+    done = threading.Event()
+    modified: Counter[str] = Counter()
+    paid: set[tuple[str, str]] = set()
+    bookkeeping = threading.Lock()
+    errors: list[BaseException] = []
+
+    def transfer(seed: int) -> None:
+        rng = random.Random(seed)
+        start.wait()
+        completed = 0
+        while completed < transfers_per_writer:
+            source, target = rng.sample(accounts, 2)
+            current = store.get_objects([ObjectLocator("Account", source), ObjectLocator("Account", target)])
+            tx = TransactionEdit(
+                edits=[
+                    ModifyObjectEdit(
+                        ObjectLocator("Account", source, version=current[0].version),
+                        {"balance": current[0].properties["balance"] - 1},
+                    ),
+                    ModifyObjectEdit(
+                        ObjectLocator("Account", target, version=current[1].version),
+                        {"balance": current[1].properties["balance"] + 1},
+                    ),
+                    AddLinkEdit("paid", ObjectLocator("Account", source), ObjectLocator("Account", target)),
+                ]
+            )
+            try:
+                store.apply_edit(tx)
+            except ValueError as exc:
+                assert "Version conflict" in str(exc)
+                continue
+            completed += 1
+            with bookkeeping:
+                modified.update([source, target])
+                paid.add((source, target))
+
+    def read() -> None:
+        locators = [ObjectLocator("Account", key) for key in accounts]
+        start.wait()
+        try:
+            while not done.is_set():
+                snapshot = store.get_objects(locators)
+                assert sum(instance.properties["balance"] for instance in snapshot) == total
+                assert len(store.list_objects("Account", limit=100)) == len(accounts)
+        except BaseException as exc:  # surfaced in the main thread
+            errors.append(exc)
+
+    threads = [threading.Thread(target=transfer, args=(seed,)) for seed in range(writers)]
+    reader = threading.Thread(target=read)
+    reader.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    reader.join()
+
+    assert errors == []
+    final = {instance.primary_key: instance for instance in store.list_objects("Account", limit=100)}
+    assert sum(instance.properties["balance"] for instance in final.values()) == total
+    for key in accounts:
+        assert final[key].version == 1 + modified[key]
+    assert store.links == {("paid", ("Account", source), ("Account", target)) for source, target in paid}
+    for key in accounts:
+        outgoing = {other.primary_key for _, other in store.neighbors(ObjectLocator("Account", key))}
+        assert outgoing == {target for source, target in paid if source == key}
+
+
+def test_in_memory_search_uses_property_indexes_and_matches_scan() -> None:
+    import random
+
+    from ontology.instance.storage.query import PropertyPredicate
+
+    rng = random.Random(11)
+    store = InMemoryGraphStore()
+    for index in range(300):
+        store.add_object(
+            "Account",
+            f"acct-{index:03d}",
+            {"status": rng.choice(["open", "frozen", "closed"]), "balance": rng.randrange(1000)},
+        )
+    store.add_object("Account", "acct-odd", {"status": 7, "balance": "n/a"})
+    queries = [
+        [PropertyPredicate("status", "eq", "frozen")],
+        [PropertyPredicate("status", "in", ["frozen", "closed"]), PropertyPredicate("balance", "lt", 100)],
+        [PropertyPredicate("balance", "gte", 250), PropertyPredicate("balance", "lt", 500)],
+        [PropertyPredicate("balance", "gt", 990)],
+        [PropertyPredicate("balance", "gt", "a")],
+    ]
+    scans = [store.search_objects("Account", where, limit=1000) for where in queries]
+    assert {result.plan.strategy for result in scans} == {"scan"}
+
+    store.create_property_index("Account", "status")
+    store.create_property_index("Account", "balance", kind="sorted")
+    for where, scan in zip(queries, scans):
+        indexed = store.search_objects("Account", where, limit=1000)
+        assert [obj.primary_key for obj in indexed.objects] == [obj.primary_key for obj in scan.objects]
+        assert indexed.plan.strategy == "index"
+        assert indexed.plan.examined <= scan.plan.examined
+
+    narrow = store.search_objects("Account", queries[1], limit=1000)
+    assert narrow.plan.index == "property_index_Account_balance"
+    page = store.search_objects("Account", queries[0], limit=5, after_primary_key=scans[0].objects[4].primary_key)
+    assert [obj.primary_key for obj in page.objects] == [obj.primary_key for obj in scans[0].objects[5:10]]
+
+
+def test_in_memory_property_index_follows_writes_and_rollback() -> None:
+    from ontology.instance.storage.query import PropertyPredicate
+
+    store = _seed_store()
+    store.create_property_index("Loan", "status", kind="sorted")
+    frozen = [PropertyPredicate("status", "eq", "FROZEN")]
+
+    store.modify_object(ObjectLocator("Loan", "loan-1"), {"status": "FROZEN"})
+    assert [obj.primary_key for obj in store.search_objects("Loan", frozen).objects] == ["loan-1"]
+
+    with pytest.raises(ValueError):
+        store.apply_edit(
+            TransactionEdit(
+                edits=[
+                    ModifyObjectEdit(ObjectLocator("Loan", "loan-2"), {"status": "FROZEN"}),
+                    DeleteObjectEdit(ObjectLocator("Loan", "loan-1")),
+                    AddObjectEdit("Loan", "loan-2", {}),
+                ]
+            )
+        )
+    assert [obj.primary_key for obj in store.search_objects("Loan", frozen).objects] == ["loan-1"]
+
+    store.delete_object(ObjectLocator("Loan", "loan-1"))
+    assert store.search_objects("Loan", frozen).objects == []
+    assert [entry["size"] for entry in store.schema_status() if entry["properties"] == ["status"]] == [1]
+
+
+def test_in_memory_aggregate_groups_and_reduces_numeric_columns() -> None:
+    from ontology.instance.storage.aggregation import AggregateSpec
+    from ontology.instance.storage.query import PropertyPredicate
+
+    store = InMemoryGraphStore()
+    rows = [
+        ("a-1", "open", 10),
+        ("a-2", "open", 30),
+        ("a-3", "frozen", 5.5),
+        ("a-4", "frozen", "n/a"),
+        ("a-5", None, 1),
+    ]
+    for key, status, balance in rows:
+        properties = {"balance": balance}
+        if status is not None:
+            properties["status"] = status
+        store.add_object("Account", key, properties)
+    aggregates = [
+        AggregateSpec("count"),
+        AggregateSpec("count", "status", alias="with_status"),
+        AggregateSpec("sum", "balance"),
+        AggregateSpec("avg", "balance"),
+        AggregateSpec("min", "balance"),
+        AggregateSpec("max", "balance"),
+    ]
+
+    result = store.aggregate_objects("Account", aggregates, group_by=["status"])
+
+    assert result.scanned == 5
+    assert [group.group for group in result.groups] == [{"status": None}, {"status": "frozen"}, {"status": "open"}]
+    assert result.groups[1].values == {
+        "count": 2,
+        "with_status": 2,
+        "sum_balance": 5.5,
+        "avg_balance": 5.5,
+        "min_balance": 5.5,
+        "max_balance": 5.5,
+    }
+    assert result.groups[2].values["sum_balance"] == 40
+    assert result.groups[2].values["avg_balance"] == 20
+    assert result.groups[0].values["with_status"] == 0
+
+    filtered = store.aggregate_objects(
+        "Account",
+        [AggregateSpec("count"), AggregateSpec("max", "balance")],
+        predicates=[PropertyPredicate("status", "eq", "open")],
+    )
+    assert [group.values for group in filtered.groups] == [{"count": 2, "max_balance": 30}]
+    empty = store.aggregate_objects("Missing", [AggregateSpec("count"), AggregateSpec("avg", "x")])
+    assert [group.values for group in empty.groups] == [{"count": 0, "avg_x": None}]
+    with pytest.raises(ValueError, match="requires a property"):
+        AggregateSpec("sum")
+
+
+def test_aggregate_engines_agree() -> None:
+    import random
+
+    from ontology.instance.storage.aggregation import AggregateSpec, aggregate_instances, numpy_available
+    from ontology.action.storage.edits import ObjectInstance
+
+    if not numpy_available():
+        pytest.skip("numpy not installed")
+    rng = random.Random(3)
+    instances = [
+        ObjectInstance(
+            "Account",
+            f"a-{index}",
+            {"region": rng.choice(["eu", "us", None]), "tier": rng.choice([1, 2, True]), "balance": rng.randrange(100)},
+        )
+        for index in range(500)
+    ]
+    aggregates = [AggregateSpec(op, "balance") for op in ("sum", "avg", "min", "max")] + [AggregateSpec("count")]
+
+    python = aggregate_instances(instances, aggregates, ["region", "tier"], engine="python")
+    vectorized = aggregate_instances(instances, aggregates, ["region", "tier"], engine="numpy")
+
+    assert [group.group for group in python.groups] == [group.group for group in vectorized.groups]
+    for left, right in zip(python.groups, vectorized.groups):
+        assert left.values == pytest.approx(right.values)
+
+
+def test_numpy_engine_keeps_integer_aggregates_exact() -> None:
+    pytest.importorskip("numpy")
+    from ontology.instance.storage.aggregation import AggregateSpec, aggregate_instances
+    from ontology.action.storage.edits import ObjectInstance
+
+    big = 2**53
+    balances = {"eu": [big + 1, big + 3, -5], "us": [2**62, 2**62, 7]}
+    instances = [
+        ObjectInstance("Account", f"{region}-{index}", {"region": region, "balance": balance})
+        for region, values in balances.items()
+        for index, balance in enumerate(values)
+    ]
+    aggregates = [AggregateSpec(op, "balance") for op in ("sum", "avg", "min", "max")]
+
+    # "eu" alone fits int64 (vectorized); with "us" the sum exceeds it (Python fallback).
+    for subset in ([instance for instance in instances if instance.properties["region"] == "eu"], instances):
+        python = aggregate_instances(subset, aggregates, ["region"], engine="python")
+        vectorized = aggregate_instances(subset, aggregates, ["region"], engine="numpy")
+        assert [group.values for group in vectorized.groups] == [group.values for group in python.groups]
+        assert all(type(group.values["min_balance"]) is int for group in vectorized.groups)
+    assert vectorized.groups[0].values["sum_balance"] == 2 * big - 1
+    assert vectorized.groups[0].values["max_balance"] == big + 3
+    assert vectorized.groups[1].values["sum_balance"] == 2**63 + 7
+
+
+def test_in_memory_traverse_expands_breadth_first_with_caps() -> None:
+    store = InMemoryGraphStore()
+    for key in ("root", "a", "b", "c", "a1", "a2", "b1"):
+        store.add_object("Node", key, {"name": key})
+
+    def node(key: str) -> ObjectLocator:
+        return ObjectLocator("Node", key)
+
+    for source, target in [("root", "a"), ("root", "b"), ("root", "c"), ("a", "a1"), ("a", "a2"), ("b", "b1"), ("b1", "root")]:
+        store.add_link("child", node(source), node(target))
+    store.add_link("peer", node("c"), node("a1"))
+
+    hits = list(store.traverse(node("root"), ["child"], max_depth=3))
+    assert [(hit.depth, hit.object.primary_key, hit.via.primary_key) for hit in hits] == [
+        (1, "a", "root"),
+        (1, "b", "root"),
+        (1, "c", "root"),
+        (2, "a1", "a"),
+        (2, "a2", "a"),
+        (2, "b1", "b"),
+    ]
+    assert [hit.object.primary_key for hit in store.traverse(node("root"), ["child"], max_depth=1)] == ["a", "b", "c"]
+    assert [hit.object.primary_key for hit in store.traverse(node("root"), ["child"], max_depth=3, limit=4)] == [
+        "a", "b", "c", "a1",
+    ]
+    capped = list(store.traverse(node("root"), ["child"], max_depth=2, max_fanout=1))
+    assert [hit.object.primary_key for hit in capped] == ["a", "a1"]
+    incoming = list(store.traverse(node("a1"), direction="incoming", max_depth=2))
+    assert [(hit.depth, hit.link_type, hit.object.primary_key) for hit in incoming] == [
+        (1, "child", "a"),
+        (1, "peer", "c"),
+        (2, "child", "root"),
+    ]
+    both = {hit.object.primary_key for hit in store.traverse(node("b1"), direction="both")}
+    assert both == {"b", "root"}
+    with pytest.raises(ValueError, match="Object not found"):
+        store.traverse(node("missing"))
+    with pytest.raises(ValueError, match="direction"):
+        store.traverse(node("root"), direction="sideways")
+
+
+def test_in_memory_iter_objects_batches_without_holding_the_latch() -> None:
+    store = InMemoryGraphStore()
+    for index in range(25):
+        store.add_object("Loan", f"loan-{index:02d}", {})
+
+    iterator = store.iter_objects("Loan", batch_size=10)
+    first = [next(iterator).primary_key for _ in range(3)]
+    # Writers are not blocked by a paused export; later batches see the write.
+    store.add_object("Loan", "loan-99", {})
+    rest = [instance.primary_key for instance in iterator]
+
+    assert first == ["loan-00", "loan-01", "loan-02"]
+    assert rest[-2:] == ["loan-24", "loan-99"]
+    assert len(first + rest) == 26
+    assert [item.primary_key for item in store.iter_objects("Loan", after_primary_key="loan-23")] == [
+        "loan-24",
+        "loan-99",
+    ]
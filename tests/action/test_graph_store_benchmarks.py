@@ -0,0 +1,161 @@
+"""Latency and memory benchmarks for the in-memory graph store.
+
+The thresholds compare small and large stores against each other instead of
+asserting absolute timings, but wall-clock and allocation ratios still vary
+on loaded runners, so the benchmarks only run when opted in.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gc
+import json
+import os
+from pathlib import Path
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from ontology import InMemoryGraphStore, ObjectLocator
+from ontology.action.storage.edits import AddObjectEdit, ModifyObjectEdit, TransactionEdit
+from ontology.instance.bulk_import import BulkImporter
+from ontology.instance.storage.records import ShapeTable
+
+BENCHMARKS = os.environ.get("ONTOLOGY_BENCHMARKS") == "1"
+# The 1M-object import takes tens of seconds and ~1 GB of memory.
+LARGE_BENCHMARKS = os.environ.get("ONTOLOGY_LARGE_BENCHMARKS") == "1"
+
+pytestmark = pytest.mark.skipif(
+    not (BENCHMARKS or LARGE_BENCHMARKS),
+    reason="set ONTOLOGY_BENCHMARKS=1 to run",
+)
+
+
+def _populated_store(size: int) -> InMemoryGraphStore:
+    store = InMemoryGraphStore()
+    for index in range(size):
+        store.add_object("Loan", f"loan-{index:07d}", {"status": "NEW", "amount": index})
+    return store
+
+
+def _median_apply_seconds(store: InMemoryGraphStore, rounds: int = 200) -> float:
+    samples = []
+    for round_index in range(rounds):
+        tx = TransactionEdit(
+            edits=[
+                ModifyObjectEdit(ObjectLocator("Loan", "loan-0000000"), {"status": f"S{round_index}"}),
+                AddObjectEdit("Audit", f"audit-{round_index}", {"round": round_index}),
+            ]
+        )
+        started = time.perf_counter()
+        store.apply_edit(tx, action_id=f"exec-{round_index}")
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def test_benchmark_transaction_apply_latency_is_flat_in_store_size() -> None:
+    """A two-edit transaction must not get slower as the store grows 100x."""
+
+    small = _median_apply_seconds(_populated_store(1_000))
+    large = _median_apply_seconds(_populated_store(100_000))
+
+    # A full-store copy would make the large store ~100x slower.
+    assert large < small * 10 + 0.0005
+
+
+def _loan_edits(size: int) -> list[AddObjectEdit]:
+    return [AddObjectEdit("Loan", f"loan-{index:07d}", {"status": "NEW", "amount": index}) for index in range(size)]
+
+
+def test_benchmark_bulk_load_beats_per_object_apply() -> None:
+    """Batched loading must be well ahead of one transaction per object."""
+
+    edits = _loan_edits(20_000)
+    # Like timeit, pause the collector: its passes scale with whatever else
+    # the test session keeps alive and would dominate the bulk timing.
+    gc.collect()
+    gc.disable()
+    try:
+        store = InMemoryGraphStore()
+        started = time.perf_counter()
+        for edit in edits:
+            store.apply_edit(edit)
+        per_edit = time.perf_counter() - started
+
+        store = InMemoryGraphStore()
+        started = time.perf_counter()
+        for start in range(0, len(edits), 5_000):
+            store.bulk_load_objects(edits[start : start + 5_000])
+        bulk = time.perf_counter() - started
+    finally:
+        gc.enable()
+
+    assert len(store.list_objects("Loan", limit=20_000)) == 20_000
+    assert bulk < per_edit * 0.6
+
+
+@dataclass
+class _DictBackedInstance:
+    """The layout before compaction: per-instance ``__dict__`` plus a properties dict."""
+
+    object_type: str
+    primary_key: str
+    properties: dict[str, Any]
+    version: int | None = None
+
+
+def _retained_bytes(build: Callable[[], list[Any]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert kept
+    return retained
+
+
+def test_benchmark_compact_records_shrink_bytes_per_object() -> None:
+    """Slot records over interned shapes must need far less memory than dicts."""
+
+    size = 20_000
+    keys = [f"loan-{index:07d}" for index in range(size)]
+    rows = [
+        {"status": "NEW", "amount": index * 10, "currency": "EUR", "owner": "team-a", "score": index / 7}
+        for index in range(size)
+    ]
+    shapes = ShapeTable()
+
+    legacy = _retained_bytes(
+        lambda: [_DictBackedInstance("Loan", key, dict(row), 1) for key, row in zip(keys, rows)]
+    )
+    compact = _retained_bytes(lambda: [shapes.record("Loan", key, row, 1) for key, row in zip(keys, rows)])
+
+    assert len(shapes) == 1
+    assert compact < legacy * 0.75
+
+
+@pytest.fixture(scope="module")
+def million_object_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("bulk") / "loans.ndjson"
+    with path.open("w") as handle:
+        for index in range(1_000_000):
+            record = {"object_type": "Loan", "primary_key": f"loan-{index:07d}", "properties": {"amount": index}}
+            handle.write(json.dumps(record) + "\n")
+    return path
+
+
+@pytest.mark.skipif(not LARGE_BENCHMARKS, reason="set ONTOLOGY_LARGE_BENCHMARKS=1 to run")
+def test_benchmark_bulk_import_million_objects(million_object_file: Path) -> None:
+    store = InMemoryGraphStore()
+
+    report = BulkImporter(store).import_objects(str(million_object_file))
+
+    assert report.objects_loaded == 1_000_000
+    assert [obj.primary_key for obj in store.list_objects("Loan", limit=1, after_primary_key="loan-0999998")] == [
+        "loan-0999999"
+    ]
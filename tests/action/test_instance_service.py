@@ -36,3 +36,77 @@ def test_data_funnel_service_read_helpers() -> None:
     assert obj is not None
     assert obj.properties['status'] == 'NEW'
     assert funnel.has_action_applied('exec-f-1', edit_payload={'type': 'transaction', 'edits': [{'type': 'add_object', 'object_type': 'Loan', 'primary_key': 'loan-f-1', 'properties': {'status': 'NEW'}}]}) is True
+
+
+def test_instance_service_has_actions_applied_bulk_probe() -> None:
+    store = InMemoryGraphStore()
+    service = InstanceService(store)
+    payloads = []
+    for index in range(3):
+        tx = TransactionEdit(edits=[AddObjectEdit(object_type='Loan', primary_key=f'loan-b-{index}', properties={})])
+        payloads.append({'type': 'transaction', 'edits': [{'type': 'add_object', 'object_type': 'Loan', 'primary_key': f'loan-b-{index}', 'properties': {}}]})
+        if index != 1:
+            service.apply(tx, action_id=f'exec-b-{index}')
+
+    flags = service.has_actions_applied([(f'exec-b-{index}', payload) for index, payload in enumerate(payloads)] + [('exec-empty', None)])
+
+    assert flags == [True, False, True, False]
+
+
+class _GroupCountingStore(InMemoryGraphStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.group_sizes: list[int] = []
+
+    def apply_group(self, transactions):  # type: ignore[no-untyped-def]
+        self.group_sizes.append(len(transactions))
+        super().apply_group(transactions)
+
+
+def test_instance_service_apply_many_isolates_failing_members() -> None:
+    store = _GroupCountingStore()
+    store.add_object('Loan', 'loan-dup', {'status': 'OLD'})
+    store.group_sizes.clear()
+    service = InstanceService(store)
+    transactions = [
+        TransactionEdit(edits=[AddObjectEdit('Loan', f'loan-m-{index}', {'n': index})]) for index in range(6)
+    ]
+    transactions[2] = TransactionEdit(edits=[AddObjectEdit('Loan', 'loan-dup', {'status': 'NEW'})])
+    transactions[4] = TransactionEdit(edits=[AddObjectEdit('Loan', '', {})])
+
+    results = service.apply_many(transactions, action_ids=[f'exec-m-{index}' for index in range(6)])
+
+    assert [result.applied for result in results] == [True, True, False, True, False, True]
+    assert results[2].error == 'Object already exists'
+    assert results[4].error == 'Invalid add object edit'
+    assert store.get_object(ObjectLocator('Loan', 'loan-dup')).properties == {'status': 'OLD'}
+    assert store.get_object(ObjectLocator('Loan', 'loan-m-5')).properties['last_modified_by_action_id'] == 'exec-m-5'
+    # One group of five valid members, then halves until the duplicate is isolated.
+    assert store.group_sizes == [5, 2, 3, 1, 2]
+
+
+def test_instance_service_group_commit_coalesces_concurrent_applies() -> None:
+    import threading
+
+    store = _GroupCountingStore()
+    service = InstanceService(store, group_commit_window=0.05, max_group_size=8)
+    barrier = threading.Barrier(16)
+    results = {}
+
+    def submit(index: int) -> None:
+        tx = TransactionEdit(edits=[AddObjectEdit('Loan', f'loan-g-{index}', {'n': index})])
+        barrier.wait()
+        results[index] = service.apply(tx, action_id=f'exec-g-{index}')
+
+    threads = [threading.Thread(target=submit, args=(index,)) for index in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert all(results[index].applied for index in range(16))
+    assert len(store.list_objects('Loan', limit=100)) == 16
+    assert sum(store.group_sizes) == 16 and len(store.group_sizes) < 16
+    assert max(store.group_sizes) <= 8
+    invalid = service.apply(TransactionEdit(edits=[AddObjectEdit('Loan', '', {})]))
+    assert invalid.applied is False
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+from ontology import InMemoryGraphStore, ObjectLocator
+from ontology.action.storage.edits import ModifyObjectEdit, TransactionEdit
+from ontology.instance.storage.cache import CachingGraphStore
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _backend() -> InMemoryGraphStore:
+    store = InMemoryGraphStore()
+    for key in ("loan-1", "loan-2", "loan-3"):
+        store.add_object("Loan", key, {"status": "NEW"})
+    return store
+
+
+def test_cache_serves_hits_and_invalidates_on_apply() -> None:
+    cache = CachingGraphStore(_backend(), max_entries=10)
+    locator = ObjectLocator("Loan", "loan-1")
+
+    assert cache.get_object(locator).version == 1
+    first = cache.get_object(locator)
+    with pytest.raises(TypeError):
+        first.properties["status"] = "MUTATED-BY-CALLER"
+    assert cache.get_object(locator) is first
+    assert first.properties["status"] == "NEW"
+
+    cache.apply_edit(TransactionEdit(edits=[ModifyObjectEdit(locator, {"status": "DONE"})]), action_id="exec-1")
+
+    refreshed = cache.get_object(locator)
+    assert refreshed.version == 2
+    assert refreshed.properties["status"] == "DONE"
+    assert cache.stats() == {"hits": 2, "misses": 2, "evictions": 0, "invalidations": 1, "size": 1}
+
+
+def test_cache_lru_eviction_and_ttl_expiry() -> None:
+    clock = _Clock()
+    cache = CachingGraphStore(_backend(), max_entries=2, ttl_seconds=5, clock=clock)
+
+    for key in ("loan-1", "loan-2", "loan-3"):
+        cache.get_object(ObjectLocator("Loan", key))
+    assert cache.stats()["evictions"] == 1
+
+    cache.get_object(ObjectLocator("Loan", "loan-3"))
+    assert cache.stats()["hits"] == 1
+    clock.now = 6
+    cache.get_object(ObjectLocator("Loan", "loan-3"))
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 4
+
+
+def test_cache_batch_get_fetches_only_misses() -> None:
+    backend = _backend()
+    cache = CachingGraphStore(backend)
+    cache.get_object(ObjectLocator("Loan", "loan-1"))
+
+    results = cache.get_objects(
+        [ObjectLocator("Loan", "loan-1"), ObjectLocator("Loan", "missing"), ObjectLocator("Loan", "loan-2")]
+    )
+
+    assert [item.primary_key if item else None for item in results] == ["loan-1", None, "loan-2"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_cache_read_racing_a_write_does_not_install_stale_version() -> None:
+    locator = ObjectLocator("Loan", "loan-1")
+    fetch_started = threading.Event()
+    write_done = threading.Event()
+
+    class SlowReadStore(InMemoryGraphStore):
+        def get_object(self, locator):
+            snapshot = super().get_object(locator)
+            fetch_started.set()
+            write_done.wait(timeout=5)
+            return snapshot
+
+    backend = SlowReadStore()
+    backend.add_object("Loan", "loan-1", {"status": "NEW"})
+    cache = CachingGraphStore(backend)
+
+    reader = threading.Thread(target=cache.get_object, args=(locator,))
+    reader.start()
+    fetch_started.wait(timeout=5)
+    cache.apply_edit(TransactionEdit(edits=[ModifyObjectEdit(locator, {"status": "DONE"})]))
+    write_done.set()
+    reader.join(timeout=5)
+
+    assert cache.stats()["size"] == 0
+    assert cache.get_object(locator).version == 2
+
+
+def test_cache_forwards_neighbors_to_the_backend() -> None:
+    backend = InMemoryGraphStore()
+    backend.add_object("Loan", "loan-1", {})
+    backend.add_object("User", "user-1", {})
+    backend.add_link("owned_by", ObjectLocator("Loan", "loan-1"), ObjectLocator("User", "user-1"))
+    cache = CachingGraphStore(backend)
+
+    assert cache.neighbors(ObjectLocator("Loan", "loan-1")) == [("owned_by", ObjectLocator("User", "user-1"))]
+    assert cache.neighbors(ObjectLocator("User", "user-1"), link_type="owned_by", direction="incoming") == [
+        ("owned_by", ObjectLocator("Loan", "loan-1"))
+    ]
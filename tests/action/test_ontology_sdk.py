@@ -32,3 +32,57 @@ def test_sdk_edits_create_and_link() -> None:
     ticket = store.get_object(ObjectLocator("Ticket", "ticket-1"))
     assert ticket.properties["due_date"] is not None
     assert ("assigned_tickets", ("Employee", "emp-1"), ("Ticket", "ticket-1")) in store.links
+
+
+def test_sdk_list_pages_with_after_primary_key() -> None:
+    store = InMemoryGraphStore()
+    for key in ("emp-1", "emp-2", "emp-3"):
+        store.add_object("Employee", key, {"name": key})
+
+    http_client = TestClient(create_app(store))
+    client = FoundryClient(base_url=str(http_client.base_url), http_client=http_client)
+
+    page = client.ontology.objects.list("Employee", limit=2, after_primary_key="emp-1")
+    typed_page = client.ontology.objects.Employee.list(limit=5, after_primary_key="emp-2")
+
+    assert [item.primary_key for item in page] == ["emp-2", "emp-3"]
+    assert [item.primary_key for item in typed_page] == ["emp-3"]
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_sdk_iterate_streams_export_lazily(compressed: bool) -> None:
+    store = InMemoryGraphStore()
+    for index in range(2500):
+        store.add_object("Employee", f"emp-{index:04d}", {"index": index})
+    store.add_object("Ticket", "ticket-1", {})
+
+    http_client = TestClient(create_app(store))
+    client = FoundryClient(base_url=str(http_client.base_url), http_client=http_client)
+
+    exported = list(client.ontology.objects.iterate("Employee", compressed=compressed))
+    resumed = client.ontology.objects.Employee.iterate(after_primary_key="emp-2497")
+
+    assert len(exported) == 2500
+    assert exported[0].primary_key == "emp-0000"
+    assert exported[-1].properties == {"index": 2499}
+    assert [item.primary_key for item in resumed] == ["emp-2498", "emp-2499"]
+
+
+def test_sdk_iterate_falls_back_to_unversioned_objects_prefix() -> None:
+    from fastapi import FastAPI
+
+    from ontology.instance.api.service import InstanceService
+    from ontology.search.api.router import create_router as create_search_router
+    from ontology.search.api.service import SearchService
+
+    store = InMemoryGraphStore()
+    for key in ("emp-1", "emp-2"):
+        store.add_object("Employee", key, {"name": key})
+    # A server exposing the objects routes without the /api/v1 prefix.
+    app = FastAPI()
+    app.include_router(create_search_router(SearchService(InstanceService(store))))
+
+    http_client = TestClient(app)
+    client = FoundryClient(base_url=str(http_client.base_url), http_client=http_client)
+
+    assert [item.primary_key for item in client.ontology.objects.iterate("Employee")] == ["emp-1", "emp-2"]
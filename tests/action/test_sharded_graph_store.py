@@ -0,0 +1,306 @@
+import random
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+import pytest
+
+from ontology import InMemoryGraphStore, ObjectLocator
+from ontology.action.storage.edits import (
+    AddLinkEdit,
+    AddObjectEdit,
+    DeleteObjectEdit,
+    ModifyObjectEdit,
+    RemoveLinkEdit,
+    TransactionEdit,
+    edit_to_dict,
+)
+from ontology.instance.api.service import InstanceService
+from ontology.instance.storage.aggregation import AggregateSpec
+from ontology.instance.storage.query import PropertyPredicate
+from ontology.instance.storage.sharding import ShardedGraphStore, ShardRecoveryLog, ShardStoreFencedError
+
+
+def _keys_on_distinct_shards(store: ShardedGraphStore, count: int) -> list[str]:
+    keys: dict[int, str] = {}
+    index = 0
+    while len(keys) < count:
+        key = f"acct-{index}"
+        keys.setdefault(store.shard_of(ObjectLocator("Account", key)), key)
+        index += 1
+    return list(keys.values())
+
+
+def test_sharded_store_partitions_objects_and_merges_reads_in_key_order() -> None:
+    shards = [InMemoryGraphStore() for _ in range(4)]
+    store = ShardedGraphStore(shards)
+    reference = InMemoryGraphStore()
+    for target in (store, reference):
+        target.create_property_index("Loan", "status")
+        for index in range(60):
+            target.apply_edit(AddObjectEdit("Loan", f"loan-{index:03d}", {"status": "OPEN" if index % 3 else "CLOSED"}))
+
+    assert all(len(shard.objects) > 0 for shard in shards)
+    assert sum(len(shard.objects) for shard in shards) == 60
+    assert store.cross_shard_commits == 0
+
+    def keys(objects: Sequence[Any]) -> list[str]:
+        return [obj.primary_key for obj in objects]
+
+    assert keys(store.list_objects("Loan", limit=7, offset=5)) == keys(reference.list_objects("Loan", limit=7, offset=5))
+    assert keys(store.list_objects("Loan", limit=5, after_primary_key="loan-040")) == [
+        f"loan-{index:03d}" for index in range(41, 46)
+    ]
+    assert keys(store.iter_objects("Loan", batch_size=8)) == keys(reference.iter_objects("Loan"))
+    closed = store.search_objects("Loan", [PropertyPredicate("status", "eq", "CLOSED")], limit=4)
+    assert keys(closed.objects) == ["loan-000", "loan-003", "loan-006", "loan-009"]
+    assert closed.plan.strategy == "index"
+    found = store.get_objects([ObjectLocator("Loan", "loan-059"), ObjectLocator("Loan", "nope")])
+    assert [item and item.primary_key for item in found] == ["loan-059", None]
+    grouped = store.aggregate_objects("Loan", [AggregateSpec("count")], group_by=["status"])
+    assert [(group.group["status"], group.values["count"]) for group in grouped.groups] == [("CLOSED", 20), ("OPEN", 40)]
+
+
+def test_cross_shard_transaction_is_all_or_nothing() -> None:
+    store = ShardedGraphStore([InMemoryGraphStore() for _ in range(3)])
+    source, target = _keys_on_distinct_shards(store, 2)
+    store.apply_edit(AddObjectEdit("Account", source, {"balance": 100}))
+    store.apply_edit(AddObjectEdit("Account", target, {"balance": 0}))
+
+    stale = TransactionEdit(
+        edits=[
+            ModifyObjectEdit(ObjectLocator("Account", source, version=1), {"balance": 60}),
+            ModifyObjectEdit(ObjectLocator("Account", target, version=7), {"balance": 40}),
+        ]
+    )
+    with pytest.raises(ValueError, match="Version conflict"):
+        store.apply_edit(stale, action_id="exec-stale")
+    assert store.get_object(ObjectLocator("Account", source)).properties == {"balance": 100}
+    assert store.cross_shard_commits == 0
+
+    transfer = TransactionEdit(
+        edits=[
+            ModifyObjectEdit(ObjectLocator("Account", source, version=1), {"balance": 60}),
+            ModifyObjectEdit(ObjectLocator("Account", target, version=1), {"balance": 40}),
+        ]
+    )
+    store.apply_edit(transfer, action_id="exec-1")
+
+    assert store.cross_shard_commits == 1
+    assert store.recovery_log.pending == {}
+    assert [obj.properties["balance"] for obj in store.get_objects(
+        [ObjectLocator("Account", source), ObjectLocator("Account", target)]
+    )] == [60, 40]
+    assert store.has_actions_applied(
+        [("exec-1", edit_to_dict(transfer)), ("exec-stale", edit_to_dict(stale)), ("exec-1", None)]
+    ) == [True, False, False]
+
+
+def test_cross_shard_links_are_mirrored_traversed_and_dropped_with_their_endpoint() -> None:
+    shards = [InMemoryGraphStore() for _ in range(4)]
+    store = ShardedGraphStore(shards)
+    reference = InMemoryGraphStore()
+    rng = random.Random(7)
+    nodes = [f"n-{index:02d}" for index in range(20)]
+    edges = {(rng.choice(nodes), rng.choice(nodes)) for _ in range(45)}
+    for target in (store, reference):
+        for node in nodes:
+            target.apply_edit(AddObjectEdit("Node", node, {}))
+        target.apply_edit(
+            TransactionEdit(
+                edits=[AddLinkEdit("next", ObjectLocator("Node", a), ObjectLocator("Node", b)) for a, b in sorted(edges)]
+            )
+        )
+
+    start = ObjectLocator("Node", "n-00")
+    for direction in ("outgoing", "incoming", "both"):
+        for max_fanout in (None, 2):
+            expected = list(reference.traverse(start, direction=direction, max_depth=3, limit=15, max_fanout=max_fanout))
+            actual = list(store.traverse(start, direction=direction, max_depth=3, limit=15, max_fanout=max_fanout))
+            assert [(hit.depth, hit.via, hit.object.primary_key) for hit in actual] == [
+                (hit.depth, hit.via, hit.object.primary_key) for hit in expected
+            ]
+
+    victim = max(nodes, key=lambda node: len(reference.neighbors(ObjectLocator("Node", node), direction="both")))
+    store.apply_edit(DeleteObjectEdit(ObjectLocator("Node", victim)))
+    assert all(
+        victim not in (link[1][1], link[2][1]) for shard in shards for link in shard.links
+    ), "mirrors of the deleted node's links must be dropped on every shard"
+    with pytest.raises(ValueError, match="Object not found"):
+        store.traverse(ObjectLocator("Node", victim))
+
+
+def test_recovery_finishes_decided_transactions_after_a_crash(tmp_path: Path) -> None:
+    class _CrashingShard(InMemoryGraphStore):
+        crash_before = False
+        crash_after = False
+
+        def apply_group(self, transactions: Any) -> None:
+            if self.crash_before:
+                raise RuntimeError("crash before apply")
+            super().apply_group(transactions)
+            if self.crash_after:
+                raise RuntimeError("crash after apply")
+
+    shards = [_CrashingShard() for _ in range(3)]
+    log_path = tmp_path / "coordinator.log"
+    store = ShardedGraphStore(shards, ShardRecoveryLog(log_path, fsync=False))
+    keys = _keys_on_distinct_shards(store, 3)
+    indexes = [store.shard_of(ObjectLocator("Account", key)) for key in keys]
+    # The lowest shard applies and then fails before logging completion; the
+    # highest shard fails outright, so the transaction stays unfinished.
+    shards[min(indexes)].crash_after = True
+    shards[max(indexes)].crash_before = True
+    create = TransactionEdit(edits=[AddObjectEdit("Account", key, {"balance": 10}) for key in keys])
+
+    with pytest.raises(ShardStoreFencedError) as raised:
+        store.apply_edit(create, action_id="exec-create")
+    assert isinstance(raised.value.__cause__, RuntimeError)
+    assert str(raised.value.__cause__) == "crash before apply"
+    assert len(store.recovery_log.pending) == 1
+    store.recovery_log.close()
+
+    for shard in shards:
+        shard.crash_before = shard.crash_after = False
+    reopened = ShardedGraphStore(shards, ShardRecoveryLog(log_path, fsync=False))
+
+    assert reopened.recovery_log.pending == {}
+    assert reopened.has_action_applied("exec-create", edit_to_dict(create))
+    assert all(len(shard.objects) == 1 for shard in shards)
+    reopened.close()
+    assert ShardRecoveryLog(log_path).pending == {}
+
+
+class _FlakyShard(InMemoryGraphStore):
+    fail_before = 0
+    fail_after = False
+
+    def apply_group(self, transactions: Any) -> None:
+        if self.fail_before:
+            self.fail_before -= 1
+            raise RuntimeError("shard unavailable")
+        super().apply_group(transactions)
+        if self.fail_after:
+            self.fail_after = False
+            raise RuntimeError("lost acknowledgement")
+
+
+def test_failed_part_rolls_forward_or_fences_the_store_until_recovered() -> None:
+    shards = [_FlakyShard() for _ in range(3)]
+    store = ShardedGraphStore(shards)
+    keys = _keys_on_distinct_shards(store, 3)
+    indexes = sorted(store.shard_of(ObjectLocator("Account", key)) for key in keys)
+
+    # A part that applied but raised is recognised and the commit completes.
+    shards[indexes[0]].fail_after = True
+    store.apply_edit(TransactionEdit(edits=[AddObjectEdit("Account", key, {"balance": 10}) for key in keys]))
+    assert not store.fenced
+    assert store.recovery_log.pending == {}
+
+    # A part that cannot be applied does not stop the later shards, and
+    # fences the store instead of serving the torn transfer.
+    shards[indexes[0]].fail_before = 1
+    transfer = TransactionEdit(edits=[ModifyObjectEdit(ObjectLocator("Account", key), {"balance": 5}) for key in keys])
+    with pytest.raises(ShardStoreFencedError):
+        store.apply_edit(transfer, action_id="exec-transfer")
+    assert store.fenced
+    assert [len(shards[index].objects) for index in indexes] == [1, 1, 1]
+    last_key = next(key for key in keys if store.shard_of(ObjectLocator("Account", key)) == indexes[2])
+    assert shards[indexes[2]].get_object(ObjectLocator("Account", last_key)).properties["balance"] == 5
+    with pytest.raises(ShardStoreFencedError):
+        store.get_object(ObjectLocator("Account", keys[0]))
+    with pytest.raises(ShardStoreFencedError):
+        store.apply_edit(AddObjectEdit("Account", "acct-new", {"balance": 0}))
+
+    assert store.recover() == 1
+    assert not store.fenced
+    balances = store.get_objects([ObjectLocator("Account", key) for key in keys])
+    assert [instance.properties["balance"] for instance in balances] == [5, 5, 5]
+
+
+def test_failed_part_counts_as_done_only_when_its_outcome_is_verified() -> None:
+    shards = [_FlakyShard() for _ in range(2)]
+    store = ShardedGraphStore(shards)
+    first, second = sorted(
+        _keys_on_distinct_shards(store, 2), key=lambda key: store.shard_of(ObjectLocator("Account", key))
+    )
+    low = shards[store.shard_of(ObjectLocator("Account", first))]
+    store.apply_edit(
+        TransactionEdit(edits=[AddObjectEdit("Account", key, {"balance": 10}) for key in (first, second)])
+    )
+    link = AddLinkEdit("pays", ObjectLocator("Account", first), ObjectLocator("Account", second))
+
+    # A link-only part that never applied is not mistaken for a done one.
+    low.fail_before = 1
+    with pytest.raises(ShardStoreFencedError):
+        store.apply_edit(link)
+    assert store.recover() == 1
+    assert [len(shard.links) for shard in shards] == [1, 1]
+
+    # A link removal that applied before failing is verified and completes.
+    low.fail_after = True
+    store.apply_edit(RemoveLinkEdit("pays", ObjectLocator("Account", first), ObjectLocator("Account", second)))
+    assert not store.fenced
+    assert [len(shard.links) for shard in shards] == [0, 0]
+
+    # An unversioned modify without an action id cannot be verified, even
+    # when the shard already holds the same property values.
+    low.fail_before = 1
+    same = TransactionEdit(
+        edits=[ModifyObjectEdit(ObjectLocator("Account", key), {"balance": 10}) for key in (first, second)]
+    )
+    with pytest.raises(ShardStoreFencedError):
+        store.apply_edit(same)
+    assert store.recover() == 1
+    accounts = store.get_objects([ObjectLocator("Account", key) for key in (first, second)])
+    assert [instance.version for instance in accounts] == [2, 2]
+
+
+def test_instance_service_runs_unchanged_on_concurrent_cross_shard_transfers() -> None:
+    store = ShardedGraphStore([InMemoryGraphStore() for _ in range(4)], lock_stripes=8)
+    service = InstanceService(store)
+    accounts = [f"acct-{index}" for index in range(10)]
+    for key in accounts:
+        service.apply(TransactionEdit(edits=[AddObjectEdit("Account", key, {"balance": 100})]))
+    errors: list[BaseException] = []
+
+    def transfer(seed: int) -> None:
+        rng = random.Random(seed)
+        completed = 0
+        try:
+            while completed < 40:
+                source, target = rng.sample(accounts, 2)
+                current = store.get_objects([ObjectLocator("Account", source), ObjectLocator("Account", target)])
+                result = service.apply(
+                    TransactionEdit(
+                        edits=[
+                            ModifyObjectEdit(
+                                ObjectLocator("Account", source, version=current[0].version),
+                                {"balance": current[0].properties["balance"] - 1},
+                            ),
+                            ModifyObjectEdit(
+                                ObjectLocator("Account", target, version=current[1].version),
+                                {"balance": current[1].properties["balance"] + 1},
+                            ),
+                            AddLinkEdit("paid", ObjectLocator("Account", source), ObjectLocator("Account", target)),
+                        ]
+                    ),
+                    action_id=f"exec-{seed}-{completed}",
+                )
+                if result.applied:
+                    completed += 1
+        except BaseException as exc:  # surfaced in the main thread
+            errors.append(exc)
+
+    threads = [threading.Thread(target=transfer, args=(seed,)) for seed in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    final = store.list_objects("Account", limit=100)
+    assert sum(obj.properties["balance"] for obj in final) == 100 * len(accounts)
+    assert sum(obj.version - 1 for obj in final) == 6 * 40 * 2
+    assert store.cross_shard_commits > 0
+    assert store.recovery_log.pending == {}
@@ -5,7 +5,12 @@ pytest.importorskip("sqlalchemy")
 from datetime import datetime
 
 from ontology import (
+    ActionBatchItem,
     ActionDefinition,
+    ActionRunner,
+    ActionService,
+    DataFunnelService,
+    InMemoryGraphStore,
     ActionExecution,
     ActionExecutionMode,
     ActionTargetType,
@@ -19,7 +24,19 @@ from ontology import (
     SideEffectOutbox,
 )
 from ontology.action.storage.edits import AddObjectEdit, ObjectLocator, ModifyObjectEdit, TransactionEdit
+from ontology.action.execution.runtime import function_action
+from ontology.action.storage.models import ActionLogModel, ActionStateModel
 from ontology.action.storage.sql_repository import SqlActionRepository
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+
+@function_action
+def set_status(loan, context, status: str) -> str:
+    if status == "BOOM":
+        raise RuntimeError("function failed")
+    loan.status = status
+    return "ok"
 
 
 def test_sql_repository_persists_records(tmp_path) -> None:
@@ -123,3 +140,215 @@ def test_sql_repository_persists_records(tmp_path) -> None:
     assert action.target_type == ActionTargetType.entity
     assert action.target_api_name == "Loan"
     assert repo.get_function("Fn", version=1) is not None
+
+
+def test_action_apply_journals_lifecycle_writes_into_two_commits(tmp_path) -> None:
+    repo = SqlActionRepository(f"sqlite:///{tmp_path}/journal.db")
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {"status": "NEW"})
+    runner = ActionRunner()
+    runner.register("approve", set_status)
+    service = ActionService(repo, runner, DataFunnelService(store))
+    commits: list[int] = []
+    event.listen(repo._engine, "commit", lambda connection: commits.append(1))
+    locators = {"loan": {"object_type": "Loan", "primary_key": "loan-1"}}
+
+    succeeded = service.apply("Approve", "user-1", {"status": "APPROVED"}, input_instance_locators=locators)
+
+    # One commit before the graph apply, one after the terminal status.
+    assert len(commits) == 2
+    failed = service.apply("Approve", "user-1", {"status": "BOOM"}, input_instance_locators=locators)
+    assert len(commits) == 3
+    with pytest.raises(ValueError, match="Input instance not found"):
+        service.apply("Approve", "user-1", {}, input_instance_locators={"loan": {"object_type": "Loan", "primary_key": "x"}})
+    assert len(commits) == 4
+
+    def events(execution_id: str) -> list[str]:
+        with Session(repo._engine) as session:
+            rows = session.execute(
+                select(ActionLogModel.event_type).where(ActionLogModel.execution_id == execution_id).order_by(ActionLogModel.id)
+            )
+            return list(rows.scalars())
+
+    assert events(succeeded.execution_id) == [
+        "submitted",
+        "execution_started",
+        "function_started",
+        "function_finished",
+        "apply_started",
+        "apply_succeeded",
+        "finished",
+    ]
+    assert events(failed.execution_id) == [
+        "submitted",
+        "execution_started",
+        "function_started",
+        "execution_failed",
+        "finished",
+    ]
+    stored = repo.get_execution(succeeded.execution_id)
+    assert stored.status == ActionStatus.succeeded and stored.finished_at is not None
+    assert repo.get_execution(failed.execution_id).error == "function failed"
+    with Session(repo._engine) as session:
+        state = session.get(ActionStateModel, succeeded.execution_id)
+        assert state.status == ActionStateStatus.succeeded.value
+    assert store.get_object(ObjectLocator("Loan", "loan-1")).properties["status"] == "APPROVED"
+
+
+def test_sql_claim_queued_executions_skips_excluded_actions(tmp_path) -> None:
+    repo = SqlActionRepository(f"sqlite:///{tmp_path}/queue.db")
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    repo.add_action(ActionDefinition(name="Reject", description="", function_name="reject", version=1))
+    store = InMemoryGraphStore()
+    service = ActionService(repo, ActionRunner(), DataFunnelService(store))
+    locators = {"loan": {"object_type": "Loan", "primary_key": "loan-1"}}
+    first = service.enqueue("Approve", "user-1", {"status": "A"}, input_instance_locators=locators)
+    second = service.enqueue("Reject", "user-1", {"status": "R"})
+
+    claimed = repo.claim_queued_executions(limit=5, exclude_action_names=["Approve"])
+
+    assert [execution.execution_id for execution in claimed] == [second.execution_id]
+    assert repo.get_execution(second.execution_id).status == ActionStatus.validating
+    assert repo.get_execution(second.execution_id).started_at is not None
+    [remaining] = repo.claim_queued_executions(limit=5)
+    assert remaining.execution_id == first.execution_id
+    assert remaining.action_version == 1
+    assert remaining.input_instances == locators
+    assert repo.claim_queued_executions() == []
+
+
+def test_sql_repository_finds_execution_by_client_request_id(tmp_path) -> None:
+    repo = SqlActionRepository(f"sqlite:///{tmp_path}/dedup.db")
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    service = ActionService(repo, ActionRunner(), DataFunnelService(InMemoryGraphStore()))
+
+    queued = service.enqueue("Approve", "user-1", {}, client_request_id="req-1")
+
+    assert repo.find_execution_by_client_request_id("Approve", "req-1").execution_id == queued.execution_id
+    assert repo.find_execution_by_client_request_id("Reject", "req-1") is None
+    assert repo.find_execution_by_client_request_id("Approve", "req-2") is None
+    restarted = ActionService(repo, ActionRunner(), DataFunnelService(InMemoryGraphStore()))
+    assert restarted.enqueue("Approve", "user-1", {}, client_request_id="req-1").execution_id == queued.execution_id
+
+
+def test_apply_batch_persists_all_items_in_two_commits(tmp_path) -> None:
+    repo = SqlActionRepository(f"sqlite:///{tmp_path}/batch.db")
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    store = InMemoryGraphStore()
+    for index in range(20):
+        store.add_object("Loan", f"loan-{index}", {"status": "NEW"})
+    runner = ActionRunner()
+    runner.register("approve", set_status)
+    service = ActionService(repo, runner, DataFunnelService(store))
+    commits: list[int] = []
+    event.listen(repo._engine, "commit", lambda connection: commits.append(1))
+    items = [
+        ActionBatchItem({"status": "BOOM" if index == 7 else "APPROVED"}, {"loan": {"object_type": "Loan", "primary_key": f"loan-{index}"}})
+        for index in range(20)
+    ]
+
+    results = service.apply_batch("Approve", "user-1", items)
+
+    assert len(commits) == 2
+    assert [index for index, result in enumerate(results) if result.error] == [7]
+    assert repo.get_execution(results[7].execution.execution_id).status == ActionStatus.failed
+    assert repo.get_execution(results[0].execution.execution_id).status == ActionStatus.succeeded
+    with Session(repo._engine) as session:
+        assert session.get(ActionStateModel, results[19].execution.execution_id).status == ActionStateStatus.succeeded.value
+
+
+def test_sql_repository_upgrades_existing_executions_table(tmp_path) -> None:
+    from sqlalchemy import create_engine, inspect
+
+    db_url = f"sqlite:///{tmp_path}/legacy.db"
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        # action_executions as created by releases before queued execution.
+        connection.exec_driver_sql(
+            "CREATE TABLE action_executions (id VARCHAR(64) PRIMARY KEY, action_name VARCHAR(255) NOT NULL, "
+            "submitter VARCHAR(255) NOT NULL, status VARCHAR(32) NOT NULL, submitted_at DATETIME, "
+            "input_payload JSON NOT NULL, output_payload JSON, ontology_edit JSON, compensation_edit JSON, "
+            "error TEXT, started_at DATETIME, finished_at DATETIME)"
+        )
+
+    repo = SqlActionRepository(db_url)
+    repo.add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    service = ActionService(repo, ActionRunner(), DataFunnelService(InMemoryGraphStore()))
+    queued = service.enqueue("Approve", "user-1", {}, input_instance_locators={"loan": {"object_type": "Loan", "primary_key": "l1"}})
+
+    columns = {column["name"] for column in inspect(engine).get_columns("action_executions")}
+    assert {"action_version", "input_instances", "client_request_id"} <= columns
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes("action_executions")}
+    assert indexes["ux_action_executions_client_request"]["unique"]
+    assert repo.claim_queued_executions()[0].execution_id == queued.execution_id
+    assert repo.get_execution(queued.execution_id).input_instances == {"loan": {"object_type": "Loan", "primary_key": "l1"}}
+
+
+def test_sql_upgrade_backfills_only_enqueued_executions(tmp_path) -> None:
+    from sqlalchemy import create_engine
+
+    db_url = f"sqlite:///{tmp_path}/backfill.db"
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        # Rows left by a release without queued_for_worker: one enqueued, one rejected apply.
+        connection.exec_driver_sql(
+            "CREATE TABLE action_executions (id VARCHAR(64) PRIMARY KEY, action_name VARCHAR(255) NOT NULL, "
+            "submitter VARCHAR(255) NOT NULL, status VARCHAR(32) NOT NULL, submitted_at DATETIME, "
+            "input_payload JSON NOT NULL, output_payload JSON, ontology_edit JSON, compensation_edit JSON, "
+            "error TEXT, started_at DATETIME, finished_at DATETIME, action_version INTEGER, "
+            "input_instances JSON, client_request_id VARCHAR(255))"
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO action_executions (id, action_name, submitter, status, input_payload, action_version) "
+            "VALUES ('enqueued', 'Approve', 'user-1', 'queued', '{}', 1), "
+            "('rejected', 'Approve', 'user-1', 'queued', '{}', NULL)"
+        )
+
+    repo = SqlActionRepository(db_url)
+
+    assert [execution.execution_id for execution in repo.claim_queued_executions(limit=5)] == ["enqueued"]
+    assert repo.get_execution("rejected").status == ActionStatus.queued
+
+
+def test_unique_client_request_id_stops_cross_process_duplicates(tmp_path) -> None:
+    class RacingRepository(SqlActionRepository):
+        """The next lookup misses, as when two processes check before either inserts."""
+
+        def find_execution_by_client_request_id(self, action_name: str, client_request_id: str):
+            if getattr(self, "racing", False):
+                self.racing = False
+                return None
+            return super().find_execution_by_client_request_id(action_name, client_request_id)
+
+    db_url = f"sqlite:///{tmp_path}/race.db"
+    calls: list[str] = []
+
+    @function_action
+    def count_calls(loan, context, status: str) -> str:
+        calls.append(status)
+        loan.status = status
+        return "ok"
+
+    store = InMemoryGraphStore()
+    store.add_object("Loan", "loan-1", {"status": "NEW"})
+    services = []
+    for _ in range(2):
+        repo = RacingRepository(db_url)
+        runner = ActionRunner()
+        runner.register("approve", count_calls)
+        services.append((repo, ActionService(repo, runner, DataFunnelService(store))))
+    services[0][0].add_action(ActionDefinition(name="Approve", description="", function_name="approve", version=1))
+    locators = {"loan": {"object_type": "Loan", "primary_key": "loan-1"}}
+
+    first = services[0][1].apply("Approve", "user-1", {"status": "A"}, input_instance_locators=locators, client_request_id="req-1")
+    services[1][0].racing = True
+    second = services[1][1].apply("Approve", "user-1", {"status": "A"}, input_instance_locators=locators, client_request_id="req-1")
+
+    assert second.execution_id == first.execution_id
+    assert calls == ["A"]
+    services[1][0].racing = True
+    queued = ActionService(services[1][0], ActionRunner(), DataFunnelService(store)).enqueue(
+        "Approve", "user-1", {}, client_request_id="req-1"
+    )
+    assert queued.execution_id == first.execution_id